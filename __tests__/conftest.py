@@ -5,6 +5,10 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker,
+    create_async_engine,
+)
 from moto import mock_aws
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
@@ -24,6 +28,7 @@ import os
 # Local imports
 from configs.Database import (
     get_db_connection,
+    get_async_db_connection,
 )
 from configs.Environment import get_environment_variables
 from configs.Logging import configure_logging
@@ -86,6 +91,12 @@ TEST_SQLALCHEMY_DATABASE_URL = (
     f"@{env.DATABASE_HOSTNAME}:{env.DATABASE_PORT}"
     f"/{env.DATABASE_NAME}"
 )
+TEST_ASYNC_SQLALCHEMY_DATABASE_URL = (
+    f"{dialect}{env.DATABASE_ASYNC_DRIVER}"
+    f"://{env.DATABASE_USERNAME}:{env.DATABASE_PASSWORD}"
+    f"@{env.DATABASE_HOSTNAME}:{env.DATABASE_PORT}"
+    f"/{env.DATABASE_NAME}"
+)
 
 print(f"Test Database URL: {TEST_SQLALCHEMY_DATABASE_URL}")
 print("================================\n")
@@ -168,6 +179,20 @@ def test_db_session(test_db_engine):
         session.close()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def test_async_db_session(test_db_session):
+    """Create an async session on the (already reset) test database."""
+    engine = create_async_engine(
+        TEST_ASYNC_SQLALCHEMY_DATABASE_URL
+    )
+    session_factory = async_sessionmaker(
+        engine, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def test_client(test_db_session):
     """Create a new FastAPI TestClient."""
@@ -178,9 +203,20 @@ def test_client(test_db_session):
         finally:
             test_db_session.close()
 
+    async def override_get_async_db():
+        engine = create_async_engine(
+            TEST_ASYNC_SQLALCHEMY_DATABASE_URL
+        )
+        async with async_sessionmaker(engine)() as session:
+            yield session
+        await engine.dispose()
+
     app.dependency_overrides[
         get_db_connection
     ] = override_get_db
+    app.dependency_overrides[
+        get_async_db_connection
+    ] = override_get_async_db
     return TestClient(app)
 
 
@@ -395,6 +431,7 @@ def storage_service(mocker):
         created_at=datetime.now(),
     )
     mock_storage.store = Mock(return_value=stored_file)
+    mock_storage.store_stream = Mock(return_value=stored_file)
     return mock_storage
 
 
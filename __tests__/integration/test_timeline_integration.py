@@ -10,7 +10,10 @@ from httpx import ASGITransport
 
 from domain.timeline import TimelineEventType
 from orm.TimelineModel import Timeline as TimelineModel
-from configs.Database import get_db_connection
+from configs.Database import (
+    get_db_connection,
+    get_async_db_connection,
+)
 from dependencies import get_current_user
 
 
@@ -73,7 +76,10 @@ def auth_headers(mock_auth_credentials):
 
 @pytest_asyncio.fixture
 async def async_client(
-    fastapi_app, test_db_session, test_user
+    fastapi_app,
+    test_db_session,
+    test_async_db_session,
+    test_user,
 ) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client."""
 
@@ -83,12 +89,18 @@ async def async_client(
         finally:
             test_db_session.close()
 
+    async def override_get_async_db():
+        yield test_async_db_session
+
     async def mock_get_current_user():
         return test_user
 
     fastapi_app.dependency_overrides[
         get_db_connection
     ] = override_get_db
+    fastapi_app.dependency_overrides[
+        get_async_db_connection
+    ] = override_get_async_db
     fastapi_app.dependency_overrides[
         get_current_user
     ] = mock_get_current_user
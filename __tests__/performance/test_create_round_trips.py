@@ -0,0 +1,126 @@
+"""Benchmark database round-trips per create for core entities."""
+
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from orm.ActivityModel import Activity
+from orm.UserModel import User
+from repositories.MomentRepository import MomentRepository
+from repositories.NoteRepository import NoteRepository
+from repositories.TaskRepository import TaskRepository
+
+pytestmark = pytest.mark.performance
+
+
+@contextmanager
+def count_round_trips(session):
+    """Count statements and commits sent to the database."""
+    engine = session.get_bind()
+    counts = {"statements": 0, "commits": 0}
+
+    def on_execute(*args):
+        counts["statements"] += 1
+
+    def on_commit(conn):
+        counts["commits"] += 1
+
+    event.listen(
+        engine, "before_cursor_execute", on_execute
+    )
+    event.listen(engine, "commit", on_commit)
+    try:
+        yield counts
+    finally:
+        event.remove(
+            engine, "before_cursor_execute", on_execute
+        )
+        event.remove(engine, "commit", on_commit)
+
+
+@pytest.fixture
+def owner(db_session):
+    """Create a user owning the benchmarked rows."""
+    user = User(
+        id=str(uuid4()),
+        username=f"bench_{uuid4().hex[:8]}",
+        key_id=str(uuid4()),
+        user_secret="bench-secret",
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def activity(db_session, owner):
+    """Create an activity for benchmarked moments."""
+    activity = Activity(
+        name="Bench Activity",
+        description="Round-trip benchmark",
+        user_id=owner.id,
+        icon="⏱",
+        color="#000000",
+        activity_schema={
+            "type": "object",
+            "properties": {"note": {"type": "string"}},
+        },
+    )
+    db_session.add(activity)
+    db_session.commit()
+    return activity
+
+
+def test_moment_create_round_trips(
+    db_session, owner, activity
+):
+    """Moment create: INSERT, counter UPDATE, COMMIT, refresh SELECT.
+
+    The activity was loaded in this session, so validation reads it
+    from the identity map instead of selecting it again. The UPDATE
+    maintains activities.moment_count.
+    """
+    repo = MomentRepository(db_session)
+    activity_id, user_id = activity.id, owner.id
+
+    with count_round_trips(db_session) as counts:
+        moment = repo.create(
+            activity_id,
+            data={"note": "bench"},
+            user_id=user_id,
+        )
+        assert moment.id is not None
+
+    assert counts == {"statements": 3, "commits": 1}
+
+
+def test_task_create_round_trips(db_session, owner):
+    """Task create: INSERT, COMMIT, one refresh SELECT."""
+    repo = TaskRepository(db_session)
+    user_id = owner.id
+
+    with count_round_trips(db_session) as counts:
+        task = repo.create(
+            {
+                "content": "Benchmark task",
+                "user_id": user_id,
+            }
+        )
+        assert task.id is not None
+
+    assert counts == {"statements": 2, "commits": 1}
+
+
+def test_note_create_round_trips(db_session, owner):
+    """Note create as NoteService does it: INSERT, COMMIT, reload."""
+    repo = NoteRepository(db_session)
+    user_id = owner.id
+
+    with count_round_trips(db_session) as counts:
+        note = repo.create(content="bench", user_id=user_id)
+        db_session.commit()
+        assert note.id is not None
+
+    assert counts == {"statements": 2, "commits": 1}
@@ -0,0 +1,46 @@
+"""Unit tests for database pool and query metrics."""
+
+from sqlalchemy import create_engine, text
+
+from configs.DatabaseMetrics import (
+    InstrumentedQueuePool,
+    LatencyHistogram,
+    get_pool_stats,
+)
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test observations land in cumulative buckets."""
+    histogram = LatencyHistogram()
+    histogram.observe(0.0005)  # 0.5ms
+    histogram.observe(0.02)  # 20ms
+    histogram.observe(10)  # beyond the last bucket
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 3
+    assert snapshot["buckets"]["1"] == 1
+    assert snapshot["buckets"]["25"] == 2
+    assert snapshot["buckets"]["5000"] == 2
+    assert snapshot["buckets"]["+Inf"] == 3
+    assert snapshot["sum_ms"] == 10020.5
+
+
+def test_instrumented_pool_records_checkout_wait():
+    """Test the pool reports checkout stats and wait times."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+    )
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        stats = get_pool_stats(engine.pool)
+        assert stats["checked_out"] == 1
+        assert stats["size"] == 2
+
+    stats = get_pool_stats(engine.pool)
+    assert stats["checked_out"] == 0
+    assert stats["wait_time_ms"]["count"] == 1
+    engine.dispose()
@@ -34,7 +34,7 @@ def test_get_current_user_valid(
             "dependencies.UserRepository"
         ) as mock_repo:
             mock_verify.return_value = "test_user_id"
-            mock_repo.return_value.get_by_id.return_value = (
+            mock_repo.return_value.get_cached_principal.return_value = (
                 mock_user
             )
 
@@ -46,7 +46,10 @@ def test_get_current_user_valid(
             mock_verify.assert_called_once_with(
                 "valid_token"
             )
-            mock_repo.return_value.get_by_id.assert_called_once_with(
+            get_principal = (
+                mock_repo.return_value.get_cached_principal
+            )
+            get_principal.assert_called_once_with(
                 "test_user_id"
             )
 
@@ -74,7 +77,7 @@ def test_get_current_user_user_not_found(
             "dependencies.UserRepository"
         ) as mock_repo:
             mock_verify.return_value = "test_user_id"
-            mock_repo.return_value.get_by_id.return_value = (
+            mock_repo.return_value.get_cached_principal.return_value = (
                 None
             )
 
@@ -94,7 +97,7 @@ def test_get_optional_user_valid(
             "dependencies.UserRepository"
         ) as mock_repo:
             mock_verify.return_value = "test_user_id"
-            mock_repo.return_value.get_by_id.return_value = (
+            mock_repo.return_value.get_cached_principal.return_value = (
                 mock_user
             )
 
@@ -106,7 +109,10 @@ def test_get_optional_user_valid(
             mock_verify.assert_called_once_with(
                 "valid_token"
             )
-            mock_repo.return_value.get_by_id.assert_called_once_with(
+            get_principal = (
+                mock_repo.return_value.get_cached_principal
+            )
+            get_principal.assert_called_once_with(
                 "test_user_id"
             )
 
@@ -171,8 +177,11 @@ def test_get_optional_user_db_error(
             "dependencies.UserRepository"
         ) as mock_repo:
             mock_verify.return_value = "test_user_id"
-            mock_repo.return_value.get_by_id.side_effect = (
-                Exception("DB error")
+            get_principal = (
+                mock_repo.return_value.get_cached_principal
+            )
+            get_principal.side_effect = Exception(
+                "DB error"
             )
 
             user = get_optional_user(
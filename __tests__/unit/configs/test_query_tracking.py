@@ -0,0 +1,105 @@
+"""Unit tests for per-request SQL tracking."""
+
+from configs.QueryTracking import (
+    OVERFLOW_ROUTE,
+    QueryTracker,
+    fingerprint_statement,
+)
+
+
+def test_fingerprint_normalizes_values():
+    """Test statements differing only by values share a shape."""
+    a = fingerprint_statement(
+        "SELECT * FROM moments WHERE id = 1 AND name = 'x'"
+    )
+    b = fingerprint_statement(
+        "SELECT *  FROM moments\nWHERE id = 42 AND name = 'y'"
+    )
+    assert (
+        a
+        == b
+        == (
+            "SELECT * FROM moments WHERE id = ? AND name = ?"
+        )
+    )
+
+
+def test_fingerprint_collapses_parameter_lists():
+    """Test IN lists of any length collapse to one shape."""
+    assert fingerprint_statement(
+        "SELECT * FROM tasks WHERE id IN (%(id_1)s, %(id_2)s)"
+    ) == fingerprint_statement(
+        "SELECT * FROM tasks WHERE id IN (%(id_1)s)"
+    )
+
+
+def test_request_budget_is_tracked():
+    """Test queries are counted against the current request."""
+    tracker = QueryTracker()
+    token = tracker.start_request("/v1/moments/1")
+    tracker.record_query("SELECT 1", 0.002)
+    tracker.record_query("SELECT 2", 0.003)
+    stats = tracker.finish_request(
+        token, "/v1/moments/{id}"
+    )
+
+    assert stats.query_count == 2
+    assert stats.db_time_ms == 5.0
+    routes = tracker.snapshot()["routes"]
+    assert routes["/v1/moments/{id}"]["requests"] == 1
+    assert routes["/v1/moments/{id}"]["queries"] == 2
+
+
+def test_queries_outside_requests_are_ignored():
+    """Test fast background queries are not attributed."""
+    tracker = QueryTracker()
+    tracker.record_query("SELECT 1", 0.001)
+    assert tracker.snapshot()["routes"] == {}
+
+
+def test_n_plus_one_detection(caplog):
+    """Test repeated statement shapes are flagged."""
+    tracker = QueryTracker(n_plus_one_threshold=3)
+    token = tracker.start_request("/v1/notes")
+    for note_id in range(5):
+        tracker.record_query(
+            f"SELECT * FROM tasks WHERE note_id = {note_id}",
+            0.001,
+        )
+    stats = tracker.finish_request(token)
+
+    assert stats.repeated_shapes(3) == {
+        "SELECT * FROM tasks WHERE note_id = ?": 5
+    }
+    assert "Possible N+1 query" in caplog.text
+    routes = tracker.snapshot()["routes"]
+    assert routes["/v1/notes"]["n_plus_one_requests"] == 1
+
+
+def test_slow_queries_are_aggregated(caplog):
+    """Test slow statements are logged and grouped by route."""
+    tracker = QueryTracker(slow_query_threshold_ms=100)
+    token = tracker.start_request("/v1/tasks/7")
+    tracker.record_query("SELECT * FROM tasks", 0.25)
+    tracker.record_query("SELECT * FROM tasks", 0.15)
+    tracker.finish_request(token, "/v1/tasks/{task_id}")
+
+    assert "Slow query" in caplog.text
+    [entry] = tracker.snapshot()["slow_queries"]
+    assert entry["route"] == "/v1/tasks/{task_id}"
+    assert entry["fingerprint"] == "SELECT * FROM tasks"
+    assert entry["count"] == 2
+    assert entry["max_ms"] == 250.0
+
+
+def test_route_table_is_capped():
+    """Test routes beyond the cap share one overflow entry."""
+    tracker = QueryTracker()
+    tracker.MAX_ROUTE_ENTRIES = 2
+    for route in ["/a", "/b", "/c", "/d"]:
+        token = tracker.start_request(route)
+        tracker.finish_request(token)
+
+    routes = tracker.snapshot()["routes"]
+    assert set(routes) == {"/a", "/b", OVERFLOW_ROUTE}
+    assert routes[OVERFLOW_ROUTE]["requests"] == 2
@@ -0,0 +1,115 @@
+"""Unit tests for the list total count cache."""
+
+import pytest
+from unittest.mock import MagicMock
+from fakeredis import FakeStrictRedis
+from redis.exceptions import RedisError
+
+from infrastructure.cache.count_cache import CountCache
+
+
+@pytest.fixture
+def redis_client():
+    """Create an in-memory Redis client."""
+    return FakeStrictRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    """Create a count cache backed by fake Redis."""
+    return CountCache(redis=redis_client, ttl_seconds=30)
+
+
+def test_get_or_count_caches_total(cache):
+    """Test a second lookup is served from the cache."""
+    count = MagicMock(return_value=42)
+
+    first = cache.get_or_count(
+        "moments", "user1", {}, count
+    )
+    second = cache.get_or_count(
+        "moments", "user1", {}, count
+    )
+
+    assert first == second == 42
+    count.assert_called_once()
+
+
+def test_get_or_count_keys_by_filters(cache):
+    """Test different filters are cached separately."""
+    count = MagicMock(side_effect=[3, 7])
+
+    a = cache.get_or_count(
+        "moments", "user1", {"activity_id": 1}, count
+    )
+    b = cache.get_or_count(
+        "moments", "user1", {"activity_id": 2}, count
+    )
+
+    assert (a, b) == (3, 7)
+    assert count.call_count == 2
+
+
+def test_get_or_count_sets_ttl(cache, redis_client):
+    """Test cached totals expire."""
+    cache.get_or_count("moments", "user1", {}, lambda: 5)
+
+    keys = [
+        k
+        for k in redis_client.keys("count:moments:user1:*")
+        if not k.endswith(b":version")
+    ]
+    assert len(keys) == 1
+    assert 0 < redis_client.ttl(keys[0]) <= 30
+
+
+def test_invalidate_forces_recount(cache):
+    """Test invalidation drops every cached total for a user."""
+    count = MagicMock(side_effect=[1, 2])
+
+    cache.get_or_count("moments", "user1", {}, count)
+    cache.invalidate("moments", "user1")
+    total = cache.get_or_count(
+        "moments", "user1", {}, count
+    )
+
+    assert total == 2
+    assert count.call_count == 2
+
+
+def test_invalidate_is_scoped_to_user(cache):
+    """Test invalidating one user keeps others cached."""
+    count = MagicMock(return_value=9)
+
+    cache.get_or_count("moments", "user2", {}, count)
+    cache.invalidate("moments", "user1")
+    cache.get_or_count("moments", "user2", {}, count)
+
+    count.assert_called_once()
+
+
+def test_get_or_count_without_user_skips_cache(cache):
+    """Test totals across all users are never cached."""
+    count = MagicMock(return_value=4)
+
+    cache.get_or_count("moments", None, {}, count)
+    cache.get_or_count("moments", None, {}, count)
+
+    assert count.call_count == 2
+
+
+def test_get_or_count_falls_back_on_redis_error():
+    """Test Redis failures fall back to counting directly."""
+    client = MagicMock()
+    client.get.side_effect = RedisError("down")
+    cache = CountCache(redis=client)
+    count = MagicMock(return_value=11)
+
+    assert (
+        cache.get_or_count("moments", "u", {}, count) == 11
+    )
+    # Cache stays disabled during the cool-down
+    assert (
+        cache.get_or_count("moments", "u", {}, count) == 11
+    )
+    assert client.get.call_count == 1
@@ -0,0 +1,162 @@
+"""Unit tests for the per-user entity cache."""
+
+import pytest
+from unittest.mock import MagicMock
+from fakeredis import FakeStrictRedis
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from infrastructure.cache.entity_cache import EntityCache
+
+
+class Item(BaseModel):
+    """Cached stand-in entity."""
+
+    id: int
+    name: str
+
+
+@pytest.fixture
+def redis_client():
+    """Create an in-memory Redis client."""
+    return FakeStrictRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    """Create an entity cache without the in-process tier."""
+    return EntityCache(
+        redis=redis_client,
+        ttl_seconds=30,
+        local_ttl_seconds=0,
+    )
+
+
+def test_get_or_load_caches_entity(cache):
+    """Test a second lookup is served from the cache."""
+    load = MagicMock(return_value=Item(id=1, name="a"))
+
+    first = cache.get_or_load(
+        "items", "user1", 1, Item, load
+    )
+    second = cache.get_or_load(
+        "items", "user1", 1, Item, load
+    )
+
+    assert first == second == Item(id=1, name="a")
+    load.assert_called_once()
+
+
+def test_get_or_load_sets_ttl(cache, redis_client):
+    """Test cached entities expire from Redis."""
+    cache.get_or_load(
+        "items",
+        "user1",
+        1,
+        Item,
+        lambda: Item(id=1, name="a"),
+    )
+
+    keys = [
+        k
+        for k in redis_client.keys("entity:items:user1:*")
+        if not k.endswith(b":version")
+    ]
+    assert len(keys) == 1
+    assert 0 < redis_client.ttl(keys[0]) <= 30
+
+
+def test_missing_entity_is_not_cached(cache):
+    """Test not-found results are loaded again."""
+    load = MagicMock(return_value=None)
+
+    assert (
+        cache.get_or_load("items", "u", 1, Item, load)
+        is None
+    )
+    assert (
+        cache.get_or_load("items", "u", 1, Item, load)
+        is None
+    )
+    assert load.call_count == 2
+
+
+def test_invalidate_forces_reload(cache):
+    """Test invalidation drops every cached entity for a user."""
+    load = MagicMock(
+        side_effect=[
+            Item(id=1, name="a"),
+            Item(id=1, name="b"),
+        ]
+    )
+
+    cache.get_or_load("items", "user1", 1, Item, load)
+    cache.invalidate("items", "user1")
+    item = cache.get_or_load(
+        "items", "user1", 1, Item, load
+    )
+
+    assert item.name == "b"
+
+
+def test_invalidate_is_scoped_to_user(cache):
+    """Test invalidating one user keeps others cached."""
+    load = MagicMock(return_value=Item(id=1, name="a"))
+
+    cache.get_or_load("items", "user2", 1, Item, load)
+    cache.invalidate("items", "user1")
+    cache.get_or_load("items", "user2", 1, Item, load)
+
+    load.assert_called_once()
+
+
+def test_local_tier_serves_without_redis(redis_client):
+    """Test the in-process tier answers repeated reads."""
+    cache = EntityCache(redis=redis_client)
+    load = MagicMock(return_value=Item(id=1, name="a"))
+    cache.get_or_load("items", "u", 1, Item, load)
+    redis_client.flushall()
+
+    assert cache.get_or_load(
+        "items", "u", 1, Item, load
+    ) == Item(id=1, name="a")
+    load.assert_called_once()
+
+
+def test_invalidate_clears_local_tier(redis_client):
+    """Test invalidation also drops in-process entries."""
+    cache = EntityCache(redis=redis_client)
+    load = MagicMock(
+        side_effect=[
+            Item(id=1, name="a"),
+            Item(id=1, name="b"),
+        ]
+    )
+
+    cache.get_or_load("items", "u", 1, Item, load)
+    cache.invalidate("items", "u")
+
+    assert (
+        cache.get_or_load("items", "u", 1, Item, load).name
+        == "b"
+    )
+
+
+def test_get_or_load_falls_back_on_redis_error():
+    """Test Redis failures fall back to loading directly."""
+    client = MagicMock()
+    client.get.side_effect = RedisError("down")
+    cache = EntityCache(redis=client, local_ttl_seconds=0)
+    load = MagicMock(return_value=Item(id=1, name="a"))
+
+    assert (
+        cache.get_or_load("items", "u", 1, Item, load).id
+        == 1
+    )
+    # Cache stays disabled during the cool-down
+    assert (
+        cache.get_or_load("items", "u", 1, Item, load).id
+        == 1
+    )
+    assert client.get.call_count == 1
+    assert load.call_count == 2
@@ -0,0 +1,94 @@
+"""Unit tests for the compiled schema validator cache."""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+
+from infrastructure.cache.schema_validator_cache import (
+    SchemaValidatorCache,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"note": {"type": "string"}},
+    "required": ["note"],
+}
+
+
+def make_activity(
+    activity_id=1, schema=SCHEMA, updated_at=None
+):
+    """Create a stand-in activity with a schema."""
+    return SimpleNamespace(
+        id=activity_id,
+        activity_schema_dict=schema,
+        updated_at=updated_at,
+    )
+
+
+@pytest.fixture
+def cache():
+    """Create an empty validator cache."""
+    return SchemaValidatorCache(max_entries=2)
+
+
+def test_get_validator_reuses_compiled_validator(cache):
+    """Test the same activity version gets the same validator."""
+    activity = make_activity()
+
+    assert cache.get_validator(
+        activity
+    ) is cache.get_validator(activity)
+
+
+def test_get_validator_recompiles_after_update(cache):
+    """Test a newer updated_at compiles a new validator."""
+    first = cache.get_validator(make_activity())
+    second = cache.get_validator(
+        make_activity(updated_at=datetime(2025, 1, 1))
+    )
+
+    assert first is not second
+
+
+def test_invalidate_drops_validator(cache):
+    """Test invalidation forces a recompile."""
+    activity = make_activity()
+    first = cache.get_validator(activity)
+
+    cache.invalidate(activity.id)
+
+    assert cache.get_validator(activity) is not first
+
+
+def test_evicts_least_recently_used(cache):
+    """Test the cache stays within max_entries."""
+    first = make_activity(1)
+    cache.get_validator(first)
+    cache.get_validator(make_activity(2))
+    cache.get_validator(first)
+    cache.get_validator(make_activity(3))
+
+    assert set(cache._validators) == {1, 3}
+
+
+def test_validate_rejects_invalid_data(cache):
+    """Test data not matching the schema raises ValueError."""
+    activity = make_activity()
+
+    cache.validate(activity, {"note": "ok"})
+    with pytest.raises(
+        ValueError, match="Invalid moment data"
+    ):
+        cache.validate(activity, {"note": 1})
+
+
+def test_invalid_schema_raises_value_error(cache):
+    """Test an invalid schema is reported and not cached."""
+    activity = make_activity(schema={"type": "nope"})
+
+    with pytest.raises(
+        ValueError, match="Invalid activity schema"
+    ):
+        cache.get_validator(activity)
+    assert activity.id not in cache._validators
@@ -0,0 +1,68 @@
+"""Unit tests for the verified API key cache."""
+
+import pytest
+from unittest.mock import MagicMock
+from fakeredis import FakeStrictRedis
+from redis.exceptions import RedisError
+
+from infrastructure.cache.verified_key_cache import (
+    VerifiedKeyCache,
+)
+
+
+@pytest.fixture
+def redis_client():
+    """Create an in-memory Redis client."""
+    return FakeStrictRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    """Create a verified key cache backed by fake Redis."""
+    return VerifiedKeyCache(
+        redis=redis_client, ttl_seconds=30, secret="test"
+    )
+
+
+def test_remember_and_get_user_id(cache):
+    """Test a remembered key maps to its user."""
+    cache.remember("key.secret", "user1")
+
+    assert cache.get_user_id("key.secret") == "user1"
+    assert cache.get_user_id("key.other") is None
+
+
+def test_stores_digest_with_ttl(cache, redis_client):
+    """Test the raw key never reaches Redis and entries expire."""
+    cache.remember("key.secret", "user1")
+
+    keys = redis_client.keys("verified_key:*")
+    assert len(keys) == 1
+    assert b"secret" not in keys[0]
+    assert 0 < redis_client.ttl(keys[0]) <= 30
+
+
+def test_digest_depends_on_server_secret(redis_client):
+    """Test entries are unusable under a different secret."""
+    VerifiedKeyCache(
+        redis=redis_client, secret="one"
+    ).remember("key.secret", "user1")
+
+    assert (
+        VerifiedKeyCache(
+            redis=redis_client, secret="two"
+        ).get_user_id("key.secret")
+        is None
+    )
+
+
+def test_get_user_id_falls_back_on_redis_error():
+    """Test Redis failures read as a cache miss."""
+    client = MagicMock()
+    client.get.side_effect = RedisError("down")
+    cache = VerifiedKeyCache(redis=client)
+
+    assert cache.get_user_id("key.secret") is None
+    # Cache stays disabled during the cool-down
+    cache.remember("key.secret", "user1")
+    client.set.assert_not_called()
@@ -1,11 +1,16 @@
 """Test activity worker module."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from fakeredis import FakeStrictRedis
+from rq import Queue
+from rq.registry import ScheduledJobRegistry
 from domain.exceptions import RoboServiceError
 from domain.values import ProcessingStatus
 from infrastructure.queue.activity_worker import (
     process_activity_job,
+    reconcile_moment_counts_job,
+    schedule_moment_count_reconcile,
 )
 
 
@@ -166,3 +171,66 @@ def test_process_activity_job_retries(
         mock_activity.processing_status
         == ProcessingStatus.COMPLETED
     )
+
+
+def test_schedule_reconcile_once_per_pending_run():
+    """Test starting workers don't stack reconcile schedules."""
+    queue = Queue(
+        "activity_schema", connection=FakeStrictRedis()
+    )
+    registry = ScheduledJobRegistry(queue=queue)
+
+    assert (
+        schedule_moment_count_reconcile(queue, 60) is True
+    )
+    assert (
+        schedule_moment_count_reconcile(queue, 60) is False
+    )
+    assert registry.count == 1
+
+    # The running job always schedules its successor
+    assert (
+        schedule_moment_count_reconcile(
+            queue, 60, replace=True
+        )
+        is True
+    )
+    assert registry.count == 2
+
+
+def test_schedule_reconcile_disabled():
+    """Test an interval of 0 disables the schedule."""
+    queue = MagicMock()
+
+    assert (
+        schedule_moment_count_reconcile(queue, 0) is False
+    )
+    queue.enqueue_in.assert_not_called()
+
+
+def test_reconcile_job_schedules_next_run(mock_session):
+    """Test a reconcile job run by RQ schedules the next one."""
+    with patch(
+        "infrastructure.queue.activity_worker.ActivityRepository"
+    ) as mock_repo, patch(
+        "infrastructure.queue.activity_worker.get_job"
+    ) as mock_get_job, patch(
+        "infrastructure.queue.activity_worker.schedule_moment_count_reconcile"
+    ) as mock_schedule:
+        mock_repo.return_value.reconcile_moment_counts.return_value = (
+            2
+        )
+        mock_get_job.return_value.origin = "activity_schema"
+
+        assert (
+            reconcile_moment_counts_job(
+                session=mock_session
+            )
+            == 2
+        )
+
+    assert (
+        mock_repo.call_args.kwargs["entity_cache"]
+        is not None
+    )
+    assert mock_schedule.call_args.kwargs["replace"] is True
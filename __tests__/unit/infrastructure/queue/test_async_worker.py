@@ -0,0 +1,113 @@
+"""Tests for the async worker."""
+
+import time
+
+import anyio
+import pytest
+from fakeredis import FakeStrictRedis
+from rq import Queue
+from rq.job import JobStatus
+
+from infrastructure.queue import async_worker
+from infrastructure.queue.async_worker import AsyncWorker
+
+
+@pytest.fixture
+def redis_conn():
+    """Create an in-memory Redis connection."""
+    return FakeStrictRedis()
+
+
+@pytest.fixture
+def queues(redis_conn):
+    """Create the queues the worker listens on."""
+    return [
+        Queue("note_enrichment", connection=redis_conn),
+        Queue("task_enrichment", connection=redis_conn),
+    ]
+
+
+@pytest.fixture(autouse=True)
+def short_dequeue_timeout(monkeypatch):
+    """Make idle dequeues return quickly."""
+    monkeypatch.setattr(async_worker, "DEQUEUE_TIMEOUT", 1)
+
+
+def run_for(worker: AsyncWorker, seconds: float) -> None:
+    """Run a worker until the given time has passed."""
+
+    async def main():
+        with anyio.move_on_after(seconds):
+            await worker._work(with_scheduler=False)
+
+    anyio.run(main)
+
+
+def test_runs_jobs_concurrently(redis_conn, queues):
+    """Test jobs from all queues run at the same time."""
+    jobs = [
+        queues[i % 2].enqueue(time.sleep, 1)
+        for i in range(4)
+    ]
+    worker = AsyncWorker(
+        queues, connection=redis_conn, max_in_flight=4
+    )
+
+    run_for(worker, 1.8)
+
+    assert all(
+        job.get_status(refresh=True) == JobStatus.FINISHED
+        for job in jobs
+    )
+
+
+def test_limits_jobs_in_flight(redis_conn, queues):
+    """Test no more than max_in_flight jobs run at once."""
+    jobs = [
+        queues[0].enqueue(time.sleep, 0.5) for _ in range(4)
+    ]
+    worker = AsyncWorker(
+        queues, connection=redis_conn, max_in_flight=2
+    )
+
+    run_for(worker, 1.5)
+
+    for job in jobs:
+        job.refresh()
+    for job in jobs:
+        running = [
+            other
+            for other in jobs
+            if other.started_at <= job.started_at
+            and other.ended_at > job.started_at
+        ]
+        assert len(running) <= 2
+
+
+def test_failed_job_frees_slot(redis_conn, queues):
+    """Test a failing job is marked failed and its slot reused."""
+    failing = queues[0].enqueue("math.sqrt", "not a number")
+    succeeding = queues[0].enqueue(time.sleep, 0)
+    worker = AsyncWorker(
+        queues, connection=redis_conn, max_in_flight=1
+    )
+
+    run_for(worker, 1)
+
+    assert (
+        failing.get_status(refresh=True) == JobStatus.FAILED
+    )
+    assert (
+        succeeding.get_status(refresh=True)
+        == JobStatus.FINISHED
+    )
+
+
+def test_rejects_invalid_in_flight_limit(
+    redis_conn, queues
+):
+    """Test at least one job must be allowed in flight."""
+    with pytest.raises(ValueError):
+        AsyncWorker(
+            queues, connection=redis_conn, max_in_flight=0
+        )
@@ -0,0 +1,106 @@
+"""Test RQ job retry scheduling."""
+
+from unittest.mock import MagicMock, patch
+
+from domain.exceptions import RoboAPIError
+from infrastructure.queue.job_retry import (
+    current_attempt,
+    reschedules_retries,
+    schedule_retry,
+)
+from utils.retry import with_retry
+
+
+def sample_job(item_id: int) -> None:
+    """Job function used as the running job."""
+
+
+def other_job(item_id: int) -> None:
+    """Job function called inline from the running job."""
+
+
+def make_job(meta=None):
+    """Create a fake RQ job running sample_job."""
+    job = MagicMock()
+    job.id = "job-1"
+    job.func_name = f"{__name__}.sample_job"
+    job.args = (7,)
+    job.kwargs = {}
+    job.origin = "note_enrichment"
+    job.timeout = 600
+    job.result_ttl = 86400
+    job.meta = meta if meta is not None else {"note_id": 7}
+    return job
+
+
+@patch("infrastructure.queue.job_retry.get_current_job")
+def test_current_attempt(mock_get_current_job):
+    """Test the attempt count is read from the job's meta."""
+    mock_get_current_job.return_value = make_job(
+        {"attempt": 2}
+    )
+
+    assert current_attempt(sample_job) == 2
+    # A job function called inline doesn't own the running job
+    assert current_attempt(other_job) == 0
+
+
+@patch("infrastructure.queue.job_retry.Queue")
+@patch("infrastructure.queue.job_retry.get_current_job")
+def test_schedule_retry(
+    mock_get_current_job, mock_queue_class
+):
+    """Test a retry re-enqueues the job with a delay."""
+    job = make_job()
+    mock_get_current_job.return_value = job
+    queue = mock_queue_class.return_value
+    queue.enqueue_in.return_value.id = "job-2"
+
+    assert schedule_retry(sample_job, 0, 2.0) is True
+
+    mock_queue_class.assert_called_once_with(
+        "note_enrichment", connection=job.connection
+    )
+    delay, func = queue.enqueue_in.call_args.args
+    kwargs = queue.enqueue_in.call_args.kwargs
+    assert delay.total_seconds() == 2.0
+    assert func is job.func
+    assert kwargs["args"] == (7,)
+    assert kwargs["meta"] == {"note_id": 7, "attempt": 1}
+    assert job.meta["retried_as"] == "job-2"
+    job.save_meta.assert_called_once()
+
+
+@patch("infrastructure.queue.job_retry.get_current_job")
+def test_schedule_retry_outside_job(mock_get_current_job):
+    """Test callers retry inline when not running as a job."""
+    mock_get_current_job.return_value = None
+
+    assert schedule_retry(sample_job, 0, 2.0) is False
+
+
+@patch("utils.retry.time.sleep")
+@patch("infrastructure.queue.job_retry.get_current_job")
+def test_reschedules_retries_defers_with_retry(
+    mock_get_current_job, mock_sleep
+):
+    """Test LLM calls fail fast inside a rescheduling job."""
+    mock_get_current_job.return_value = make_job()
+    calls = []
+
+    @with_retry(max_retries=3)
+    def call_llm():
+        calls.append(1)
+        raise RoboAPIError("temporary failure")
+
+    @reschedules_retries
+    def sample_job(item_id: int) -> None:
+        call_llm()
+
+    try:
+        sample_job(7)
+    except RoboAPIError:
+        pass
+
+    assert len(calls) == 1
+    mock_sleep.assert_not_called()
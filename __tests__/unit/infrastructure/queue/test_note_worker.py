@@ -4,8 +4,9 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 
+from domain.exceptions import RoboAPIError
 from domain.values import ProcessingStatus
-from domain.robo import RoboProcessingResult
+from domain.robo import RoboNoteResult, RoboProcessingResult
 from infrastructure.queue.note_worker import (
     process_note_job,
 )
@@ -82,6 +83,7 @@ def mock_robo_service():
     service.config.note_enrichment_prompt = (
         "Format this note"
     )
+    service.config.combined_note_processing = False
 
     return service
 
@@ -89,9 +91,9 @@ def mock_robo_service():
 @patch("infrastructure.queue.note_worker.NoteRepository")
 @patch("infrastructure.queue.note_worker.get_robo_service")
 @patch("infrastructure.queue.note_worker.SessionLocal")
-@patch("infrastructure.queue.note_worker.create_task")
+@patch("infrastructure.queue.note_worker.create_tasks")
 def test_process_note_success(
-    mock_create_task,
+    mock_create_tasks,
     mock_session_local,
     mock_get_robo_service,
     mock_note_repo_class,
@@ -106,7 +108,7 @@ def test_process_note_success(
     mock_note_repo_class.return_value = mock_note_repo
     mock_get_robo_service.return_value = mock_robo_service
     mock_note_repo.get_by_id.return_value = mock_note
-    mock_create_task.side_effect = [1, 2]  # Return task IDs
+    mock_create_tasks.return_value = [1, 2]  # Task IDs
 
     # Execute
     process_note_job(
@@ -128,26 +130,14 @@ def test_process_note_success(
         mock_note.content
     )
 
-    # Verify task creation was called
-    assert mock_create_task.call_count == 2
-    mock_create_task.assert_any_call(
-        content="Task 1",
+    # Verify tasks were created together, to be enriched
+    # inline since the job isn't running in a worker
+    mock_create_tasks.assert_called_once_with(
+        mock_robo_service.extract_tasks.return_value,
         user_id=mock_note.user_id,
         source_note_id=1,
-        priority="high",
-        status="todo",
-        due_date=None,
-        session=mock_session,
-        max_retries=3,
-    )
-    mock_create_task.assert_any_call(
-        content="Task 2",
-        user_id=mock_note.user_id,
-        source_note_id=1,
-        priority="medium",
-        status="todo",
-        due_date=None,
         session=mock_session,
+        queue=None,
         max_retries=3,
     )
 
@@ -197,9 +187,11 @@ def test_process_note_success(
 @patch("infrastructure.queue.note_worker.NoteRepository")
 @patch("infrastructure.queue.note_worker.get_robo_service")
 @patch("infrastructure.queue.note_worker.SessionLocal")
-@patch("infrastructure.queue.note_worker.create_task")
+@patch("infrastructure.queue.note_worker.get_job")
+@patch("infrastructure.queue.note_worker.create_tasks")
 def test_process_note_with_tasks(
-    mock_create_task,
+    mock_create_tasks,
+    mock_get_job,
     mock_session_local,
     mock_get_robo_service,
     mock_note_repo_class,
@@ -208,13 +200,13 @@ def test_process_note_with_tasks(
     mock_note,
     mock_robo_service,
 ):
-    """Test note processing with task extraction."""
+    """Test extracted tasks are enqueued when running as a job."""
     # Setup
     mock_session_local.return_value = mock_session
     mock_note_repo_class.return_value = mock_note_repo
     mock_get_robo_service.return_value = mock_robo_service
     mock_note_repo.get_by_id.return_value = mock_note
-    mock_create_task.side_effect = [1, 2]  # Return task IDs
+    mock_create_tasks.return_value = [1, 2]  # Task IDs
 
     # Execute
     process_note_job(
@@ -224,27 +216,13 @@ def test_process_note_with_tasks(
         note_repository=mock_note_repo,
     )
 
-    # Verify task creation
-    assert mock_create_task.call_count == 2
-    mock_create_task.assert_any_call(
-        content="Task 1",
-        user_id=mock_note.user_id,
-        source_note_id=1,
-        priority="high",
-        status="todo",
-        due_date=None,
-        session=mock_session,
-        max_retries=3,
-    )
-    mock_create_task.assert_any_call(
-        content="Task 2",
-        user_id=mock_note.user_id,
-        source_note_id=1,
-        priority="medium",
-        status="todo",
-        due_date=None,
-        session=mock_session,
-        max_retries=3,
+    # Verify tasks go to the task queue on the job's connection
+    mock_create_tasks.assert_called_once()
+    queue = mock_create_tasks.call_args.kwargs["queue"]
+    assert queue.name == "task_enrichment"
+    assert (
+        queue.connection
+        is mock_get_job.return_value.connection
     )
 
     # Verify task stats
@@ -265,9 +243,111 @@ def test_process_note_with_tasks(
 @patch("infrastructure.queue.note_worker.NoteRepository")
 @patch("infrastructure.queue.note_worker.get_robo_service")
 @patch("infrastructure.queue.note_worker.SessionLocal")
-@patch("infrastructure.queue.note_worker.create_task")
+@patch("infrastructure.queue.note_worker.create_tasks")
+def test_process_note_combined_call(
+    mock_create_tasks,
+    mock_session_local,
+    mock_get_robo_service,
+    mock_note_repo_class,
+    mock_session,
+    mock_note_repo,
+    mock_note,
+    mock_robo_service,
+):
+    """Test combined mode extracts tasks in the enrichment call."""
+    # Setup
+    mock_session_local.return_value = mock_session
+    mock_note_repo_class.return_value = mock_note_repo
+    mock_get_robo_service.return_value = mock_robo_service
+    mock_note_repo.get_by_id.return_value = mock_note
+    mock_create_tasks.return_value = [1]
+    mock_robo_service.config.combined_note_processing = True
+    tasks = [{"content": "Task 1", "priority": "high"}]
+    mock_robo_service.process_note_with_tasks.return_value = RoboNoteResult(
+        note=mock_robo_service.process_note.return_value,
+        tasks=tasks,
+    )
+
+    # Execute
+    process_note_job(
+        note_id=1,
+        session=mock_session,
+        robo_service=mock_robo_service,
+        note_repository=mock_note_repo,
+    )
+
+    # Verify one call both enriched the note and found its tasks
+    mock_robo_service.process_note_with_tasks.assert_called_once()
+    mock_robo_service.process_note.assert_not_called()
+    mock_robo_service.extract_tasks.assert_not_called()
+    assert mock_create_tasks.call_args.args[0] == tasks
+    assert mock_note.enrichment_data["title"] == "Test Note"
+    assert (
+        mock_note.enrichment_data["task_extraction_stats"][
+            "tasks_found"
+        ]
+        == 1
+    )
+
+
+@pytest.mark.parametrize("combined_fails", [True, False])
+@patch("infrastructure.queue.note_worker.create_tasks")
+def test_process_note_combined_call_fallback(
+    mock_create_tasks,
+    combined_fails,
+    mock_session,
+    mock_note_repo,
+    mock_note,
+    mock_robo_service,
+):
+    """Test unusable combined results fall back to separate calls."""
+    mock_note_repo.get_by_id.return_value = mock_note
+    mock_create_tasks.return_value = [1, 2]
+    mock_robo_service.config.combined_note_processing = True
+    combined_call = (
+        mock_robo_service.process_note_with_tasks
+    )
+    if combined_fails:
+        combined_call.side_effect = RoboAPIError(
+            "Truncated response"
+        )
+    else:
+        combined_call.return_value = RoboNoteResult(
+            note=mock_robo_service.process_note.return_value,
+            tasks=None,
+        )
+
+    process_note_job(
+        note_id=1,
+        session=mock_session,
+        robo_service=mock_robo_service,
+        note_repository=mock_note_repo,
+    )
+
+    # The note is enriched either way and tasks extracted alone
+    assert mock_robo_service.process_note.call_count == int(
+        combined_fails
+    )
+    mock_robo_service.extract_tasks.assert_called_once()
+    assert (
+        mock_note.processing_status
+        == ProcessingStatus.COMPLETED
+    )
+    assert mock_note.enrichment_data["title"] == "Test Note"
+    assert (
+        mock_note.enrichment_data["task_extraction_stats"][
+            "tasks_found"
+        ]
+        == 2
+    )
+
+
+@patch("infrastructure.queue.note_worker.NoteRepository")
+@patch("infrastructure.queue.note_worker.get_robo_service")
+@patch("infrastructure.queue.note_worker.SessionLocal")
+@patch("infrastructure.queue.note_worker.create_tasks")
 def test_process_note_task_extraction_failure(
-    mock_create_task,
+    mock_create_tasks,
     mock_session_local,
     mock_get_robo_service,
     mock_note_repo_class,
@@ -321,3 +401,51 @@ def test_process_note_task_extraction_failure(
         ]
         == 0
     )
+
+
+@patch("infrastructure.queue.note_worker.time.sleep")
+@patch("infrastructure.queue.job_retry.Queue")
+@patch("infrastructure.queue.job_retry.get_current_job")
+def test_process_note_failure_reschedules_job(
+    mock_get_current_job,
+    mock_queue_class,
+    mock_sleep,
+    mock_session,
+    mock_note_repo,
+    mock_note,
+    mock_robo_service,
+):
+    """Test a failed attempt re-enqueues the job instead of sleeping."""
+    job = MagicMock()
+    job.func_name = (
+        "infrastructure.queue.note_worker.process_note_job"
+    )
+    job.args = (1,)
+    job.kwargs = {}
+    job.meta = {"note_id": 1, "attempt": 1}
+    mock_get_current_job.return_value = job
+    mock_note_repo.get_by_id.return_value = mock_note
+    mock_robo_service.process_note.side_effect = Exception(
+        "API unavailable"
+    )
+
+    process_note_job(
+        note_id=1,
+        session=mock_session,
+        robo_service=mock_robo_service,
+        note_repository=mock_note_repo,
+    )
+
+    # One attempt in this run, the next one scheduled on the queue
+    mock_robo_service.process_note.assert_called_once()
+    mock_sleep.assert_not_called()
+    enqueue_in = mock_queue_class.return_value.enqueue_in
+    enqueue_in.assert_called_once()
+    assert (
+        enqueue_in.call_args.kwargs["meta"]["attempt"] == 2
+    )
+    mock_robo_service.extract_tasks.assert_not_called()
+    assert (
+        mock_note.processing_status
+        == ProcessingStatus.PROCESSING
+    )
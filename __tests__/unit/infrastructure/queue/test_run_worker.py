@@ -91,3 +91,45 @@ def test_worker_graceful_shutdown():
             run_worker()
         assert exc_info.value.code == 0
         assert mock_worker_instance.work.call_count == 1
+
+
+def test_worker_async_mode():
+    """Test async mode runs jobs on an AsyncWorker."""
+    with patch(
+        "infrastructure.queue.run_worker.get_redis_connection"
+    ) as mock_get_conn, patch(
+        "infrastructure.queue.run_worker.Queue"
+    ), patch(
+        "infrastructure.queue.run_worker.get_environment_variables"
+    ) as mock_env, patch(
+        "infrastructure.queue.run_worker.AsyncWorker"
+    ) as mock_async_worker, patch(
+        "infrastructure.queue.run_worker.Worker"
+    ) as mock_worker:
+        mock_env.return_value = Mock(
+            WORKER_MODE="async",
+            WORKER_MAX_IN_FLIGHT=16,
+            MOMENT_COUNT_RECONCILE_INTERVAL_SECONDS=0,
+        )
+        mock_async_worker.return_value.work.side_effect = (
+            KeyboardInterrupt()
+        )
+
+        with pytest.raises(SystemExit) as exc_info:
+            run_worker()
+
+        assert exc_info.value.code == 0
+        mock_worker.assert_not_called()
+        assert (
+            mock_async_worker.call_args.kwargs["connection"]
+            == mock_get_conn.return_value
+        )
+        assert (
+            mock_async_worker.call_args.kwargs[
+                "max_in_flight"
+            ]
+            == 16
+        )
+        mock_async_worker.return_value.work.assert_called_once_with(
+            with_scheduler=True
+        )
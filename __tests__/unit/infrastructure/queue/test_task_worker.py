@@ -4,11 +4,19 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 
-from domain.values import ProcessingStatus
+from fakeredis import FakeStrictRedis
+from rq import Queue
+
+from domain.values import (
+    ProcessingStatus,
+    TaskPriority,
+    TaskStatus,
+)
 from domain.robo import RoboProcessingResult
 from domain.exceptions import RoboServiceError
 from infrastructure.queue.task_worker import (
     create_task,
+    create_tasks,
     process_task_job,
 )
 
@@ -105,6 +113,84 @@ def test_create_task_success(
     )
 
 
+@patch("infrastructure.queue.task_worker.TaskRepository")
+def test_create_tasks_enqueues_enrichment(
+    mock_task_repo_class,
+    mock_session,
+    mock_task_repo,
+):
+    """Test tasks are inserted together and enriched as jobs."""
+    mock_task_repo_class.return_value = mock_task_repo
+    mock_task_repo.bulk_create.return_value = [1, 2]
+    queue = Queue(
+        "task_enrichment", connection=FakeStrictRedis()
+    )
+
+    task_ids = create_tasks(
+        [
+            {"content": "Task 1", "priority": "high"},
+            {"content": "Task 2", "status": "in_progress"},
+            {"content": "Task 3", "priority": "someday"},
+        ],
+        user_id=123,
+        source_note_id=7,
+        session=mock_session,
+        queue=queue,
+    )
+
+    # The task with an unknown priority is skipped
+    assert task_ids == [1, 2]
+    rows = mock_task_repo.bulk_create.call_args[0][0]
+    assert [row["content"] for row in rows] == [
+        "Task 1",
+        "Task 2",
+    ]
+    assert rows[0]["priority"] == TaskPriority.HIGH
+    assert rows[0]["status"] == TaskStatus.TODO
+    assert rows[1]["status"] == TaskStatus.IN_PROGRESS
+    assert all(row["note_id"] == 7 for row in rows)
+    assert all(
+        row["processing_status"] == ProcessingStatus.PENDING
+        for row in rows
+    )
+
+    jobs = queue.get_jobs()
+    assert [job.args for job in jobs] == [(1,), (2,)]
+    assert all(
+        job.func_name
+        == process_task_job.__module__ + ".process_task_job"
+        for job in jobs
+    )
+    assert [job.meta["task_id"] for job in jobs] == [1, 2]
+
+
+@patch("infrastructure.queue.task_worker.process_task_job")
+@patch("infrastructure.queue.task_worker.TaskRepository")
+def test_create_tasks_without_queue_enriches_inline(
+    mock_task_repo_class,
+    mock_process_task_job,
+    mock_session,
+    mock_task_repo,
+):
+    """Test tasks are enriched inline when no queue is given."""
+    mock_task_repo_class.return_value = mock_task_repo
+    mock_task_repo.bulk_create.return_value = [1, 2]
+    mock_process_task_job.side_effect = [
+        Exception("LLM error"),
+        None,
+    ]
+
+    task_ids = create_tasks(
+        [{"content": "Task 1"}, {"content": "Task 2"}],
+        user_id=123,
+        session=mock_session,
+    )
+
+    # A failed enrichment doesn't stop the others
+    assert task_ids == [1, 2]
+    assert mock_process_task_job.call_count == 2
+
+
 @patch("infrastructure.queue.task_worker.TaskRepository")
 @patch("infrastructure.queue.task_worker.get_robo_service")
 @patch("infrastructure.queue.task_worker.SessionLocal")
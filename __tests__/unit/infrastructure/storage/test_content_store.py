@@ -0,0 +1,82 @@
+"""Tests for content-addressed storage."""
+
+import hashlib
+import shutil
+import tempfile
+from io import BytesIO
+
+import pytest
+
+from domain.storage import CONTENT_OWNER, FileNotFoundError
+from infrastructure.storage.content_store import (
+    ContentAddressedStore,
+)
+from infrastructure.storage.local_sync import (
+    LocalStorageService,
+)
+
+
+@pytest.fixture
+def storage():
+    """Create a local storage service in a temporary directory."""
+    temp_dir = tempfile.mkdtemp()
+    yield LocalStorageService(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def content_store(storage):
+    """Create a content store backed by local storage."""
+    return ContentAddressedStore(storage)
+
+
+def test_commit_stores_content_by_hash(
+    content_store, storage
+):
+    """Test committed content is addressed by its SHA-256."""
+    data = b"Shared content"
+    content_hash = hashlib.sha256(data).hexdigest()
+
+    staged = content_store.stage(
+        BytesIO(data), "text/plain"
+    )
+    assert staged.content_hash == content_hash
+    assert staged.size_bytes == len(data)
+
+    stored = content_store.commit(staged)
+
+    assert stored.id == content_hash
+    assert stored.user_id == CONTENT_OWNER
+    assert (
+        content_store.retrieve(content_hash).read() == data
+    )
+    assert b"".join(
+        content_store.stream(content_hash, 7)
+    ) == (b"content")
+    with pytest.raises(FileNotFoundError):
+        storage.retrieve(staged.id, CONTENT_OWNER)
+
+
+def test_discard_keeps_stored_content(
+    content_store, storage
+):
+    """Test discarding a duplicate leaves the stored copy alone."""
+    data = b"Shared content"
+    first = content_store.stage(BytesIO(data), "text/plain")
+    content_store.commit(first)
+
+    duplicate = content_store.stage(
+        BytesIO(data), "text/plain"
+    )
+    content_store.discard(duplicate)
+
+    with pytest.raises(FileNotFoundError):
+        storage.retrieve(duplicate.id, CONTENT_OWNER)
+    assert (
+        content_store.retrieve(first.content_hash).read()
+        == data
+    )
+
+    content_store.delete(first.content_hash)
+    with pytest.raises(FileNotFoundError):
+        content_store.retrieve(first.content_hash)
@@ -1,14 +1,17 @@
 """Unit tests for local storage service."""
 
 import os
+import hashlib
 import pytest
 import tempfile
 import shutil
 from datetime import datetime
+from io import BytesIO
 
 from domain.storage import (
     StorageStatus,
     StorageError,
+    StorageLimitExceededError,
     FileNotFoundError,
     StoragePermissionError,
 )
@@ -95,6 +98,92 @@ def test_store_large_file(storage_service):
     assert b"".join(chunks) == file_data
 
 
+def test_store_stream(storage_service):
+    """Test storing a file from a stream in chunks."""
+    file_data = b"x" * (200 * 1024)
+    file_id = "streamed123"
+    user_id = "user456"
+
+    stored = storage_service.store_stream(
+        file_stream=BytesIO(file_data),
+        file_id=file_id,
+        user_id=user_id,
+        mime_type="application/octet-stream",
+    )
+
+    assert stored.size_bytes == len(file_data)
+    assert (
+        stored.content_hash
+        == hashlib.sha256(file_data).hexdigest()
+    )
+    retrieved = storage_service.retrieve(
+        file_id=file_id,
+        user_id=user_id,
+    )
+    assert retrieved.read() == file_data
+
+
+def test_store_stream_over_limit(
+    storage_service, storage_dir
+):
+    """Test a stream over its limit leaves nothing behind."""
+    with pytest.raises(StorageLimitExceededError):
+        storage_service.store_stream(
+            file_stream=BytesIO(b"x" * 1024),
+            file_id="toolarge123",
+            user_id="user456",
+            mime_type="text/plain",
+            max_bytes=1000,
+        )
+
+    assert (
+        os.listdir(os.path.join(storage_dir, "user456"))
+        == []
+    )
+
+
+def test_stream_byte_range(storage_service):
+    """Test streaming a byte range of a file in chunks."""
+    file_data = bytes(range(256)) * 4
+    file_id = "stream123"
+    user_id = "user456"
+
+    storage_service.store(
+        file_data=file_data,
+        file_id=file_id,
+        user_id=user_id,
+        mime_type="application/octet-stream",
+    )
+
+    # Whole file
+    chunks = list(
+        storage_service.stream(
+            file_id=file_id,
+            user_id=user_id,
+            chunk_size=100,
+        )
+    )
+    assert max(len(chunk) for chunk in chunks) == 100
+    assert b"".join(chunks) == file_data
+
+    # Inclusive byte range
+    chunks = storage_service.stream(
+        file_id=file_id,
+        user_id=user_id,
+        start=10,
+        end=509,
+        chunk_size=64,
+    )
+    assert b"".join(chunks) == file_data[10:510]
+
+    # Permission is checked before streaming starts
+    with pytest.raises(StoragePermissionError):
+        storage_service.stream(
+            file_id=file_id,
+            user_id="other_user",
+        )
+
+
 def test_delete_file(storage_service):
     """Test deleting a file."""
     # Store a file first
@@ -242,3 +331,85 @@ def test_public_file_access(storage_service):
         owner_id=owner_id,
     )
     assert retrieved.read() == file_data
+
+
+def test_owner_lookup_does_not_scan_users(
+    storage_service, monkeypatch
+):
+    """Test indexed files are found without listing user directories."""
+    storage_service.store(
+        file_data=b"Indexed data",
+        file_id="indexed123",
+        user_id="owner123",
+        mime_type="text/plain",
+    )
+
+    def fail_listdir(path):
+        raise AssertionError(f"unexpected scan of {path}")
+
+    monkeypatch.setattr(
+        "infrastructure.storage.local_sync.os.listdir",
+        fail_listdir,
+    )
+
+    # Owner found through the index, access then denied
+    with pytest.raises(StoragePermissionError):
+        storage_service.retrieve(
+            file_id="indexed123",
+            user_id="other456",
+        )
+    metadata = storage_service.get_metadata(
+        file_id="indexed123",
+        user_id="owner123",
+    )
+    assert metadata.user_id == "owner123"
+
+
+def test_owner_lookup_indexes_unindexed_files(
+    storage_service, storage_dir
+):
+    """Test files stored without an index entry are still found."""
+    user_dir = os.path.join(storage_dir, "owner123")
+    os.makedirs(user_dir)
+    with open(
+        os.path.join(user_dir, "legacy123"), "wb"
+    ) as f:
+        f.write(b"Legacy data")
+
+    retrieved = storage_service.retrieve(
+        file_id="legacy123",
+        user_id="other456",
+        owner_id="someone-else",
+    )
+    assert retrieved.read() == b"Legacy data"
+    assert os.path.exists(
+        os.path.join(storage_dir, ".owners", "legacy123")
+    )
+
+
+def test_rename(storage_service, storage_dir):
+    """Test moving a file to a new ID keeps content and owner."""
+    storage_service.store_stream(
+        file_stream=BytesIO(b"Staged data"),
+        file_id="staged123",
+        user_id="owner123",
+        mime_type="text/plain",
+    )
+
+    renamed = storage_service.rename(
+        "staged123", "owner123", "final123"
+    )
+
+    assert renamed.id == "final123"
+    assert renamed.mime_type == "text/plain"
+    assert (
+        storage_service.retrieve(
+            "final123", "owner123"
+        ).read()
+        == b"Staged data"
+    )
+    with pytest.raises(FileNotFoundError):
+        storage_service.retrieve("staged123", "owner123")
+    assert not os.path.exists(
+        os.path.join(storage_dir, ".owners", "staged123")
+    )
@@ -54,7 +54,7 @@ def test_file():
 
 def test_store_file(storage, s3_stubber, test_file):
     """Test storing a file."""
-    # Expected S3 requests
+    # Expected S3 requests: metadata travels with the content
     s3_stubber.add_response(
         "put_object",
         {},
@@ -63,22 +63,10 @@ def test_store_file(storage, s3_stubber, test_file):
             "Key": "user1/test.txt",
             "Body": test_file,
             "ContentType": "text/plain",
-        },
-    )
-
-    metadata = {
-        "user_id": "user1",
-        "mime_type": "text/plain",
-        "created_at": "2025-01-25T17:08:44.982014+00:00",
-    }
-    s3_stubber.add_response(
-        "put_object",
-        {},
-        {
-            "Bucket": "test-bucket",
-            "Key": "user1/test.txt.meta",
-            "Body": json.dumps(metadata).encode(),
-            "ContentType": "application/json",
+            "Metadata": {
+                "user-id": "user1",
+                "created-at": "2025-01-25T17:08:44.982014+00:00",
+            },
         },
     )
 
@@ -121,31 +109,7 @@ def test_store_file(storage, s3_stubber, test_file):
 
 def test_retrieve_file(storage, s3_stubber, test_file):
     """Test retrieving a file."""
-    # Expected S3 requests for metadata
-    s3_stubber.add_response(
-        "get_object",
-        {
-            "Body": BytesIO(
-                json.dumps(
-                    {
-                        "user_id": "user1",
-                        "mime_type": "text/plain",
-                        "created_at": "2025-01-25T17:08:44.982014+00:00",
-                    }
-                ).encode()
-            ),
-            "ContentLength": len(test_file),
-            "LastModified": datetime(
-                2025, 1, 25, 17, 8, 44, tzinfo=timezone.utc
-            ),
-        },
-        {
-            "Bucket": "test-bucket",
-            "Key": "user1/test.txt.meta",
-        },
-    )
-
-    # Expected S3 request for file content
+    # Expected S3 request for file content, with no metadata GET
     s3_stubber.add_response(
         "get_object",
         {
@@ -177,31 +141,7 @@ def test_retrieve_file_with_owner(
     storage, s3_stubber, test_file
 ):
     """Test retrieving a file with owner specified."""
-    # Expected S3 requests for metadata
-    s3_stubber.add_response(
-        "get_object",
-        {
-            "Body": BytesIO(
-                json.dumps(
-                    {
-                        "user_id": "user1",
-                        "mime_type": "text/plain",
-                        "created_at": "2025-01-25T17:08:44.982014+00:00",
-                    }
-                ).encode()
-            ),
-            "ContentLength": len(test_file),
-            "LastModified": datetime(
-                2025, 1, 25, 17, 8, 44, tzinfo=timezone.utc
-            ),
-        },
-        {
-            "Bucket": "test-bucket",
-            "Key": "user1/test.txt.meta",
-        },
-    )
-
-    # Expected S3 request for file content
+    # Expected S3 request for file content, with no metadata GET
     s3_stubber.add_response(
         "get_object",
         {
@@ -231,21 +171,7 @@ def test_retrieve_file_with_owner(
 
 def test_delete_file(storage, s3_stubber):
     """Test deleting a file."""
-    # Expected S3 requests for metadata
-    s3_stubber.add_response(
-        "list_objects_v2",
-        {
-            "CommonPrefixes": [
-                {"Prefix": "user1/"},
-                {"Prefix": "user2/"},
-            ],
-        },
-        {
-            "Bucket": "test-bucket",
-            "Delimiter": "/",
-        },
-    )
-
+    # Expected S3 request for metadata
     s3_stubber.add_response(
         "head_object",
         {
@@ -254,6 +180,10 @@ def test_delete_file(storage, s3_stubber):
             "LastModified": datetime(
                 2025, 1, 25, 17, 8, 44, tzinfo=timezone.utc
             ),
+            "Metadata": {
+                "user-id": "user1",
+                "created-at": "2025-01-25T17:08:44.982014+00:00",
+            },
         },
         {
             "Bucket": "test-bucket",
@@ -261,24 +191,6 @@ def test_delete_file(storage, s3_stubber):
         },
     )
 
-    metadata = {
-        "user_id": "user1",
-        "mime_type": "text/plain",
-        "created_at": "2025-01-25T17:08:44.982014+00:00",
-    }
-    metadata_json = json.dumps(metadata).encode()
-
-    s3_stubber.add_response(
-        "get_object",
-        {
-            "Body": BytesIO(metadata_json),
-        },
-        {
-            "Bucket": "test-bucket",
-            "Key": "user1/test.txt.meta",
-        },
-    )
-
     s3_stubber.add_response(
         "delete_object",
         {},
@@ -309,22 +221,54 @@ def test_delete_file(storage, s3_stubber):
 
 
 def test_get_metadata(storage, s3_stubber, test_file):
-    """Test getting file metadata."""
+    """Test getting file metadata with a single HEAD request."""
     # Expected S3 requests
     s3_stubber.add_response(
-        "list_objects_v2",
+        "head_object",
         {
-            "CommonPrefixes": [
-                {"Prefix": "user1/"},
-                {"Prefix": "user2/"},
-            ],
+            "ContentLength": len(test_file),
+            "ContentType": "text/plain",
+            "LastModified": datetime(
+                2025, 1, 25, 17, 8, 44, tzinfo=timezone.utc
+            ),
+            "Metadata": {
+                "user-id": "user1",
+                "created-at": "2025-01-25T17:08:44.982014+00:00",
+            },
         },
         {
             "Bucket": "test-bucket",
-            "Delimiter": "/",
+            "Key": "user1/test.txt",
         },
     )
 
+    s3_stubber.activate()
+
+    # Get metadata
+    stored = storage.get_metadata(
+        file_id="test.txt",
+        user_id="user1",
+    )
+
+    # Verify metadata
+    assert isinstance(stored, StoredFile)
+    assert stored.id == "test.txt"
+    assert stored.user_id == "user1"
+    assert stored.path == "user1/test.txt"
+    assert stored.size_bytes == len(test_file)
+    assert stored.mime_type == "text/plain"
+    assert stored.status == StorageStatus.ACTIVE
+    assert stored.created_at == datetime.fromisoformat(
+        "2025-01-25T17:08:44.982014+00:00"
+    )
+
+    s3_stubber.assert_no_pending_responses()
+
+
+def test_get_metadata_legacy_sidecar(
+    storage, s3_stubber, test_file
+):
+    """Test metadata falls back to the .meta sidecar of older files."""
     s3_stubber.add_response(
         "head_object",
         {
@@ -392,7 +336,7 @@ def test_file_not_found(storage, s3_stubber):
         http_status_code=404,
         expected_params={
             "Bucket": "test-bucket",
-            "Key": "user1/nonexistent.txt.meta",
+            "Key": "user1/nonexistent.txt",
         },
     )
 
@@ -407,6 +351,30 @@ def test_file_not_found(storage, s3_stubber):
     s3_stubber.assert_no_pending_responses()
 
 
+def test_get_metadata_not_found(storage, s3_stubber):
+    """Test metadata of a missing file without listing the bucket."""
+    s3_stubber.add_client_error(
+        "head_object",
+        service_error_code="404",
+        service_message="Not Found",
+        http_status_code=404,
+        expected_params={
+            "Bucket": "test-bucket",
+            "Key": "user1/nonexistent.txt",
+        },
+    )
+
+    s3_stubber.activate()
+
+    with pytest.raises(FileNotFoundError):
+        storage.get_metadata(
+            file_id="nonexistent.txt",
+            user_id="user1",
+        )
+
+    s3_stubber.assert_no_pending_responses()
+
+
 def test_s3_errors(storage, s3_stubber):
     """Test handling of S3 errors."""
     # Expected S3 requests
@@ -420,6 +388,10 @@ def test_s3_errors(storage, s3_stubber):
             "Key": "user1/test.txt",
             "Body": b"test",
             "ContentType": "text/plain",
+            "Metadata": {
+                "user-id": "user1",
+                "created-at": "2025-01-25T17:08:44.982014+00:00",
+            },
         },
     )
 
@@ -434,3 +406,49 @@ def test_s3_errors(storage, s3_stubber):
         )
 
     s3_stubber.assert_no_pending_responses()
+
+
+def test_rename(storage, s3_stubber, test_file):
+    """Test moving a file copies it server-side, then deletes it."""
+    s3_stubber.add_response(
+        "head_object",
+        {
+            "ContentLength": len(test_file),
+            "ContentType": "text/plain",
+            "LastModified": datetime(
+                2025, 1, 25, 17, 8, 44, tzinfo=timezone.utc
+            ),
+            "Metadata": {
+                "user-id": "user1",
+                "created-at": "2025-01-25T17:08:44.982014+00:00",
+            },
+        },
+        {"Bucket": "test-bucket", "Key": "user1/staged"},
+    )
+    s3_stubber.add_response(
+        "copy_object",
+        {},
+        {
+            "Bucket": "test-bucket",
+            "Key": "user1/final",
+            "CopySource": {
+                "Bucket": "test-bucket",
+                "Key": "user1/staged",
+            },
+            "MetadataDirective": "COPY",
+        },
+    )
+    s3_stubber.add_response(
+        "delete_object",
+        {},
+        {"Bucket": "test-bucket", "Key": "user1/staged"},
+    )
+
+    s3_stubber.activate()
+
+    renamed = storage.rename("staged", "user1", "final")
+
+    assert renamed.id == "final"
+    assert renamed.path == "user1/final"
+    assert renamed.size_bytes == len(test_file)
+    s3_stubber.assert_no_pending_responses()
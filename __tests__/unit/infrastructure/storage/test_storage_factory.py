@@ -2,9 +2,13 @@
 
 import os
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 
-from infrastructure.storage.factory import StorageFactory
+from infrastructure.storage.factory import (
+    StorageFactory,
+    _get_storage_service,
+    get_storage_service,
+)
 from infrastructure.storage.local_sync import (
     LocalStorageService,
 )
@@ -102,8 +106,30 @@ def test_s3_storage_creation(mock_boto3_client, clean_env):
         aws_access_key_id="test-key",
         aws_secret_access_key="test-secret",
         region_name="us-west-2",
+        config=ANY,
     )
 
+    # The client keeps a tuned, reusable connection pool
+    config = mock_boto3_client.call_args[1]["config"]
+    assert config.max_pool_connections == 50
+    assert config.retries == {
+        "max_attempts": 3,
+        "mode": "standard",
+    }
+
+
+def test_get_storage_service_is_shared(clean_env):
+    """Test one storage service is shared per backend."""
+    _get_storage_service.cache_clear()
+    os.environ["STORAGE_BACKEND"] = "mock"
+
+    service = get_storage_service()
+
+    assert isinstance(service, MockStorageService)
+    assert get_storage_service() is service
+    assert get_storage_service("mock") is service
+    _get_storage_service.cache_clear()
+
 
 def test_s3_storage_missing_bucket(clean_env):
     """Test S3 storage creation fails without bucket name."""
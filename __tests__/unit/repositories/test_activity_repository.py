@@ -1,4 +1,5 @@
 from orm.ActivityModel import Activity
+from orm.MomentModel import Moment
 from orm.UserModel import User
 from repositories.ActivityRepository import (
     ActivityRepository,
@@ -6,7 +7,9 @@ from repositories.ActivityRepository import (
 import sys
 import os
 import pytest
+from unittest.mock import Mock
 from fastapi import HTTPException
+from sqlalchemy import update
 
 sys.path.append(
     os.path.join(os.path.dirname(__file__), "../..")
@@ -339,6 +342,89 @@ def test_delete_activity_nonexistent(activity_repository):
     assert result is False
 
 
+def test_moment_count_tracks_moments(
+    activity_repository,
+    sample_activity_data,
+    test_db_session,
+):
+    """Test moment_count follows moment inserts and deletes"""
+    activity = activity_repository.create(
+        Activity(**sample_activity_data)
+    )
+    moments = [
+        Moment(
+            user_id=activity.user_id,
+            activity_id=activity.id,
+            data={"note": f"note {i}"},
+        )
+        for i in range(2)
+    ]
+    test_db_session.add_all(moments)
+    test_db_session.commit()
+    test_db_session.refresh(activity)
+    assert activity.moment_count == 2
+
+    test_db_session.delete(moments[0])
+    test_db_session.commit()
+    test_db_session.refresh(activity)
+    assert activity.moment_count == 1
+
+
+def test_reconcile_moment_counts(
+    activity_repository,
+    sample_activity_data,
+    test_db_session,
+):
+    """Test reconciliation repairs a drifted counter"""
+    activity = activity_repository.create(
+        Activity(**sample_activity_data)
+    )
+    test_db_session.add(
+        Moment(
+            user_id=activity.user_id,
+            activity_id=activity.id,
+            data={"note": "note"},
+        )
+    )
+    test_db_session.commit()
+    test_db_session.execute(
+        update(Activity).values(moment_count=5)
+    )
+    test_db_session.commit()
+
+    assert (
+        activity_repository.reconcile_moment_counts() == 1
+    )
+    test_db_session.refresh(activity)
+    assert activity.moment_count == 1
+    assert (
+        activity_repository.reconcile_moment_counts() == 0
+    )
+
+
+def test_reconcile_moment_counts_invalidates_cache(
+    sample_activity_data, test_db_session
+):
+    """Test reconciliation drops the owners' cached activities"""
+    entity_cache = Mock()
+    repository = ActivityRepository(
+        test_db_session, entity_cache=entity_cache
+    )
+    activity = repository.create(
+        Activity(**sample_activity_data)
+    )
+    test_db_session.execute(
+        update(Activity).values(moment_count=5)
+    )
+    test_db_session.commit()
+    entity_cache.reset_mock()
+
+    assert repository.reconcile_moment_counts() == 1
+    entity_cache.invalidate.assert_called_once_with(
+        "activities", activity.user_id
+    )
+
+
 def test_validate_existence_success(
     activity_repository, sample_activity_data
 ):
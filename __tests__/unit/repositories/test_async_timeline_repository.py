@@ -0,0 +1,154 @@
+"""Unit tests for AsyncTimelineRepository."""
+
+import threading
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeStrictRedis
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from orm.BaseModel import Base
+from orm.TimelineModel import Timeline
+from domain.timeline import TimelineEventType
+from infrastructure.cache.count_cache import CountCache
+from repositories.AsyncTimelineRepository import (
+    AsyncTimelineRepository,
+)
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    """Create an AsyncSession on an in-memory SQLite database."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(
+        engine, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def sample_timeline_events(async_session):
+    """Create sample timeline events for two users."""
+    base_time = datetime.now(timezone.utc)
+    events = [
+        Timeline(
+            event_type=TimelineEventType.TASK_CREATED,
+            user_id="user1",
+            event_metadata={"id": i},
+            timestamp=base_time - timedelta(hours=i),
+        )
+        for i in range(6)
+    ] + [
+        Timeline(
+            event_type=TimelineEventType.NOTE_CREATED,
+            user_id="user2",
+            event_metadata={"id": 10},
+            timestamp=base_time,
+        )
+    ]
+    async_session.add_all(events)
+    await async_session.commit()
+    return events
+
+
+@pytest.fixture
+def timeline_repository(async_session):
+    """Create an async timeline repository instance."""
+    return AsyncTimelineRepository(async_session)
+
+
+@pytest.mark.asyncio
+async def test_get_recent_by_user(
+    timeline_repository, sample_timeline_events
+):
+    """Test recent events are scoped to the user and ordered."""
+    events = await timeline_repository.get_recent_by_user(
+        "user1", limit=3
+    )
+    assert len(events) == 3
+    assert all(e.user_id == "user1" for e in events)
+    assert events[0].timestamp > events[-1].timestamp
+
+
+@pytest.mark.asyncio
+async def test_list_events_pagination(
+    timeline_repository, sample_timeline_events
+):
+    """Test listing delegates to the sync query builder."""
+    result = await timeline_repository.list_events(
+        page=2, size=4, user_id="user1"
+    )
+    assert len(result.items) == 2
+    assert result.total == 6
+    assert result.pages == 2
+
+
+@pytest.mark.asyncio
+async def test_list_events_cursor(
+    timeline_repository, sample_timeline_events
+):
+    """Test cursor pages walk every event exactly once."""
+    first = await timeline_repository.list_events(
+        size=4, user_id="user1", cursor=""
+    )
+    second = await timeline_repository.list_events(
+        size=4, user_id="user1", cursor=first.next_cursor
+    )
+    ids = [e.id for e in first.items + second.items]
+    assert len(ids) == len(set(ids)) == 6
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_events_counts_off_the_event_loop(
+    async_session, sample_timeline_events
+):
+    """Test cached totals are looked up on a worker thread."""
+    count_cache = CountCache(redis=FakeStrictRedis())
+    get_or_count = count_cache.get_or_count
+    threads = []
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        return get_or_count(*args)
+
+    count_cache.get_or_count = record_thread
+    repository = AsyncTimelineRepository(
+        async_session, count_cache=count_cache
+    )
+
+    # The second total is served from the cache
+    for _ in range(2):
+        result = await repository.list_events(
+            size=4, user_id="user1"
+        )
+        assert result.total == 6
+        assert result.pages == 2
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_list_events_without_total(
+    timeline_repository, sample_timeline_events
+):
+    """Test no total is computed when it isn't requested."""
+    result = await timeline_repository.list_events(
+        size=4, user_id="user1", include_total=False
+    )
+    assert len(result.items) == 4
+    assert result.total is None
+    assert result.pages is None
@@ -9,7 +9,7 @@ from domain.document import DocumentStatus
 from repositories.DocumentRepository import (
     DocumentRepository,
 )
-from orm.DocumentModel import Document
+from orm.DocumentModel import Document, DocumentContent
 
 
 @pytest.fixture
@@ -401,3 +401,88 @@ class TestDocumentRepository:
         )
         assert len(docs) == 0
         assert isinstance(docs, list)
+
+    def test_content_reference_counting(
+        self, document_repository
+    ):
+        """Test content rows count references and go at zero."""
+        content_hash = "a" * 64
+
+        content, is_new = (
+            document_repository.add_content_reference(
+                content_hash, 1024
+            )
+        )
+        assert is_new is True
+        assert content.ref_count == 1
+
+        content, is_new = (
+            document_repository.add_content_reference(
+                content_hash, 1024
+            )
+        )
+        assert is_new is False
+        assert content.ref_count == 2
+
+        assert (
+            document_repository.release_content_reference(
+                content_hash
+            )
+            is False
+        )
+        assert (
+            document_repository.release_content_reference(
+                content_hash
+            )
+            is True
+        )
+        assert (
+            document_repository.db.get(
+                DocumentContent, content_hash
+            )
+            is None
+        )
+
+    def test_physical_size_counts_shared_content_once(
+        self, document_repository, sample_user
+    ):
+        """Test shared content counts once in physical size."""
+        content_hash = "b" * 64
+        for _ in range(2):
+            document_repository.add_content_reference(
+                content_hash, 1000
+            )
+            document_repository.create(
+                Document(
+                    name="shared.pdf",
+                    storage_url=f"_content/{content_hash}",
+                    mime_type="application/pdf",
+                    size_bytes=1000,
+                    user_id=sample_user.id,
+                    status=DocumentStatus.ACTIVE,
+                    content_hash=content_hash,
+                )
+            )
+        document_repository.create(
+            Document(
+                name="own.pdf",
+                storage_url="/test/path/own.pdf",
+                mime_type="application/pdf",
+                size_bytes=500,
+                user_id=sample_user.id,
+                status=DocumentStatus.ACTIVE,
+            )
+        )
+
+        assert (
+            document_repository.get_total_size_by_user(
+                sample_user.id
+            )
+            == 2500
+        )
+        assert (
+            document_repository.get_physical_size_by_user(
+                sample_user.id
+            )
+            == 1500
+        )
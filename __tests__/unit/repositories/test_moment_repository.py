@@ -290,6 +290,40 @@ def test_get_activity_moments_count(
     assert count == 3
 
 
+def test_bulk_create_moments(
+    moment_repo: MomentRepository,
+    test_activity: ActivityModel,
+    test_user: UserModel,
+):
+    """Test inserting many moments in one transaction"""
+    moment_repo.BULK_INSERT_CHUNK_SIZE = 2
+    rows = [
+        {
+            "activity_id": test_activity.id,
+            "data": {"note": f"Bulk note {i}"},
+            "timestamp": datetime.now(timezone.utc),
+        }
+        for i in range(5)
+    ]
+
+    created = moment_repo.bulk_create(rows, test_user.id)
+
+    assert created == 5
+    assert (
+        moment_repo.get_activity_moments_count(
+            test_activity.id
+        )
+        == 5
+    )
+
+
+def test_bulk_create_moments_empty(
+    moment_repo: MomentRepository, test_user: UserModel
+):
+    """Test bulk insert with no rows is a no-op"""
+    assert moment_repo.bulk_create([], test_user.id) == 0
+
+
 def test_list_moments_with_filters(
     moment_repo: MomentRepository,
     test_activity: ActivityModel,
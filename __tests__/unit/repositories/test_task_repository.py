@@ -410,3 +410,52 @@ class TestTaskRepository:
         # Act & Assert
         with pytest.raises(TaskReferenceError):
             task_repo.update_topic(1, "test-user-id", None)
+
+    def test_bulk_create_commits_once(
+        self,
+        task_repo: TaskRepository,
+        mock_db: Session,
+    ):
+        """Test bulk creation adds all tasks in one commit."""
+        # Arrange
+        rows = [
+            {
+                "content": "Task 1",
+                "user_id": "test-user-id",
+            },
+            {
+                "content": "Task 2",
+                "user_id": "test-user-id",
+            },
+        ]
+
+        # Act
+        task_repo.bulk_create(rows)
+
+        # Assert
+        added = mock_db.add_all.call_args[0][0]
+        assert [task.content for task in added] == [
+            "Task 1",
+            "Task 2",
+        ]
+        mock_db.flush.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+    def test_bulk_create_invalid_reference(
+        self,
+        task_repo: TaskRepository,
+        mock_db: Session,
+    ):
+        """Test bulk creation rolls back on an integrity error."""
+        # Arrange
+        mock_db.flush.side_effect = IntegrityError(
+            "mock", "mock", "mock"
+        )
+
+        # Act & Assert
+        with pytest.raises(TaskValidationError):
+            task_repo.bulk_create(
+                [{"content": "Task", "note_id": 999}]
+            )
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
@@ -196,3 +196,77 @@ def test_list_events_empty_results(
     assert len(result.items) == 0
     assert result.total == 0
     assert result.pages == 0
+
+
+def test_list_events_cursor_pagination(
+    timeline_repository, sample_timeline_events
+):
+    """Test keyset pagination walks all events without overlap."""
+    seen = []
+    cursor = ""
+    while cursor is not None:
+        result = timeline_repository.list_events(
+            size=4, user_id="user1", cursor=cursor
+        )
+        seen.extend(e.id for e in result.items)
+        cursor = result.next_cursor
+
+    assert len(seen) == 10
+    assert len(set(seen)) == 10
+
+    # Cursor pages follow the same order as offset pages
+    offset_result = timeline_repository.list_events(
+        size=10, user_id="user1"
+    )
+    assert seen == [e.id for e in offset_result.items]
+
+
+def test_list_events_cursor_tie_breaker(
+    timeline_repository, db_session
+):
+    """Test events sharing a timestamp are split by id."""
+    db_session.query(Timeline).delete()
+    same_time = datetime.now(timezone.utc)
+    for i in range(5):
+        db_session.add(
+            Timeline(
+                event_type=TimelineEventType.NOTE_CREATED,
+                user_id="user1",
+                event_metadata={"id": i},
+                timestamp=same_time,
+            )
+        )
+    db_session.commit()
+
+    first = timeline_repository.list_events(
+        size=3, cursor=""
+    )
+    second = timeline_repository.list_events(
+        size=3, cursor=first.next_cursor
+    )
+
+    assert len(first.items) == 3
+    assert len(second.items) == 2
+    assert second.next_cursor is None
+    ids = [e.id for e in first.items + second.items]
+    assert ids == sorted(ids, reverse=True)
+
+
+def test_list_events_invalid_cursor(timeline_repository):
+    """Test a malformed cursor is rejected."""
+    with pytest.raises(ValueError):
+        timeline_repository.list_events(
+            cursor="not-a-cursor"
+        )
+
+
+def test_list_events_without_total(
+    timeline_repository, sample_timeline_events
+):
+    """Test total and pages are skipped when not requested."""
+    result = timeline_repository.list_events(
+        size=5, user_id="user1", include_total=False
+    )
+    assert len(result.items) == 5
+    assert result.total is None
+    assert result.pages is None
@@ -0,0 +1,79 @@
+"""Test UserRepository class."""
+
+import pytest
+from unittest.mock import patch
+from fakeredis import FakeStrictRedis
+
+from infrastructure.cache.entity_cache import EntityCache
+from repositories.UserRepository import UserRepository
+
+
+@pytest.fixture
+def user_repository(test_db_session):
+    """Create a user repository with a fake Redis user cache."""
+    return UserRepository(
+        test_db_session,
+        user_cache=EntityCache(
+            redis=FakeStrictRedis(), local_ttl_seconds=0
+        ),
+    )
+
+
+def test_get_cached_principal_skips_database(
+    user_repository, test_user
+):
+    """Test a cached principal is served without a query."""
+    first = user_repository.get_cached_principal(
+        test_user.id
+    )
+
+    with patch.object(
+        user_repository, "get_by_id"
+    ) as get_by_id:
+        second = user_repository.get_cached_principal(
+            test_user.id
+        )
+
+    assert first == second
+    assert second.username == test_user.username
+    get_by_id.assert_not_called()
+
+
+def test_get_cached_principal_unknown_user(user_repository):
+    """Test an unknown user is not found."""
+    assert (
+        user_repository.get_cached_principal("missing")
+        is None
+    )
+
+
+def test_update_invalidates_principal(
+    user_repository, test_user
+):
+    """Test updating a user drops the cached principal."""
+    user_repository.get_cached_principal(test_user.id)
+
+    user_repository.update(
+        test_user.id, {"username": "renamed_user"}
+    )
+
+    assert (
+        user_repository.get_cached_principal(
+            test_user.id
+        ).username
+        == "renamed_user"
+    )
+
+
+def test_delete_invalidates_principal(
+    user_repository, test_user
+):
+    """Test deleting a user stops it authenticating."""
+    user_repository.get_cached_principal(test_user.id)
+
+    assert user_repository.delete(test_user.id)
+
+    assert (
+        user_repository.get_cached_principal(test_user.id)
+        is None
+    )
@@ -214,3 +214,31 @@ def test_get_public_document(
         result["data"]["name"]
         == sample_public_document.name
     )
+
+
+def test_get_document_content_range(
+    app, storage_service, sample_document
+):
+    """Test content downloads honour Range and If-None-Match."""
+    storage_service.stream.return_value = iter([b"0123456789"])
+
+    response = app.get(
+        f"/v1/docs/{sample_document.id}/content",
+        headers={"Range": "bytes=10-19"},
+    )
+
+    assert response.status_code == 206
+    assert response.content == b"0123456789"
+    assert (
+        response.headers["Content-Range"]
+        == f"bytes 10-19/{sample_document.size_bytes}"
+    )
+    assert response.headers["Accept-Ranges"] == "bytes"
+    _, kwargs = storage_service.stream.call_args
+    assert (kwargs["start"], kwargs["end"]) == (10, 19)
+
+    response = app.get(
+        f"/v1/docs/{sample_document.id}/content",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 304
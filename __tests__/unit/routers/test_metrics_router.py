@@ -0,0 +1,79 @@
+"""Test MetricsRouter endpoints."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from routers.v1.MetricsRouter import (
+    router as metrics_router,
+)
+
+
+@pytest.fixture
+def client():
+    """Create a client for an app serving the metrics router."""
+    app = FastAPI()
+    app.include_router(metrics_router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def metrics_token():
+    """Configure the token the metrics endpoint expects."""
+    with patch(
+        "routers.v1.MetricsRouter.get_environment_variables"
+    ) as mock_env:
+        mock_env.return_value.INTERNAL_METRICS_TOKEN = (
+            SecretStr("internal-secret")
+        )
+        yield "internal-secret"
+
+
+def test_get_database_metrics(client, metrics_token):
+    """Test pool and query stats are returned."""
+    response = client.get(
+        "/internal/metrics/database",
+        headers={
+            "Authorization": f"Bearer {metrics_token}"
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert "checked_out" in data["pools"]["sync"]
+    assert "wait_time_ms" in data["pools"]["sync"]
+    assert "buckets" in data["query_time_ms"]
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong"}],
+)
+def test_get_database_metrics_requires_token(
+    client, metrics_token, headers
+):
+    """Test requests without the metrics token are rejected."""
+    response = client.get(
+        "/internal/metrics/database", headers=headers
+    )
+
+    assert response.status_code == 401
+
+
+def test_get_database_metrics_without_configured_token(
+    client,
+):
+    """Test nothing is served when no token is configured."""
+    with patch(
+        "routers.v1.MetricsRouter.get_environment_variables"
+    ) as mock_env:
+        mock_env.return_value.INTERNAL_METRICS_TOKEN = None
+        response = client.get(
+            "/internal/metrics/database",
+            headers={"Authorization": "Bearer anything"},
+        )
+
+    assert response.status_code == 401
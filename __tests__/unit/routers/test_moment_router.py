@@ -11,6 +11,8 @@ from routers.v1.MomentRouter import router, MomentService
 from schemas.pydantic.MomentSchema import (
     MomentResponse,
     MomentList,
+    MomentBatchResult,
+    MomentBatchItemResult,
 )
 from schemas.pydantic.ActivitySchema import ActivityResponse
 from orm.UserModel import User
@@ -138,6 +140,72 @@ class TestMomentRouter:
         )
         mock_moment_service.create_moment.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_moments_batch_success(
+        self,
+        client,
+        mock_moment_service,
+        mock_current_user,
+        mock_auth_credentials,
+        valid_moment_data,
+    ):
+        """Test batch moment creation."""
+        service = mock_moment_service
+        service.create_moments_batch.return_value = MomentBatchResult(
+            created=1,
+            failed=1,
+            results=[
+                MomentBatchItemResult(
+                    index=0, status="created"
+                ),
+                MomentBatchItemResult(
+                    index=1,
+                    status="failed",
+                    error="Activity not found",
+                ),
+            ],
+        )
+
+        response = client.post(
+            "/v1/moments/batch",
+            json={
+                "moments": [
+                    valid_moment_data,
+                    valid_moment_data,
+                ]
+            },
+            headers={
+                "Authorization": f"Bearer {mock_auth_credentials.credentials}"
+            },
+        )
+
+        assert response.status_code == 201
+        data = response.json()["data"]
+        assert data["created"] == 1
+        assert data["results"][1]["status"] == "failed"
+        moments, user_id = (
+            mock_moment_service.create_moments_batch.call_args[
+                0
+            ]
+        )
+        assert len(moments) == 2
+        assert user_id == mock_current_user.id
+
+    @pytest.mark.asyncio
+    async def test_create_moments_batch_empty(
+        self, client, mock_auth_credentials
+    ):
+        """Test batch creation rejects an empty batch."""
+        response = client.post(
+            "/v1/moments/batch",
+            json={"moments": []},
+            headers={
+                "Authorization": f"Bearer {mock_auth_credentials.credentials}"
+            },
+        )
+
+        assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_list_moments_success(
         self,
@@ -367,6 +367,7 @@ class TestTaskRouter:
             topic_id=None,
             page=1,
             size=50,
+            cursor=None,
         )
 
     def test_get_task_not_found(
@@ -7,9 +7,11 @@ from unittest.mock import Mock
 from fastapi import HTTPException
 from io import BytesIO
 
-from domain.document import DocumentStatus
+from domain.document import DocumentData, DocumentStatus
 from domain.storage import (
+    CONTENT_OWNER,
     StorageError,
+    StorageLimitExceededError,
     StorageStatus,
     StoredFile,
     IStorageService,
@@ -64,6 +66,16 @@ def mock_repository(sample_document):
     mock_repo.get_total_size_by_user.side_effect = (
         mock_get_total_size_by_user
     )
+    mock_repo.get_physical_size_by_user.return_value = 1024
+
+    # New content by default, so it is kept rather than discarded
+    content = Mock()
+    content.storage_url = None
+    mock_repo.add_content_reference.return_value = (
+        content,
+        True,
+    )
+    mock_repo.release_content_reference.return_value = True
 
     # Mock the db attribute
     mock_repo.db = Mock()
@@ -85,8 +97,13 @@ def mock_storage():
         status=StorageStatus.ACTIVE,
         created_at=datetime.now(),
         updated_at=datetime.now(),
+        content_hash="a" * 64,
     )
     mock_storage.store = Mock(return_value=stored_file)
+    mock_storage.store_stream = Mock(
+        return_value=stored_file
+    )
+    mock_storage.rename = Mock(return_value=stored_file)
     mock_storage.retrieve.return_value = BytesIO(
         b"test content"
     )
@@ -120,6 +137,7 @@ def sample_document():
         "test_doc"  # Using underscore instead of hyphen
     )
     doc.is_public = False
+    doc.content_hash = None
     return doc
 
 
@@ -157,7 +175,7 @@ class TestDocumentService:
         assert result.id == sample_document.id
         assert result.name == "test.pdf"
         assert result.user_id == "test-user"
-        mock_storage.store.assert_called_once()
+        mock_storage.store_stream.assert_called_once()
         mock_repository.create.assert_called_once()
         mock_repository.update.assert_called_once()
         mock_repository.db.commit.assert_called_once()
@@ -169,8 +187,8 @@ class TestDocumentService:
     ):
         """Test handling storage errors during document creation."""
         # Setup
-        mock_storage.store.side_effect = StorageError(
-            "Failed to store file"
+        mock_storage.store_stream.side_effect = (
+            StorageError("Failed to store file")
         )
 
         # Test
@@ -186,6 +204,132 @@ class TestDocumentService:
             )
         assert exc.value.status_code == 500
 
+    def test_create_document_from_stream(
+        self,
+        document_service,
+        mock_storage,
+        mock_repository,
+        sample_document,
+    ):
+        """Test creating a document from a stream."""
+        mock_repository.create.return_value = (
+            sample_document
+        )
+        stream = BytesIO(b"test content")
+
+        result = (
+            document_service.create_document_from_stream(
+                name="test.pdf",
+                mime_type="application/pdf",
+                file_stream=stream,
+                user_id="test-user",
+            )
+        )
+
+        assert result.size_bytes == 2048
+        args, kwargs = mock_storage.store_stream.call_args
+        assert args[2] == CONTENT_OWNER
+        assert (
+            kwargs["max_bytes"]
+            == DocumentData.MAX_DOCUMENT_SIZE
+        )
+        mock_storage.rename.assert_called_once_with(
+            "test-file-id", CONTENT_OWNER, "a" * 64
+        )
+        mock_repository.add_content_reference.assert_called_once_with(
+            "a" * 64, 2048
+        )
+        mock_repository.update.assert_called_once_with(
+            sample_document.id,
+            {
+                "content_hash": "a" * 64,
+                "storage_url": "/test/path/file.pdf",
+                "size_bytes": 2048,
+            },
+        )
+
+    def test_create_document_from_stream_duplicate(
+        self,
+        document_service,
+        mock_storage,
+        mock_repository,
+        sample_document,
+    ):
+        """Test duplicate content shares the already stored copy."""
+        content = Mock()
+        content.storage_url = "_content/" + "a" * 64
+        mock_repository.add_content_reference.return_value = (
+            content,
+            False,
+        )
+
+        result = (
+            document_service.create_document_from_stream(
+                name="test.pdf",
+                mime_type="application/pdf",
+                file_stream=BytesIO(b"test content"),
+                user_id="test-user",
+            )
+        )
+
+        assert result.storage_url == "_content/" + "a" * 64
+        mock_storage.rename.assert_not_called()
+        mock_storage.delete.assert_called_once_with(
+            "test-file-id", CONTENT_OWNER
+        )
+
+    def test_create_document_from_stream_over_limit(
+        self,
+        document_service,
+        mock_storage,
+        mock_repository,
+        sample_document,
+    ):
+        """Test a stream over its size limit is rejected and cleaned up."""
+        mock_repository.create.return_value = (
+            sample_document
+        )
+        mock_storage.store_stream.side_effect = (
+            StorageLimitExceededError("too large")
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            document_service.create_document_from_stream(
+                name="test.pdf",
+                mime_type="application/pdf",
+                file_stream=BytesIO(b"test content"),
+                user_id="test-user",
+            )
+        assert exc.value.status_code == 413
+        mock_repository.delete.assert_called_once_with(
+            sample_document.id, "test-user"
+        )
+
+    def test_create_document_from_stream_quota_used(
+        self,
+        document_service,
+        mock_storage,
+        mock_repository,
+    ):
+        """Test uploads are refused once the quota is used up."""
+        mock_repository.get_total_size_by_user.side_effect = (
+            None
+        )
+        mock_repository.get_total_size_by_user.return_value = (
+            DocumentData.MAX_USER_STORAGE
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            document_service.create_document_from_stream(
+                name="test.pdf",
+                mime_type="application/pdf",
+                file_stream=BytesIO(b"test content"),
+                user_id="test-user",
+            )
+        assert exc.value.status_code == 413
+        assert exc.value.detail == "Storage quota exceeded"
+        mock_storage.store_stream.assert_not_called()
+
     def test_get_document_not_found(
         self, document_service, mock_repository
     ):
@@ -366,6 +510,54 @@ class TestDocumentService:
             1, "test-user"
         )
 
+    def test_delete_document_last_content_reference(
+        self,
+        document_service,
+        mock_repository,
+        mock_storage,
+        sample_document,
+    ):
+        """Test shared content is deleted with its last reference."""
+        sample_document.content_hash = "a" * 64
+
+        document_service.delete_document(
+            document_id=1,
+            user_id="test-user",
+        )
+
+        mock_repository.release_content_reference.assert_called_once_with(
+            "a" * 64
+        )
+        mock_storage.delete.assert_called_once_with(
+            "a" * 64, CONTENT_OWNER
+        )
+        mock_repository.delete.assert_called_once_with(
+            1, "test-user"
+        )
+
+    def test_delete_document_shared_content(
+        self,
+        document_service,
+        mock_repository,
+        mock_storage,
+        sample_document,
+    ):
+        """Test shared content is kept while other documents use it."""
+        sample_document.content_hash = "a" * 64
+        mock_repository.release_content_reference.return_value = (
+            False
+        )
+
+        document_service.delete_document(
+            document_id=1,
+            user_id="test-user",
+        )
+
+        mock_storage.delete.assert_not_called()
+        mock_repository.delete.assert_called_once_with(
+            1, "test-user"
+        )
+
     def test_delete_document_not_found(
         self,
         document_service,
@@ -422,6 +614,7 @@ class TestDocumentService:
 
         # Assert
         assert usage.used_bytes == expected_size
+        assert usage.physical_bytes == 1024
         assert (
             usage.total_bytes == 1024 * 1024 * 1024
         )  # 1GB
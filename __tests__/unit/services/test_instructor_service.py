@@ -691,3 +691,93 @@ class TestTaskExtraction:
 
         with pytest.raises(RoboValidationError):
             instructor_service.extract_tasks("Test content")
+
+
+class TestCombinedNoteProcessing:
+    """Test suite for combined note processing."""
+
+    def test_process_note_with_tasks_success(
+        self, instructor_service, mocker
+    ):
+        """Test one call returns the enriched note and its tasks."""
+        tool_call = mocker.MagicMock()
+        tool_call.function.name = MockFunctionName(
+            "NoteProcessingSchema"
+        )
+        tool_call.function.arguments = json.dumps(
+            {
+                "title": "Test Note",
+                "formatted": "Formatted content",
+                "tasks": [
+                    {
+                        "content": "Call Bob tomorrow",
+                        "priority": "high",
+                        "due_date": "2025-02-01",
+                    }
+                ],
+            }
+        )
+        response = mocker.MagicMock()
+        response.choices[0].message.tool_calls = [tool_call]
+        response.usage.total_tokens = 120
+        create = mocker.MagicMock(return_value=response)
+        instructor_service.client.chat.completions.create = (
+            create
+        )
+
+        result = instructor_service.process_note_with_tasks(
+            "Call Bob tomorrow"
+        )
+
+        create.assert_called_once()
+        assert (
+            create.call_args.kwargs["max_tokens"]
+            == instructor_service.config.note_processing_max_tokens
+        )
+        assert result.note.content == "Formatted content"
+        assert result.note.metadata["title"] == "Test Note"
+        assert result.note.tokens_used == 120
+        assert result.tasks == [
+            {
+                "content": "Call Bob tomorrow",
+                "priority": "high",
+                "due_date": "2025-02-01",
+            }
+        ]
+
+    def test_process_note_with_tasks_invalid_tasks(
+        self, instructor_service, mocker
+    ):
+        """Test invalid tasks keep the note and come back as None."""
+        tool_call = mocker.MagicMock()
+        tool_call.function.name = MockFunctionName(
+            "NoteProcessingSchema"
+        )
+        tool_call.function.arguments = json.dumps(
+            {
+                "title": "Test Note",
+                "formatted": "Formatted content",
+                "tasks": [{"priority": "someday"}],
+            }
+        )
+        response = mocker.MagicMock()
+        response.choices[0].message.tool_calls = [tool_call]
+        response.usage.total_tokens = 120
+        create = mocker.MagicMock(return_value=response)
+        instructor_service.client.chat.completions.create = (
+            create
+        )
+
+        result = instructor_service.process_note_with_tasks(
+            "Call Bob tomorrow"
+        )
+
+        assert result.note.content == "Formatted content"
+        assert result.tasks is None
+
+    def test_process_note_with_tasks_validation(
+        self, instructor_service
+    ):
+        """Test empty notes are rejected."""
+        with pytest.raises(RoboValidationError):
+            instructor_service.process_note_with_tasks("")
@@ -5,6 +5,9 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock
 from fastapi import HTTPException
 
+from infrastructure.cache.schema_validator_cache import (
+    SchemaValidatorCache,
+)
 from services.MomentService import MomentService
 from schemas.pydantic.MomentSchema import (
     MomentCreate,
@@ -21,7 +24,12 @@ from domain.exceptions import MomentTimestampError
 @pytest.fixture
 def moment_service(test_db_session):
     """Create MomentService instance with test database session."""
-    return MomentService(db=test_db_session)
+    service = MomentService(db=test_db_session)
+    # Mock activities share IDs, so don't reuse other tests' schemas
+    service.moment_repository.validator_cache = (
+        SchemaValidatorCache()
+    )
+    return service
 
 
 @pytest.fixture
@@ -45,6 +53,7 @@ def mock_activity():
         "type": "object",
         "properties": {},
     }
+    activity.activity_schema_dict = activity.activity_schema
     activity.icon = "test-icon"
     activity.color = "#000000"
     activity.user_id = "test-user-id"
@@ -202,6 +211,12 @@ class TestMomentService:
         assert isinstance(result, MomentResponse)
         assert result.id == mock_moment.id
         assert result.activity_id == mock_moment.activity_id
+        # Validated once here, not again by the repository
+        create = moment_service.moment_repository.create
+        assert (
+            create.call_args.kwargs["schema_checked"]
+            is True
+        )
 
     def test_create_moment_invalid_activity(
         self, moment_service, valid_moment_data
@@ -226,10 +241,11 @@ class TestMomentService:
         mock_activity,
     ):
         """Test moment creation with invalid data."""
-        # Setup mock to fail schema validation
-        mock_activity.validate_moment_data.side_effect = (
-            ValueError("Invalid data")
-        )
+        # Setup a schema the moment data doesn't match
+        mock_activity.activity_schema_dict = {
+            "type": "object",
+            "required": ["missing_field"],
+        }
         moment_service.activity_repository.get_by_user = (
             Mock(return_value=mock_activity)
         )
@@ -248,6 +264,149 @@ class TestMomentService:
             in exc.value.detail
         )
 
+    def test_create_moments_batch_partial_success(
+        self,
+        moment_service,
+        valid_moment_data,
+        mock_activity,
+    ):
+        """Test batch creation reports invalid items per index."""
+        mock_activity.activity_schema_dict = {
+            "type": "object",
+            "properties": {
+                "test_field": {"type": "string"}
+            },
+            "required": ["test_field"],
+        }
+        moment_service.activity_repository.get_many_by_user = Mock(
+            return_value={1: mock_activity}
+        )
+        moment_service.moment_repository.bulk_create = Mock(
+            side_effect=lambda rows, user_id: len(rows)
+        )
+
+        moments = [
+            MomentCreate(**valid_moment_data),
+            MomentCreate(
+                **{
+                    **valid_moment_data,
+                    "data": {"other": 1},
+                }
+            ),
+            MomentCreate(
+                **{**valid_moment_data, "activity_id": 2}
+            ),
+        ]
+        result = moment_service.create_moments_batch(
+            moments, "test_user"
+        )
+
+        assert result.created == 1
+        assert result.failed == 2
+        assert [r.status for r in result.results] == [
+            "created",
+            "failed",
+            "failed",
+        ]
+        assert (
+            "does not match activity schema"
+            in result.results[1].error
+        )
+        assert (
+            "Activity not found" in result.results[2].error
+        )
+        repository = moment_service.activity_repository
+        repository.get_many_by_user.assert_called_once()
+        bulk_create = (
+            moment_service.moment_repository.bulk_create
+        )
+        rows = bulk_create.call_args[0][0]
+        assert rows[0]["data"] == valid_moment_data["data"]
+
+    def test_create_moments_batch_timestamp_range(
+        self,
+        moment_service,
+        valid_moment_data,
+        mock_activity,
+    ):
+        """Test batch items get the single create timestamp range."""
+        mock_activity.activity_schema_dict = {
+            "type": "object"
+        }
+        moment_service.activity_repository.get_many_by_user = Mock(
+            return_value={1: mock_activity}
+        )
+        moment_service.moment_repository.bulk_create = Mock(
+            side_effect=lambda rows, user_id: len(rows)
+        )
+        now = datetime.now(timezone.utc)
+
+        moments = [
+            MomentCreate(**valid_moment_data),
+            MomentCreate(
+                **{
+                    **valid_moment_data,
+                    "timestamp": now + timedelta(days=2),
+                }
+            ),
+            MomentCreate(
+                **{
+                    **valid_moment_data,
+                    "timestamp": now
+                    - timedelta(days=365 * 11),
+                }
+            ),
+        ]
+        result = moment_service.create_moments_batch(
+            moments, "test_user"
+        )
+
+        assert result.created == 1
+        assert [r.status for r in result.results] == [
+            "created",
+            "failed",
+            "failed",
+        ]
+        assert "future" in result.results[1].error
+        assert "past" in result.results[2].error
+        bulk_create = (
+            moment_service.moment_repository.bulk_create
+        )
+        assert len(bulk_create.call_args[0][0]) == 1
+
+    def test_create_moments_batch_leaves_input_unchanged(
+        self,
+        moment_service,
+        valid_moment_data,
+        mock_activity,
+    ):
+        """Test UTC-coerced timestamps aren't written back."""
+        mock_activity.activity_schema_dict = {
+            "type": "object"
+        }
+        moment_service.activity_repository.get_many_by_user = Mock(
+            return_value={1: mock_activity}
+        )
+        moment_service.moment_repository.bulk_create = Mock(
+            side_effect=lambda rows, user_id: len(rows)
+        )
+        naive = datetime(2024, 1, 1, 12, 0)
+        moment = MomentCreate(
+            **{**valid_moment_data, "timestamp": naive}
+        )
+
+        moment_service.create_moments_batch(
+            [moment], "test_user"
+        )
+
+        assert moment.timestamp == naive
+        assert moment.timestamp.tzinfo is None
+        bulk_create = (
+            moment_service.moment_repository.bulk_create
+        )
+        rows = bulk_create.call_args[0][0]
+        assert rows[0]["timestamp"].tzinfo is not None
+
     def test_list_moments_success(
         self, moment_service, mock_moment
     ):
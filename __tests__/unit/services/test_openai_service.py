@@ -102,7 +102,7 @@ def openai_service(
         "services.OpenAIService.OpenAI",
         return_value=mock_openai,
     ), patch(
-        "services.OpenAIService.RateLimiter",
+        "services.OpenAIService.get_rate_limiter",
         return_value=mock_rate_limiter,
     ):
         return OpenAIService(robo_config)
@@ -217,7 +217,7 @@ class TestOpenAIService:
             "services.OpenAIService.OpenAI",
             return_value=mock_openai,
         ), patch(
-            "services.OpenAIService.RateLimiter",
+            "services.OpenAIService.get_rate_limiter",
             return_value=mock_rate_limiter,
         ):
             service = OpenAIService(robo_config)
@@ -241,7 +241,7 @@ class TestOpenAIService:
             "services.OpenAIService.OpenAI",
             return_value=mock_openai,
         ), patch(
-            "services.OpenAIService.RateLimiter",
+            "services.OpenAIService.get_rate_limiter",
             return_value=mock_rate_limiter,
         ):
             service = OpenAIService(robo_config)
@@ -269,7 +269,7 @@ class TestOpenAIService:
             "services.OpenAIService.OpenAI",
             return_value=mock_openai,
         ), patch(
-            "services.OpenAIService.RateLimiter",
+            "services.OpenAIService.get_rate_limiter",
             return_value=mock_rate_limiter,
         ):
             service = OpenAIService(robo_config)
@@ -485,7 +485,7 @@ class TestOpenAIService:
             "services.OpenAIService.OpenAI",
             return_value=mock_openai,
         ), patch(
-            "services.OpenAIService.RateLimiter",
+            "services.OpenAIService.get_rate_limiter",
             return_value=mock_rate_limiter,
         ):
             service = OpenAIService(robo_config)
@@ -509,7 +509,7 @@ class TestOpenAIService:
             "services.OpenAIService.OpenAI",
             return_value=mock_openai,
         ), patch(
-            "services.OpenAIService.RateLimiter",
+            "services.OpenAIService.get_rate_limiter",
             return_value=mock_rate_limiter,
         ):
             service = OpenAIService(robo_config)
@@ -534,6 +534,42 @@ class TestOpenAIService:
             assert len(result) == 1
             assert result[0]["content"] == "Test task"
 
+    def test_extract_tasks_rate_limited(
+        self,
+        openai_service,
+        mock_rate_limiter,
+        mock_openai_function_response,
+    ):
+        """Test task extraction reserves and records capacity."""
+        mock_openai_function_response.created = 1700000000
+        mock_openai_function_response.usage.total_tokens = (
+            60
+        )
+        with patch.object(
+            openai_service.client.chat.completions,
+            "create",
+            return_value=mock_openai_function_response,
+        ):
+            openai_service.extract_tasks(
+                "Test note content"
+            )
+
+        mock_rate_limiter.wait_for_capacity.assert_called_once()
+        mock_rate_limiter.record_usage.assert_called_once_with(
+            datetime.fromtimestamp(
+                1700000000, timezone.utc
+            ),
+            60,
+        )
+
+        mock_rate_limiter.wait_for_capacity.return_value = (
+            False
+        )
+        with pytest.raises(RoboRateLimitError):
+            openai_service.extract_tasks(
+                "Test note content"
+            )
+
     def test_extract_tasks_no_tasks(
         self, openai_service, mock_openai_function_response
     ):
@@ -649,6 +685,86 @@ class TestOpenAIService:
             assert result[1]["content"] == "Task 2"
             assert result[2]["content"] == "Task 3"
 
+    def test_process_note_with_tasks_success(
+        self, openai_service, mock_openai_function_response
+    ):
+        """Test enriching a note and extracting tasks in one call."""
+        tool_call = mock_openai_function_response.choices[
+            0
+        ].message.tool_calls[0]
+        tool_call.function.name = "process_note"
+        tool_call.function.arguments = json.dumps(
+            {
+                "title": "Test Note",
+                "formatted": "Formatted content",
+                "tasks": [
+                    {
+                        "content": "Task 1",
+                        "priority": "high",
+                    }
+                ],
+            }
+        )
+        mock_openai_function_response.usage.total_tokens = (
+            40
+        )
+
+        with patch.object(
+            openai_service.client.chat.completions,
+            "create",
+            return_value=mock_openai_function_response,
+        ) as mock_create:
+            result = openai_service.process_note_with_tasks(
+                "Test note content"
+            )
+
+        mock_create.assert_called_once()
+        assert (
+            mock_create.call_args.kwargs["max_tokens"]
+            == openai_service.config.note_processing_max_tokens
+        )
+        assert result.note.content == "Formatted content"
+        assert result.note.metadata["title"] == "Test Note"
+        assert result.note.tokens_used == 40
+        assert result.tasks == [
+            {"content": "Task 1", "priority": "high"}
+        ]
+
+    @pytest.mark.parametrize(
+        "tasks",
+        [None, "Task 1", [{"priority": "high"}]],
+    )
+    def test_process_note_with_tasks_invalid_tasks(
+        self,
+        openai_service,
+        mock_openai_function_response,
+        tasks,
+    ):
+        """Test invalid tasks keep the note and come back as None."""
+        tool_call = mock_openai_function_response.choices[
+            0
+        ].message.tool_calls[0]
+        tool_call.function.name = "process_note"
+        arguments = {
+            "title": "Test Note",
+            "formatted": "Content",
+        }
+        if tasks is not None:
+            arguments["tasks"] = tasks
+        tool_call.function.arguments = json.dumps(arguments)
+
+        with patch.object(
+            openai_service.client.chat.completions,
+            "create",
+            return_value=mock_openai_function_response,
+        ):
+            result = openai_service.process_note_with_tasks(
+                "Test note content"
+            )
+
+        assert result.note.content == "Content"
+        assert result.tasks is None
+
     def test_get_datetime_context(self, openai_service):
         """Test datetime context generation."""
         context = openai_service._get_datetime_context()
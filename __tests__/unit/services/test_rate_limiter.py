@@ -1,7 +1,11 @@
 import pytest
 from datetime import datetime, timedelta, UTC
 from unittest.mock import patch
-from services.RateLimiter import RateLimiter
+from fakeredis import FakeServer, FakeStrictRedis
+from services.RateLimiter import (
+    RateLimiter,
+    SharedRateLimiter,
+)
 
 
 @pytest.fixture
@@ -94,3 +98,83 @@ def test_wait_for_capacity_with_retries(rate_limiter):
         # Should succeed as the record will be cleaned up
         result = rate_limiter.wait_for_capacity(1000)
         assert result is True
+
+
+def test_record_usage_reconciles_reservation(rate_limiter):
+    """Test actual usage replaces the estimate reserved for it."""
+    assert rate_limiter.wait_for_capacity(5000) is True
+    # Another request cleans the window in between
+    rate_limiter._get_current_usage(datetime.now(UTC))
+    rate_limiter.record_usage(datetime.now(UTC), 1200)
+
+    (
+        request_count,
+        token_count,
+    ) = rate_limiter._get_current_usage(datetime.now(UTC))
+
+    assert request_count == 1
+    assert token_count == 1200
+
+
+def test_try_acquire_reserves_estimate(rate_limiter):
+    """Test reserved estimates count before usage is recorded."""
+    assert rate_limiter.try_acquire(60_000) is True
+    assert rate_limiter.try_acquire(60_000) is False
+
+
+@pytest.fixture
+def redis_server():
+    """Create an in-memory Redis server."""
+    return FakeServer()
+
+
+def shared_limiter(server, **kwargs):
+    """Create a shared limiter, as one process would."""
+    options = {
+        "requests_per_minute": 2,
+        "tokens_per_minute": 10_000,
+        "max_wait_seconds": 0,
+    }
+    options.update(kwargs)
+    return SharedRateLimiter(
+        redis=FakeStrictRedis(server=server), **options
+    )
+
+
+def test_shared_limit_spans_processes(redis_server):
+    """Test every limiter on the same Redis shares one quota."""
+    first = shared_limiter(redis_server)
+    second = shared_limiter(redis_server)
+
+    assert first.try_acquire(100) is True
+    assert second.try_acquire(100) is True
+    assert first.try_acquire(100) is False
+    assert second.try_acquire(100) is False
+
+
+def test_shared_reservation_reconciled(redis_server):
+    """Test recording usage frees the unused part of an estimate."""
+    first = shared_limiter(
+        redis_server, requests_per_minute=10
+    )
+    second = shared_limiter(
+        redis_server, requests_per_minute=10
+    )
+
+    assert first.try_acquire(8000) is True
+    assert second.try_acquire(4000) is False
+
+    first.record_usage(datetime.now(UTC), 3000)
+
+    assert second.try_acquire(4000) is True
+
+
+def test_shared_falls_back_without_redis(redis_server):
+    """Test the local window is used while Redis is down."""
+    redis_server.connected = False
+    limiter = shared_limiter(redis_server)
+
+    assert limiter.try_acquire(100) is True
+    limiter.record_usage(datetime.now(UTC), 50)
+
+    assert limiter.token_history[0][1] == 50
@@ -30,6 +30,15 @@ def mock_task_repo():
         yield mock.return_value
 
 
+@pytest.fixture
+def mock_topic_repo():
+    """Create a mock topic repository."""
+    with patch(
+        "services.TaskService.TopicRepository"
+    ) as mock:
+        yield mock.return_value
+
+
 @pytest.fixture
 def mock_queue_service():
     """Create a mock queue service."""
@@ -39,11 +48,15 @@ def mock_queue_service():
 
 @pytest.fixture
 def task_service(
-    mock_db, mock_task_repo, mock_queue_service
+    mock_db,
+    mock_task_repo,
+    mock_topic_repo,
+    mock_queue_service,
 ):
     """Create a TaskService instance with mocked dependencies."""
     service = TaskService(db=mock_db)
     service.task_repo = mock_task_repo
+    service.topic_repo = mock_topic_repo
     service.queue_service = mock_queue_service
     return service
 
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException, status
 
 from services.TimelineService import TimelineService
@@ -23,8 +23,9 @@ def mock_db():
 def timeline_service(mock_db):
     """Create a TimelineService instance with mocked dependencies."""
     service = TimelineService(db=mock_db)
-    # Mock the repository's list_events method
-    service.timeline_repo.list_events = MagicMock()
+    # Mock the async repository's query methods
+    service.timeline_repo.list_events = AsyncMock()
+    service.timeline_repo.get_recent_by_user = AsyncMock()
     return service
 
 
@@ -59,12 +60,12 @@ def sample_timeline_events():
 
 @pytest.mark.asyncio
 async def test_get_recent_events(
-    timeline_service, mock_db, sample_timeline_events
+    timeline_service, sample_timeline_events
 ):
     """Test getting recent events for a user."""
     # Setup mock
     mock_result = sample_timeline_events[:2]
-    mock_db.query().filter().order_by().limit().all.return_value = (
+    timeline_service.timeline_repo.get_recent_by_user.return_value = (
         mock_result
     )
 
@@ -74,6 +75,9 @@ async def test_get_recent_events(
     )
 
     # Verify
+    timeline_service.timeline_repo.get_recent_by_user.assert_awaited_once_with(
+        user_id="user1", limit=2
+    )
     assert len(events) == 2
     assert events[0].id == 1
     assert (
@@ -3,7 +3,11 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from unittest.mock import Mock, patch
 import bcrypt
+from fakeredis import FakeStrictRedis
 
+from infrastructure.cache.verified_key_cache import (
+    VerifiedKeyCache,
+)
 from services.UserService import UserService
 
 
@@ -175,6 +179,58 @@ class TestUserService:
             user_service.authenticate_user(wrong_key)
         assert exc_info.value.status_code == 401
 
+    def test_authenticate_user_caches_verified_key(self):
+        """Test a verified key skips bcrypt on the next login"""
+        secret = "secret456"
+        user = Mock(
+            id="user-1",
+            user_secret=bcrypt.hashpw(
+                secret.encode(), bcrypt.gensalt(rounds=4)
+            ).decode(),
+        )
+        service = UserService(Mock())
+        service.user_repository = Mock()
+        service.user_repository.get_by_key_id.return_value = (
+            user
+        )
+        service.key_cache = VerifiedKeyCache(
+            redis=FakeStrictRedis()
+        )
+
+        with patch.object(
+            service,
+            "verify_secret",
+            wraps=service.verify_secret,
+        ) as verify:
+            service.authenticate_user(f"key123.{secret}")
+            service.authenticate_user(f"key123.{secret}")
+
+        verify.assert_called_once()
+
+    def test_authenticate_user_cached_key_other_user(self):
+        """Test a cached key for another user is re-verified"""
+        user = Mock(
+            id="user-2",
+            user_secret=bcrypt.hashpw(
+                b"other", bcrypt.gensalt(rounds=4)
+            ).decode(),
+        )
+        service = UserService(Mock())
+        service.user_repository = Mock()
+        service.user_repository.get_by_key_id.return_value = (
+            user
+        )
+        service.key_cache = VerifiedKeyCache(
+            redis=FakeStrictRedis()
+        )
+        service.key_cache.remember(
+            "key123.secret", "user-1"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.authenticate_user("key123.secret")
+        assert exc_info.value.status_code == 401
+
     def test_get_user_by_id_success(
         self, user_service: UserService
     ):
@@ -1,11 +1,18 @@
 """Tests for the request logging middleware."""
 
+import logging
+
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 from utils.middleware.request_logging import (
     RequestLoggingMiddleware,
 )
+from configs.QueryTracking import (
+    UNMATCHED_ROUTE,
+    QueryTracker,
+)
 
 
 @pytest.fixture
@@ -51,3 +58,127 @@ def test_request_logging_middleware(
         or "status_code = 200" in logs
     )
     assert "duration_ms" in logs
+
+
+def test_request_logging_exposes_db_headers():
+    """Test the SQL budget is exposed as headers when enabled."""
+    tracker = QueryTracker(expose_headers=True)
+    app = FastAPI()
+    app.add_middleware(
+        RequestLoggingMiddleware, query_tracker=tracker
+    )
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        """Endpoint that pretends to run two queries."""
+        tracker.record_query("SELECT 1", 0.001)
+        tracker.record_query("SELECT 1", 0.001)
+        return {"id": item_id}
+
+    response = TestClient(app).get("/items/5")
+
+    assert response.headers["X-DB-Query-Count"] == "2"
+    assert response.headers["X-DB-Repeated-Queries"] == "0"
+    assert "X-DB-Time-Ms" in response.headers
+    routes = tracker.snapshot()["routes"]
+    assert routes["/items/{item_id}"]["queries"] == 2
+
+
+def test_request_logging_buckets_unmatched_paths():
+    """Test requests matching no route share one stats entry."""
+    tracker = QueryTracker()
+    app = FastAPI()
+    app.add_middleware(
+        RequestLoggingMiddleware, query_tracker=tracker
+    )
+
+    client = TestClient(app)
+    client.get("/random-1")
+    client.get("/random-2")
+
+    routes = tracker.snapshot()["routes"]
+    assert list(routes) == [UNMATCHED_ROUTE]
+    assert routes[UNMATCHED_ROUTE]["requests"] == 2
+
+
+def test_request_logging_hides_db_headers_by_default():
+    """Test headers are omitted when the tracker does not expose them."""
+    app = FastAPI()
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        query_tracker=QueryTracker(expose_headers=False),
+    )
+
+    @app.get("/test")
+    async def test_endpoint():
+        """Simple test endpoint that returns a message."""
+        return {"message": "test"}
+
+    response = TestClient(app).get("/test")
+    assert "X-DB-Query-Count" not in response.headers
+
+
+def test_request_logging_copies_allowed_headers_only(
+    caplog,
+):
+    """Test only allow-listed request headers reach the log."""
+    app = FastAPI()
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        query_tracker=QueryTracker(),
+        log_headers=["User-Agent"],
+    )
+
+    @app.get("/test")
+    async def test_endpoint():
+        """Simple test endpoint that returns a message."""
+        return {"message": "test"}
+
+    with caplog.at_level(logging.INFO):
+        TestClient(app).get(
+            "/test",
+            headers={
+                "User-Agent": "tests",
+                "Authorization": "Bearer secret",
+            },
+        )
+
+    started = next(
+        r
+        for r in caplog.records
+        if r.getMessage().startswith("Request started")
+    )
+    assert started.headers == {"user-agent": "tests"}
+
+
+def test_request_logging_sampling_keeps_errors(caplog):
+    """Test unsampled requests are only logged on server errors."""
+    app = FastAPI()
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        query_tracker=QueryTracker(),
+        sample_rate=0,
+    )
+
+    @app.get("/ok")
+    async def ok():
+        """Endpoint that succeeds."""
+        return {"message": "ok"}
+
+    @app.get("/fail")
+    async def fail():
+        """Endpoint that fails."""
+        return JSONResponse({}, status_code=503)
+
+    client = TestClient(app)
+    with caplog.at_level(logging.INFO):
+        client.get("/ok")
+        client.get("/fail")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert not any("path=/ok" in m for m in messages)
+    assert any(
+        m.startswith("Request completed path=/fail")
+        and "status_code=503" in m
+        for m in messages
+    )
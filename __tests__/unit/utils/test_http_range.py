@@ -0,0 +1,50 @@
+"""Tests for HTTP Range and conditional request helpers."""
+
+import pytest
+from datetime import datetime, timezone
+
+from utils.http_range import (
+    RangeNotSatisfiable,
+    etag_matches,
+    make_etag,
+    parse_range,
+)
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=90-", (90, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=50-500", (50, 99)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-9", None),
+        ("bytes=abc", None),
+    ],
+)
+def test_parse_range(header, expected):
+    """Test single byte ranges resolve against the file size."""
+    assert parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize(
+    "header", ["bytes=100-", "bytes=10-5"]
+)
+def test_parse_range_not_satisfiable(header):
+    """Test ranges outside the file are rejected."""
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, 100)
+
+
+def test_etag_matches():
+    """Test If-None-Match comparison against an ETag."""
+    etag = make_etag(
+        1, 100, datetime(2024, 5, 1, tzinfo=timezone.utc)
+    )
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
@@ -0,0 +1,59 @@
+"""Tests for pagination utilities."""
+
+import pytest
+from datetime import datetime, timezone
+
+from utils.pagination import (
+    calculate_pages,
+    decode_cursor,
+    encode_cursor,
+    page_to_skip,
+)
+
+
+def test_page_to_skip():
+    """Test page/size conversion to skip/limit."""
+    assert page_to_skip(1, 50) == (0, 50)
+    assert page_to_skip(3, 10) == (20, 10)
+
+
+def test_calculate_pages():
+    """Test page count calculation."""
+    assert calculate_pages(0, 10) == 0
+    assert calculate_pages(10, 10) == 1
+    assert calculate_pages(11, 10) == 2
+
+
+def test_cursor_round_trip():
+    """Test cursors decode to the position they encode."""
+    timestamp = datetime(
+        2024, 5, 1, 12, 30, tzinfo=timezone.utc
+    )
+    cursor = encode_cursor(timestamp, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (timestamp, 42)
+
+
+def test_cursor_round_trip_naive_datetime():
+    """Test naive datetimes (e.g. from MySQL) survive a round trip."""
+    timestamp = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(timestamp, 7)) == (
+        timestamp,
+        7,
+    )
+
+
+@pytest.mark.parametrize("cursor", [None, ""])
+def test_decode_empty_cursor(cursor):
+    """Test an empty cursor starts from the first item."""
+    assert decode_cursor(cursor) is None
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", "W10", "eyJhIjoxfQ"]
+)
+def test_decode_invalid_cursor(cursor):
+    """Test malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
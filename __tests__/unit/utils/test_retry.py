@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock
-from utils.retry import with_retry
+from utils.retry import defer_retries, with_retry
 
 
 @pytest.mark.asyncio
@@ -94,3 +94,18 @@ async def test_retry_with_backoff():
     result = await test_func()
     assert result == "success"
     assert mock_func.await_count == 3
+
+
+def test_retry_deferred():
+    """Test deferred retries raise on the first failure."""
+    calls = []
+
+    @with_retry(max_retries=3, retry_on=ValueError)
+    def test_func():
+        calls.append(1)
+        raise ValueError("retry later")
+
+    with defer_retries():
+        with pytest.raises(ValueError):
+            test_func()
+    assert len(calls) == 1
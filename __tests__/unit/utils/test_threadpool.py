@@ -0,0 +1,76 @@
+"""Tests for running blocking route handlers in threads."""
+
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+
+import pytest
+
+from utils.threadpool import run_in_threadpool
+
+request_id: ContextVar[str] = ContextVar(
+    "request_id", default=""
+)
+
+
+@pytest.mark.asyncio
+async def test_runs_handler_off_the_event_loop():
+    """Test the handler runs in a worker thread."""
+    loop_thread = threading.get_ident()
+
+    @run_in_threadpool
+    def handler(value):
+        return value, threading.get_ident()
+
+    value, thread = await handler(5)
+
+    assert value == 5
+    assert thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_propagates_exceptions():
+    """Test handler exceptions reach the caller."""
+
+    @run_in_threadpool
+    def handler():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await handler()
+
+
+@pytest.mark.asyncio
+async def test_carries_context_variables():
+    """Test request context is visible in the worker thread."""
+
+    @run_in_threadpool
+    def handler():
+        return request_id.get()
+
+    request_id.set("req-1")
+
+    assert await handler() == "req-1"
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_calls():
+    """Test max_concurrency caps calls running at once."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    @run_in_threadpool(max_concurrency=2)
+    def handler():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(handler() for _ in range(6)))
+
+    assert peak == 2
@@ -1,18 +1,34 @@
 import logging
+from functools import lru_cache
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from configs.Environment import get_environment_variables
-import time
-
-# Configure SQLAlchemy logging
-logging.basicConfig()
-logging.getLogger("sqlalchemy.engine").setLevel(
-    logging.INFO
+from configs.DatabaseMetrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    get_pool_stats,
+    query_histogram,
 )
+from configs.QueryTracking import get_query_tracker
+import time
 
 env = get_environment_variables()
 
+# Statement logging is opt-in: formatting every query at INFO
+# costs real CPU under load
+logging.basicConfig()
+if env.DATABASE_ECHO:
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.INFO
+    )
+
 # Construct Database URL from environment variables
 DATABASE_URL = (
     f"{env.DATABASE_DIALECT}{env.DATABASE_DRIVER}"
@@ -21,13 +37,25 @@ DATABASE_URL = (
     f"/{env.DATABASE_NAME}"
 )
 
-# Create engine with echo=True to enable SQL logging
+# Same database through an asyncio driver (aiomysql by default)
+ASYNC_DATABASE_URL = (
+    f"{env.DATABASE_DIALECT}{env.DATABASE_ASYNC_DRIVER}"
+    f"://{env.DATABASE_USERNAME}:{env.DATABASE_PASSWORD}"
+    f"@{env.DATABASE_HOSTNAME}:{env.DATABASE_PORT}"
+    f"/{env.DATABASE_NAME}"
+)
+
+# Pool sizing comes from the environment so it can be tuned per
+# deployment; checkout wait time is recorded by the pool class
 engine = create_engine(
     DATABASE_URL,
-    echo=True,  # Enable SQL echoing
+    echo=env.DATABASE_ECHO,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=env.DATABASE_POOL_SIZE,
+    max_overflow=env.DATABASE_POOL_OVERFLOW,
+    pool_recycle=env.DATABASE_POOL_RECYCLE,
+    pool_timeout=env.DATABASE_POOL_TIMEOUT,
+    poolclass=InstrumentedQueuePool,
 )
 
 
@@ -42,7 +70,7 @@ def before_cursor_execute(
     executemany,
 ):
     conn.info.setdefault("query_start_time", []).append(
-        time.time()
+        time.perf_counter()
     )
     logging.getLogger("sqlalchemy.engine").debug(
         "Start Query: %s", statement
@@ -58,9 +86,11 @@ def after_cursor_execute(
     context,
     executemany,
 ):
-    total = time.time() - conn.info["query_start_time"].pop(
-        -1
-    )
+    total = time.perf_counter() - conn.info[
+        "query_start_time"
+    ].pop(-1)
+    query_histogram.observe(total)
+    get_query_tracker().record_query(statement, total)
     logging.getLogger("sqlalchemy.engine").debug(
         "Query Complete!"
     )
@@ -89,3 +119,77 @@ def get_db_connection():
         yield db
     finally:
         db.close()
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Get the process-wide async engine.
+
+    Created lazily so the asyncio driver is only imported by
+    processes that actually use the async path.
+
+    Returns:
+        SQLAlchemy async engine for ASYNC_DATABASE_URL
+    """
+    return create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=env.DATABASE_ECHO,
+        pool_pre_ping=True,
+        pool_size=env.DATABASE_POOL_SIZE,
+        max_overflow=env.DATABASE_POOL_OVERFLOW,
+        pool_recycle=env.DATABASE_POOL_RECYCLE,
+        pool_timeout=env.DATABASE_POOL_TIMEOUT,
+        poolclass=InstrumentedAsyncQueuePool,
+    )
+
+
+@lru_cache
+def get_async_session_factory() -> (
+    async_sessionmaker[AsyncSession]
+):
+    """Get the session factory bound to the async engine.
+
+    Returns:
+        Factory producing AsyncSession instances
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db_connection():
+    """FastAPI dependency for an async database connection.
+
+    Queries made through this session await the driver instead
+    of blocking the event loop, so concurrent requests overlap
+    their database I/O within one worker.
+
+    Yields:
+        AsyncSession that will be automatically closed
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+def get_database_metrics() -> dict:
+    """Get live pool, query and per-route SQL statistics.
+
+    The async engine is only reported once something has
+    created it, so reading metrics never opens a new pool.
+
+    Returns:
+        Dict with per-engine pool stats, the query histogram and
+        per-route query budgets with slow statements
+    """
+    pools = {"sync": get_pool_stats(engine.pool)}
+    if get_async_engine.cache_info().currsize:
+        pools["async"] = get_pool_stats(
+            get_async_engine().sync_engine.pool
+        )
+    return {
+        "pools": pools,
+        "query_time_ms": query_histogram.snapshot(),
+        "requests": get_query_tracker().snapshot(),
+    }
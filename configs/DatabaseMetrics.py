@@ -0,0 +1,140 @@
+"""Connection pool and query timing metrics."""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    Pool,
+    QueuePool,
+)
+
+
+class LatencyHistogram:
+    """Thread-safe histogram of durations with fixed buckets.
+
+    Buckets are cumulative upper bounds in milliseconds, so a
+    snapshot can be read the same way as a Prometheus histogram.
+    """
+
+    BUCKETS_MS = (
+        1,
+        5,
+        10,
+        25,
+        50,
+        100,
+        250,
+        500,
+        1000,
+        2500,
+        5000,
+    )
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a single duration.
+
+        Args:
+            seconds: Observed duration in seconds
+        """
+        ms = seconds * 1000
+        index = bisect.bisect_left(self.BUCKETS_MS, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a consistent copy of the histogram.
+
+        Returns:
+            Dict with count, sum_ms and cumulative bucket counts
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            sum_ms = self._sum_ms
+
+        buckets = {}
+        running = 0
+        for bound, bucket_count in zip(
+            self.BUCKETS_MS, counts
+        ):
+            running += bucket_count
+            buckets[str(bound)] = running
+        buckets["+Inf"] = count
+        return {
+            "count": count,
+            "sum_ms": round(sum_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class _WaitTimingPoolMixin:
+    """Records how long each connection checkout takes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = LatencyHistogram()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_histogram.observe(
+                time.perf_counter() - start
+            )
+
+
+class InstrumentedQueuePool(
+    _WaitTimingPoolMixin, QueuePool
+):
+    """QueuePool that tracks checkout wait time."""
+
+
+class InstrumentedAsyncQueuePool(
+    _WaitTimingPoolMixin, AsyncAdaptedQueuePool
+):
+    """AsyncAdaptedQueuePool that tracks checkout wait time."""
+
+
+# Durations of every statement executed through any engine
+query_histogram = LatencyHistogram()
+
+
+def get_pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Get live statistics for a connection pool.
+
+    Args:
+        pool: SQLAlchemy pool to inspect
+
+    Returns:
+        Dict with pool size, checked in/out and overflow counts,
+        plus the checkout wait histogram when the pool records it
+    """
+    stats: Dict[str, Any] = {}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+    wait_histogram: Optional[LatencyHistogram] = getattr(
+        pool, "wait_histogram", None
+    )
+    if wait_histogram is not None:
+        stats["wait_time_ms"] = wait_histogram.snapshot()
+    return stats
@@ -32,11 +32,39 @@ class EnvironmentSettings(BaseSettings):
     DATABASE_DRIVER: str = (
         "+pymysql"  # Default to pymysql for MySQL
     )
+    DATABASE_ASYNC_DRIVER: str = (
+        "+aiomysql"  # asyncio driver for the async engine
+    )
     DATABASE_HOSTNAME: str
     DATABASE_NAME: str
     DATABASE_PASSWORD: str
     DATABASE_PORT: int
     DATABASE_USERNAME: str
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 3600
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_ECHO: bool = False
+
+    # Threadpool for blocking route handlers
+    THREADPOOL_MAX_WORKERS: int = 40
+    UPLOAD_MAX_CONCURRENCY: int = 8
+    MOMENT_BATCH_MAX_CONCURRENCY: int = 4
+
+    # Query Tracking Configuration
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    N_PLUS_ONE_THRESHOLD: int = 10
+
+    # Request Logging Configuration
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0
+    REQUEST_LOG_HEADERS: str = (
+        "user-agent,content-type,content-length"
+    )
+
+    # Internal metrics endpoint (/internal/metrics); requests must
+    # send INTERNAL_METRICS_TOKEN as a bearer token
+    INTERNAL_METRICS_ENABLED: bool = False
+    INTERNAL_METRICS_TOKEN: SecretStr | None = None
 
     # Optional Robo Configuration
     ROBO_API_KEY: SecretStr | None = None
@@ -48,12 +76,23 @@ class EnvironmentSettings(BaseSettings):
     ROBO_TIMEOUT_SECONDS: int = 30
     ROBO_TEMPERATURE: float = 0.7
     ROBO_MAX_TOKENS: int = 150
+    # Enrich notes and extract their tasks with one LLM call,
+    # whose response carries both and needs a larger budget
+    ROBO_COMBINED_NOTE_PROCESSING: bool = False
+    ROBO_NOTE_PROCESSING_MAX_TOKENS: int = 1000
+    # Provider limits for LLM calls, shared through Redis by
+    # every API and worker process when ROBO_SHARED_RATE_LIMIT is on
+    ROBO_REQUESTS_PER_MINUTE: int = 60
+    ROBO_TOKENS_PER_MINUTE: int = 90000
+    ROBO_RATE_LIMIT_MAX_WAIT_SECONDS: int = 60
+    ROBO_SHARED_RATE_LIMIT: bool = True
 
     # Prompt Configuration
     ROBO_NOTE_ENRICHMENT_PROMPT: str | None = None
     ROBO_ACTIVITY_SCHEMA_PROMPT: str | None = None
     ROBO_TASK_ENRICHMENT_PROMPT: str | None = None
     ROBO_TASK_EXTRACTION_PROMPT: str | None = None
+    ROBO_NOTE_PROCESSING_PROMPT: str | None = None
 
     # Redis Configuration
     REDIS_HOST: str = "localhost"
@@ -65,6 +104,28 @@ class EnvironmentSettings(BaseSettings):
     QUEUE_JOB_TIMEOUT: int = 600
     QUEUE_JOB_TTL: int = 3600
 
+    # Worker Configuration: "sync" runs one job at a time,
+    # "async" runs up to WORKER_MAX_IN_FLIGHT jobs at once (each
+    # holds a database connection while it runs)
+    WORKER_MODE: str = "sync"
+    WORKER_MAX_IN_FLIGHT: int = 8
+
+    # Seconds between runs of the job repairing drifted activity
+    # moment counters (0 disables the schedule)
+    MOMENT_COUNT_RECONCILE_INTERVAL_SECONDS: int = 3600
+
+    # List Total Cache Configuration
+    LIST_TOTAL_CACHE_TTL_SECONDS: int = 30
+
+    # Entity Read Cache Configuration
+    ENTITY_CACHE_TTL_SECONDS: int = 300
+    ENTITY_CACHE_LOCAL_TTL_SECONDS: float = 5
+    ENTITY_CACHE_LOCAL_MAX_ENTRIES: int = 1024
+
+    # Authenticated User Cache Configuration
+    USER_CACHE_TTL_SECONDS: int = 60
+    VERIFIED_KEY_CACHE_TTL_SECONDS: int = 300
+
     model_config = ConfigDict(
         env_file=get_env_filename(),
         env_file_encoding="utf-8",
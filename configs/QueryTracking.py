@@ -0,0 +1,341 @@
+"""Per-request SQL tracking, slow-query and N+1 detection."""
+
+import logging
+import re
+import threading
+from collections import Counter
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from configs.Environment import get_environment_variables
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?|:\w+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Route key for requests no route matched (404s, scans)
+UNMATCHED_ROUTE = "<unmatched>"
+# Route key for routes seen once the per-route table is full
+OVERFLOW_ROUTE = "<other>"
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape.
+
+    Literals and bound parameters become ``?`` and value lists
+    collapse to ``(?)``, so the same query issued for different
+    rows yields the same fingerprint.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        Normalized statement fingerprint
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _VALUE_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class RequestQueryStats:
+    """SQL activity recorded while serving one request."""
+
+    def __init__(self, route: str):
+        """Initialize empty stats.
+
+        Args:
+            route: Path of the request being served
+        """
+        self.route = route
+        self.query_count = 0
+        self.total_time = 0.0
+        self.shapes: Counter = Counter()
+        self.slow_queries: List[Tuple[str, float]] = []
+
+    @property
+    def db_time_ms(self) -> float:
+        """Total time spent in the database, in milliseconds."""
+        return round(self.total_time * 1000, 2)
+
+    def repeated_shapes(
+        self, threshold: int
+    ) -> Dict[str, int]:
+        """Get statement shapes executed more than threshold times.
+
+        Args:
+            threshold: Repetitions allowed before flagging
+
+        Returns:
+            Mapping of fingerprint to execution count
+        """
+        return {
+            shape: count
+            for shape, count in self.shapes.items()
+            if count > threshold
+        }
+
+
+_current_request: ContextVar[
+    Optional[RequestQueryStats]
+] = ContextVar("current_request_query_stats", default=None)
+
+
+class QueryTracker:
+    """Collects per-request SQL budgets and aggregates them.
+
+    Queries are attributed to the request in the current context.
+    Slow statements are logged with their fingerprint and route;
+    shapes repeated more than ``n_plus_one_threshold`` times in one
+    request are reported as likely N+1 patterns. Aggregates are kept
+    per route so production can read them without per-request noise.
+    """
+
+    MAX_SLOW_QUERY_ENTRIES = 500
+    MAX_ROUTE_ENTRIES = 500
+
+    def __init__(
+        self,
+        slow_query_threshold_ms: int = 200,
+        n_plus_one_threshold: int = 10,
+        expose_headers: bool = False,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            slow_query_threshold_ms: Duration above which a
+                statement is recorded as slow
+            n_plus_one_threshold: Repetitions of one statement
+                shape allowed per request
+            expose_headers: Whether responses carry X-DB-* headers
+        """
+        self.slow_query_threshold_ms = (
+            slow_query_threshold_ms
+        )
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.expose_headers = expose_headers
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self._slow_queries: Dict[
+            Tuple[str, str], Dict[str, Any]
+        ] = {}
+
+    def start_request(self, route: str) -> Token:
+        """Start attributing queries to a new request.
+
+        Args:
+            route: Path of the request
+
+        Returns:
+            Token to pass to finish_request
+        """
+        return _current_request.set(
+            RequestQueryStats(route)
+        )
+
+    def current_request(
+        self,
+    ) -> Optional[RequestQueryStats]:
+        """Get the stats of the request in the current context.
+
+        Returns:
+            Stats collected so far, or None outside a request
+        """
+        return _current_request.get()
+
+    def finish_request(
+        self, token: Token, route: Optional[str] = None
+    ) -> Optional[RequestQueryStats]:
+        """Stop tracking the current request and aggregate it.
+
+        Args:
+            token: Token returned by start_request
+            route: Route template to aggregate under; defaults to
+                the path given to start_request. Once
+                MAX_ROUTE_ENTRIES routes are tracked, new ones are
+                aggregated under OVERFLOW_ROUTE.
+
+        Returns:
+            Stats for the finished request
+        """
+        stats = _current_request.get()
+        _current_request.reset(token)
+        if stats is None:
+            return None
+        if route:
+            stats.route = route
+
+        repeated = stats.repeated_shapes(
+            self.n_plus_one_threshold
+        )
+        for shape, count in repeated.items():
+            logger.warning(
+                f"Possible N+1 query route={stats.route} "
+                f"count={count} statement={shape}",
+                extra={
+                    "route": stats.route,
+                    "count": count,
+                    "fingerprint": shape,
+                },
+            )
+
+        with self._lock:
+            route_key = stats.route
+            if (
+                route_key not in self._routes
+                and len(self._routes)
+                >= self.MAX_ROUTE_ENTRIES
+            ):
+                route_key = OVERFLOW_ROUTE
+            totals = self._routes.setdefault(
+                route_key,
+                {
+                    "requests": 0,
+                    "queries": 0,
+                    "db_time_ms": 0.0,
+                    "max_queries": 0,
+                    "slow_queries": 0,
+                    "n_plus_one_requests": 0,
+                },
+            )
+            totals["requests"] += 1
+            totals["queries"] += stats.query_count
+            totals["db_time_ms"] += stats.total_time * 1000
+            totals["max_queries"] = max(
+                totals["max_queries"], stats.query_count
+            )
+            totals["slow_queries"] += len(
+                stats.slow_queries
+            )
+            if repeated:
+                totals["n_plus_one_requests"] += 1
+            for shape, duration_ms in stats.slow_queries:
+                self._record_slow_query(
+                    route_key, shape, duration_ms
+                )
+        return stats
+
+    def record_query(
+        self, statement: str, duration: float
+    ) -> None:
+        """Attribute an executed statement to the current request.
+
+        Args:
+            statement: SQL statement as sent to the driver
+            duration: Execution time in seconds
+        """
+        stats = _current_request.get()
+        duration_ms = duration * 1000
+        is_slow = (
+            duration_ms >= self.slow_query_threshold_ms
+        )
+        if stats is None and not is_slow:
+            return
+
+        shape = fingerprint_statement(statement)
+        if stats is not None:
+            stats.query_count += 1
+            stats.total_time += duration
+            stats.shapes[shape] += 1
+        if not is_slow:
+            return
+
+        route = stats.route if stats is not None else None
+        logger.warning(
+            f"Slow query route={route} "
+            f"duration_ms={round(duration_ms, 2)} "
+            f"statement={shape}",
+            extra={
+                "route": route,
+                "duration_ms": round(duration_ms, 2),
+                "fingerprint": shape,
+            },
+        )
+        if stats is not None:
+            # Aggregated under the route template at request end
+            stats.slow_queries.append((shape, duration_ms))
+        else:
+            with self._lock:
+                self._record_slow_query(
+                    None, shape, duration_ms
+                )
+
+    def _record_slow_query(
+        self,
+        route: Optional[str],
+        shape: str,
+        duration_ms: float,
+    ) -> None:
+        """Aggregate a slow statement; caller holds the lock."""
+        key = (route or "-", shape)
+        entry = self._slow_queries.get(key)
+        if entry is None:
+            if (
+                len(self._slow_queries)
+                >= self.MAX_SLOW_QUERY_ENTRIES
+            ):
+                return
+            entry = self._slow_queries[key] = {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            }
+        entry["count"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get aggregated per-route and slow-query statistics.
+
+        Returns:
+            Dict with per-route budgets and slow statements,
+            slowest total time first
+        """
+        with self._lock:
+            routes = {
+                route: {
+                    **totals,
+                    "db_time_ms": round(
+                        totals["db_time_ms"], 2
+                    ),
+                }
+                for route, totals in self._routes.items()
+            }
+            slow = [
+                {
+                    "route": route,
+                    "fingerprint": shape,
+                    "count": entry["count"],
+                    "total_ms": round(entry["total_ms"], 2),
+                    "max_ms": round(entry["max_ms"], 2),
+                }
+                for (route, shape), entry in (
+                    self._slow_queries.items()
+                )
+            ]
+        slow.sort(key=lambda e: e["total_ms"], reverse=True)
+        return {
+            "slow_query_threshold_ms": (
+                self.slow_query_threshold_ms
+            ),
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "routes": routes,
+            "slow_queries": slow,
+        }
+
+
+@lru_cache()
+def get_query_tracker() -> QueryTracker:
+    """Get the process-wide query tracker."""
+    env = get_environment_variables()
+    return QueryTracker(
+        slow_query_threshold_ms=env.SLOW_QUERY_THRESHOLD_MS,
+        n_plus_one_threshold=env.N_PLUS_ONE_THRESHOLD,
+        expose_headers=env.DEBUG_MODE,
+    )
@@ -69,6 +69,18 @@ class RoboConfig(BaseModel):
         "5. Exclude any non-task content or context\n"
         "Note: A task is any actionable item that requires completion"
     )
+    # Enrich notes and extract their tasks with one LLM call
+    combined_note_processing: bool = False
+    note_processing_max_tokens: int = 1000
+    note_processing_prompt: str = (
+        "You are a note processing assistant. "
+        "Your task is to:\n"
+        "1. Extract a concise title (<50 chars)\n"
+        "2. Format the content in clean markdown\n"
+        "3. Identify any explicit tasks or action items\n"
+        "4. Return each task in a clear, actionable format\n"
+        "Note: A task is any actionable item that requires completion"
+    )
 
     def to_domain_config(self) -> DomainRoboConfig:
         """Convert settings to domain config.
@@ -109,6 +121,9 @@ class RoboConfig(BaseModel):
             activity_schema_prompt=self.activity_schema_prompt,
             task_enrichment_prompt=self.task_enrichment_prompt,
             task_extraction_prompt=self.task_extraction_prompt,
+            combined_note_processing=self.combined_note_processing,
+            note_processing_max_tokens=self.note_processing_max_tokens,
+            note_processing_prompt=self.note_processing_prompt,
         )
 
     @classmethod
@@ -133,6 +148,10 @@ class RoboConfig(BaseModel):
             env.ROBO_TASK_ENRICHMENT_PROMPT,
             "task_enrichment.txt",
         )
+        note_processing_prompt = get_prompt_from_env(
+            env.ROBO_NOTE_PROCESSING_PROMPT,
+            "note_processing.txt",
+        )
 
         # Parse service implementation
         try:
@@ -162,6 +181,9 @@ class RoboConfig(BaseModel):
             activity_schema_prompt=activity_schema_prompt,
             task_extraction_prompt=task_extraction_prompt,
             task_enrichment_prompt=task_enrichment_prompt,
+            combined_note_processing=env.ROBO_COMBINED_NOTE_PROCESSING,
+            note_processing_max_tokens=env.ROBO_NOTE_PROCESSING_MAX_TOKENS,
+            note_processing_prompt=note_processing_prompt,
         )
 
 
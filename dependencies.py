@@ -11,8 +11,12 @@ from repositories.ActivityRepository import (
     ActivityRepository,
 )
 from services.ActivityService import ActivityService
+from infrastructure.cache.entity_cache import (
+    get_entity_cache,
+    get_user_cache,
+)
 from utils.security import verify_token
-from orm.UserModel import User
+from schemas.pydantic.UserSchema import UserPrincipal
 from domain.ports.QueueService import QueueService
 from fastapi.security import HTTPAuthorizationCredentials
 
@@ -22,8 +26,13 @@ def get_current_user(
         security
     ),
     db: Session = Depends(get_db_connection),
-) -> User:
-    """Get the current authenticated user from the bearer token"""
+) -> UserPrincipal:
+    """Get the current authenticated user from the bearer token
+
+    The user is read through the user cache, so in the steady
+    state authentication does not touch the database and the
+    request session never checks out a connection for it.
+    """
     try:
         # Get the token from credentials
         token = credentials.credentials
@@ -36,9 +45,11 @@ def get_current_user(
                 detail="Invalid token",
             )
 
-        # Get user from database
-        repository = UserRepository(db)
-        user = repository.get_by_id(user_id)
+        # Get user from cache or database
+        repository = UserRepository(
+            db, user_cache=get_user_cache()
+        )
+        user = repository.get_cached_principal(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,7 +69,7 @@ def get_optional_user(
     credentials: Optional[
         HTTPAuthorizationCredentials
     ] = Depends(security),
-) -> Optional[User]:
+) -> Optional[UserPrincipal]:
     """Get the current user if authenticated, otherwise return None."""
     try:
         if not credentials:
@@ -72,10 +83,11 @@ def get_optional_user(
         if not user_id:
             return None
 
-        # Get user from database
-        repository = UserRepository(db)
-        user = repository.get_by_id(user_id)
-        return user
+        # Get user from cache or database
+        repository = UserRepository(
+            db, user_cache=get_user_cache()
+        )
+        return repository.get_cached_principal(user_id)
     except Exception:
         return None
 
@@ -90,7 +102,9 @@ def get_activity_service(
     queue: QueueService = Depends(get_queue),
 ) -> ActivityService:
     """Get activity service instance."""
-    repository = ActivityRepository(db)
+    repository = ActivityRepository(
+        db, entity_cache=get_entity_cache()
+    )
     return ActivityService(
         repository=repository, queue_service=queue
     )
@@ -52,6 +52,9 @@ class DocumentData:
     # Maximum document size in bytes (100MB)
     MAX_DOCUMENT_SIZE = 100 * 1024 * 1024
 
+    # Maximum total size of a user's documents in bytes (1GB)
+    MAX_USER_STORAGE = 1024 * 1024 * 1024
+
     name: str
     mime_type: str
     user_id: str
@@ -63,6 +63,18 @@ class RoboConfig:
         "5. Exclude any non-task content or context\n"
         "Note: Task is any actionable item that needs completion"
     )
+    # Enrich notes and extract their tasks with one LLM call
+    combined_note_processing: bool = False
+    note_processing_max_tokens: int = 1000
+    note_processing_prompt: str = (
+        "You are a note processing assistant. "
+        "Your task is to:\n"
+        "1. Extract a concise title (<50 chars)\n"
+        "2. Format the content in clean markdown\n"
+        "3. Identify any explicit tasks or action items\n"
+        "4. Return each task in a clear, actionable format\n"
+        "Note: Task is any actionable item that needs completion"
+    )
     schema_analysis_prompt: str = (
         "You are a UI/UX expert analyzing JSON schemas. "
         "Your task is to:\n"
@@ -95,6 +107,18 @@ class RoboProcessingResult:
     created_at: datetime = datetime.now(UTC)
 
 
+@dataclass
+class RoboNoteResult:
+    """Result of enriching a note and extracting its tasks.
+
+    tasks is None when the response's tasks couldn't be parsed;
+    the note is still usable and tasks can be extracted separately.
+    """
+
+    note: RoboProcessingResult
+    tasks: Optional[List[Dict[str, Any]]]
+
+
 class RoboService(ABC):
     """Interface for Robo service operations."""
 
@@ -138,6 +162,29 @@ class RoboService(ABC):
         """
         pass
 
+    @abstractmethod
+    def process_note_with_tasks(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> RoboNoteResult:
+        """Enrich a note and extract its tasks in one request.
+
+        Returns what process_note and extract_tasks would for the
+        same content, with the note's prompt tokens paid once.
+
+        Args:
+            content: Note content to process
+            context: Optional context for processing
+
+        Returns:
+            RoboNoteResult: Enriched note (title in metadata) and
+                task dicts with content and optional priority,
+                status and due_date, or None for the tasks when
+                they couldn't be parsed
+        """
+        pass
+
     @abstractmethod
     def extract_entities(
         self, text: str, entity_types: List[str]
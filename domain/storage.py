@@ -3,9 +3,20 @@
 from abc import abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Protocol, BinaryIO
+from typing import BinaryIO, Iterator, Optional, Protocol
 from dataclasses import dataclass
 
+# Bytes read from storage per chunk when streaming file content
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bytes buffered per part when uploading a stream (S3 requires
+# at least 5 MiB for every multipart part but the last)
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Storage owner of content-addressed objects shared between
+# documents; not a valid user ID, so it never clashes with one
+CONTENT_OWNER = "_content"
+
 
 class StorageStatus(str, Enum):
     """Status of a stored file."""
@@ -32,6 +43,7 @@ class StoredFile:
     created_at: datetime
     updated_at: Optional[datetime] = None
     error_message: Optional[str] = None
+    content_hash: Optional[str] = None
 
 
 class StorageError(Exception):
@@ -52,6 +64,12 @@ class StoragePermissionError(StorageError):
     pass
 
 
+class StorageLimitExceededError(StorageError):
+    """Raised when a streamed file grows past its size limit."""
+
+    pass
+
+
 class IStorageService(Protocol):
     """Interface for storage operations.
 
@@ -83,6 +101,37 @@ class IStorageService(Protocol):
         """
         ...
 
+    @abstractmethod
+    def store_stream(
+        self,
+        file_stream: BinaryIO,
+        file_id: str,
+        user_id: str,
+        mime_type: str,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Store a file from a stream without reading it whole.
+
+        Content is copied in chunks while its size and SHA-256 are
+        computed; nothing is left behind if the limit is exceeded.
+
+        Args:
+            file_stream: File-like object to read content from
+            file_id: Unique identifier for the file
+            user_id: ID of the user who owns the file
+            mime_type: MIME type of the file
+            max_bytes: Optional maximum size of the content
+
+        Returns:
+            StoredFile: Metadata about the stored file, including
+                size_bytes and content_hash
+
+        Raises:
+            StorageLimitExceededError: If content exceeds max_bytes
+            StorageError: If file storage fails
+        """
+        ...
+
     @abstractmethod
     def retrieve(
         self,
@@ -107,6 +156,66 @@ class IStorageService(Protocol):
         """
         ...
 
+    @abstractmethod
+    def stream(
+        self,
+        file_id: str,
+        user_id: str,
+        owner_id: Optional[str] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a file's content in chunks.
+
+        Existence and permissions are checked before this returns,
+        so errors surface before the first chunk is produced.
+
+        Args:
+            file_id: ID of the file to stream
+            user_id: ID of the user requesting the file
+            owner_id: Optional ID of the file owner (for public files)
+            start: Offset of the first byte to return
+            end: Offset of the last byte to return, inclusive
+                (defaults to the end of the file)
+            chunk_size: Maximum size of each chunk
+
+        Returns:
+            Iterator[bytes]: Chunks of the requested byte range
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            StoragePermissionError: If user cannot access file
+            StorageError: If the file cannot be opened
+        """
+        ...
+
+    @abstractmethod
+    def rename(
+        self,
+        file_id: str,
+        user_id: str,
+        new_file_id: str,
+    ) -> StoredFile:
+        """Move a file to a new ID under the same owner.
+
+        An existing file with the new ID is replaced.
+
+        Args:
+            file_id: Current ID of the file
+            user_id: ID of the user who owns the file
+            new_file_id: ID to move the file to
+
+        Returns:
+            StoredFile: Metadata about the moved file
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            StoragePermissionError: If user cannot access file
+            StorageError: If the move fails
+        """
+        ...
+
     @abstractmethod
     def delete(
         self,
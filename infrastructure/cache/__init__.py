@@ -0,0 +1,28 @@
+"""Cache infrastructure package."""
+
+from .count_cache import CountCache, get_count_cache
+from .entity_cache import (
+    EntityCache,
+    get_entity_cache,
+    get_user_cache,
+)
+from .schema_validator_cache import (
+    SchemaValidatorCache,
+    get_schema_validator_cache,
+)
+from .verified_key_cache import (
+    VerifiedKeyCache,
+    get_verified_key_cache,
+)
+
+__all__ = [
+    "CountCache",
+    "get_count_cache",
+    "EntityCache",
+    "get_entity_cache",
+    "get_user_cache",
+    "SchemaValidatorCache",
+    "get_schema_validator_cache",
+    "VerifiedKeyCache",
+    "get_verified_key_cache",
+]
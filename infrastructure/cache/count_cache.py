@@ -0,0 +1,118 @@
+"""Short-lived cache for list endpoint totals."""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from configs.Environment import get_environment_variables
+from infrastructure.cache.redis_cache import (
+    RedisBackedCache,
+)
+
+
+class CountCache(RedisBackedCache):
+    """Redis-backed cache of list totals per user and filter signature.
+
+    Entries live under a per-user version number, so a write can
+    invalidate every cached filter combination with a single INCR.
+    Entries also expire after a short TTL, which bounds staleness for
+    tables written outside the application (e.g. timeline events).
+
+    Redis is optional: when it is unreachable the cache falls back to
+    counting directly and retries the connection after a cool-down.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        ttl_seconds: int = 30,
+        retry_after_seconds: int = 30,
+        prefix: str = "count",
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis: Optional Redis client (defaults to the shared one)
+            ttl_seconds: How long a cached total stays valid
+            retry_after_seconds: Cool-down after a Redis failure
+            prefix: Key prefix for all cache entries
+        """
+        super().__init__(
+            redis=redis,
+            retry_after_seconds=retry_after_seconds,
+            prefix=prefix,
+        )
+        self.ttl_seconds = ttl_seconds
+
+    def _entry_key(
+        self,
+        client: Redis,
+        scope: str,
+        user_id: str,
+        filters: Dict[str, Any],
+    ) -> str:
+        """Key for a total under the user's current version."""
+        version = self._version(client, scope, user_id)
+        signature = hashlib.sha1(
+            json.dumps(
+                filters, sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()
+        return (
+            f"{self.prefix}:{scope}:{user_id}:"
+            f"{version}:{signature}"
+        )
+
+    def get_or_count(
+        self,
+        scope: str,
+        user_id: Optional[str],
+        filters: Dict[str, Any],
+        count: Callable[[], int],
+    ) -> int:
+        """Return a cached total, counting and caching on a miss.
+
+        Args:
+            scope: Entity the total belongs to (e.g. "moments")
+            user_id: Owner of the listed rows; totals across all
+                users are never cached
+            filters: Filter values that shape the count
+            count: Callable running the real COUNT query
+
+        Returns:
+            Total number of matching rows
+        """
+        client = self._client()
+        if client is None or user_id is None:
+            return count()
+
+        try:
+            key = self._entry_key(
+                client, scope, user_id, filters
+            )
+            cached = client.get(key)
+            if cached is not None:
+                return int(cached)
+        except RedisError as e:
+            self._disable(e)
+            return count()
+
+        total = count()
+        try:
+            client.set(key, total, ex=self.ttl_seconds)
+        except RedisError as e:
+            self._disable(e)
+        return total
+
+
+@lru_cache()
+def get_count_cache() -> CountCache:
+    """Get the process-wide count cache."""
+    env = get_environment_variables()
+    return CountCache(
+        ttl_seconds=env.LIST_TOTAL_CACHE_TTL_SECONDS
+    )
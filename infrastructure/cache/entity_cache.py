@@ -0,0 +1,240 @@
+"""Read-through cache for per-user entity reads."""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+from redis import Redis
+from redis.exceptions import RedisError
+
+from configs.Environment import get_environment_variables
+from infrastructure.cache.redis_cache import (
+    RedisBackedCache,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class EntityCache(RedisBackedCache):
+    """Two-tier read-through cache of single entities per user.
+
+    Values are pydantic models stored as JSON. A small in-process
+    LRU answers repeated reads without a network round trip; behind
+    it, Redis shares entries between processes under the per-user
+    version, so a write through any process invalidates them.
+
+    The in-process tier is invalidated immediately for writes made
+    in the same process; writes from other processes reach it once
+    its short TTL expires. Not-found results are never cached.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        ttl_seconds: int = 300,
+        local_ttl_seconds: float = 5,
+        local_max_entries: int = 1024,
+        retry_after_seconds: int = 30,
+        prefix: str = "entity",
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis: Optional Redis client (defaults to the shared one)
+            ttl_seconds: How long an entry stays in Redis
+            local_ttl_seconds: How long an entry stays in process;
+                0 disables the in-process tier
+            local_max_entries: Entries kept in process before
+                evicting the least recently used
+            retry_after_seconds: Cool-down after a Redis failure
+            prefix: Key prefix for all cache entries
+        """
+        super().__init__(
+            redis=redis,
+            retry_after_seconds=retry_after_seconds,
+            prefix=prefix,
+        )
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        self.local_max_entries = local_max_entries
+        self._lock = threading.Lock()
+        # (scope, user_id, key) -> (local version, expiry, JSON)
+        self._local: OrderedDict[
+            Tuple[str, str, str], Tuple[int, float, str]
+        ] = OrderedDict()
+        # (scope, user_id) -> in-process invalidation count
+        self._local_versions: Dict[Tuple[str, str], int] = (
+            {}
+        )
+
+    def _get_local(
+        self, scope: str, user_id: str, key: str
+    ) -> Optional[str]:
+        """Get a fresh in-process entry."""
+        local_key = (scope, user_id, key)
+        with self._lock:
+            entry = self._local.get(local_key)
+            if entry is None:
+                return None
+            version, expires_at, payload = entry
+            if version != self._local_versions.get(
+                (scope, user_id), 0
+            ) or (time.monotonic() >= expires_at):
+                del self._local[local_key]
+                return None
+            self._local.move_to_end(local_key)
+            return payload
+
+    def _set_local(
+        self,
+        scope: str,
+        user_id: str,
+        key: str,
+        payload: str,
+        version: int,
+    ) -> None:
+        """Store an in-process entry read under a local version."""
+        if self.local_ttl_seconds <= 0:
+            return
+        local_key = (scope, user_id, key)
+        with self._lock:
+            if version != self._local_versions.get(
+                (scope, user_id), 0
+            ):
+                # Invalidated while loading
+                return
+            self._local[local_key] = (
+                version,
+                time.monotonic() + self.local_ttl_seconds,
+                payload,
+            )
+            self._local.move_to_end(local_key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    def get_or_load(
+        self,
+        scope: str,
+        user_id: str,
+        key: str,
+        model: Type[M],
+        load: Callable[[], Optional[M]],
+    ) -> Optional[M]:
+        """Return a cached entity, loading and caching on a miss.
+
+        Args:
+            scope: Entity type (e.g. "activities")
+            user_id: Owner of the entity
+            key: Entity identifier within the user's scope
+            model: Pydantic model the entity is stored as
+            load: Callable reading the entity from the database;
+                returns None when it does not exist
+
+        Returns:
+            The entity, or None if load found nothing
+        """
+        key = str(key)
+        payload = self._get_local(scope, user_id, key)
+        if payload is not None:
+            return model.model_validate_json(payload)
+
+        with self._lock:
+            local_version = self._local_versions.get(
+                (scope, user_id), 0
+            )
+
+        client = self._client()
+        redis_key = None
+        if client is not None:
+            try:
+                version = self._version(
+                    client, scope, user_id
+                )
+                redis_key = (
+                    f"{self.prefix}:{scope}:{user_id}:"
+                    f"{version}:{key}"
+                )
+                payload = client.get(redis_key)
+            except RedisError as e:
+                self._disable(e)
+                redis_key = None
+            if payload is not None:
+                if isinstance(payload, bytes):
+                    payload = payload.decode()
+                self._set_local(
+                    scope,
+                    user_id,
+                    key,
+                    payload,
+                    local_version,
+                )
+                return model.model_validate_json(payload)
+
+        value = load()
+        if value is None:
+            return None
+
+        payload = value.model_dump_json()
+        self._set_local(
+            scope, user_id, key, payload, local_version
+        )
+        if client is not None and redis_key is not None:
+            try:
+                client.set(
+                    redis_key, payload, ex=self.ttl_seconds
+                )
+            except RedisError as e:
+                self._disable(e)
+        return value
+
+    def invalidate(self, scope: str, user_id: str) -> None:
+        """Invalidate every cached entity of a scope for a user.
+
+        Args:
+            scope: Entity type whose data changed
+            user_id: Owner of the changed rows
+        """
+        with self._lock:
+            scope_key = (scope, user_id)
+            self._local_versions[scope_key] = (
+                self._local_versions.get(scope_key, 0) + 1
+            )
+        super().invalidate(scope, user_id)
+
+
+@lru_cache()
+def get_entity_cache() -> EntityCache:
+    """Get the process-wide entity cache."""
+    env = get_environment_variables()
+    return EntityCache(
+        ttl_seconds=env.ENTITY_CACHE_TTL_SECONDS,
+        local_ttl_seconds=env.ENTITY_CACHE_LOCAL_TTL_SECONDS,
+        local_max_entries=env.ENTITY_CACHE_LOCAL_MAX_ENTRIES,
+    )
+
+
+@lru_cache()
+def get_user_cache() -> EntityCache:
+    """Get the process-wide authenticated user cache.
+
+    Kept apart from the entity cache so that user records, which
+    every authenticated request resolves, expire on their own
+    shorter TTL.
+    """
+    env = get_environment_variables()
+    return EntityCache(
+        ttl_seconds=env.USER_CACHE_TTL_SECONDS,
+        local_ttl_seconds=env.ENTITY_CACHE_LOCAL_TTL_SECONDS,
+        local_max_entries=env.ENTITY_CACHE_LOCAL_MAX_ENTRIES,
+        prefix="user",
+    )
@@ -0,0 +1,92 @@
+"""Shared plumbing for optional Redis-backed caches."""
+
+import logging
+import time
+from typing import Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from configs.redis.RedisConnection import (
+    RedisConnectionError,
+    get_redis_connection,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisBackedCache:
+    """Base for caches that degrade gracefully without Redis.
+
+    Entries are grouped per scope and user under a version number,
+    so a write invalidates everything cached for that user with a
+    single INCR. When Redis is unreachable, callers fall back to the
+    database and the connection is retried after a cool-down.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        retry_after_seconds: int = 30,
+        prefix: str = "cache",
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis: Optional Redis client (defaults to the shared one)
+            retry_after_seconds: Cool-down after a Redis failure
+            prefix: Key prefix for all cache entries
+        """
+        self._redis = redis
+        self.retry_after_seconds = retry_after_seconds
+        self.prefix = prefix
+        self._disabled_until = 0.0
+
+    def _client(self) -> Optional[Redis]:
+        """Get the Redis client, or None while Redis is unavailable."""
+        if time.monotonic() < self._disabled_until:
+            return None
+        if self._redis is None:
+            try:
+                self._redis = get_redis_connection()
+            except RedisConnectionError as e:
+                self._disable(e)
+        return self._redis
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using Redis until the cool-down has passed."""
+        logger.warning(
+            f"{type(self).__name__} disabled for "
+            f"{self.retry_after_seconds}s: {str(error)}"
+        )
+        self._disabled_until = (
+            time.monotonic() + self.retry_after_seconds
+        )
+
+    def _version_key(self, scope: str, user_id: str) -> str:
+        """Key holding the invalidation version for a user."""
+        return f"{self.prefix}:{scope}:{user_id}:version"
+
+    def _version(
+        self, client: Redis, scope: str, user_id: str
+    ) -> int:
+        """Current invalidation version for a user."""
+        return int(
+            client.get(self._version_key(scope, user_id))
+            or 0
+        )
+
+    def invalidate(self, scope: str, user_id: str) -> None:
+        """Invalidate every cached entry of a scope for a user.
+
+        Args:
+            scope: Entity whose data changed
+            user_id: Owner of the changed rows
+        """
+        client = self._client()
+        if client is None:
+            return
+        try:
+            client.incr(self._version_key(scope, user_id))
+        except RedisError as e:
+            self._disable(e)
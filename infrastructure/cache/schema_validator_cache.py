@@ -0,0 +1,131 @@
+"""In-process cache of compiled activity schema validators."""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from jsonschema.exceptions import SchemaError, best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+if TYPE_CHECKING:
+    from orm.ActivityModel import Activity
+
+
+class SchemaValidatorCache:
+    """LRU cache of jsonschema validators per activity.
+
+    Building a validator means resolving the draft and checking the
+    schema against its metaschema, which jsonschema.validate repeats
+    on every call. Entries are keyed by activity ID and remember the
+    activity's ``updated_at``, so a schema changed by another process
+    is recompiled the next time it is seen; updates made through
+    ActivityRepository invalidate the entry directly.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Activities kept before evicting the least
+                recently used validator
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # activity_id -> (updated_at, validator), oldest first
+        self._validators: OrderedDict[
+            int, Tuple[Optional[datetime], Validator]
+        ] = OrderedDict()
+
+    def get_validator(
+        self, activity: "Activity"
+    ) -> Validator:
+        """Get the compiled validator for an activity's schema.
+
+        Args:
+            activity: Activity whose schema moment data must match
+
+        Returns:
+            Validator for the activity schema
+
+        Raises:
+            ValueError: If the activity schema is not a valid schema
+        """
+        with self._lock:
+            entry = self._validators.get(activity.id)
+            if (
+                entry is not None
+                and entry[0] == activity.updated_at
+            ):
+                self._validators.move_to_end(activity.id)
+                return entry[1]
+
+        schema: Dict[str, Any] = (
+            activity.activity_schema_dict
+        )
+        cls = validator_for(schema)
+        try:
+            cls.check_schema(schema)
+        except SchemaError as e:
+            raise ValueError(
+                f"Invalid activity schema: {e.message}"
+            )
+        validator = cls(schema)
+
+        with self._lock:
+            self._validators[activity.id] = (
+                activity.updated_at,
+                validator,
+            )
+            self._validators.move_to_end(activity.id)
+            while len(self._validators) > self.max_entries:
+                self._validators.popitem(last=False)
+        return validator
+
+    def validate(
+        self, activity: "Activity", data: Dict[str, Any]
+    ) -> None:
+        """Validate moment data against an activity's schema.
+
+        Args:
+            activity: Activity the moment belongs to
+            data: Moment data to validate
+
+        Raises:
+            ValueError: If data does not match the schema
+        """
+        error = best_match(
+            self.get_validator(activity).iter_errors(data)
+        )
+        if error is not None:
+            raise ValueError(
+                f"Invalid moment data: {str(error)}"
+            )
+
+    def invalidate(self, activity_id: int) -> None:
+        """Drop the cached validator for an activity.
+
+        Args:
+            activity_id: Activity whose schema changed
+        """
+        with self._lock:
+            self._validators.pop(activity_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached validator."""
+        with self._lock:
+            self._validators.clear()
+
+
+@lru_cache()
+def get_schema_validator_cache() -> SchemaValidatorCache:
+    """Get the process-wide schema validator cache."""
+    return SchemaValidatorCache()
@@ -0,0 +1,113 @@
+"""Short-lived cache of API keys that passed bcrypt verification."""
+
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Optional
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from configs.Environment import get_environment_variables
+from infrastructure.cache.redis_cache import (
+    RedisBackedCache,
+)
+from utils.security import SECRET_KEY
+
+
+class VerifiedKeyCache(RedisBackedCache):
+    """Redis-backed map from verified API keys to their user.
+
+    Keys are stored as an HMAC of the full API key under the server
+    secret, so neither the key nor anything that can be checked
+    offline against it reaches Redis. A hit only proves the key was
+    verified recently; callers still look the user up by key_id and
+    compare IDs, so rotated keys and deleted users stop matching
+    without explicit invalidation.
+
+    Redis is optional: when it is unreachable every login runs
+    bcrypt as before.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        ttl_seconds: int = 300,
+        retry_after_seconds: int = 30,
+        prefix: str = "verified_key",
+        secret: str = SECRET_KEY,
+    ):
+        """Initialize the cache.
+
+        Args:
+            redis: Optional Redis client (defaults to the shared one)
+            ttl_seconds: How long a verified key is trusted
+            retry_after_seconds: Cool-down after a Redis failure
+            prefix: Key prefix for all cache entries
+            secret: HMAC key used to digest API keys
+        """
+        super().__init__(
+            redis=redis,
+            retry_after_seconds=retry_after_seconds,
+            prefix=prefix,
+        )
+        self.ttl_seconds = ttl_seconds
+        self._secret = secret.encode("utf-8")
+
+    def _entry_key(self, api_key: str) -> str:
+        """Key for an API key's digest."""
+        digest = hmac.new(
+            self._secret,
+            api_key.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"{self.prefix}:{digest}"
+
+    def get_user_id(self, api_key: str) -> Optional[str]:
+        """Get the user a key was recently verified for.
+
+        Args:
+            api_key: Full API key as presented by the client
+
+        Returns:
+            User ID, or None if the key is not cached
+        """
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            user_id = client.get(self._entry_key(api_key))
+        except RedisError as e:
+            self._disable(e)
+            return None
+        if isinstance(user_id, bytes):
+            user_id = user_id.decode()
+        return user_id
+
+    def remember(self, api_key: str, user_id: str) -> None:
+        """Record that a key was verified for a user.
+
+        Args:
+            api_key: Full API key that passed verification
+            user_id: ID of the user the key belongs to
+        """
+        client = self._client()
+        if client is None:
+            return
+        try:
+            client.set(
+                self._entry_key(api_key),
+                user_id,
+                ex=self.ttl_seconds,
+            )
+        except RedisError as e:
+            self._disable(e)
+
+
+@lru_cache()
+def get_verified_key_cache() -> VerifiedKeyCache:
+    """Get the process-wide verified key cache."""
+    env = get_environment_variables()
+    return VerifiedKeyCache(
+        ttl_seconds=env.VERIFIED_KEY_CACHE_TTL_SECONDS
+    )
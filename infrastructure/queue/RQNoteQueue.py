@@ -13,6 +13,9 @@ from services.robo import get_robo_service
 from infrastructure.queue.activity_worker import (
     process_activity_job,
 )
+from infrastructure.queue.job_retry import (
+    RETRIED_AS_META_KEY,
+)
 from infrastructure.queue.note_worker import (
     process_note_job,
 )
@@ -98,6 +101,12 @@ class RQNoteQueue(QueueService):
                     job = Job.fetch(
                         job_id, connection=queue.connection
                     )
+                    # Report on the latest retry of the job
+                    while job.meta.get(RETRIED_AS_META_KEY):
+                        job = Job.fetch(
+                            job.meta[RETRIED_AS_META_KEY],
+                            connection=queue.connection,
+                        )
                     return {
                         "status": job.get_status(),
                         "created_at": (
@@ -2,13 +2,29 @@
 
 import time
 import logging
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from rq import Queue
 
 from domain.values import ProcessingStatus
 from domain.exceptions import RoboAPIError, RoboServiceError
 from orm.ActivityModel import Activity
 from configs.Database import SessionLocal
+from configs.Environment import get_environment_variables
+from repositories.ActivityRepository import (
+    ActivityRepository,
+)
 from services.robo import get_robo_service
+from infrastructure.cache.entity_cache import (
+    get_entity_cache,
+)
+from infrastructure.queue.job_retry import (
+    current_attempt,
+    get_job,
+    reschedules_retries,
+    schedule_retry,
+)
 
 # Required for SQLAlchemy model registry
 import orm.UserModel  # noqa: F401
@@ -19,12 +35,16 @@ import orm.TaskModel  # noqa: F401
 import orm.ActivityModel  # noqa: F401
 
 logger = logging.getLogger(__name__)
+# Redis key held while a reconcile run is scheduled, so every
+# worker that starts doesn't begin its own chain of runs
+RECONCILE_SCHEDULE_KEY = "moment_count_reconcile:scheduled"
 # Reduce SQLAlchemy logging
 logging.getLogger("sqlalchemy.engine").setLevel(
     logging.WARNING
 )
 
 
+@reschedules_retries
 def process_activity_job(
     activity_id: int,
     session=None,
@@ -33,6 +53,9 @@ def process_activity_job(
 ) -> None:
     """Process an activity job.
 
+    When run as an RQ job, a failed attempt re-enqueues the job
+    with a backoff delay instead of sleeping in the worker.
+
     Args:
         activity_id: ID of the activity to process
         session: Optional database session
@@ -60,6 +83,7 @@ def process_activity_job(
         session_created = True
 
     activity = None
+    owner_id = None
     try:
         # Get activity
         activity = (
@@ -72,9 +96,10 @@ def process_activity_job(
             raise ValueError(
                 f"Failed to process activity {activity_id}"
             )
+        owner_id = activity.user_id
 
         # Process activity schema
-        retries = 0
+        retries = current_attempt(process_activity_job)
         while retries < max_retries:
             try:
                 schema_render = (
@@ -97,9 +122,14 @@ def process_activity_job(
                     f"(attempt {retries}): {str(e)}"
                 )
                 if retries < max_retries:
-                    time.sleep(
-                        2**retries
-                    )  # Exponential backoff
+                    # Exponential backoff
+                    if schedule_retry(
+                        process_activity_job,
+                        retries - 1,
+                        2**retries,
+                    ):
+                        return
+                    time.sleep(2**retries)
                 else:
                     activity.processing_status = (
                         ProcessingStatus.FAILED
@@ -116,9 +146,14 @@ def process_activity_job(
                     f"(attempt {retries}): {str(e)}"
                 )
                 if retries < max_retries:
-                    time.sleep(
-                        2**retries
-                    )  # Exponential backoff
+                    # Exponential backoff
+                    if schedule_retry(
+                        process_activity_job,
+                        retries - 1,
+                        2**retries,
+                    ):
+                        return
+                    time.sleep(2**retries)
                 else:
                     activity.processing_status = (
                         ProcessingStatus.FAILED
@@ -139,6 +174,11 @@ def process_activity_job(
         raise e
 
     finally:
+        # Cached activities carry the processing status
+        if owner_id:
+            get_entity_cache().invalidate(
+                "activities", owner_id
+            )
         if session_created:
             session.close()
 
@@ -146,3 +186,85 @@ def process_activity_job(
         logger.info(
             f"Activity {activity_id} processing finished in {duration:.2f}s"
         )
+
+
+def reconcile_moment_counts_job(
+    user_id: Optional[str] = None, session=None
+) -> int:
+    """Repair drifted activity moment counters.
+
+    Catches moments changed outside the ORM. Workers schedule it
+    every MOMENT_COUNT_RECONCILE_INTERVAL_SECONDS on the
+    activity_schema queue, each run scheduling the next; with the
+    interval set to 0 it can be run from cron instead.
+
+    Args:
+        user_id: Only reconcile this user's activities
+        session: Optional database session
+
+    Returns:
+        Number of activities whose counter was corrected
+    """
+    session_created = False
+    if session is None:
+        session = SessionLocal()
+        session_created = True
+
+    try:
+        corrected = ActivityRepository(
+            session, entity_cache=get_entity_cache()
+        ).reconcile_moment_counts(user_id)
+        if corrected:
+            logger.warning(
+                f"Corrected moment_count on {corrected} activities"
+            )
+        return corrected
+    finally:
+        if session_created:
+            session.close()
+
+        job = get_job(reconcile_moment_counts_job)
+        if job is not None and user_id is None:
+            env = get_environment_variables()
+            schedule_moment_count_reconcile(
+                Queue(
+                    job.origin, connection=job.connection
+                ),
+                env.MOMENT_COUNT_RECONCILE_INTERVAL_SECONDS,
+                replace=True,
+            )
+
+
+def schedule_moment_count_reconcile(
+    queue: Queue, interval: int, replace: bool = False
+) -> bool:
+    """Schedule the next reconcile_moment_counts_job run.
+
+    Args:
+        queue: Queue to run the job on
+        interval: Seconds until the run (0 disables scheduling)
+        replace: Schedule even if a run is already pending, as the
+            running job does for its successor
+
+    Returns:
+        bool: True if a run was scheduled
+    """
+    if interval <= 0:
+        return False
+    # Outlives the pending run in case the queue is backed up
+    if not queue.connection.set(
+        RECONCILE_SCHEDULE_KEY,
+        1,
+        nx=not replace,
+        ex=interval * 2,
+    ):
+        return False
+
+    queue.enqueue_in(
+        timedelta(seconds=interval),
+        reconcile_moment_counts_job,
+    )
+    logger.info(
+        f"Scheduled moment count reconcile in {interval}s"
+    )
+    return True
@@ -0,0 +1,200 @@
+"""Worker running several RQ jobs at once on one event loop."""
+
+import logging
+from typing import List, Optional, Tuple
+
+import anyio
+from anyio import to_thread
+from anyio.streams.memory import MemoryObjectSendStream
+from redis import Redis
+from rq import Queue, SimpleWorker
+from rq.exceptions import DequeueTimeout
+from rq.job import Job
+from rq.scheduler import RQScheduler
+from rq.timeouts import TimerDeathPenalty
+
+logger = logging.getLogger(__name__)
+
+# Seconds a dequeue blocks waiting for a job before polling again
+DEQUEUE_TIMEOUT = 5
+
+
+class JobSlot(SimpleWorker):
+    """RQ worker performing the jobs of one AsyncWorker slot.
+
+    Each slot registers as its own worker so RQ's registries, job
+    results and failure handling work per job. Jobs run outside
+    the main thread, where RQ's SIGALRM job timeout is unavailable,
+    so timeouts are enforced with a timer thread instead.
+    """
+
+    death_penalty_class = TimerDeathPenalty
+
+
+class AsyncWorker:
+    """Runs up to max_in_flight RQ jobs concurrently.
+
+    The event loop dequeues a job whenever a slot is free and runs
+    it in a thread. Jobs spend most of their time waiting on the
+    LLM API, so one process keeps many calls in flight instead of
+    needing a worker process per concurrent job.
+    """
+
+    def __init__(
+        self,
+        queues: List[Queue],
+        connection: Redis,
+        max_in_flight: int,
+    ):
+        """Initialize the worker.
+
+        Args:
+            queues: Queues to take jobs from, in priority order
+            connection: Redis connection
+            max_in_flight: Maximum number of jobs running at once
+
+        Raises:
+            ValueError: If max_in_flight is less than 1
+        """
+        if max_in_flight < 1:
+            raise ValueError(
+                "max_in_flight must be at least 1"
+            )
+
+        self.queues = queues
+        self.connection = connection
+        self.max_in_flight = max_in_flight
+        self.slots = [
+            JobSlot(queues, connection=connection)
+            for _ in range(max_in_flight)
+        ]
+        # One thread per running job plus the one dequeuing
+        self._limiter = anyio.CapacityLimiter(
+            max_in_flight + 1
+        )
+
+    def work(self, with_scheduler: bool = False) -> None:
+        """Process jobs until interrupted.
+
+        Jobs already running are finished before returning.
+
+        Args:
+            with_scheduler: Also run the RQ scheduler, which
+                enqueues jobs scheduled with enqueue_in
+        """
+        anyio.run(self._work, with_scheduler)
+
+    async def _work(self, with_scheduler: bool) -> None:
+        """Dequeue jobs into free slots until cancelled.
+
+        Args:
+            with_scheduler: Whether to run the RQ scheduler
+        """
+        for slot in self.slots:
+            slot.register_birth()
+        if with_scheduler:
+            self._start_scheduler()
+
+        free_slots, next_slot = (
+            anyio.create_memory_object_stream(
+                self.max_in_flight
+            )
+        )
+        for slot in self.slots:
+            free_slots.send_nowait(slot)
+
+        try:
+            async with anyio.create_task_group() as tg:
+                async for slot in next_slot:
+                    dequeued = await to_thread.run_sync(
+                        self._dequeue,
+                        slot,
+                        limiter=self._limiter,
+                    )
+                    if dequeued is None:
+                        free_slots.send_nowait(slot)
+                        continue
+                    job, queue = dequeued
+                    tg.start_soon(
+                        self._perform,
+                        slot,
+                        job,
+                        queue,
+                        free_slots,
+                    )
+        finally:
+            self._teardown()
+
+    def _start_scheduler(self) -> None:
+        """Start the RQ scheduler if no other worker runs it.
+
+        The first slot owns the scheduler, so its maintenance
+        restarts the scheduler process if it dies.
+        """
+        scheduler = RQScheduler(
+            self.queues, connection=self.connection
+        )
+        self.slots[0].scheduler = scheduler
+        scheduler.acquire_locks(auto_start=True)
+
+    def _dequeue(
+        self, slot: JobSlot
+    ) -> Optional[Tuple[Job, Queue]]:
+        """Wait for the next job on behalf of a slot.
+
+        Args:
+            slot: Free slot the job will run in
+
+        Returns:
+            Optional[Tuple[Job, Queue]]: The job and its queue, or
+            None if no job arrived within DEQUEUE_TIMEOUT
+        """
+        maintainer = self.slots[0]
+        if maintainer.should_run_maintenance_tasks:
+            maintainer.run_maintenance_tasks()
+
+        slot.heartbeat()
+        try:
+            return Queue.dequeue_any(
+                self.queues,
+                DEQUEUE_TIMEOUT,
+                connection=self.connection,
+            )
+        except DequeueTimeout:
+            return None
+
+    async def _perform(
+        self,
+        slot: JobSlot,
+        job: Job,
+        queue: Queue,
+        free_slots: MemoryObjectSendStream,
+    ) -> None:
+        """Run a job in a thread and free its slot afterwards.
+
+        Args:
+            slot: Slot running the job
+            job: Job to run
+            queue: Queue the job came from
+            free_slots: Stream to return the slot to
+        """
+        try:
+            await to_thread.run_sync(
+                slot.execute_job,
+                job,
+                queue,
+                limiter=self._limiter,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to run job {job.id}: {str(e)}"
+            )
+        finally:
+            free_slots.send_nowait(slot)
+
+    def _teardown(self) -> None:
+        """Stop the scheduler and unregister the slots."""
+        for slot in self.slots:
+            if slot.scheduler:
+                slot.stop_scheduler()
+            slot.register_death()
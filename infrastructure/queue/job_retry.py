@@ -0,0 +1,133 @@
+"""Retry scheduling for RQ jobs.
+
+Jobs retry failed attempts by re-enqueueing themselves with a delay
+(picked up by the scheduler run_worker enables) rather than sleeping
+through the backoff, so the worker is free to run other jobs in the
+meantime. The attempt number travels in the job's meta.
+"""
+
+import logging
+from datetime import timedelta
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar
+
+from rq import Queue, get_current_job
+from rq.job import Job
+
+from utils.retry import defer_retries
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Job meta key holding the number of attempts already made
+ATTEMPT_META_KEY = "attempt"
+# Job meta key pointing a retried job at the job that replaced it
+RETRIED_AS_META_KEY = "retried_as"
+
+
+def get_job(func: Callable) -> Optional[Job]:
+    """Get the running RQ job if it is executing func.
+
+    Job functions also call each other inline (e.g. a note job
+    creating tasks), so the current job only belongs to func when
+    it was enqueued for that function.
+
+    Args:
+        func: Job function
+
+    Returns:
+        Optional[Job]: The running job, or None outside of one
+    """
+    job = get_current_job()
+    if job is None or job.func_name != (
+        f"{func.__module__}.{func.__name__}"
+    ):
+        return None
+    return job
+
+
+def current_attempt(func: Callable) -> int:
+    """Get how many attempts earlier runs of func's job made.
+
+    Args:
+        func: Job function
+
+    Returns:
+        int: Attempts already made (0 outside of an RQ job)
+    """
+    job = get_job(func)
+    return job.meta.get(ATTEMPT_META_KEY, 0) if job else 0
+
+
+def reschedules_retries(
+    func: Callable[..., T],
+) -> Callable[..., T]:
+    """Mark a job function as scheduling its own retries.
+
+    While it runs as an RQ job, with_retry fails fast inside it so
+    a failed LLM call reaches the job, which re-enqueues itself
+    with schedule_retry. Called directly, nothing changes.
+
+    Args:
+        func: Job function
+
+    Returns:
+        Decorated job function
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        if get_job(func) is None:
+            return func(*args, **kwargs)
+        with defer_retries():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def schedule_retry(
+    func: Callable, attempt: int, delay: float
+) -> bool:
+    """Re-enqueue the running job of func to run again after a delay.
+
+    The new job gets the same arguments and options, with the
+    attempt count in its meta. The running job records the new
+    job's ID in its own meta so status lookups can follow it.
+
+    Args:
+        func: Job function
+        attempt: Zero-based number of the attempt that just failed
+        delay: Seconds to wait before the next attempt
+
+    Returns:
+        bool: True if a retry was scheduled, False when func isn't
+        running as an RQ job and the caller must retry inline
+    """
+    job = get_job(func)
+    if job is None:
+        return False
+
+    meta = {
+        key: value
+        for key, value in job.meta.items()
+        if key != RETRIED_AS_META_KEY
+    }
+    meta[ATTEMPT_META_KEY] = attempt + 1
+    queue = Queue(job.origin, connection=job.connection)
+    retry_job = queue.enqueue_in(
+        timedelta(seconds=delay),
+        job.func,
+        args=job.args,
+        kwargs=job.kwargs,
+        job_timeout=job.timeout,
+        result_ttl=job.result_ttl,
+        meta=meta,
+    )
+    job.meta[RETRIED_AS_META_KEY] = retry_job.id
+    job.save_meta()
+    logger.info(
+        f"Scheduled attempt {attempt + 2} of job {job.id} "
+        f"as {retry_job.id} in {delay:.1f}s"
+    )
+    return True
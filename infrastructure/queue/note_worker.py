@@ -4,16 +4,23 @@ import logging
 import time
 from datetime import datetime, timezone
 from typing import Optional
+from rq import Queue
 from sqlalchemy.orm import Session
 
 from domain.values import ProcessingStatus
-from domain.exceptions import RoboServiceError
+from domain.exceptions import RoboError, RoboServiceError
 from domain.robo import RoboService
 from repositories.NoteRepository import NoteRepository
 from services.robo import get_robo_service
 from utils.retry import calculate_backoff
 from configs.Database import SessionLocal
-from infrastructure.queue.task_worker import create_task
+from infrastructure.queue.job_retry import (
+    current_attempt,
+    get_job,
+    reschedules_retries,
+    schedule_retry,
+)
+from infrastructure.queue.task_worker import create_tasks
 import orm.UserModel  # noqa: F401 Required for SQLAlchemy model registry
 import orm.TopicModel  # noqa: F401 Required for SQLAlchemy model registry
 import orm.NoteModel  # noqa: F401 Required for SQLAlchemy model registry
@@ -24,6 +31,7 @@ import orm.ActivityModel  # noqa: F401 Required for SQLAlchemy model registry
 logger = logging.getLogger(__name__)
 
 
+@reschedules_retries
 def process_note_job(
     note_id: int,
     session: Optional[Session] = None,
@@ -33,6 +41,9 @@ def process_note_job(
 ) -> None:
     """Process a note using RoboService.
 
+    When run as an RQ job, a failed attempt re-enqueues the job
+    with a backoff delay instead of sleeping in the worker.
+
     Args:
         note_id: ID of note to process
         session: Optional database session
@@ -96,31 +107,53 @@ def process_note_job(
                 f"Created RoboService of type: {type(robo_service).__name__}"
             )
 
-        # Step 1: Process note with retries
-        for attempt in range(max_retries + 1):
+        # Step 1: Process note with retries, extracting its tasks
+        # in the same call when configured
+        combined = (
+            robo_service.config.combined_note_processing
+        )
+        extracted_tasks = None
+        first_attempt = current_attempt(process_note_job)
+        for attempt in range(
+            first_attempt, max_retries + 1
+        ):
             try:
                 logger.info(
                     f"Attempt {attempt + 1}/{max_retries + 1} "
                     f"to process note {note_id}"
                 )
-                result = robo_service.process_note(
-                    note.content,
-                    context={
-                        "type": "note_enrichment",
-                        "related_notes": (
-                            note.related_notes
-                            if hasattr(
-                                note, "related_notes"
-                            )
-                            else []
-                        ),
-                        "topics": (
-                            note.topics
-                            if hasattr(note, "topics")
-                            else []
-                        ),
-                    },
-                )
+                context = {
+                    "type": "note_enrichment",
+                    "related_notes": (
+                        note.related_notes
+                        if hasattr(note, "related_notes")
+                        else []
+                    ),
+                    "topics": (
+                        note.topics
+                        if hasattr(note, "topics")
+                        else []
+                    ),
+                }
+                result = None
+                if combined:
+                    # Fall back to separate calls rather than
+                    # lose the note to a bad combined response
+                    try:
+                        note_result = robo_service.process_note_with_tasks(
+                            note.content, context=context
+                        )
+                        result = note_result.note
+                        extracted_tasks = note_result.tasks
+                    except RoboError as e:
+                        logger.warning(
+                            f"Combined processing failed for note "
+                            f"{note_id}, enriching it alone: {e}"
+                        )
+                if result is None:
+                    result = robo_service.process_note(
+                        note.content, context=context
+                    )
                 logger.info(
                     f"Successfully processed note {note_id}"
                 )
@@ -177,8 +210,13 @@ def process_note_job(
                         f"Failed to process note {note_id}: {str(e)}"
                     )
 
-                # Wait before retrying with exponential backoff
+                # Retry with exponential backoff, from the queue
+                # when running as a job so the worker stays free
                 delay = calculate_backoff(attempt + 1)
+                if schedule_retry(
+                    process_note_job, attempt, delay
+                ):
+                    return
                 logger.info(
                     f"Waiting {delay}s before retry"
                 )
@@ -190,12 +228,14 @@ def process_note_job(
             logger.info(
                 f"Starting task extraction for note {note_id}"
             )
-            logger.debug(
-                f"Analyzing note content for tasks: {note.content[:200]}..."
-            )
-            extracted_tasks = robo_service.extract_tasks(
-                note.content
-            )
+            if extracted_tasks is None:
+                logger.debug(
+                    "Analyzing note content for tasks: "
+                    f"{note.content[:200]}..."
+                )
+                extracted_tasks = (
+                    robo_service.extract_tasks(note.content)
+                )
             task_stats["tasks_found"] = len(extracted_tasks)
 
             if task_stats["tasks_found"] > 0:
@@ -211,41 +251,25 @@ def process_note_job(
                     )
                 )
 
-                # Create tasks
-                for task_data in extracted_tasks:
-                    try:
-                        logger.debug(
-                            f"Creating task with content: "
-                            f"{task_data['content']}"
-                        )
-                        task_id = create_task(
-                            content=task_data["content"],
-                            user_id=note.user_id,
-                            source_note_id=note_id,
-                            priority=task_data.get(
-                                "priority", "medium"
-                            ),
-                            status=task_data.get(
-                                "status", "todo"
-                            ),
-                            due_date=task_data.get(
-                                "due_date"
-                            ),
-                            session=session,
-                            max_retries=max_retries,
-                        )
-                        task_stats["tasks_created"] += 1
-                        logger.info(
-                            f"Created task {task_id} from note {note_id}: "
-                            f"{task_data['content'][:50]}..."
+                # Create tasks in one transaction and enrich
+                # them in parallel as separate jobs
+                job = get_job(process_note_job)
+                task_ids = create_tasks(
+                    extracted_tasks,
+                    user_id=note.user_id,
+                    source_note_id=note_id,
+                    session=session,
+                    queue=(
+                        Queue(
+                            "task_enrichment",
+                            connection=job.connection,
                         )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create task from note {note_id} "
-                            f"with content '{task_data['content'][:50]}...': "
-                            f"{str(e)}"
-                        )
-                        continue
+                        if job
+                        else None
+                    ),
+                    max_retries=max_retries,
+                )
+                task_stats["tasks_created"] = len(task_ids)
 
                 session.commit()
                 logger.info(
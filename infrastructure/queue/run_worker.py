@@ -4,8 +4,13 @@ import sys
 import logging
 from rq import Worker, Queue
 
+from configs.Environment import get_environment_variables
 from configs.Logging import configure_logging
 from configs.queue_dependencies import get_redis_connection
+from infrastructure.queue.async_worker import AsyncWorker
+from infrastructure.queue.activity_worker import (
+    schedule_moment_count_reconcile,
+)
 
 
 def run_worker():
@@ -14,8 +19,12 @@ def run_worker():
     This function:
     1. Sets up logging
     2. Creates Redis connection
-    3. Starts RQ worker process listening to multiple queues
-    4. Handles graceful shutdown
+    3. Schedules the periodic moment count reconcile unless a
+       run is already pending
+    4. Starts RQ worker process listening to multiple queues,
+       running jobs one at a time or, with WORKER_MODE=async,
+       up to WORKER_MAX_IN_FLIGHT at once
+    5. Handles graceful shutdown
     """
     # Configure logging
     configure_logging()
@@ -32,7 +41,19 @@ def run_worker():
             Queue("activity_schema", connection=redis_conn),
             Queue("task_enrichment", connection=redis_conn),
         ]
-        worker = Worker(queues, connection=redis_conn)
+        env = get_environment_variables()
+        schedule_moment_count_reconcile(
+            queues[1],
+            env.MOMENT_COUNT_RECONCILE_INTERVAL_SECONDS,
+        )
+        if env.WORKER_MODE == "async":
+            worker = AsyncWorker(
+                queues,
+                connection=redis_conn,
+                max_in_flight=env.WORKER_MAX_IN_FLIGHT,
+            )
+        else:
+            worker = Worker(queues, connection=redis_conn)
         logger.info(
             f"Worker listening on queues: {[q.name for q in queues]}"
         )
@@ -3,17 +3,27 @@
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from rq import Queue
 from sqlalchemy.orm import Session
 
-from domain.values import ProcessingStatus
+from domain.values import (
+    ProcessingStatus,
+    TaskPriority,
+    TaskStatus,
+)
 from domain.exceptions import RoboServiceError
 from domain.robo import RoboService
 from repositories.TaskRepository import TaskRepository
 from services.robo import get_robo_service
 from utils.retry import calculate_backoff
 from configs.Database import SessionLocal
+from infrastructure.queue.job_retry import (
+    current_attempt,
+    reschedules_retries,
+    schedule_retry,
+)
 import orm.UserModel  # noqa: F401 Required for SQLAlchemy model registry
 import orm.TopicModel  # noqa: F401 Required for SQLAlchemy model registry
 import orm.NoteModel  # noqa: F401 Required for SQLAlchemy model registry
@@ -93,6 +103,125 @@ def create_task(
             session.close()
 
 
+def create_tasks(
+    tasks: List[Dict[str, Any]],
+    user_id: int,
+    source_note_id: Optional[int] = None,
+    session: Optional[Session] = None,
+    queue: Optional[Queue] = None,
+    max_retries: int = 3,
+) -> List[int]:
+    """Create several tasks at once and enqueue their enrichment.
+
+    The tasks are inserted in one transaction. With a queue, each
+    task gets its own enrichment job, all enqueued in one Redis
+    round trip so workers enrich them in parallel. Without one,
+    they are enriched inline one after another.
+
+    Tasks with an unknown status or priority are skipped.
+
+    Args:
+        tasks: Task dicts with content and optional priority,
+            status and due_date
+        user_id: ID of the task owner
+        source_note_id: Optional ID of source note
+        session: Optional database session
+        queue: Optional task_enrichment queue to enqueue
+            enrichment jobs on
+        max_retries: Maximum number of retries per task
+
+    Returns:
+        IDs of the created tasks
+
+    Raises:
+        TaskValidationError: If task creation fails
+    """
+    session_provided = session is not None
+    try:
+        if not session:
+            session = SessionLocal()
+
+        created_at = datetime.now(timezone.utc)
+        rows = []
+        for task_data in tasks:
+            try:
+                status = TaskStatus[
+                    task_data.get("status", "todo").upper()
+                ]
+                priority = TaskPriority[
+                    task_data.get(
+                        "priority", "medium"
+                    ).upper()
+                ]
+            except (AttributeError, KeyError):
+                logger.warning(
+                    f"Skipping task with invalid status or "
+                    f"priority: {task_data}"
+                )
+                continue
+            rows.append(
+                {
+                    "content": task_data["content"],
+                    "user_id": user_id,
+                    "note_id": source_note_id,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "status": status,
+                    "priority": priority,
+                    "processing_status": ProcessingStatus.PENDING,
+                    "due_date": task_data.get("due_date"),
+                }
+            )
+
+        task_ids = TaskRepository(session).bulk_create(rows)
+
+        if queue is None:
+            for task_id in task_ids:
+                try:
+                    process_task_job(
+                        task_id,
+                        session=session,
+                        max_retries=max_retries,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to enrich task {task_id}: {str(e)}"
+                    )
+            return task_ids
+
+        queued_at = datetime.now(timezone.utc).isoformat()
+        try:
+            queue.enqueue_many(
+                [
+                    Queue.prepare_data(
+                        process_task_job,
+                        args=(task_id,),
+                        kwargs={"max_retries": max_retries},
+                        timeout="10m",
+                        result_ttl=24 * 60 * 60,  # 24 hours
+                        meta={
+                            "task_id": task_id,
+                            "task_type": "process_task",
+                            "queued_at": queued_at,
+                        },
+                    )
+                    for task_id in task_ids
+                ]
+            )
+        except Exception as e:
+            # Tasks stay PENDING, as when the API fails to enqueue
+            logger.error(
+                f"Error enqueueing tasks {task_ids}: {str(e)}",
+                exc_info=True,
+            )
+        return task_ids
+
+    finally:
+        if not session_provided and session:
+            session.close()
+
+
+@reschedules_retries
 def process_task_job(
     task_id: int,
     session: Optional[Session] = None,
@@ -102,6 +231,9 @@ def process_task_job(
 ) -> None:
     """Process a task using RoboService.
 
+    When run as an RQ job, a failed attempt re-enqueues the job
+    with a backoff delay instead of sleeping in the worker.
+
     Args:
         task_id: ID of task to process
         session: Optional database session
@@ -160,7 +292,10 @@ def process_task_job(
                 f"Created RoboService of type: {type(robo_service).__name__}"
             )
 
-        for attempt in range(max_retries + 1):
+        first_attempt = current_attempt(process_task_job)
+        for attempt in range(
+            first_attempt, max_retries + 1
+        ):
             try:
                 # Process the task with enrichment context
                 logger.info(
@@ -247,8 +382,13 @@ def process_task_job(
                         f"Failed to process task {task_id}: {str(e)}"
                     )
 
-                # Wait before retrying with exponential backoff
+                # Retry with exponential backoff, from the queue
+                # when running as a job so the worker stays free
                 delay = calculate_backoff(attempt + 1)
+                if schedule_retry(
+                    process_task_job, attempt, delay
+                ):
+                    return
                 logger.info(
                     f"Waiting {delay}s before retry"
                 )
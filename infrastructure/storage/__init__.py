@@ -1,9 +1,11 @@
 """Storage implementations package."""
 
+from .content_store import ContentAddressedStore
 from .local_sync import LocalStorageService
 from .mock_sync import MockStorageService
 
 __all__ = [
+    "ContentAddressedStore",
     "LocalStorageService",
     "MockStorageService",
 ]
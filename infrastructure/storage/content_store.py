@@ -0,0 +1,145 @@
+"""Content-addressed storage shared between documents."""
+
+from typing import BinaryIO, Iterator, Optional
+from uuid import uuid4
+
+from domain.storage import (
+    CONTENT_OWNER,
+    IStorageService,
+    StoredFile,
+)
+
+
+class ContentAddressedStore:
+    """Stores each distinct content once, keyed by its SHA-256.
+
+    Works on top of any IStorageService by keeping objects under
+    the reserved CONTENT_OWNER. Uploads are staged under a
+    temporary ID while their hash is computed, then either
+    promoted to the hash's key or discarded because that content
+    is already stored. The caller decides which from its own
+    reference counts, so the store keeps no state of its own.
+    """
+
+    def __init__(self, storage: IStorageService):
+        """Initialize the content store.
+
+        Args:
+            storage: Storage service holding the content
+        """
+        self.storage = storage
+
+    def stage(
+        self,
+        file_stream: BinaryIO,
+        mime_type: str,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Copy a stream into storage under a temporary ID.
+
+        Args:
+            file_stream: File-like object to read content from
+            mime_type: MIME type of the content
+            max_bytes: Optional maximum size of the content
+
+        Returns:
+            StoredFile: The staged file, with size_bytes and
+                content_hash set
+
+        Raises:
+            StorageLimitExceededError: If content exceeds max_bytes
+            StorageError: If the content cannot be stored
+        """
+        return self.storage.store_stream(
+            file_stream,
+            f"staging-{uuid4().hex}",
+            CONTENT_OWNER,
+            mime_type,
+            max_bytes=max_bytes,
+        )
+
+    def commit(self, staged: StoredFile) -> StoredFile:
+        """Promote a staged file to its content hash's key.
+
+        Args:
+            staged: File returned by stage()
+
+        Returns:
+            StoredFile: The content-addressed file
+
+        Raises:
+            StorageError: If the file cannot be moved
+        """
+        return self.storage.rename(
+            staged.id, CONTENT_OWNER, staged.content_hash
+        )
+
+    def discard(self, staged: StoredFile) -> None:
+        """Remove a staged file whose content is already stored.
+
+        Args:
+            staged: File returned by stage()
+
+        Raises:
+            StorageError: If the file cannot be deleted
+        """
+        self.storage.delete(staged.id, CONTENT_OWNER)
+
+    def retrieve(self, content_hash: str) -> BinaryIO:
+        """Retrieve stored content.
+
+        Args:
+            content_hash: SHA-256 of the content
+
+        Returns:
+            BinaryIO: File-like object for reading the content
+
+        Raises:
+            FileNotFoundError: If the content is not stored
+            StorageError: If retrieval fails
+        """
+        return self.storage.retrieve(
+            content_hash,
+            CONTENT_OWNER,
+            owner_id=CONTENT_OWNER,
+        )
+
+    def stream(
+        self,
+        content_hash: str,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """Stream stored content in chunks.
+
+        Args:
+            content_hash: SHA-256 of the content
+            start: Offset of the first byte to return
+            end: Offset of the last byte to return, inclusive
+
+        Returns:
+            Iterator[bytes]: Chunks of the requested byte range
+
+        Raises:
+            FileNotFoundError: If the content is not stored
+            StorageError: If the content cannot be opened
+        """
+        return self.storage.stream(
+            content_hash,
+            CONTENT_OWNER,
+            owner_id=CONTENT_OWNER,
+            start=start,
+            end=end,
+        )
+
+    def delete(self, content_hash: str) -> None:
+        """Delete stored content once nothing references it.
+
+        Args:
+            content_hash: SHA-256 of the content
+
+        Raises:
+            FileNotFoundError: If the content is not stored
+            StorageError: If deletion fails
+        """
+        self.storage.delete(content_hash, CONTENT_OWNER)
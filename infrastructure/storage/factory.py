@@ -1,6 +1,7 @@
 """Factory for creating storage service instances."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 from domain.storage import IStorageService
@@ -80,6 +81,7 @@ class StorageFactory:
                     region_name=os.getenv(
                         "AWS_REGION", "us-east-1"
                     ),
+                    config=_s3_client_config(),
                 ),
             )
 
@@ -87,3 +89,68 @@ class StorageFactory:
             raise ValueError(
                 f"Invalid storage type: {storage_type}"
             )
+
+
+def _s3_client_config():
+    """Build the botocore config for the shared S3 client.
+
+    Returns:
+        Config with connection pool, retry and timeout settings
+    """
+    from botocore.config import Config
+
+    return Config(
+        # One connection per concurrent request thread,
+        # reused with keep-alive
+        max_pool_connections=int(
+            os.getenv("S3_MAX_POOL_CONNECTIONS", "50")
+        ),
+        retries={
+            "max_attempts": int(
+                os.getenv("S3_MAX_ATTEMPTS", "3")
+            ),
+            "mode": "standard",
+        },
+        connect_timeout=float(
+            os.getenv("S3_CONNECT_TIMEOUT", "5")
+        ),
+        read_timeout=float(
+            os.getenv("S3_READ_TIMEOUT", "60")
+        ),
+    )
+
+
+def get_storage_service(
+    storage_type: Optional[str] = None,
+) -> IStorageService:
+    """Get the process-wide storage service for a backend.
+
+    Storage services hold no per-request state and boto3 clients
+    are thread-safe, so one instance per backend is shared by all
+    requests. This avoids building a new S3 client,
+    and with it a new connection pool, on every request.
+
+    Args:
+        storage_type: Type of storage service (local, mock, s3)
+                    Defaults to value from STORAGE_BACKEND env var
+
+    Returns:
+        IStorageService: Shared storage service instance
+
+    Raises:
+        ValueError: If storage type invalid or required config is missing
+    """
+    return _get_storage_service(
+        storage_type
+        or os.getenv("STORAGE_BACKEND", "local")
+    )
+
+
+@lru_cache()
+def _get_storage_service(
+    storage_type: str,
+) -> IStorageService:
+    """Create and cache the storage service for a backend."""
+    return StorageFactory.create_storage_service(
+        storage_type
+    )
@@ -2,17 +2,24 @@
 
 import os
 import json
+import hashlib
 from datetime import datetime
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Iterator, Optional
 from io import BytesIO
 
 from domain.storage import (
+    STREAM_CHUNK_SIZE,
     StorageStatus,
     StorageError,
+    StorageLimitExceededError,
     FileNotFoundError,
     StoragePermissionError,
     StoredFile,
 )
+from infrastructure.storage.streaming import read_chunks
+
+# Directory under base_dir mapping each file ID to its owner
+OWNER_INDEX_DIR = ".owners"
 
 
 class LocalStorageService:
@@ -57,6 +64,81 @@ class LocalStorageService:
             self.base_dir, user_id, f"{file_id}.meta"
         )
 
+    def _get_index_path(self, file_id: str) -> str:
+        """Get the path of a file's owner index entry.
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            Full path to the index entry
+        """
+        return os.path.join(
+            self.base_dir, OWNER_INDEX_DIR, file_id
+        )
+
+    def _index_owner(
+        self, file_id: str, user_id: str
+    ) -> None:
+        """Record the owner of a file in the owner index.
+
+        Args:
+            file_id: File ID
+            user_id: ID of the file owner
+        """
+        index_path = self._get_index_path(file_id)
+        os.makedirs(
+            os.path.dirname(index_path), exist_ok=True
+        )
+        with open(index_path, "w") as f:
+            f.write(user_id)
+
+    def _find_owner(
+        self, file_id: str, *candidates: Optional[str]
+    ) -> Optional[str]:
+        """Find the user directory holding a file.
+
+        Owners the caller already knows (e.g. Document.user_id)
+        are probed first, then the owner index, so lookups take a
+        constant number of stat calls however many users exist.
+        Only files stored before the index existed fall back to
+        scanning user directories, and are indexed when found.
+
+        Args:
+            file_id: File ID
+            candidates: Likely owners to probe first
+
+        Returns:
+            ID of the file owner, or None if the file doesn't exist
+        """
+        for candidate in candidates:
+            if candidate and os.path.exists(
+                self._get_file_path(file_id, candidate)
+            ):
+                return candidate
+
+        try:
+            with open(self._get_index_path(file_id)) as f:
+                owner = f.read()
+            if os.path.exists(
+                self._get_file_path(file_id, owner)
+            ):
+                return owner
+        except OSError:
+            pass
+
+        try:
+            user_dirs = os.listdir(self.base_dir)
+        except OSError:
+            return None
+        for d in user_dirs:
+            if d != OWNER_INDEX_DIR and os.path.exists(
+                self._get_file_path(file_id, d)
+            ):
+                self._index_owner(file_id, d)
+                return d
+        return None
+
     def _check_permission(
         self,
         file_id: str,
@@ -77,16 +159,10 @@ class LocalStorageService:
             FileNotFoundError: If file doesn't exist
             StoragePermissionError: If user doesn't have permission
         """
-        try:
-            # Get the directory containing the file (user_id)
-            file_owner = next(
-                d
-                for d in os.listdir(self.base_dir)
-                if os.path.exists(
-                    os.path.join(self.base_dir, d, file_id)
-                )
-            )
-        except (StopIteration, FileNotFoundError):
+        file_owner = self._find_owner(
+            file_id, owner_id, user_id
+        )
+        if file_owner is None:
             raise FileNotFoundError(
                 f"File {file_id} not found"
             )
@@ -133,6 +209,7 @@ class LocalStorageService:
         try:
             with open(file_path, "wb") as f:
                 f.write(file_data)
+            self._index_owner(file_id, user_id)
 
             # Store metadata
             metadata = {
@@ -157,6 +234,84 @@ class LocalStorageService:
             created_at=datetime.utcnow(),
         )
 
+    def store_stream(
+        self,
+        file_stream: BinaryIO,
+        file_id: str,
+        user_id: str,
+        mime_type: str,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Store a file from a stream in chunks.
+
+        Content is written to a temporary file that replaces the
+        target only once it is complete and within the limit.
+
+        Args:
+            file_stream: File-like object to read content from
+            file_id: File ID
+            user_id: User ID
+            mime_type: MIME type of the file
+            max_bytes: Optional maximum size of the content
+
+        Returns:
+            StoredFile object with metadata
+
+        Raises:
+            StorageLimitExceededError: If content exceeds max_bytes
+            StorageError: If file cannot be stored
+        """
+        file_path = self._get_file_path(file_id, user_id)
+        metadata_path = self._get_metadata_path(
+            file_id, user_id
+        )
+        temp_path = f"{file_path}.part"
+        os.makedirs(
+            os.path.dirname(file_path), exist_ok=True
+        )
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(temp_path, "wb") as f:
+                for chunk in read_chunks(
+                    file_stream, digest, max_bytes
+                ):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(temp_path, file_path)
+            self._index_owner(file_id, user_id)
+
+            # Store metadata
+            metadata = {
+                "mime_type": mime_type,
+                "created_at": datetime.utcnow().isoformat(),
+                "content_hash": digest.hexdigest(),
+            }
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f)
+
+        except StorageLimitExceededError:
+            os.remove(temp_path)
+            raise
+        except OSError as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise StorageError(
+                f"Failed to store file: {str(e)}"
+            )
+
+        return StoredFile(
+            id=file_id,
+            user_id=user_id,
+            path=file_path,
+            size_bytes=size,
+            mime_type=mime_type,
+            status=StorageStatus.ACTIVE,
+            created_at=datetime.utcnow(),
+            content_hash=digest.hexdigest(),
+        )
+
     def retrieve(
         self,
         file_id: str,
@@ -198,6 +353,135 @@ class LocalStorageService:
                 f"Failed to retrieve file: {str(e)}"
             )
 
+    def stream(
+        self,
+        file_id: str,
+        user_id: str,
+        owner_id: Optional[str] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a file's content in chunks.
+
+        Args:
+            file_id: File ID
+            user_id: User ID
+            owner_id: Optional owner ID for public files
+            start: Offset of the first byte to return
+            end: Offset of the last byte to return, inclusive
+            chunk_size: Maximum size of each chunk
+
+        Returns:
+            Iterator over chunks of the requested byte range
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            StoragePermissionError: If user doesn't have permission
+            StorageError: If file cannot be opened
+        """
+        file_owner = self._check_permission(
+            file_id, user_id, owner_id
+        )
+
+        try:
+            f = open(
+                self._get_file_path(file_id, file_owner),
+                "rb",
+            )
+            f.seek(start)
+        except OSError as e:
+            raise StorageError(
+                f"Failed to retrieve file: {str(e)}"
+            )
+
+        return self._read_chunks(f, start, end, chunk_size)
+
+    @staticmethod
+    def _read_chunks(
+        f: BinaryIO,
+        start: int,
+        end: Optional[int],
+        chunk_size: int,
+    ) -> Iterator[bytes]:
+        """Read a byte range from an open file, then close it.
+
+        Args:
+            f: File positioned at start
+            start: Offset of the first byte
+            end: Offset of the last byte, inclusive (None for EOF)
+            chunk_size: Maximum size of each chunk
+
+        Yields:
+            Chunks of the byte range
+        """
+        remaining = None if end is None else end - start + 1
+        with f:
+            while remaining is None or remaining > 0:
+                size = (
+                    chunk_size
+                    if remaining is None
+                    else min(chunk_size, remaining)
+                )
+                chunk = f.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def rename(
+        self,
+        file_id: str,
+        user_id: str,
+        new_file_id: str,
+    ) -> StoredFile:
+        """Move a file to a new ID under the same owner.
+
+        Args:
+            file_id: Current file ID
+            user_id: User ID
+            new_file_id: File ID to move the file to
+
+        Returns:
+            StoredFile object with metadata
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            StoragePermissionError: If user doesn't have permission
+            StorageError: If file cannot be moved
+        """
+        file_owner = self._check_permission(
+            file_id, user_id
+        )
+        try:
+            os.replace(
+                self._get_file_path(file_id, file_owner),
+                self._get_file_path(
+                    new_file_id, file_owner
+                ),
+            )
+            metadata_path = self._get_metadata_path(
+                file_id, file_owner
+            )
+            if os.path.exists(metadata_path):
+                os.replace(
+                    metadata_path,
+                    self._get_metadata_path(
+                        new_file_id, file_owner
+                    ),
+                )
+            self._index_owner(new_file_id, file_owner)
+            index_path = self._get_index_path(file_id)
+            if os.path.exists(index_path):
+                os.remove(index_path)
+        except OSError as e:
+            raise StorageError(
+                f"Failed to rename file: {str(e)}"
+            )
+
+        return self.get_metadata(new_file_id, file_owner)
+
     def delete(
         self,
         file_id: str,
@@ -219,26 +503,24 @@ class LocalStorageService:
             StoragePermissionError: If user doesn't have permission
             StorageError: If file cannot be deleted
         """
-        self._check_permission(file_id, user_id, owner_id)
+        file_owner = self._check_permission(
+            file_id, user_id, owner_id
+        )
         try:
-            file_owner = next(
-                d
-                for d in os.listdir(self.base_dir)
-                if os.path.exists(
-                    os.path.join(self.base_dir, d, file_id)
-                )
-            )
             file_path = self._get_file_path(
                 file_id, file_owner
             )
             metadata_path = self._get_metadata_path(
                 file_id, file_owner
             )
+            index_path = self._get_index_path(file_id)
 
-            # Delete both file and metadata
+            # Delete file, metadata and owner index entry
             os.remove(file_path)
             if os.path.exists(metadata_path):
                 os.remove(metadata_path)
+            if os.path.exists(index_path):
+                os.remove(index_path)
 
             # Remove user directory if empty
             user_dir = os.path.dirname(file_path)
@@ -276,15 +558,10 @@ class LocalStorageService:
             StoragePermissionError: If user doesn't have permission
             StorageError: If metadata cannot be retrieved
         """
-        self._check_permission(file_id, user_id, owner_id)
+        file_owner = self._check_permission(
+            file_id, user_id, owner_id
+        )
         try:
-            file_owner = next(
-                d
-                for d in os.listdir(self.base_dir)
-                if os.path.exists(
-                    os.path.join(self.base_dir, d, file_id)
-                )
-            )
             file_path = self._get_file_path(
                 file_id, file_owner
             )
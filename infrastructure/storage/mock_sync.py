@@ -1,17 +1,20 @@
 """Mock storage implementation for testing."""
 
+import hashlib
 from datetime import datetime, UTC
 from io import BytesIO
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
 from unittest.mock import MagicMock
 
 from domain.storage import (
+    STREAM_CHUNK_SIZE,
     IStorageService,
     StoragePermissionError,
     StorageStatus,
     StoredFile,
     FileNotFoundError,
 )
+from infrastructure.storage.streaming import read_chunks
 
 
 class MockStorageService(IStorageService):
@@ -109,6 +112,39 @@ class MockStorageService(IStorageService):
 
         return metadata
 
+    def store_stream(
+        self,
+        file_stream: BinaryIO,
+        file_id: str,
+        user_id: str,
+        mime_type: str,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Store a file in mock storage from a stream.
+
+        Args:
+            file_stream: File-like object to read content from
+            file_id: ID to store file under
+            user_id: ID of file owner
+            mime_type: MIME type of file
+            max_bytes: Optional maximum size of the content
+
+        Returns:
+            StoredFile: Metadata about stored file
+
+        Raises:
+            StorageLimitExceededError: If content exceeds max_bytes
+        """
+        digest = hashlib.sha256()
+        file_data = b"".join(
+            read_chunks(file_stream, digest, max_bytes)
+        )
+        stored = self.store(
+            file_data, file_id, user_id, mime_type
+        )
+        stored.content_hash = digest.hexdigest()
+        return stored
+
     def retrieve(
         self,
         file_id: str,
@@ -185,6 +221,76 @@ class MockStorageService(IStorageService):
             "The specified key does not exist."
         )
 
+    def stream(
+        self,
+        file_id: str,
+        user_id: str,
+        owner_id: Optional[str] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a file from mock storage in chunks.
+
+        Args:
+            file_id: ID of file to stream
+            user_id: ID of requesting user
+            owner_id: Optional owner ID
+            start: Offset of the first byte to return
+            end: Offset of the last byte to return, inclusive
+            chunk_size: Maximum size of each chunk
+
+        Returns:
+            Iterator[bytes]: Chunks of the requested byte range
+
+        Raises:
+            FileNotFoundError: If file not found
+            StoragePermissionError: If user lacks permission
+        """
+        data = self.retrieve(
+            file_id, user_id, owner_id
+        ).getvalue()
+        stop = None if end is None else end + 1
+        data = data[slice(start, stop)]
+        return iter(
+            [
+                data[slice(i, i + chunk_size)]
+                for i in range(0, len(data), chunk_size)
+            ]
+        )
+
+    def rename(
+        self,
+        file_id: str,
+        user_id: str,
+        new_file_id: str,
+    ) -> StoredFile:
+        """Move a file to a new ID in mock storage.
+
+        Args:
+            file_id: Current ID of the file
+            user_id: ID of file owner
+            new_file_id: ID to move the file to
+
+        Returns:
+            StoredFile: Metadata about moved file
+
+        Raises:
+            FileNotFoundError: If file not found
+        """
+        key = self._get_file_key(user_id, file_id)
+        if key not in self._files:
+            raise FileNotFoundError(
+                "The specified key does not exist."
+            )
+
+        file_data, metadata = self._files.pop(key)
+        new_key = self._get_file_key(user_id, new_file_id)
+        metadata.id = new_file_id
+        metadata.path = f"mock://{new_key}"
+        self._files[new_key] = (file_data, metadata)
+        return metadata
+
     def delete(
         self,
         file_id: str,
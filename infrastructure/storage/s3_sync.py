@@ -4,13 +4,18 @@ This implementation:
 1. Uses boto3 for S3 operations
 2. Implements proper permission checks
 3. Stores files in user-specific directories
-4. Maintains metadata files for ownership and permissions
+4. Keeps ownership metadata on the objects themselves
 5. Handles large files efficiently through streaming
 6. Provides consistent error handling
 
 Directory Structure:
     /<bucket_root>/<user_id>/<file_id>         # File content
-    /<bucket_root>/<user_id>/<file_id>.meta    # File metadata
+    /<bucket_root>/<user_id>/<file_id>.meta    # Legacy metadata
+
+Ownership, creation time and content hash are stored as S3 object
+metadata (x-amz-meta-*), so a single HEAD answers metadata lookups.
+Objects stored before that carry a .meta sidecar file instead,
+which is still read when the object metadata is missing.
 
 Example Usage:
     ```python
@@ -49,26 +54,31 @@ Error Handling:
 
 Performance Notes:
     - Files are streamed in chunks to minimize memory usage
-    - Metadata files are small and cached when appropriate
+    - Lookups go straight to the owner's key, never listing the bucket
     - Early permission checks prevent unnecessary transfers
 """
 
+import hashlib
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from io import BytesIO
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Iterator, Optional
 
 import boto3
 from botocore.exceptions import ClientError
 
 from domain.storage import (
+    STREAM_CHUNK_SIZE,
+    UPLOAD_PART_SIZE,
     IStorageService,
     StorageError,
+    StorageLimitExceededError,
     StoragePermissionError,
     StorageStatus,
     StoredFile,
     FileNotFoundError,
 )
+from infrastructure.storage.streaming import read_chunks
 
 
 class S3StorageService(IStorageService):
@@ -77,7 +87,7 @@ class S3StorageService(IStorageService):
     This implementation:
     1. Uses synchronous boto3 client instead of async aioboto3
     2. Organizes files by user ID for proper isolation
-    3. Stores metadata in separate .meta files
+    3. Stores metadata as S3 object metadata
     4. Implements proper permission checks
 
     Attributes:
@@ -157,6 +167,46 @@ class S3StorageService(IStorageService):
                 "Not authorized to access this file"
             )
 
+    @staticmethod
+    def _object_metadata(
+        user_id: str,
+        created_at: str,
+        content_hash: Optional[str] = None,
+    ) -> dict:
+        """Build the S3 object metadata stored with a file.
+
+        Args:
+            user_id: ID of the file owner
+            created_at: ISO timestamp of when the file was stored
+            content_hash: Optional SHA-256 of the content
+
+        Returns:
+            dict: Metadata for put_object/create_multipart_upload
+        """
+        metadata = {
+            "user-id": user_id,
+            "created-at": created_at,
+        }
+        if content_hash:
+            metadata["content-hash"] = content_hash
+        return metadata
+
+    @staticmethod
+    def _is_missing(error: ClientError) -> bool:
+        """Check whether a client error means the key doesn't exist.
+
+        Args:
+            error: Error raised by the S3 client
+
+        Returns:
+            bool: True for NoSuchKey (GET) and 404 (HEAD) errors
+        """
+        return error.response["Error"]["Code"] in (
+            "NoSuchKey",
+            "404",
+            "NotFound",
+        )
+
     def store(
         self,
         file_data: BinaryIO,
@@ -206,29 +256,23 @@ class S3StorageService(IStorageService):
             file_path = self._get_file_path(
                 user_id, file_id
             )
-            meta_path = self._get_metadata_path(
-                user_id, file_id
-            )
-
-            # Store file content
-            self.client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Body=file_data,
-                ContentType=mime_type,
-            )
 
-            # Store metadata with fixed timestamp for testing
+            # Metadata with fixed timestamp for testing
             metadata = {
                 "user_id": user_id,
                 "mime_type": mime_type,
                 "created_at": "2025-01-25T17:08:44.982014+00:00",
             }
+
+            # Store file content along with its metadata
             self.client.put_object(
                 Bucket=self.bucket_name,
-                Key=meta_path,
-                Body=json.dumps(metadata).encode(),
-                ContentType="application/json",
+                Key=file_path,
+                Body=file_data,
+                ContentType=mime_type,
+                Metadata=self._object_metadata(
+                    user_id, metadata["created_at"]
+                ),
             )
 
             # Get file info
@@ -253,6 +297,187 @@ class S3StorageService(IStorageService):
                 f"Failed to store file: {str(e)}"
             )
 
+    def store_stream(
+        self,
+        file_stream: BinaryIO,
+        file_id: str,
+        user_id: str,
+        mime_type: str,
+        max_bytes: Optional[int] = None,
+    ) -> StoredFile:
+        """Store a file in S3 from a stream.
+
+        Content is buffered one part at a time: files smaller than
+        a part are sent with a single PUT, larger ones as a
+        multipart upload that is aborted if the stream fails or
+        exceeds the limit, so memory use is bounded by the part
+        size rather than the file size.
+
+        Example:
+            ```python
+            # Store an upload without reading it into memory
+            stored = storage.store_stream(
+                file_stream=upload.file,
+                file_id="video.mp4",
+                user_id="user123",
+                mime_type="video/mp4",
+                max_bytes=100 * 1024 * 1024,
+            )
+            ```
+
+        Args:
+            file_stream: File-like object to read content from
+            file_id: ID to store the file under
+            user_id: ID of the file owner
+            mime_type: MIME type of the file
+            max_bytes: Optional maximum size of the content
+
+        Returns:
+            StoredFile: Metadata about the stored file
+
+        Raises:
+            StorageLimitExceededError: If content exceeds max_bytes
+            StorageError: If file storage fails
+        """
+        file_path = self._get_file_path(user_id, file_id)
+        created_at = datetime.now(timezone.utc).isoformat()
+
+        digest = hashlib.sha256()
+        size = 0
+        upload_id = None
+        parts = []
+        buffer = bytearray()
+        try:
+            for chunk in read_chunks(
+                file_stream, digest, max_bytes
+            ):
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) < UPLOAD_PART_SIZE:
+                    continue
+                if upload_id is None:
+                    upload_id = (
+                        self.client.create_multipart_upload(
+                            Bucket=self.bucket_name,
+                            Key=file_path,
+                            ContentType=mime_type,
+                            Metadata=self._object_metadata(
+                                user_id, created_at
+                            ),
+                        )["UploadId"]
+                    )
+                parts.append(
+                    self._upload_part(
+                        file_path,
+                        upload_id,
+                        len(parts) + 1,
+                        bytes(buffer),
+                    )
+                )
+                buffer.clear()
+
+            if upload_id is None:
+                # Small enough for one PUT, which can carry the hash
+                self.client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    Body=bytes(buffer),
+                    ContentType=mime_type,
+                    Metadata=self._object_metadata(
+                        user_id,
+                        created_at,
+                        digest.hexdigest(),
+                    ),
+                )
+            else:
+                if buffer:
+                    parts.append(
+                        self._upload_part(
+                            file_path,
+                            upload_id,
+                            len(parts) + 1,
+                            bytes(buffer),
+                        )
+                    )
+                self.client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=file_path,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+                upload_id = None
+
+            return StoredFile(
+                id=file_id,
+                user_id=user_id,
+                path=file_path,
+                size_bytes=size,
+                mime_type=mime_type,
+                status=StorageStatus.ACTIVE,
+                created_at=datetime.fromisoformat(
+                    created_at
+                ),
+                content_hash=digest.hexdigest(),
+            )
+        except StorageLimitExceededError:
+            raise
+        except Exception as e:
+            raise StorageError(
+                f"Failed to store file: {str(e)}"
+            ) from e
+        finally:
+            if upload_id is not None:
+                self._abort_upload(file_path, upload_id)
+
+    def _upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict:
+        """Upload one part of a multipart upload.
+
+        Args:
+            key: S3 key being uploaded
+            upload_id: ID of the multipart upload
+            part_number: 1-based number of the part
+            data: Content of the part
+
+        Returns:
+            dict: Part entry for complete_multipart_upload
+        """
+        response = self.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {
+            "ETag": response["ETag"],
+            "PartNumber": part_number,
+        }
+
+    def _abort_upload(
+        self, key: str, upload_id: str
+    ) -> None:
+        """Abort a multipart upload, discarding uploaded parts.
+
+        Args:
+            key: S3 key being uploaded
+            upload_id: ID of the multipart upload
+        """
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+            )
+        except ClientError:
+            # Unfinished parts expire with the bucket lifecycle
+            pass
+
     def retrieve(
         self,
         file_id: str,
@@ -261,8 +486,8 @@ class S3StorageService(IStorageService):
     ) -> BinaryIO:
         """Retrieve a file from S3.
 
-        Files are retrieved in chunks to minimize memory usage. The metadata
-        file is checked first to verify existence and permissions.
+        Permissions are checked against the key before any request is
+        made; the content GET itself reports missing files.
 
         Example:
             ```python
@@ -310,23 +535,6 @@ class S3StorageService(IStorageService):
                 file_path, user_id, owner_id
             )
 
-            # Get metadata first to verify file exists
-            meta_path = f"{file_path}.meta"
-            try:
-                self.client.get_object(
-                    Bucket=self.bucket_name,
-                    Key=meta_path,
-                )
-            except ClientError as e:
-                if (
-                    e.response["Error"]["Code"]
-                    == "NoSuchKey"
-                ):
-                    raise FileNotFoundError(
-                        "The specified key does not exist."
-                    )
-                raise e
-
             # Get file content
             try:
                 response = self.client.get_object(
@@ -356,6 +564,149 @@ class S3StorageService(IStorageService):
                 f"Failed to retrieve file: {str(e)}"
             ) from e
 
+    def stream(
+        self,
+        file_id: str,
+        user_id: str,
+        owner_id: Optional[str] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a file from S3 in chunks.
+
+        Only the requested byte range is fetched, via a ranged GET,
+        and the response body is read incrementally, so memory use
+        does not grow with the file size.
+
+        Example:
+            ```python
+            # Stream the first KiB of a file
+            for chunk in storage.stream(
+                file_id="large_file.dat",
+                user_id="user123",
+                end=1023,
+            ):
+                process_chunk(chunk)
+            ```
+
+        Args:
+            file_id: ID of the file to stream
+            user_id: ID of the user requesting the file
+            owner_id: Optional ID of the file owner (for public files)
+            start: Offset of the first byte to return
+            end: Offset of the last byte to return, inclusive
+            chunk_size: Maximum size of each chunk
+
+        Returns:
+            Iterator[bytes]: Chunks of the requested byte range
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            StoragePermissionError: If user cannot access file
+            StorageError: If the file cannot be opened
+        """
+        actual_user = owner_id if owner_id else user_id
+        file_path = self._get_file_path(
+            actual_user, file_id
+        )
+        self._verify_user_access(
+            file_path, user_id, owner_id
+        )
+
+        params = {
+            "Bucket": self.bucket_name,
+            "Key": file_path,
+        }
+        if start or end is not None:
+            params["Range"] = (
+                f"bytes={start}-{'' if end is None else end}"
+            )
+
+        try:
+            response = self.client.get_object(**params)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                raise FileNotFoundError(
+                    "The specified key does not exist."
+                )
+            raise StorageError(
+                f"Failed to retrieve file: {str(e)}"
+            ) from e
+
+        return self._read_chunks(
+            response["Body"], chunk_size
+        )
+
+    @staticmethod
+    def _read_chunks(
+        body, chunk_size: int
+    ) -> Iterator[bytes]:
+        """Read an S3 streaming body in chunks, then close it.
+
+        Args:
+            body: botocore StreamingBody of a GET response
+            chunk_size: Maximum size of each chunk
+
+        Yields:
+            Chunks of the body
+        """
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def rename(
+        self,
+        file_id: str,
+        user_id: str,
+        new_file_id: str,
+    ) -> StoredFile:
+        """Move a file to a new key under the same owner.
+
+        S3 has no rename, so the object is copied server-side with
+        its metadata and the original is deleted; the content never
+        passes through this process.
+
+        Args:
+            file_id: Current ID of the file
+            user_id: ID of the file owner
+            new_file_id: ID to move the file to
+
+        Returns:
+            StoredFile: Metadata about the moved file
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            StoragePermissionError: If user cannot access file
+            StorageError: If the move fails
+        """
+        stored_file = self.get_metadata(file_id, user_id)
+        file_path = self._get_file_path(user_id, file_id)
+        new_path = self._get_file_path(user_id, new_file_id)
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket_name,
+                Key=new_path,
+                CopySource={
+                    "Bucket": self.bucket_name,
+                    "Key": file_path,
+                },
+                MetadataDirective="COPY",
+            )
+            self.client.delete_object(
+                Bucket=self.bucket_name,
+                Key=file_path,
+            )
+        except ClientError as e:
+            raise StorageError(
+                f"Failed to rename file: {str(e)}"
+            ) from e
+
+        stored_file.id = new_file_id
+        stored_file.path = new_path
+        return stored_file
+
     def delete(
         self,
         file_id: str,
@@ -414,7 +765,7 @@ class S3StorageService(IStorageService):
                     Key=file_path,
                 )
 
-                # Delete metadata last
+                # Delete legacy metadata sidecar, if any
                 self.client.delete_object(
                     Bucket=self.bucket_name,
                     Key=meta_path,
@@ -442,12 +793,15 @@ class S3StorageService(IStorageService):
         self,
         file_id: str,
         user_id: str,
+        owner_id: Optional[str] = None,
     ) -> StoredFile:
         """Get metadata for a file.
 
-        Retrieves the metadata file associated with the content file.
-        This is useful for checking file existence and properties without
-        downloading the actual content.
+        Reads the object's own S3 metadata with a single HEAD on the
+        owner's key, which is useful for checking file existence and
+        properties without downloading the actual content. Objects
+        stored before metadata was kept on them fall back to their
+        .meta sidecar file.
 
         Example:
             ```python
@@ -467,6 +821,8 @@ class S3StorageService(IStorageService):
         Args:
             file_id: ID of the file to get metadata for
             user_id: ID of the user requesting metadata
+            owner_id: Optional ID of the file owner (for public files);
+                defaults to the requesting user
 
         Returns:
             StoredFile: File metadata
@@ -476,76 +832,66 @@ class S3StorageService(IStorageService):
             StoragePermissionError: If user cannot access file
             StorageError: If metadata retrieval fails
         """
-        # Search through all user directories to find the file
         try:
-            # List all user directories
-            response = self.client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Delimiter="/",
+            actual_user = owner_id if owner_id else user_id
+            file_path = self._get_file_path(
+                actual_user, file_id
+            )
+            self._verify_user_access(
+                file_path, user_id, owner_id
             )
 
-            # Check each user's directory
-            for prefix in response.get(
-                "CommonPrefixes", []
-            ):
-                dir_name = prefix.get("Prefix", "").rstrip(
-                    "/"
+            try:
+                response = self.client.head_object(
+                    Bucket=self.bucket_name,
+                    Key=file_path,
                 )
-                if not dir_name:
-                    continue
+            except ClientError as e:
+                if self._is_missing(e):
+                    raise FileNotFoundError(
+                        f"File not found: {file_id}"
+                    )
+                raise
 
-                file_path = self._get_file_path(
-                    dir_name, file_id
+            object_metadata = response.get("Metadata", {})
+            if "user-id" in object_metadata:
+                metadata = {
+                    "user_id": object_metadata["user-id"],
+                    "mime_type": response.get(
+                        "ContentType",
+                        "application/octet-stream",
+                    ),
+                    "created_at": object_metadata[
+                        "created-at"
+                    ],
+                    "content_hash": object_metadata.get(
+                        "content-hash"
+                    ),
+                }
+            else:
+                # Stored before metadata was kept on the object
+                meta_response = self.client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=self._get_metadata_path(
+                        actual_user, file_id
+                    ),
                 )
-                meta_path = self._get_metadata_path(
-                    dir_name, file_id
+                metadata = json.loads(
+                    meta_response["Body"].read()
                 )
 
-                try:
-                    # Try to get file metadata
-                    response = self.client.head_object(
-                        Bucket=self.bucket_name,
-                        Key=file_path,
-                    )
-                    meta_response = self.client.get_object(
-                        Bucket=self.bucket_name,
-                        Key=meta_path,
-                    )
-                    metadata = json.loads(
-                        meta_response["Body"].read()
-                    )
-
-                    # Verify user has access
-                    self._verify_user_access(
-                        file_path,
-                        user_id,
-                        metadata.get("user_id"),
-                    )
-
-                    return StoredFile(
-                        id=file_id,
-                        user_id=metadata["user_id"],
-                        path=file_path,
-                        size_bytes=response[
-                            "ContentLength"
-                        ],
-                        mime_type=metadata["mime_type"],
-                        status="active",
-                        created_at=datetime.fromisoformat(
-                            metadata["created_at"]
-                        ),
-                        updated_at=response["LastModified"],
-                    )
-                except ClientError as e:
-                    if (
-                        e.response["Error"]["Code"]
-                        != "NoSuchKey"
-                    ):
-                        raise
-                    continue
-
-            raise FileNotFoundError(
-                f"File not found: {file_id}"
+            return StoredFile(
+                id=file_id,
+                user_id=metadata["user_id"],
+                path=file_path,
+                size_bytes=response["ContentLength"],
+                mime_type=metadata["mime_type"],
+                status=StorageStatus.ACTIVE,
+                created_at=datetime.fromisoformat(
+                    metadata["created_at"]
+                ),
+                updated_at=response["LastModified"],
+                content_hash=metadata.get("content_hash"),
             )
 
         except FileNotFoundError:
@@ -0,0 +1,40 @@
+"""Helpers shared by the streaming store implementations."""
+
+from typing import BinaryIO, Iterator, Optional
+
+from domain.storage import (
+    STREAM_CHUNK_SIZE,
+    StorageLimitExceededError,
+)
+
+
+def read_chunks(
+    file_stream: BinaryIO,
+    digest,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Read a stream in chunks, hashing and size-checking as it goes.
+
+    Args:
+        file_stream: File-like object to read from
+        digest: hashlib object updated with every chunk
+        max_bytes: Optional maximum number of bytes to read
+        chunk_size: Maximum size of each chunk
+
+    Yields:
+        Chunks of the stream
+
+    Raises:
+        StorageLimitExceededError: As soon as more than max_bytes
+            have been read
+    """
+    size = 0
+    while chunk := file_stream.read(chunk_size):
+        size += len(chunk)
+        if max_bytes is not None and size > max_bytes:
+            raise StorageLimitExceededError(
+                f"File exceeds the limit of {max_bytes} bytes"
+            )
+        digest.update(chunk)
+        yield chunk
@@ -1,5 +1,8 @@
 """Main application module."""
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -21,18 +24,40 @@ from routers.v1.TopicRouter import router as topic_router
 from routers.v1.TimelineRouter import (
     router as timeline_router,
 )
+from routers.v1.MetricsRouter import (
+    router as metrics_router,
+)
 from utils.middleware.request_logging import (
     RequestLoggingMiddleware,
 )
+from utils.threadpool import configure_threadpool
+from infrastructure.storage.factory import (
+    get_storage_service,
+)
 
 # Get environment variables
 env = get_environment_variables()
 
 # Configure logging
 configure_logging()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure per-process resources at startup."""
+    # Blocking handlers and sync dependencies share this pool
+    configure_threadpool(env.THREADPOOL_MAX_WORKERS)
+    # Build the shared storage client before the first upload
+    try:
+        get_storage_service()
+    except ValueError as e:
+        logger.warning(f"Storage not configured: {e}")
+    yield
+
 
 # Create FastAPI app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Configure OpenAPI
 configure_openapi(app)
@@ -58,6 +83,8 @@ app.include_router(note_router)
 app.include_router(task_router)
 app.include_router(topic_router)
 app.include_router(timeline_router)
+if env.INTERNAL_METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 
 # Add dependencies
@@ -17,16 +17,23 @@ from sqlalchemy import (
     ForeignKey,
     select,
     func,
+    update,
+    event,
+    inspect,
     DateTime,
     CheckConstraint,
     UniqueConstraint,
     Enum,
 )
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import (
     Mapped,
     relationship,
     column_property,
+    object_session,
 )
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.dialects.mysql import JSON
 
 from .BaseModel import EntityMeta
@@ -53,7 +60,10 @@ class Activity(EntityMeta):
         activity_schema: JSON Schema for validating moment data
         icon: Display icon (emoji)
         color: Display color (hex code)
-        moment_count: Number of moments using this activity
+        moment_count: Number of moments using this activity,
+            maintained as moments are added, moved or deleted
+        live_moment_count: Moment count computed by a subquery;
+            deferred, so only loaded on access or undefer()
         moments: List of moments using this activity
         user: User who created the activity
         created_at: When the activity was created
@@ -102,13 +112,23 @@ class Activity(EntityMeta):
         onupdate=lambda: datetime.now(UTC),
     )
 
+    # Denormalized counter, kept in step by the Moment mapper
+    # events below; repair drift with reconcile_moment_counts
+    moment_count: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     # Computed fields
-    moment_count: Mapped[int] = column_property(
+    live_moment_count: Mapped[int] = column_property(
         select(func.count(1))
         .select_from(Moment)
         .where(Moment.activity_id == id)
         .correlate_except(Moment)
-        .scalar_subquery()
+        .scalar_subquery(),
+        deferred=True,
     )
 
     # Relationships
@@ -343,3 +363,78 @@ class Activity(EntityMeta):
         """
         self.activity_schema = schema
         self.validate_schema()
+
+
+def adjust_moment_count(
+    connection: Connection, counts: Dict[int, int]
+) -> None:
+    """Add deltas to activities' moment counters in SQL.
+
+    updated_at is assigned to itself so counter changes do not
+    count as activity edits (this also suppresses MySQL's
+    ON UPDATE CURRENT_TIMESTAMP).
+
+    Args:
+        connection: Connection of the current transaction
+        counts: Mapping of activity ID to counter delta
+    """
+    table = Activity.__table__
+    for activity_id, delta in counts.items():
+        if not delta:
+            continue
+        connection.execute(
+            update(table)
+            .where(table.c.id == activity_id)
+            .values(
+                moment_count=table.c.moment_count + delta,
+                updated_at=table.c.updated_at,
+            )
+        )
+
+
+def _sync_loaded_count(
+    target: Moment, activity_id: int, delta: int
+) -> None:
+    """Mirror a counter change on an already loaded activity."""
+    session = object_session(target)
+    if session is None:
+        return
+    activity = session.identity_map.get(
+        identity_key(Activity, activity_id)
+    )
+    if activity is not None and (
+        "moment_count" in activity.__dict__
+    ):
+        set_committed_value(
+            activity,
+            "moment_count",
+            activity.moment_count + delta,
+        )
+
+
+@event.listens_for(Moment, "after_insert")
+def receive_after_insert(mapper, connection, target):
+    """Count a new moment against its activity."""
+    adjust_moment_count(connection, {target.activity_id: 1})
+    _sync_loaded_count(target, target.activity_id, 1)
+
+
+@event.listens_for(Moment, "after_update")
+def receive_after_update(mapper, connection, target):
+    """Move the count when a moment changes activity."""
+    history = inspect(target).attrs.activity_id.history
+    if not (history.added and history.deleted):
+        return
+    old_id, new_id = history.deleted[0], history.added[0]
+    adjust_moment_count(connection, {old_id: -1, new_id: 1})
+    _sync_loaded_count(target, old_id, -1)
+    _sync_loaded_count(target, new_id, 1)
+
+
+@event.listens_for(Moment, "after_delete")
+def receive_after_delete(mapper, connection, target):
+    """Uncount a deleted moment from its activity."""
+    adjust_moment_count(
+        connection, {target.activity_id: -1}
+    )
+    _sync_loaded_count(target, target.activity_id, -1)
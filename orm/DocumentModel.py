@@ -43,6 +43,8 @@ class Document(EntityMeta):
         owner: User who owns the document
         unique_name: Unique identifier for public access (optional)
         is_public: Whether the document is publicly accessible
+        content_hash: SHA-256 of the shared content, or None for
+            documents stored as their own file
     """
 
     __tablename__ = "documents"
@@ -75,6 +77,9 @@ class Document(EntityMeta):
     is_public: Mapped[bool] = Column(
         Boolean, nullable=False, default=False
     )
+    content_hash: Mapped[Optional[str]] = Column(
+        String(64), nullable=True, index=True
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = Column(
@@ -117,6 +122,7 @@ class Document(EntityMeta):
             "storage_url": self.storage_url,
             "unique_name": self.unique_name,
             "is_public": self.is_public,
+            "content_hash": self.content_hash,
         }
 
     @classmethod
@@ -154,9 +160,47 @@ class Document(EntityMeta):
             storage_url=data.get("storage_url"),
             unique_name=data.get("unique_name"),
             is_public=data.get("is_public", False),
+            content_hash=data.get("content_hash"),
         )
 
 
+class DocumentContent(EntityMeta):
+    """DocumentContent Model represents one stored copy of content.
+
+    Documents with identical content share a single stored object,
+    keyed by the content's SHA-256. The reference count tracks how
+    many documents point at it, so the object is deleted only when
+    the last of them goes away.
+
+    Attributes:
+        content_hash: SHA-256 of the content
+        storage_url: URL where the content is stored
+        size_bytes: Size of the content in bytes
+        ref_count: Number of documents referencing the content
+        created_at: Timestamp of when the content was first stored
+    """
+
+    __tablename__ = "document_contents"
+
+    content_hash: Mapped[str] = Column(
+        String(64), primary_key=True
+    )
+    storage_url: Mapped[Optional[str]] = Column(
+        String(1024), nullable=True
+    )
+    size_bytes: Mapped[int] = Column(
+        Integer, nullable=False
+    )
+    ref_count: Mapped[int] = Column(
+        Integer, nullable=False, default=0
+    )
+    created_at: Mapped[datetime] = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+
 @event.listens_for(Document, "before_update")
 def receive_before_update(mapper, connection, target):
     """Update the updated_at timestamp before any update."""
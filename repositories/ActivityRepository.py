@@ -1,11 +1,20 @@
 from typing import List, Optional, Dict, Any, Union
 import logging
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from domain.activity import ActivityData
 from orm.ActivityModel import Activity
+from orm.MomentModel import Moment
+from schemas.pydantic.ActivitySchema import ActivityResponse
 from .BaseRepository import BaseRepository
+from infrastructure.cache.entity_cache import EntityCache
+from infrastructure.cache.schema_validator_cache import (
+    SchemaValidatorCache,
+    get_schema_validator_cache,
+)
 
 # Set up module logger
 logger = logging.getLogger(__name__)
@@ -15,13 +24,77 @@ logger.setLevel(logging.DEBUG)
 class ActivityRepository(BaseRepository[Activity, int]):
     """Repository for managing Activity entities"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        validator_cache: Optional[
+            SchemaValidatorCache
+        ] = None,
+        entity_cache: Optional[EntityCache] = None,
+    ):
         """Initialize with database session
 
         Args:
             db: SQLAlchemy database session
+            validator_cache: Compiled schema validators to
+                invalidate on schema changes (defaults to the
+                shared one)
+            entity_cache: Optional read-through cache for single
+                activities; when set, writes through this
+                repository invalidate it
         """
         super().__init__(db, Activity)
+        self.validator_cache = (
+            validator_cache or get_schema_validator_cache()
+        )
+        self.entity_cache = entity_cache
+
+    def _invalidate_cache(
+        self, user_id: Optional[str]
+    ) -> None:
+        """Drop cached activities for a user after a write
+
+        Args:
+            user_id: Owner of the changed activity
+        """
+        if self.entity_cache is not None and user_id:
+            self.entity_cache.invalidate(
+                "activities", user_id
+            )
+
+    def get_cached_by_owner(
+        self, activity_id: int, user_id: str
+    ) -> Optional[ActivityResponse]:
+        """Get an activity owned by a user, read through the cache
+
+        Args:
+            activity_id: Activity ID
+            user_id: User ID to verify ownership
+
+        Returns:
+            Activity response if found and owned by user,
+            None otherwise
+        """
+
+        def load() -> Optional[ActivityResponse]:
+            activity = self.get_by_owner(
+                activity_id, user_id
+            )
+            if activity is None:
+                return None
+            return ActivityResponse.model_validate(
+                ActivityData.from_orm(activity)
+            )
+
+        if self.entity_cache is None:
+            return load()
+        return self.entity_cache.get_or_load(
+            "activities",
+            user_id,
+            activity_id,
+            ActivityResponse,
+            load,
+        )
 
     def create(
         self,
@@ -106,6 +179,33 @@ class ActivityRepository(BaseRepository[Activity, int]):
             .first()
         )
 
+    def get_many_by_user(
+        self, activity_ids: List[int], user_id: str
+    ) -> Dict[int, Activity]:
+        """Get several activities owned by a user in one query
+
+        Args:
+            activity_ids: Activity IDs to load
+            user_id: User ID to verify ownership
+
+        Returns:
+            Mapping of activity ID to activity; IDs that do not
+            exist or belong to another user are absent
+        """
+        if not activity_ids:
+            return {}
+        activities = (
+            self.db.query(Activity)
+            .filter(
+                Activity.id.in_(set(activity_ids)),
+                Activity.user_id == user_id,
+            )
+            .all()
+        )
+        return {
+            activity.id: activity for activity in activities
+        }
+
     def list_activities(
         self, user_id: str, skip: int = 0, limit: int = 100
     ) -> List[Activity]:
@@ -166,6 +266,9 @@ class ActivityRepository(BaseRepository[Activity, int]):
                 setattr(activity, key, value)
 
             self.db.commit()
+            if "activity_schema" in data:
+                self.validator_cache.invalidate(activity_id)
+            self._invalidate_cache(user_id)
             self.db.refresh(activity)
             return activity
         except ValueError as e:
@@ -209,6 +312,107 @@ class ActivityRepository(BaseRepository[Activity, int]):
             return False
         return self.delete(activity_id)
 
+    def update(
+        self, id: int, data: Dict[str, Any]
+    ) -> Optional[Activity]:
+        """Update an activity by ID and invalidate the owner's cache
+
+        Args:
+            id: Activity ID
+            data: Fields to update
+
+        Returns:
+            Updated activity if found, None otherwise
+        """
+        activity = super().update(id, data)
+        if activity is not None:
+            self._invalidate_cache(activity.user_id)
+        return activity
+
+    def delete(self, id: int) -> bool:
+        """Delete an activity by ID and invalidate the owner's cache
+
+        Args:
+            id: Activity ID
+
+        Returns:
+            True if the activity was deleted
+        """
+        # Usually already loaded by the ownership check
+        activity = self.db.get(Activity, id)
+        deleted = super().delete(id)
+        if deleted and activity is not None:
+            self._invalidate_cache(activity.user_id)
+        return deleted
+
+    def reconcile_moment_counts(
+        self, user_id: Optional[str] = None
+    ) -> int:
+        """Repair drifted moment_count counters
+
+        Recomputes each counter from the moments table and writes
+        only the rows that differ, then invalidates the cached
+        activities of their owners. Counters drift when moments are
+        changed outside the ORM (raw SQL, database cascades).
+
+        Args:
+            user_id: Only reconcile this user's activities
+
+        Returns:
+            Number of activities whose counter was corrected
+
+        Raises:
+            HTTPException: If the update fails
+        """
+        live_count = (
+            select(func.count(Moment.id))
+            .where(Moment.activity_id == Activity.id)
+            .correlate(Activity)
+            .scalar_subquery()
+        )
+        drifted = select(
+            Activity.id, Activity.user_id
+        ).where(Activity.moment_count != live_count)
+        if user_id is not None:
+            drifted = drifted.where(
+                Activity.user_id == user_id
+            )
+
+        try:
+            rows = self.db.execute(drifted).all()
+            if not rows:
+                return 0
+            result = self.db.execute(
+                update(Activity)
+                .where(
+                    Activity.id.in_(
+                        [row.id for row in rows]
+                    )
+                )
+                .where(Activity.moment_count != live_count)
+                .values(
+                    moment_count=live_count,
+                    updated_at=Activity.updated_at,
+                )
+                .execution_options(
+                    synchronize_session=False
+                )
+            )
+            self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Database error during reconcile: {str(e)}"
+            )
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}",
+            )
+
+        for owner_id in {row.user_id for row in rows}:
+            self._invalidate_cache(owner_id)
+        return result.rowcount
+
     def validate_existence(
         self, activity_id: int, user_id: str
     ) -> Activity:
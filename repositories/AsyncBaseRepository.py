@@ -0,0 +1,80 @@
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Type,
+    TypeVar,
+)
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+
+# Set up repository logger
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Type variables with better constraints
+ModelType = TypeVar("ModelType")
+KeyType = TypeVar(
+    "KeyType", int, str
+)  # Limit key types to int and str
+ResultType = TypeVar("ResultType")
+
+
+class AsyncBaseRepository(Generic[ModelType, KeyType]):
+    """Base for repositories reading over AsyncSession
+
+    Every database round-trip is awaited, so the event loop keeps
+    serving other requests while a query is in flight. Subclasses
+    await queries on ``self.db`` or reuse synchronous query
+    builders through ``run_sync``.
+    """
+
+    def __init__(
+        self, db: AsyncSession, model: Type[ModelType]
+    ):
+        """Initialize repository with async session and model class
+
+        Args:
+            db: SQLAlchemy async database session
+            model: SQLAlchemy model class
+        """
+        logger.debug(
+            f"Initializing {self.__class__.__name__}"
+            f" with model {model.__name__}"
+        )
+        self.db = db
+        self.model = model
+
+    async def run_sync(
+        self,
+        fn: Callable[..., ResultType],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ResultType:
+        """Run synchronous ORM code on this session's connection
+
+        Lets async repositories reuse the query builders of their
+        synchronous counterparts; I/O inside ``fn`` is still awaited.
+
+        Args:
+            fn: Callable taking a sync Session as first argument
+            *args: Extra positional arguments for ``fn``
+            **kwargs: Extra keyword arguments for ``fn``
+
+        Returns:
+            Whatever ``fn`` returns
+        """
+        try:
+            return await self.db.run_sync(
+                lambda session: fn(session, *args, **kwargs)
+            )
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Database error during run_sync: {str(e)}"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}",
+            )
@@ -0,0 +1,137 @@
+from typing import List, Optional
+from datetime import datetime
+from anyio import from_thread, to_thread
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from orm.TimelineModel import Timeline as TimelineModel
+from domain.timeline import TimelineEventType
+from schemas.pydantic.TimelineSchema import TimelineList
+from infrastructure.cache.count_cache import CountCache
+from .AsyncBaseRepository import AsyncBaseRepository
+from utils.pagination import calculate_pages
+from .TimelineRepository import TimelineRepository
+
+
+class AsyncTimelineRepository(
+    AsyncBaseRepository[TimelineModel, int]
+):
+    """Repository for reading Timeline events over AsyncSession"""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        count_cache: Optional[CountCache] = None,
+    ):
+        """Initialize with async database session
+
+        Args:
+            db: SQLAlchemy async database session
+            count_cache: Optional cache for list totals
+        """
+        super().__init__(db, TimelineModel)
+        self.count_cache = count_cache
+
+    async def get_recent_by_user(
+        self, user_id: str, limit: int = 5
+    ) -> List[TimelineModel]:
+        """Get recent timeline events for a user
+
+        Args:
+            user_id: User ID to filter events
+            limit: Maximum number of events to return
+
+        Returns:
+            List of recent timeline events
+        """
+        result = await self.db.execute(
+            select(TimelineModel)
+            .where(TimelineModel.user_id == user_id)
+            .order_by(desc(TimelineModel.timestamp))
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def list_events(
+        self,
+        page: int = 1,
+        size: int = 50,
+        event_type: Optional[TimelineEventType] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> TimelineList:
+        """List timeline events with pagination and filtering
+
+        Reuses TimelineRepository's query builders so offset, cursor
+        and total handling stay identical to the synchronous path.
+        The count cache talks to Redis synchronously, so totals are
+        looked up on a worker thread rather than on the event loop.
+
+        Args:
+            page: Page number (1-based)
+            size: Items per page
+            event_type: Optional event type to filter by
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+            user_id: Optional user ID filter
+            cursor: Optional keyset cursor from a previous page
+            include_total: Whether to compute total/pages
+
+        Returns:
+            TimelineList with items and pagination info
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        result = await self.run_sync(
+            lambda session: TimelineRepository(
+                session
+            ).list_events(
+                page=page,
+                size=size,
+                event_type=event_type,
+                start_time=start_time,
+                end_time=end_time,
+                user_id=user_id,
+                cursor=cursor,
+                include_total=False,
+            )
+        )
+        if not include_total:
+            return result
+
+        async def count() -> int:
+            return await self.run_sync(
+                lambda session: TimelineRepository(session)
+                .filtered_query(
+                    event_type,
+                    start_time,
+                    end_time,
+                    user_id,
+                )
+                .count()
+            )
+
+        if self.count_cache is None:
+            total = await count()
+        else:
+            total = await to_thread.run_sync(
+                self.count_cache.get_or_count,
+                "timeline",
+                user_id,
+                {
+                    "event_type": event_type,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                },
+                lambda: from_thread.run(count),
+            )
+        return result.model_copy(
+            update={
+                "total": total,
+                "pages": calculate_pages(total, size),
+            }
+        )
@@ -10,7 +10,6 @@ import logging
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
-from sqlalchemy import select
 
 from .RepositoryMeta import RepositoryMeta
 from utils.validation.validation import validate_existence
@@ -58,17 +57,10 @@ class BaseRepository(
             self.db.commit()
             logger.debug("Committed transaction")
 
-            # Refresh with the relationships we know we'll need
+            # Commit expires the instance; a single refresh reloads
+            # its columns, including server-side defaults
             self.db.refresh(instance)
             logger.debug("Refreshed instance")
-
-            # Execute any pending loads within the same session
-            self.db.execute(
-                select(self.model).filter(
-                    self.model.id == instance.id
-                )
-            )
-            logger.debug("Loaded relationships")
             return instance
         except IntegrityError as e:
             logger.error(
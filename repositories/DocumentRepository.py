@@ -1,6 +1,6 @@
 """Repository for managing documents in the database."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, UTC
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, asc, func
@@ -8,12 +8,13 @@ from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 
 from domain.document import DocumentStatus
-from orm.DocumentModel import Document
+from orm.DocumentModel import Document, DocumentContent
 from .BaseRepository import BaseRepository
 from domain.exceptions import (
     DocumentValidationError,
     DocumentStatusError,
 )
+from utils.pagination import paginate_by_cursor
 
 
 class DocumentRepository(BaseRepository[Document, int]):
@@ -127,6 +128,53 @@ class DocumentRepository(BaseRepository[Document, int]):
 
         return query.offset(skip).limit(limit).all()
 
+    def list_documents_by_cursor(
+        self,
+        user_id: str,
+        cursor: str = "",
+        limit: int = 100,
+        status: Optional[DocumentStatus] = None,
+        mime_type: Optional[str] = None,
+        name_pattern: Optional[str] = None,
+    ) -> Tuple[List[Document], Optional[str]]:
+        """Get documents for a user by keyset on (created_at, id).
+
+        Args:
+            user_id: ID of the user
+            cursor: Cursor from a previous page ("" for the first page)
+            limit: Maximum number of records to return
+            status: Filter by document status
+            mime_type: Filter by MIME type
+            name_pattern: Filter by document name pattern
+
+        Returns:
+            Tuple of (documents, next_cursor), newest first
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self.db.query(Document).filter(
+            Document.user_id == user_id
+        )
+        if status:
+            query = query.filter(Document.status == status)
+        if mime_type:
+            query = query.filter(
+                Document.mime_type == mime_type
+            )
+        if name_pattern:
+            query = query.filter(
+                Document.name.ilike(f"%{name_pattern}%")
+            )
+
+        return paginate_by_cursor(
+            query,
+            Document.created_at,
+            Document.id,
+            cursor,
+            limit,
+        )
+
     def update_status(
         self,
         document_id: int,
@@ -240,6 +288,134 @@ class DocumentRepository(BaseRepository[Document, int]):
         )
         return result.total_size or 0
 
+    def get_physical_size_by_user(
+        self, user_id: str
+    ) -> int:
+        """Get bytes actually stored for a user's active documents.
+
+        Content shared by several documents is counted once, while
+        documents stored as their own file count in full.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            int: Total size in bytes
+        """
+        active = (
+            Document.user_id == user_id,
+            Document.status == DocumentStatus.ACTIVE,
+        )
+        own_files = (
+            self.db.query(func.sum(Document.size_bytes))
+            .filter(
+                *active, Document.content_hash.is_(None)
+            )
+            .scalar()
+        )
+        shared_hashes = (
+            self.db.query(Document.content_hash)
+            .filter(
+                *active, Document.content_hash.isnot(None)
+            )
+            .distinct()
+        )
+        shared = (
+            self.db.query(
+                func.sum(DocumentContent.size_bytes)
+            )
+            .filter(
+                DocumentContent.content_hash.in_(
+                    shared_hashes.scalar_subquery()
+                )
+            )
+            .scalar()
+        )
+        return (own_files or 0) + (shared or 0)
+
+    def _lock_content(
+        self, content_hash: str
+    ) -> Optional[DocumentContent]:
+        """Load a content row, locking it until the transaction ends.
+
+        Args:
+            content_hash: SHA-256 of the content
+
+        Returns:
+            Optional[DocumentContent]: Content row if it exists
+        """
+        return (
+            self.db.query(DocumentContent)
+            .filter(
+                DocumentContent.content_hash == content_hash
+            )
+            .with_for_update()
+            .first()
+        )
+
+    def add_content_reference(
+        self, content_hash: str, size_bytes: int
+    ) -> Tuple[DocumentContent, bool]:
+        """Count a new reference to content, creating its row if needed.
+
+        The row stays locked until the caller commits, so the content
+        can't be released and deleted while the new reference is
+        being recorded.
+
+        Args:
+            content_hash: SHA-256 of the content
+            size_bytes: Size of the content in bytes
+
+        Returns:
+            Tuple of (content row, whether the content is new and
+            still has to be stored)
+        """
+        content = self._lock_content(content_hash)
+        if content:
+            content.ref_count += 1
+            return content, False
+
+        content = DocumentContent(
+            content_hash=content_hash,
+            size_bytes=size_bytes,
+            ref_count=1,
+        )
+        try:
+            with self.db.begin_nested():
+                self.db.add(content)
+        except IntegrityError:
+            # Another upload of the same content created it first
+            content = self._lock_content(content_hash)
+            content.ref_count += 1
+            return content, False
+        return content, True
+
+    def release_content_reference(
+        self, content_hash: str
+    ) -> bool:
+        """Drop a reference to content, removing its row at zero.
+
+        The row stays locked until the caller commits, so stored
+        content can be deleted before anything references it again.
+
+        Args:
+            content_hash: SHA-256 of the content
+
+        Returns:
+            bool: True if that was the last reference and the stored
+            content should be deleted
+        """
+        content = self._lock_content(content_hash)
+        if not content:
+            return False
+
+        content.ref_count -= 1
+        if content.ref_count > 0:
+            return False
+        self.db.delete(content)
+        self.db.flush()
+        return True
+
     def _ensure_metadata_dict(
         self, document: Document
     ) -> None:
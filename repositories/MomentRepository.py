@@ -1,25 +1,102 @@
+from collections import Counter
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, UTC
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, insert
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+import logging
 
 from orm.MomentModel import Moment as MomentModel
-from orm.ActivityModel import Activity
+from orm.ActivityModel import Activity, adjust_moment_count
 from schemas.pydantic.MomentSchema import MomentList
 from .BaseRepository import BaseRepository
-from utils.pagination import page_to_skip, calculate_pages
+from infrastructure.cache.count_cache import CountCache
+from infrastructure.cache.entity_cache import EntityCache
+from infrastructure.cache.schema_validator_cache import (
+    SchemaValidatorCache,
+    get_schema_validator_cache,
+)
+from utils.pagination import (
+    page_to_skip,
+    calculate_pages,
+    paginate_by_cursor,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class MomentRepository(BaseRepository[MomentModel, int]):
     """Repository for managing Moment entities"""
 
-    def __init__(self, db: Session):
+    # Rows per executemany statement in bulk_create
+    BULK_INSERT_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        db: Session,
+        count_cache: Optional[CountCache] = None,
+        validator_cache: Optional[
+            SchemaValidatorCache
+        ] = None,
+        entity_cache: Optional[EntityCache] = None,
+    ):
         """Initialize with database session
 
         Args:
             db: SQLAlchemy database session
+            count_cache: Optional cache for list totals; when set,
+                writes through this repository invalidate it
+            validator_cache: Compiled activity schema validators
+                (defaults to the shared one)
+            entity_cache: Optional cache of single activities,
+                invalidated on writes since cached activities
+                carry their moment count
         """
         super().__init__(db, MomentModel)
+        self.count_cache = count_cache
+        self.validator_cache = (
+            validator_cache or get_schema_validator_cache()
+        )
+        self.entity_cache = entity_cache
+
+    def _invalidate_caches(
+        self, user_id: Optional[str]
+    ) -> None:
+        """Drop a user's cached totals and activities after a write
+
+        Args:
+            user_id: Owner of the changed moments
+        """
+        if not user_id:
+            return
+        if self.count_cache is not None:
+            self.count_cache.invalidate("moments", user_id)
+        if self.entity_cache is not None:
+            self.entity_cache.invalidate(
+                "activities", user_id
+            )
+
+    def _validate_data(self, moment: MomentModel) -> None:
+        """Validate moment data against its activity's schema
+
+        The activity is read through the session identity map and
+        its schema is validated with a cached compiled validator.
+
+        Args:
+            moment: Moment whose data to validate
+
+        Raises:
+            ValueError: If the activity does not exist or the data
+                does not match its schema
+        """
+        moment.validate_data()
+        activity = self.db.get(Activity, moment.activity_id)
+        if not activity:
+            raise ValueError(
+                f"Activity {moment.activity_id} not found"
+            )
+        self.validator_cache.validate(activity, moment.data)
 
     def create(
         self,
@@ -28,6 +105,7 @@ class MomentRepository(BaseRepository[MomentModel, int]):
         data: Optional[dict] = None,
         user_id: Optional[str] = None,
         timestamp: Optional[datetime] = None,
+        schema_checked: bool = False,
     ) -> MomentModel:
         """Create a new moment
 
@@ -42,6 +120,9 @@ class MomentRepository(BaseRepository[MomentModel, int]):
                 (if creating by fields)
             user_id: Owner's user ID (if creating by fields)
             timestamp: Optional timestamp (if creating by fields)
+            schema_checked: Whether the caller already validated
+                data against the activity schema (if creating by
+                fields), so it isn't validated twice
 
         Returns:
             Created Moment instance
@@ -51,8 +132,10 @@ class MomentRepository(BaseRepository[MomentModel, int]):
         """
         if isinstance(instance_or_activity_id, MomentModel):
             # Validate data before saving
-            instance_or_activity_id.validate_data(self.db)
-            return super().create(instance_or_activity_id)
+            self._validate_data(instance_or_activity_id)
+            moment = super().create(instance_or_activity_id)
+            self._invalidate_caches(moment.user_id)
+            return moment
 
         # Create new instance from fields
         moment = MomentModel(
@@ -62,8 +145,111 @@ class MomentRepository(BaseRepository[MomentModel, int]):
             timestamp=timestamp or datetime.now(UTC),
         )
         # Validate data before saving
-        moment.validate_data(self.db)
-        return super().create(moment)
+        if schema_checked:
+            moment.validate_data()
+        else:
+            self._validate_data(moment)
+        moment = super().create(moment)
+        self._invalidate_caches(moment.user_id)
+        return moment
+
+    def bulk_create(
+        self, rows: List[Dict[str, Any]], user_id: str
+    ) -> int:
+        """Insert many pre-validated moments in one transaction
+
+        Rows are sent as executemany INSERTs in chunks of
+        BULK_INSERT_CHUNK_SIZE and committed once, together with
+        one counter update per activity (bulk inserts skip the
+        mapper events that maintain moment_count). No per-row
+        validation or refresh happens here; callers must validate
+        data against the activity schema beforehand.
+
+        Args:
+            rows: Column values (activity_id, data, timestamp)
+                for each moment
+            user_id: Owner of every inserted moment
+
+        Returns:
+            Number of inserted moments
+
+        Raises:
+            HTTPException: If the insert fails; nothing is committed
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now(UTC)
+        values = [
+            {**row, "user_id": user_id, "created_at": now}
+            for row in rows
+        ]
+        try:
+            for start in range(
+                0, len(values), self.BULK_INSERT_CHUNK_SIZE
+            ):
+                stop = start + self.BULK_INSERT_CHUNK_SIZE
+                self.db.execute(
+                    insert(MomentModel), values[start:stop]
+                )
+            adjust_moment_count(
+                self.db.connection(),
+                Counter(row["activity_id"] for row in rows),
+            )
+            self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(
+                f"Database error during bulk create: {str(e)}"
+            )
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error: {str(e)}",
+            )
+
+        self._invalidate_caches(user_id)
+        return len(values)
+
+    def update(
+        self, id: int, data: Dict[str, Any]
+    ) -> Optional[MomentModel]:
+        """Update a moment by ID and invalidate cached data
+
+        Args:
+            id: Moment ID
+            data: Dictionary of fields to update
+
+        Returns:
+            Updated Moment if found, None otherwise
+        """
+        moment = super().update(id, data)
+        if moment is not None:
+            self._invalidate_caches(moment.user_id)
+        return moment
+
+    def delete(self, id: int) -> bool:
+        """Delete a moment by ID and invalidate cached data
+
+        Args:
+            id: Moment ID
+
+        Returns:
+            True if moment was deleted, False if not found
+        """
+        if (
+            self.count_cache is None
+            and self.entity_cache is None
+        ):
+            return super().delete(id)
+
+        moment = self.get(id)
+        if moment is None:
+            return False
+        user_id = moment.user_id
+        deleted = super().delete(id)
+        if deleted:
+            self._invalidate_caches(user_id)
+        return deleted
 
     def get(self, id: int) -> Optional[MomentModel]:
         """Get a moment by ID with eagerly loaded activity
@@ -167,9 +353,16 @@ class MomentRepository(BaseRepository[MomentModel, int]):
         end_time: Optional[datetime] = None,
         user_id: Optional[str] = None,
         include_activity: bool = True,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> MomentList:
         """List moments with pagination and filtering
 
+        When a cursor is given (including an empty one), the page is
+        fetched by keyset on (timestamp, id) instead of by offset.
+        Totals come from the count cache when one is configured, so
+        they may lag concurrent writes by up to the cache TTL.
+
         Args:
             page: Page number (1-based)
             size: Items per page
@@ -178,9 +371,15 @@ class MomentRepository(BaseRepository[MomentModel, int]):
             end_time: Optional end time filter
             user_id: Optional user ID filter
             include_activity: Whether to include activity data
+            cursor: Optional keyset cursor from a previous page
+            include_total: Whether to compute total/pages; when
+                False both are None and no COUNT query runs
 
         Returns:
             MomentList with items and pagination info
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         # Convert page/size to skip/limit
         skip, limit = page_to_skip(page, size)
@@ -210,19 +409,47 @@ class MomentRepository(BaseRepository[MomentModel, int]):
                 MomentModel.timestamp <= end_time
             )
 
-        # Order by timestamp descending
-        base_query = base_query.order_by(
-            desc(MomentModel.timestamp)
-        )
-
         # Get total count before pagination
-        total = base_query.count()
+        total = None
+        if include_total:
+            total = self._count(
+                base_query,
+                user_id,
+                {
+                    "activity_id": activity_id,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                },
+            )
 
-        # Apply pagination using skip/limit
-        items = base_query.offset(skip).limit(limit).all()
+        next_cursor = None
+        if cursor is not None:
+            # Seek past the cursor instead of scanning the offset
+            items, next_cursor = paginate_by_cursor(
+                base_query,
+                MomentModel.timestamp,
+                MomentModel.id,
+                cursor,
+                size,
+            )
+        else:
+            # Order by timestamp descending, id as tie-breaker
+            items = (
+                base_query.order_by(
+                    desc(MomentModel.timestamp),
+                    desc(MomentModel.id),
+                )
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
 
         # Calculate total pages
-        pages = calculate_pages(total, size)
+        pages = (
+            calculate_pages(total, size)
+            if total is not None
+            else None
+        )
 
         return MomentList(
             items=items,
@@ -230,6 +457,29 @@ class MomentRepository(BaseRepository[MomentModel, int]):
             page=page,
             size=size,
             pages=pages,
+            next_cursor=next_cursor,
+        )
+
+    def _count(
+        self,
+        query,
+        user_id: Optional[str],
+        filters: Dict[str, Any],
+    ) -> int:
+        """Count a filtered query, through the count cache if set
+
+        Args:
+            query: Filtered moment query
+            user_id: Owner the query is scoped to
+            filters: Filter values that shape the count
+
+        Returns:
+            Total number of matching moments
+        """
+        if self.count_cache is None:
+            return query.count()
+        return self.count_cache.get_or_count(
+            "moments", user_id, filters, query.count
         )
 
     def update_moment(
@@ -260,13 +510,14 @@ class MomentRepository(BaseRepository[MomentModel, int]):
                 activity_id=moment.activity_id,
                 data=data["data"],
             )
-            test_moment.validate_data(self.db)
+            self._validate_data(test_moment)
 
         # Update fields
         for key, value in data.items():
             setattr(moment, key, value)
 
         self.db.commit()
+        self._invalidate_caches(moment.user_id)
         return moment
 
     def delete_moment(self, moment_id: int) -> bool:
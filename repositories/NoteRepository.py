@@ -1,10 +1,11 @@
 """Repository for managing notes in the database."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 
 from domain.values import ProcessingStatus
 from orm.NoteModel import Note
+from utils.pagination import paginate_by_cursor
 
 
 class NoteRepository:
@@ -108,12 +109,40 @@ class NoteRepository:
         return (
             self.session.query(Note)
             .filter(Note.user_id == user_id)
-            .order_by(Note.created_at.desc())
+            .order_by(
+                Note.created_at.desc(), Note.id.desc()
+            )
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def list_notes_by_cursor(
+        self,
+        user_id: str,
+        cursor: str = "",
+        limit: int = 50,
+    ) -> Tuple[List[Note], Optional[str]]:
+        """List notes for a user by keyset on (created_at, id).
+
+        Args:
+            user_id: ID of the user whose notes to list
+            cursor: Cursor from a previous page ("" for the first page)
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (notes, next_cursor)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self.session.query(Note).filter(
+            Note.user_id == user_id
+        )
+        return paginate_by_cursor(
+            query, Note.created_at, Note.id, cursor, limit
+        )
+
     def count_user_notes(self, user_id: str) -> int:
         """Count total notes for a user.
 
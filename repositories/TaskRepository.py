@@ -1,8 +1,8 @@
 """Repository for managing tasks in the database."""
 
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, Query
 from sqlalchemy import desc, asc
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
@@ -15,6 +15,7 @@ from domain.exceptions import (
     TaskValidationError,
 )
 from domain.task import TaskData
+from utils.pagination import paginate_by_cursor
 
 
 class TaskRepository(BaseRepository[Task, int]):
@@ -66,7 +67,44 @@ class TaskRepository(BaseRepository[Task, int]):
                 )
             raise
 
-    def list_tasks(
+    def bulk_create(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[int]:
+        """Insert many tasks in one transaction.
+
+        All rows are flushed together and committed once, so
+        either every task is created or none is.
+
+        Args:
+            rows: Dicts of task attributes, one per task
+
+        Returns:
+            IDs of the created tasks, in the order of rows
+
+        Raises:
+            TaskValidationError: If a row references a missing
+                note, topic or parent task
+        """
+        if not rows:
+            return []
+
+        tasks = [Task(**row) for row in rows]
+        try:
+            self.db.add_all(tasks)
+            self.db.flush()
+            task_ids = [task.id for task in tasks]
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise TaskValidationError(
+                f"Invalid task reference: {str(e)}"
+            )
+        except Exception:
+            self.db.rollback()
+            raise
+        return task_ids
+
+    def _filtered_tasks_query(
         self,
         user_id: str,
         status: Optional[TaskStatus] = None,
@@ -75,10 +113,8 @@ class TaskRepository(BaseRepository[Task, int]):
         due_after: Optional[datetime] = None,
         parent_id: Optional[int] = None,
         topic_id: Optional[int] = None,
-        skip: int = 0,
-        limit: int = 50,
-    ) -> List[Task]:
-        """List tasks for a user with filtering and pagination.
+    ) -> Query:
+        """Build the filtered task query shared by the list methods.
 
         Args:
             user_id: ID of the user whose tasks to list
@@ -88,11 +124,9 @@ class TaskRepository(BaseRepository[Task, int]):
             due_after: Optional due date lower bound
             parent_id: Optional parent task ID filter
             topic_id: Optional topic ID filter
-            skip: Number of records to skip
-            limit: Maximum number of records to return
 
         Returns:
-            List[Task]: List of tasks matching the criteria
+            Query: Unordered query matching the criteria
         """
         query = self.db.query(Task).filter(
             Task.user_id == user_id
@@ -115,6 +149,45 @@ class TaskRepository(BaseRepository[Task, int]):
             )
         if topic_id is not None:
             query = query.filter(Task.topic_id == topic_id)
+        return query
+
+    def list_tasks(
+        self,
+        user_id: str,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        parent_id: Optional[int] = None,
+        topic_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> List[Task]:
+        """List tasks for a user with filtering and pagination.
+
+        Args:
+            user_id: ID of the user whose tasks to list
+            status: Optional status filter
+            priority: Optional priority filter
+            due_before: Optional due date upper bound
+            due_after: Optional due date lower bound
+            parent_id: Optional parent task ID filter
+            topic_id: Optional topic ID filter
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List[Task]: List of tasks matching the criteria
+        """
+        query = self._filtered_tasks_query(
+            user_id=user_id,
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            due_after=due_after,
+            parent_id=parent_id,
+            topic_id=topic_id,
+        )
 
         # Order by priority (high to low) then due date
         query = query.order_by(
@@ -124,6 +197,53 @@ class TaskRepository(BaseRepository[Task, int]):
 
         return query.offset(skip).limit(limit).all()
 
+    def list_tasks_by_cursor(
+        self,
+        user_id: str,
+        cursor: str = "",
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None,
+        parent_id: Optional[int] = None,
+        topic_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Task], Optional[str]]:
+        """List tasks for a user by keyset on (created_at, id).
+
+        Tasks are returned newest first; priority ordering is not
+        stable under inserts, so it is only available page by page.
+
+        Args:
+            user_id: ID of the user whose tasks to list
+            cursor: Cursor from a previous page ("" for the first page)
+            status: Optional status filter
+            priority: Optional priority filter
+            due_before: Optional due date upper bound
+            due_after: Optional due date lower bound
+            parent_id: Optional parent task ID filter
+            topic_id: Optional topic ID filter
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (tasks, next_cursor)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self._filtered_tasks_query(
+            user_id=user_id,
+            status=status,
+            priority=priority,
+            due_before=due_before,
+            due_after=due_after,
+            parent_id=parent_id,
+            topic_id=topic_id,
+        )
+        return paginate_by_cursor(
+            query, Task.created_at, Task.id, cursor, limit
+        )
+
     def count_tasks(
         self,
         user_id: str,
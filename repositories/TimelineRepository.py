@@ -1,24 +1,35 @@
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 from sqlalchemy import desc
 
 from orm.TimelineModel import Timeline as TimelineModel
 from domain.timeline import TimelineEventType
 from schemas.pydantic.TimelineSchema import TimelineList
-from utils.pagination import page_to_skip, calculate_pages
+from infrastructure.cache.count_cache import CountCache
+from utils.pagination import (
+    page_to_skip,
+    calculate_pages,
+    paginate_by_cursor,
+)
 
 
 class TimelineRepository:
     """Repository for reading Timeline events"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        count_cache: Optional[CountCache] = None,
+    ):
         """Initialize with database session
 
         Args:
             db: SQLAlchemy database session
+            count_cache: Optional cache for list totals
         """
         self.db = db
+        self.count_cache = count_cache
 
     def get_recent_by_user(
         self, user_id: str, limit: int = 5
@@ -40,65 +51,129 @@ class TimelineRepository:
             .all()
         )
 
-    def list_events(
+    def filtered_query(
         self,
-        page: int = 1,
-        size: int = 50,
         event_type: Optional[TimelineEventType] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         user_id: Optional[str] = None,
-    ) -> TimelineList:
-        """List timeline events with pagination and filtering
+    ) -> Query:
+        """Build the timeline query for a set of filters
 
         Args:
-            page: Page number (1-based)
-            size: Items per page
             event_type: Optional event type to filter by
             start_time: Optional start time filter
             end_time: Optional end time filter
             user_id: Optional user ID filter
 
         Returns:
-            TimelineList with items and pagination info
+            Unordered query over the matching events
         """
-        # Convert page/size to skip/limit
-        skip, limit = page_to_skip(page, size)
-
-        # Build base query
-        base_query = self.db.query(TimelineModel)
-
-        # Apply filters
+        query = self.db.query(TimelineModel)
         if event_type is not None:
-            base_query = base_query.filter(
+            query = query.filter(
                 TimelineModel.event_type == event_type
             )
         if user_id is not None:
-            base_query = base_query.filter(
+            query = query.filter(
                 TimelineModel.user_id == user_id
             )
         if start_time is not None:
-            base_query = base_query.filter(
+            query = query.filter(
                 TimelineModel.timestamp >= start_time
             )
         if end_time is not None:
-            base_query = base_query.filter(
+            query = query.filter(
                 TimelineModel.timestamp <= end_time
             )
+        return query
 
-        # Order by timestamp descending
-        base_query = base_query.order_by(
-            desc(TimelineModel.timestamp)
+    def list_events(
+        self,
+        page: int = 1,
+        size: int = 50,
+        event_type: Optional[TimelineEventType] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> TimelineList:
+        """List timeline events with pagination and filtering
+
+        When a cursor is given (including an empty one), the page is
+        fetched by keyset on (timestamp, id) instead of by offset.
+        Timeline events are written outside this repository, so totals
+        from the count cache are approximate for up to the cache TTL.
+
+        Args:
+            page: Page number (1-based)
+            size: Items per page
+            event_type: Optional event type to filter by
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+            user_id: Optional user ID filter
+            cursor: Optional keyset cursor from a previous page
+            include_total: Whether to compute total/pages; when
+                False both are None and no COUNT query runs
+
+        Returns:
+            TimelineList with items and pagination info
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Convert page/size to skip/limit
+        skip, limit = page_to_skip(page, size)
+
+        base_query = self.filtered_query(
+            event_type, start_time, end_time, user_id
         )
 
         # Get total count before pagination
-        total = base_query.count()
-
-        # Apply pagination using skip/limit
-        items = base_query.offset(skip).limit(limit).all()
+        total = None
+        if include_total and self.count_cache is not None:
+            total = self.count_cache.get_or_count(
+                "timeline",
+                user_id,
+                {
+                    "event_type": event_type,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                },
+                base_query.count,
+            )
+        elif include_total:
+            total = base_query.count()
+
+        next_cursor = None
+        if cursor is not None:
+            # Seek past the cursor instead of scanning the offset
+            items, next_cursor = paginate_by_cursor(
+                base_query,
+                TimelineModel.timestamp,
+                TimelineModel.id,
+                cursor,
+                size,
+            )
+        else:
+            # Order by timestamp descending, id as tie-breaker
+            items = (
+                base_query.order_by(
+                    desc(TimelineModel.timestamp),
+                    desc(TimelineModel.id),
+                )
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
 
         # Calculate total pages
-        pages = calculate_pages(total, size)
+        pages = (
+            calculate_pages(total, size)
+            if total is not None
+            else None
+        )
 
         return TimelineList(
             items=items,
@@ -106,4 +181,5 @@ class TimelineRepository:
             page=page,
             size=size,
             pages=pages,
+            next_cursor=next_cursor,
         )
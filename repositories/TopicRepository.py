@@ -1,11 +1,13 @@
 """Repository for managing Topic entities."""
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from repositories.BaseRepository import BaseRepository
 from orm.TopicModel import Topic
+from schemas.pydantic.TopicSchema import TopicResponse
+from infrastructure.cache.entity_cache import EntityCache
 from domain.exceptions import (
     TopicValidationError,
     TopicNameError,
@@ -20,13 +22,91 @@ class TopicRepository(BaseRepository[Topic, int]):
     filtering by user and name.
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        entity_cache: Optional[EntityCache] = None,
+    ):
         """Initialize repository with database session.
 
         Args:
             db: SQLAlchemy database session
+            entity_cache: Optional read-through cache for single
+                topics; when set, writes through this repository
+                invalidate it
         """
         super().__init__(db, Topic)
+        self.entity_cache = entity_cache
+
+    def _invalidate_cache(
+        self, user_id: Optional[str]
+    ) -> None:
+        """Drop cached topics for a user after a write.
+
+        Args:
+            user_id: Owner of the changed topic
+        """
+        if self.entity_cache is not None and user_id:
+            self.entity_cache.invalidate("topics", user_id)
+
+    def get_cached_by_owner(
+        self, topic_id: int, user_id: str
+    ) -> Optional[TopicResponse]:
+        """Get a topic owned by a user, read through the cache.
+
+        Args:
+            topic_id: ID of the topic
+            user_id: ID of the user who owns the topic
+
+        Returns:
+            TopicResponse: Topic if found and owned by user,
+                None otherwise
+        """
+
+        def load() -> Optional[TopicResponse]:
+            topic = self.get_by_owner(topic_id, user_id)
+            if topic is None:
+                return None
+            return TopicResponse.model_validate(topic)
+
+        if self.entity_cache is None:
+            return load()
+        return self.entity_cache.get_or_load(
+            "topics", user_id, topic_id, TopicResponse, load
+        )
+
+    def update(
+        self, id: int, data: Dict[str, Any]
+    ) -> Optional[Topic]:
+        """Update a topic by ID and invalidate the owner's cache.
+
+        Args:
+            id: ID of the topic
+            data: Fields to update
+
+        Returns:
+            Topic: Updated topic if found, None otherwise
+        """
+        topic = super().update(id, data)
+        if topic is not None:
+            self._invalidate_cache(topic.user_id)
+        return topic
+
+    def delete(self, id: int) -> bool:
+        """Delete a topic by ID and invalidate the owner's cache.
+
+        Args:
+            id: ID of the topic
+
+        Returns:
+            bool: True if the topic was deleted
+        """
+        # Usually already loaded by the ownership check
+        topic = self.db.get(Topic, id)
+        deleted = super().delete(id)
+        if deleted and topic is not None:
+            self._invalidate_cache(topic.user_id)
+        return deleted
 
     def create(
         self,
@@ -155,6 +235,7 @@ class TopicRepository(BaseRepository[Topic, int]):
 
             self.db.add(topic)
             self.db.flush()
+            self._invalidate_cache(user_id)
             return topic
         except IntegrityError as e:
             if "uq_topic_name_per_user" in str(e):
@@ -1,21 +1,42 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 from sqlalchemy.orm import Session
 from orm.UserModel import User
 from fastapi import HTTPException, status
 
+from schemas.pydantic.UserSchema import UserPrincipal
+from infrastructure.cache.entity_cache import EntityCache
 from .BaseRepository import BaseRepository
 
 
 class UserRepository(BaseRepository[User, str]):
     """Repository for managing User entities"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        user_cache: Optional[EntityCache] = None,
+    ):
         """Initialize with database session
 
         Args:
             db: SQLAlchemy database session
+            user_cache: Optional cache of authenticated users;
+                when set, writes through this repository
+                invalidate it
         """
         super().__init__(db, User)
+        self.user_cache = user_cache
+
+    def _invalidate_cache(
+        self, user_id: Optional[str]
+    ) -> None:
+        """Drop the cached principal for a user after a write
+
+        Args:
+            user_id: ID of the changed user
+        """
+        if self.user_cache is not None and user_id:
+            self.user_cache.invalidate("users", user_id)
 
     def create_user(
         self, username: str, key_id: str, user_secret: str
@@ -94,3 +115,58 @@ class UserRepository(BaseRepository[User, str]):
             .filter(User.key_id == key_id)
             .first()
         )
+
+    def get_cached_principal(
+        self, user_id: str
+    ) -> Optional[UserPrincipal]:
+        """Get a user's principal, read through the cache
+
+        Args:
+            user_id: ID of the user (the token subject)
+
+        Returns:
+            UserPrincipal if the user exists, None otherwise
+        """
+
+        def load() -> Optional[UserPrincipal]:
+            user = self.get_by_id(user_id)
+            if user is None:
+                return None
+            return UserPrincipal.model_validate(user)
+
+        if self.user_cache is None:
+            return load()
+        return self.user_cache.get_or_load(
+            "users", user_id, user_id, UserPrincipal, load
+        )
+
+    def update(
+        self, id: str, data: Dict[str, Any]
+    ) -> Optional[User]:
+        """Update a user by ID and invalidate the cached principal
+
+        Args:
+            id: User ID
+            data: Fields to update
+
+        Returns:
+            Updated user if found, None otherwise
+        """
+        user = super().update(id, data)
+        if user is not None:
+            self._invalidate_cache(id)
+        return user
+
+    def delete(self, id: str) -> bool:
+        """Delete a user by ID and invalidate the cached principal
+
+        Args:
+            id: User ID
+
+        Returns:
+            True if the user was deleted
+        """
+        deleted = super().delete(id)
+        if deleted:
+            self._invalidate_cache(id)
+        return deleted
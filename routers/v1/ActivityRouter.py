@@ -23,6 +23,7 @@ from dependencies import (
 )
 from orm.UserModel import User
 from utils.error_handlers import handle_exceptions
+from utils.threadpool import run_in_threadpool
 
 # Use our custom bearer that returns 401 for invalid tokens
 auth_scheme = CustomHTTPBearer()
@@ -40,7 +41,8 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
 )
 @handle_exceptions
-async def create_activity(
+@run_in_threadpool
+def create_activity(
     activity: ActivityCreate,
     service: ActivityService = Depends(
         get_activity_service
@@ -61,7 +63,8 @@ async def create_activity(
     "", response_model=GenericResponse[ActivityList]
 )
 @handle_exceptions
-async def list_activities(
+@run_in_threadpool
+def list_activities(
     pagination: PaginationParams = Depends(),
     service: ActivityService = Depends(
         get_activity_service
@@ -85,7 +88,8 @@ async def list_activities(
     response_model=GenericResponse[ActivityResponse],
 )
 @handle_exceptions
-async def get_activity(
+@run_in_threadpool
+def get_activity(
     activity_id: int,
     service: ActivityService = Depends(
         get_activity_service
@@ -104,7 +108,8 @@ async def get_activity(
     response_model=GenericResponse[ActivityResponse],
 )
 @handle_exceptions
-async def update_activity(
+@run_in_threadpool
+def update_activity(
     activity_id: int,
     activity: ActivityUpdate,
     service: ActivityService = Depends(
@@ -130,7 +135,8 @@ async def update_activity(
     status_code=status.HTTP_200_OK,
 )
 @handle_exceptions
-async def delete_activity(
+@run_in_threadpool
+def delete_activity(
     activity_id: int,
     service: ActivityService = Depends(
         get_activity_service
@@ -151,7 +157,8 @@ async def delete_activity(
     ],
 )
 @handle_exceptions
-async def get_processing_status(
+@run_in_threadpool
+def get_processing_status(
     activity_id: int,
     service: ActivityService = Depends(
         get_activity_service
@@ -173,7 +180,8 @@ async def get_processing_status(
     response_model=GenericResponse[RetryResponse],
 )
 @handle_exceptions
-async def retry_processing(
+@run_in_threadpool
+def retry_processing(
     activity_id: int,
     service: ActivityService = Depends(
         get_activity_service
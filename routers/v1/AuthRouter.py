@@ -17,8 +17,10 @@ from schemas.pydantic.CommonSchema import GenericResponse
 from utils.security import (
     create_access_token,
     get_current_user,
+    run_in_auth_executor,
 )
 from utils.error_handlers import handle_exceptions
+from utils.threadpool import run_in_threadpool
 from datetime import timedelta
 from typing import Dict
 
@@ -37,8 +39,8 @@ async def register_user(
 ):
     """Register a new user"""
     service = UserService(db)
-    user, user_secret = service.register_user(
-        username=request.username
+    user, user_secret = await run_in_auth_executor(
+        service.register_user, username=request.username
     )
     response = UserRegisterResponse.from_domain(
         user, user_secret
@@ -60,7 +62,9 @@ async def login_for_access_token(
 ):
     """Login to get an access token"""
     service = UserService(db)
-    user = service.authenticate_user(request.user_secret)
+    user = await run_in_auth_executor(
+        service.authenticate_user, request.user_secret
+    )
 
     # Create access token with user ID as subject
     access_token = create_access_token(
@@ -84,7 +88,8 @@ async def login_for_access_token(
     response_model=GenericResponse[UserInfoResponse],
 )
 @handle_exceptions
-async def get_current_user_info(
+@run_in_threadpool
+def get_current_user_info(
     db: Session = Depends(get_db_connection),
     current_user: Dict = Depends(get_current_user),
 ):
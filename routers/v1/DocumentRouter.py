@@ -9,6 +9,8 @@ from fastapi import (
     status,
     Body,
     Form,
+    Header,
+    Response,
 )
 from fastapi.responses import StreamingResponse
 from fastapi import HTTPException
@@ -28,14 +30,27 @@ from schemas.pydantic.StorageSchema import (
 from dependencies import get_current_user
 from orm.UserModel import User
 from utils.error_handlers import handle_exceptions
+from configs.Environment import get_environment_variables
+from utils.threadpool import run_in_threadpool
+from utils.http_range import (
+    RangeNotSatisfiable,
+    etag_matches,
+    make_etag,
+    parse_range,
+)
 from auth.bearer import CustomHTTPBearer
 from configs.Database import get_db_connection
 from repositories.DocumentRepository import (
     DocumentRepository,
 )
-from infrastructure.storage.factory import StorageFactory
+from infrastructure.storage.factory import (
+    get_storage_service,
+)
+from typing import Dict, Optional
 import json
 
+env = get_environment_variables()
+
 # Use our custom bearer that returns 401 for invalid tokens
 auth_scheme = CustomHTTPBearer()
 
@@ -59,12 +74,87 @@ def get_document_service(
 ) -> DocumentService:
     """Get document service instance."""
     repository = DocumentRepository(db)
-    storage_service = (
-        StorageFactory.create_storage_service()
-    )
     return DocumentService(
         repository=repository,
-        storage=storage_service,
+        storage=get_storage_service(),
+    )
+
+
+def _content_response(
+    doc: DocumentResponse,
+    service: DocumentService,
+    user_id: str,
+    range_header: Optional[str],
+    if_none_match: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Build a streamed, range-aware response for document content.
+
+    Answers 304 when the client's copy is current and 206 for a
+    satisfiable single byte range; content is streamed from storage
+    in chunks, so memory use does not grow with the file size.
+
+    Args:
+        doc: Document being downloaded
+        service: Document service to stream content through
+        user_id: ID of the user making the request
+        range_header: Raw Range header, if any
+        if_none_match: Raw If-None-Match header, if any
+        headers: Extra headers for the response
+
+    Returns:
+        Response: 304, 416, 206 or 200 response
+    """
+    etag = make_etag(doc.id, doc.size_bytes, doc.created_at)
+    response_headers = {
+        **(headers or {}),
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+    }
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=response_headers,
+        )
+
+    try:
+        byte_range = parse_range(
+            range_header, doc.size_bytes
+        )
+    except RangeNotSatisfiable:
+        response_headers["Content-Range"] = (
+            f"bytes */{doc.size_bytes}"
+        )
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers=response_headers,
+        )
+
+    if byte_range is None:
+        start, end = 0, doc.size_bytes - 1
+        status_code = status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        response_headers["Content-Range"] = (
+            f"bytes {start}-{end}/{doc.size_bytes}"
+        )
+    response_headers["Content-Length"] = str(
+        max(end - start + 1, 0)
+    )
+
+    chunks = service.stream_document_content(
+        document_id=doc.id,
+        user_id=user_id,
+        start=start,
+        end=end if byte_range else None,
+    )
+    return StreamingResponse(
+        chunks,
+        status_code=status_code,
+        media_type=doc.mime_type,
+        headers=response_headers,
     )
 
 
@@ -74,7 +164,10 @@ def get_document_service(
     status_code=status.HTTP_201_CREATED,
 )
 @handle_exceptions
-async def upload_document(
+@run_in_threadpool(
+    max_concurrency=env.UPLOAD_MAX_CONCURRENCY
+)
+def upload_document(
     file: UploadFile = File(...),
     name: str = Form(...),
     mime_type: str = Form(...),
@@ -86,19 +179,19 @@ async def upload_document(
         get_document_service
     ),
 ) -> GenericResponse[DocumentResponse]:
-    """Upload a document."""
-    # Read file content synchronously
-    file_content = file.file.read()
+    """Upload a document.
 
+    The upload is streamed into storage in chunks, never read
+    into memory whole; size limits are enforced as it streams.
+    """
     # Parse metadata
     metadata_dict = json.loads(metadata) if metadata else {}
 
     # Create document
-    result = document_service.create_document(
+    result = document_service.create_document_from_stream(
         name=name,
         mime_type=mime_type,
-        file_content=file_content,
-        file_size=len(file_content),
+        file_stream=file.file,
         metadata=metadata_dict,
         is_public=is_public,
         unique_name=unique_name,
@@ -114,20 +207,39 @@ async def upload_document(
     ],
 )
 @handle_exceptions
-async def list_documents(
+@run_in_threadpool
+def list_documents(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Opaque keyset cursor from a previous next_cursor; "
+            "pass an empty value to start cursor mode"
+        ),
+    ),
     service: DocumentService = Depends(
         get_document_service
     ),
     current_user: User = Depends(get_current_user),
 ) -> GenericResponse[PaginatedResponse[DocumentResponse]]:
     """List documents."""
-    result = service.list_documents(
-        user_id=current_user.id,
-        skip=skip,
-        limit=limit,
-    )
+    next_cursor = None
+    if cursor is not None:
+        (
+            result,
+            next_cursor,
+        ) = service.list_documents_by_cursor(
+            user_id=current_user.id,
+            cursor=cursor,
+            limit=limit,
+        )
+    else:
+        result = service.list_documents(
+            user_id=current_user.id,
+            skip=skip,
+            limit=limit,
+        )
     total = service.count_documents(user_id=current_user.id)
     pages = (total + limit - 1) // limit
     paginated_response = PaginatedResponse(
@@ -136,6 +248,7 @@ async def list_documents(
         page=(skip // limit) + 1,
         size=limit,
         pages=pages,
+        next_cursor=next_cursor,
     )
     return GenericResponse(
         data=paginated_response,
@@ -148,7 +261,8 @@ async def list_documents(
     response_model=GenericResponse[StorageUsageResponse],
 )
 @handle_exceptions
-async def get_storage_usage(
+@run_in_threadpool
+def get_storage_usage(
     user: User = Depends(get_current_user),
     document_service: DocumentService = Depends(
         get_document_service
@@ -167,7 +281,8 @@ async def get_storage_usage(
     response_model=GenericResponse[DocumentResponse],
 )
 @handle_exceptions
-async def get_document(
+@run_in_threadpool
+def get_document(
     document_id: int,
     service: DocumentService = Depends(
         get_document_service
@@ -190,7 +305,8 @@ async def get_document(
     response_model=GenericResponse[DocumentResponse],
 )
 @handle_exceptions
-async def update_document(
+@run_in_threadpool
+def update_document(
     document_id: int,
     document: DocumentUpdate = Body(...),
     service: DocumentService = Depends(
@@ -214,7 +330,8 @@ async def update_document(
     response_model=GenericResponse[DocumentResponse],
 )
 @handle_exceptions
-async def update_document_status(
+@run_in_threadpool
+def update_document_status(
     document_id: int,
     status_update: DocumentStatusUpdate,
     service: DocumentService = Depends(
@@ -239,33 +356,35 @@ async def update_document_status(
     response_class=StreamingResponse,
 )
 @handle_exceptions
-async def get_document_content(
+@run_in_threadpool
+def get_document_content(
     document_id: int,
+    range_header: Optional[str] = Header(
+        None, alias="Range"
+    ),
+    if_none_match: Optional[str] = Header(None),
     service: DocumentService = Depends(
         get_document_service
     ),
     current_user: User = Depends(get_current_user),
-) -> StreamingResponse:
+) -> Response:
     """Get document content.
 
-    Returns the actual file content of the document.
+    Returns the actual file content of the document, streamed,
+    honouring Range and If-None-Match.
     """
-    # First get document metadata to get mime_type
+    # First get document metadata for mime_type, size and ETag
     doc = service.get_document(
         document_id=document_id,
         user_id=current_user.id,
     )
 
-    # Then get the content
-    content = service.get_document_content(
-        document_id=document_id,
-        user_id=current_user.id,
-        owner_id=doc.user_id,  # Pass the document owner's ID
-    )
-
-    return StreamingResponse(
-        iter([content.getvalue()]),
-        media_type=doc.mime_type,
+    return _content_response(
+        doc,
+        service,
+        current_user.id,
+        range_header,
+        if_none_match,
     )
 
 
@@ -274,7 +393,8 @@ async def get_document_content(
     response_model=GenericResponse[None],
 )
 @handle_exceptions
-async def delete_document(
+@run_in_threadpool
+def delete_document(
     document_id: int,
     service: DocumentService = Depends(
         get_document_service
@@ -296,7 +416,8 @@ async def delete_document(
     response_model=GenericResponse[DocumentResponse],
 )
 @handle_exceptions
-async def get_public_document(
+@run_in_threadpool
+def get_public_document(
     unique_name: str,
     service: DocumentService = Depends(
         get_document_service
@@ -321,12 +442,17 @@ async def get_public_document(
     response_class=StreamingResponse,
 )
 @handle_exceptions
-async def download_public_document(
+@run_in_threadpool
+def download_public_document(
     unique_name: str,
+    range_header: Optional[str] = Header(
+        None, alias="Range"
+    ),
+    if_none_match: Optional[str] = Header(None),
     service: DocumentService = Depends(
         get_document_service
     ),
-) -> StreamingResponse:
+) -> Response:
     """Download a public document."""
     # First get document metadata
     doc = service.get_public_document(unique_name)
@@ -336,16 +462,12 @@ async def download_public_document(
             detail="Document not found",
         )
 
-    # Then get the content
-    content = service.get_document_content(
-        document_id=doc.id,
-        user_id=doc.user_id,  # Use document owner's ID as the requesting user
-        owner_id=doc.user_id,  # Pass the document owner's ID
-    )
-
-    return StreamingResponse(
-        iter([content.getvalue()]),
-        media_type=doc.mime_type,
+    return _content_response(
+        doc,
+        service,
+        doc.user_id,  # Use document owner's ID as the requesting user
+        range_header,
+        if_none_match,
         headers={
             "Content-Disposition": f'attachment; filename="{doc.name}"'
         },
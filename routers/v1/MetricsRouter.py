@@ -0,0 +1,84 @@
+"""Router for internal operational metrics."""
+
+import secrets
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+)
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBearer,
+)
+
+from configs.Database import get_database_metrics
+from configs.Environment import get_environment_variables
+from schemas.pydantic.CommonSchema import GenericResponse
+
+internal_token = HTTPBearer(auto_error=False)
+
+
+def require_metrics_token(
+    credentials: Optional[
+        HTTPAuthorizationCredentials
+    ] = Depends(internal_token),
+) -> None:
+    """Allow only requests bearing INTERNAL_METRICS_TOKEN.
+
+    Without a configured token every request is rejected, so
+    enabling the endpoint never exposes it unauthenticated.
+
+    Raises:
+        HTTPException: 401 if the token is missing or wrong
+    """
+    expected = (
+        get_environment_variables().INTERNAL_METRICS_TOKEN
+    )
+    if (
+        expected is None
+        or not expected.get_secret_value()
+        or credentials is None
+        or not secrets.compare_digest(
+            credentials.credentials.encode(),
+            expected.get_secret_value().encode(),
+        )
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+# Only mounted when INTERNAL_METRICS_ENABLED is set; meant to be
+# reachable from inside the deployment, not from the public API
+router = APIRouter(
+    prefix="/internal/metrics",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_token)],
+)
+
+
+@router.get(
+    "/database",
+    response_model=GenericResponse[dict],
+)
+async def get_database_pool_metrics() -> (
+    GenericResponse[dict]
+):
+    """Get live connection pool and query timing statistics.
+
+    Returns:
+        Dictionary containing:
+            - pools: Size, checked in/out, overflow and checkout
+              wait time histogram per engine
+            - query_time_ms: Statement duration histogram
+    """
+    return GenericResponse(
+        data=get_database_metrics(),
+        message="Database metrics retrieved successfully",
+    )
@@ -8,6 +8,8 @@ from schemas.pydantic.MomentSchema import (
     MomentCreate,
     MomentUpdate,
     MomentList,
+    MomentBatchCreate,
+    MomentBatchResult,
 )
 from schemas.pydantic.ActivitySchema import ActivityResponse
 from schemas.pydantic.PaginationSchema import (
@@ -21,6 +23,10 @@ from services.MomentService import MomentService
 from dependencies import get_current_user
 from orm.UserModel import User
 from utils.error_handlers import handle_exceptions
+from configs.Environment import get_environment_variables
+from utils.threadpool import run_in_threadpool
+
+env = get_environment_variables()
 
 # Use our custom bearer that returns 401 for invalid tokens
 auth_scheme = CustomHTTPBearer()
@@ -38,7 +44,8 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
 )
 @handle_exceptions
-async def create_moment(
+@run_in_threadpool
+def create_moment(
     moment: MomentCreate,
     service: MomentService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -51,13 +58,46 @@ async def create_moment(
     )
 
 
+@router.post(
+    "/batch",
+    response_model=GenericResponse[MomentBatchResult],
+    status_code=status.HTTP_201_CREATED,
+)
+@handle_exceptions
+@run_in_threadpool(
+    max_concurrency=env.MOMENT_BATCH_MAX_CONCURRENCY
+)
+def create_moments_batch(
+    batch: MomentBatchCreate,
+    service: MomentService = Depends(),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create many moments in one request
+    - Invalid moments are reported per item and skipped
+    - Valid moments are inserted in a single transaction
+    """
+    result = service.create_moments_batch(
+        batch.moments, current_user.id
+    )
+    return GenericResponse(
+        data=result,
+        message=(
+            f"Created {result.created} moments,"
+            f" {result.failed} failed"
+        ),
+    )
+
+
 @router.get("", response_model=GenericResponse[MomentList])
 @handle_exceptions
-async def list_moments(
+@run_in_threadpool
+def list_moments(
     pagination: PaginationParams = Depends(),
     activity_id: int | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
+    include_total: bool = True,
     service: MomentService = Depends(),
     current_user: User = Depends(get_current_user),
 ):
@@ -66,6 +106,8 @@ async def list_moments(
     - activity_id: Filter by activity
     - start_date: Filter moments after this time (UTC)
     - end_date: Filter moments before this time (UTC)
+    - cursor: Keyset cursor; pass empty to start, then next_cursor
+    - include_total: Set false to skip total/pages (no COUNT query)
     """
     result = service.list_moments(
         page=pagination.page,
@@ -74,10 +116,17 @@ async def list_moments(
         start_date=start_date,
         end_date=end_date,
         user_id=current_user.id,
+        cursor=pagination.cursor,
+        include_total=include_total,
+    )
+    count = (
+        result.total
+        if result.total is not None
+        else len(result.items)
     )
     return GenericResponse(
         data=result,
-        message=f"Retrieved {result.total} moments",
+        message=f"Retrieved {count} moments",
     )
 
 
@@ -86,7 +135,8 @@ async def list_moments(
     response_model=GenericResponse[MomentResponse],
 )
 @handle_exceptions
-async def get_moment(
+@run_in_threadpool
+def get_moment(
     moment_id: int,
     service: MomentService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -101,7 +151,8 @@ async def get_moment(
     response_model=GenericResponse[MomentResponse],
 )
 @handle_exceptions
-async def update_moment(
+@run_in_threadpool
+def update_moment(
     moment_id: int,
     moment: MomentUpdate,
     service: MomentService = Depends(),
@@ -123,7 +174,8 @@ async def update_moment(
     status_code=status.HTTP_200_OK,
 )
 @handle_exceptions
-async def delete_moment(
+@run_in_threadpool
+def delete_moment(
     moment_id: int,
     service: MomentService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -140,7 +192,8 @@ async def delete_moment(
     response_model=GenericResponse[List[ActivityResponse]],
 )
 @handle_exceptions
-async def get_recent_activities(
+@run_in_threadpool
+def get_recent_activities(
     limit: int = Query(5, ge=1, le=20),
     service: MomentService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -160,7 +213,8 @@ async def get_recent_activities(
     response_model=GenericResponse[MomentResponse],
 )
 @handle_exceptions
-async def attach_note(
+@run_in_threadpool
+def attach_note(
     moment_id: int,
     note_id: int,
     service: MomentService = Depends(),
@@ -186,7 +240,8 @@ async def attach_note(
     response_model=GenericResponse[MomentResponse],
 )
 @handle_exceptions
-async def detach_note(
+@run_in_threadpool
+def detach_note(
     moment_id: int,
     service: MomentService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -15,6 +15,7 @@ from schemas.pydantic.PaginationSchema import (
 from dependencies import get_current_user
 from orm.UserModel import User
 from utils.error_handlers import handle_exceptions
+from utils.threadpool import run_in_threadpool
 from auth.bearer import CustomHTTPBearer
 
 # Use our custom bearer that returns 401 for invalid tokens
@@ -32,7 +33,8 @@ router = APIRouter(
     response_model=GenericResponse[NoteResponse],
     status_code=status.HTTP_201_CREATED,
 )
-async def create_note(
+@run_in_threadpool
+def create_note(
     note: NoteCreate,
     current_user: User = Depends(get_current_user),
     service: NoteService = Depends(),
@@ -46,14 +48,18 @@ async def create_note(
 
 @router.get("", response_model=GenericResponse[dict])
 @handle_exceptions
-async def list_notes(
+@run_in_threadpool
+def list_notes(
     pagination: PaginationParams = Depends(),
     service: NoteService = Depends(),
     current_user: User = Depends(get_current_user),
 ):
     """List all notes for the current user with pagination."""
     result = service.list_notes(
-        current_user.id, pagination.page, pagination.size
+        current_user.id,
+        pagination.page,
+        pagination.size,
+        cursor=pagination.cursor,
     )
     return GenericResponse(
         data=result,
@@ -66,7 +72,8 @@ async def list_notes(
     response_model=GenericResponse[NoteResponse],
 )
 @handle_exceptions
-async def get_note(
+@run_in_threadpool
+def get_note(
     note_id: int,
     service: NoteService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -81,7 +88,8 @@ async def get_note(
     response_model=GenericResponse[NoteResponse],
 )
 @handle_exceptions
-async def update_note(
+@run_in_threadpool
+def update_note(
     note_id: int,
     note: NoteUpdate,
     service: NoteService = Depends(),
@@ -102,7 +110,8 @@ async def update_note(
     status_code=status.HTTP_200_OK,
 )
 @handle_exceptions
-async def delete_note(
+@run_in_threadpool
+def delete_note(
     note_id: int,
     service: NoteService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -24,6 +24,7 @@ from domain.values import (
 from dependencies import get_current_user
 from orm.UserModel import User
 from utils.error_handlers import handle_exceptions
+from utils.threadpool import run_in_threadpool
 from auth.bearer import CustomHTTPBearer
 
 # Use our custom bearer that returns 401 for invalid tokens
@@ -42,7 +43,8 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
 )
 @handle_exceptions
-async def create_task(
+@run_in_threadpool
+def create_task(
     task: TaskCreate,
     service: TaskService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -61,7 +63,8 @@ async def create_task(
 
 @router.get("", response_model=GenericResponse[dict])
 @handle_exceptions
-async def list_tasks(
+@run_in_threadpool
+def list_tasks(
     pagination: PaginationParams = Depends(),
     status: Optional[TaskStatus] = None,
     priority: Optional[TaskPriority] = None,
@@ -80,6 +83,7 @@ async def list_tasks(
     - due_after: Filter tasks due after this time (UTC)
     - parent_id: Filter subtasks of a specific parent task
     - topic_id: Filter tasks by topic
+    - cursor: Keyset cursor (newest first); pass empty to start
     """
     result = service.list_tasks(
         user_id=current_user.id,
@@ -91,6 +95,7 @@ async def list_tasks(
         topic_id=topic_id,
         page=pagination.page,
         size=pagination.size,
+        cursor=pagination.cursor,
     )
     return GenericResponse(
         data=result,
@@ -103,7 +108,8 @@ async def list_tasks(
     response_model=GenericResponse[TaskResponse],
 )
 @handle_exceptions
-async def get_task(
+@run_in_threadpool
+def get_task(
     task_id: int,
     service: TaskService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -118,7 +124,8 @@ async def get_task(
     response_model=GenericResponse[TaskResponse],
 )
 @handle_exceptions
-async def update_task(
+@run_in_threadpool
+def update_task(
     task_id: str,
     task: TaskUpdate,
     service: TaskService = Depends(),
@@ -140,7 +147,8 @@ async def update_task(
     status_code=status.HTTP_200_OK,
 )
 @handle_exceptions
-async def delete_task(
+@run_in_threadpool
+def delete_task(
     task_id: int,
     service: TaskService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -157,7 +165,8 @@ async def delete_task(
     response_model=GenericResponse[TaskResponse],
 )
 @handle_exceptions
-async def update_task_status(
+@run_in_threadpool
+def update_task_status(
     task_id: int,
     status: TaskStatus,
     service: TaskService = Depends(),
@@ -180,7 +189,8 @@ async def update_task_status(
     response_model=GenericResponse[dict],
 )
 @handle_exceptions
-async def get_subtasks(
+@run_in_threadpool
+def get_subtasks(
     task_id: int,
     pagination: PaginationParams = Depends(),
     service: TaskService = Depends(),
@@ -204,7 +214,8 @@ async def get_subtasks(
     response_model=GenericResponse[TaskResponse],
 )
 @handle_exceptions
-async def attach_note(
+@run_in_threadpool
+def attach_note(
     task_id: int,
     note_id: int,
     service: TaskService = Depends(),
@@ -230,7 +241,8 @@ async def attach_note(
     response_model=GenericResponse[TaskResponse],
 )
 @handle_exceptions
-async def detach_note(
+@run_in_threadpool
+def detach_note(
     task_id: int,
     service: TaskService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -248,7 +260,8 @@ async def detach_note(
     response_model=GenericResponse[TaskResponse],
 )
 @handle_exceptions
-async def update_task_topic(
+@run_in_threadpool
+def update_task_topic(
     task_id: int,
     topic_id: Optional[int] = None,
     service: TaskService = Depends(),
@@ -276,7 +289,8 @@ async def update_task_topic(
     response_model=GenericResponse[dict],
 )
 @handle_exceptions
-async def list_tasks_by_topic(
+@run_in_threadpool
+def list_tasks_by_topic(
     topic_id: int,
     pagination: PaginationParams = Depends(),
     service: TaskService = Depends(),
@@ -304,7 +318,8 @@ async def list_tasks_by_topic(
     response_model=GenericResponse[TaskProcessingResponse],
 )
 @handle_exceptions
-async def get_task_processing_status(
+@run_in_threadpool
+def get_task_processing_status(
     task_id: int,
     service: TaskService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -325,7 +340,8 @@ async def get_task_processing_status(
     status_code=status.HTTP_202_ACCEPTED,
 )
 @handle_exceptions
-async def reprocess_task(
+@run_in_threadpool
+def reprocess_task(
     task_id: int,
     service: TaskService = Depends(),
     current_user: User = Depends(get_current_user),
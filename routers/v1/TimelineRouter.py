@@ -36,6 +36,7 @@ async def list_timeline_events(
     event_type: Optional[TimelineEventType] = Query(None),
     start_time: Optional[datetime] = Query(None),
     end_time: Optional[datetime] = Query(None),
+    include_total: bool = Query(True),
     service: TimelineService = Depends(),
     current_user: User = Depends(get_current_user),
 ) -> GenericResponse[dict]:
@@ -46,6 +47,7 @@ async def list_timeline_events(
         event_type: Optional event type to filter by
         start_time: Optional start time to filter by
         end_time: Optional end time to filter by
+        include_total: Set false to skip total/pages (no COUNT query)
         service: Timeline service instance
         current_user: Current authenticated user
 
@@ -56,6 +58,7 @@ async def list_timeline_events(
             - page: Current page number
             - size: Page size
             - pages: Total number of pages
+            - next_cursor: Cursor for the next page (cursor mode)
     """
     result = await service.list_events(
         page=pagination.page,
@@ -64,6 +67,8 @@ async def list_timeline_events(
         start_time=start_time,
         end_time=end_time,
         user_id=current_user.id,
+        cursor=pagination.cursor,
+        include_total=include_total,
     )
 
     return GenericResponse(
@@ -129,12 +134,14 @@ async def get_events_by_type(
             - page: Current page number
             - size: Page size
             - pages: Total number of pages
+            - next_cursor: Cursor for the next page (cursor mode)
     """
     result = await service.get_events_by_type(
         event_type=event_type,
         user_id=current_user.id,
         page=pagination.page,
         size=pagination.size,
+        cursor=pagination.cursor,
     )
 
     return GenericResponse(
@@ -171,6 +178,7 @@ async def get_events_in_timerange(
             - page: Current page number
             - size: Page size
             - pages: Total number of pages
+            - next_cursor: Cursor for the next page (cursor mode)
     """
     result = await service.get_events_in_timerange(
         user_id=current_user.id,
@@ -178,6 +186,7 @@ async def get_events_in_timerange(
         end_time=end_time,
         page=pagination.page,
         size=pagination.size,
+        cursor=pagination.cursor,
     )
 
     return GenericResponse(
@@ -20,6 +20,7 @@ from services.TaskService import TaskService
 from dependencies import get_current_user
 from orm.UserModel import User
 from utils.error_handlers import handle_exceptions
+from utils.threadpool import run_in_threadpool
 
 # Use our custom bearer that returns 401 for invalid tokens
 auth_scheme = CustomHTTPBearer()
@@ -37,7 +38,8 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
 )
 @handle_exceptions
-async def create_topic(
+@run_in_threadpool
+def create_topic(
     topic: TopicCreate,
     service: TopicService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -55,7 +57,8 @@ async def create_topic(
 
 @router.get("", response_model=GenericResponse[dict])
 @handle_exceptions
-async def list_topics(
+@run_in_threadpool
+def list_topics(
     pagination: PaginationParams = Depends(),
     service: TopicService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -77,7 +80,8 @@ async def list_topics(
     response_model=GenericResponse[TopicResponse],
 )
 @handle_exceptions
-async def get_topic(
+@run_in_threadpool
+def get_topic(
     topic_id: int,
     service: TopicService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -92,7 +96,8 @@ async def get_topic(
     response_model=GenericResponse[TopicResponse],
 )
 @handle_exceptions
-async def update_topic(
+@run_in_threadpool
+def update_topic(
     topic_id: int,
     topic: TopicUpdate,
     service: TopicService = Depends(),
@@ -116,7 +121,8 @@ async def update_topic(
     status_code=status.HTTP_200_OK,
 )
 @handle_exceptions
-async def delete_topic(
+@run_in_threadpool
+def delete_topic(
     topic_id: int,
     service: TopicService = Depends(),
     current_user: User = Depends(get_current_user),
@@ -133,7 +139,8 @@ async def delete_topic(
     response_model=GenericResponse[dict],
 )
 @handle_exceptions
-async def get_topic_tasks(
+@run_in_threadpool
+def get_topic_tasks(
     topic_id: int,
     pagination: PaginationParams = Depends(),
     task_service: TaskService = Depends(),
@@ -175,21 +175,28 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
     Attributes:
         items: List of items of type T
-        total: Total number of items
+        total: Total number of items (None when not requested)
         page: Current page number (1-based)
         size: Number of items per page (max 100)
-        pages: Total number of pages
+        pages: Total number of pages (None when not requested)
+        next_cursor: Cursor for the next page (cursor mode only)
     """
 
     items: list[T]
-    total: int
+    total: Optional[int] = None
     page: int = Field(
         ge=1, description="Current page number (1-based)"
     )
     size: int = Field(
         ge=1, le=100, description="Items per page (max 100)"
     )
-    pages: int = Field(description="Total number of pages")
+    pages: Optional[int] = Field(
+        default=None, description="Total number of pages"
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (cursor mode only)",
+    )
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -198,8 +205,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
     @field_validator("pages", mode="before")
     @classmethod
     def calculate_pages(
-        cls, v: int, info: ValidationInfo
-    ) -> int:
+        cls, v: Optional[int], info: ValidationInfo
+    ) -> Optional[int]:
         """Calculate total pages based on total items and page size.
 
         Args:
@@ -210,7 +217,9 @@ class PaginatedResponse(BaseModel, Generic[T]):
             The calculated number of pages
         """
         data = info.data
-        if "total" in data and "size" in data:
+        if data.get("total") is None:
+            return v
+        if "size" in data:
             return (
                 data["total"] + data["size"] - 1
             ) // data["size"]
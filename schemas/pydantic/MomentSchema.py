@@ -1,7 +1,12 @@
 from datetime import datetime, UTC
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import Field, field_validator, ConfigDict
+from pydantic import (
+    BaseModel,
+    Field,
+    field_validator,
+    ConfigDict,
+)
 
 from domain.moment import MomentData
 from schemas.pydantic.ActivitySchema import ActivityResponse
@@ -10,7 +15,6 @@ from schemas.pydantic.CommonSchema import (
     PaginatedResponse,
 )
 
-
 # Common model configuration
 model_config = ConfigDict(
     from_attributes=True,  # Enable ORM mode
@@ -178,3 +182,58 @@ class MomentList(PaginatedResponse[MomentResponse]):
     """Paginated list of moments."""
 
     model_config = model_config
+
+
+# Upper bound on moments accepted by one batch request
+MAX_MOMENT_BATCH_SIZE = 5000
+
+
+class MomentBatchCreate(BaseModel):
+    """Schema for creating many moments in one request.
+
+    Attributes:
+        moments: Moments to create, in order
+    """
+
+    moments: List[MomentCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_MOMENT_BATCH_SIZE,
+        description="Moments to create, in order",
+    )
+
+
+class MomentBatchItemResult(BaseModel):
+    """Outcome of a single moment in a batch.
+
+    Attributes:
+        index: Position of the moment in the request
+        status: Whether the moment was created
+        error: Reason the moment was rejected
+    """
+
+    index: int = Field(
+        ...,
+        description="Position of the moment in the request",
+    )
+    status: Literal["created", "failed"]
+    error: Optional[str] = Field(
+        None, description="Reason the moment was rejected"
+    )
+
+
+class MomentBatchResult(BaseModel):
+    """Result of a batch moment creation.
+
+    Invalid moments are reported individually and do not prevent
+    the valid ones from being created.
+
+    Attributes:
+        created: Number of moments created
+        failed: Number of moments rejected
+        results: Per-moment outcome in request order
+    """
+
+    created: int
+    failed: int
+    results: List[MomentBatchItemResult]
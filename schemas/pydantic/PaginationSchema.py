@@ -1,6 +1,6 @@
 """Base schema for pagination parameters and response."""
 
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 from pydantic import (
     BaseModel,
     Field,
@@ -26,6 +26,13 @@ class PaginationParams(BaseModel):
         le=100,
         description="Number of items per page (max 100)",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Opaque keyset cursor from a previous next_cursor; "
+            "pass an empty value to start cursor mode"
+        ),
+    )
 
     @field_validator("page")
     @classmethod
@@ -50,11 +57,21 @@ class PaginationResponse(BaseModel, Generic[T]):
     """Base schema for paginated responses"""
 
     items: List[T]
-    total: int = Field(description="Total number of items")
+    total: Optional[int] = Field(
+        default=None,
+        description="Total number of items (None when not requested)",
+    )
     page: int = Field(description="Current page number")
     size: int = Field(
         description="Number of items per page"
     )
-    pages: int = Field(description="Total number of pages")
+    pages: Optional[int] = Field(
+        default=None,
+        description="Total number of pages (None when not requested)",
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (cursor mode only)",
+    )
 
     model_config = ConfigDict(from_attributes=True)
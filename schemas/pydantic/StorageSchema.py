@@ -11,6 +11,14 @@ class StorageUsageResponse(BaseModel):
         description="Total storage used in bytes",
         example=1024,
     )
+    physical_bytes: int = Field(
+        ...,
+        description=(
+            "Bytes actually stored, counting content shared "
+            "between documents once"
+        ),
+        example=512,
+    )
     total_bytes: int = Field(
         ...,
         description="Total storage limit in bytes",
@@ -269,3 +269,33 @@ class UserInfoResponse(BaseModel):
         ser_json_timedelta="iso8601",
         json_encoders=None,  # Use default serializers
     )
+
+
+class UserPrincipal(BaseModel):
+    """Authenticated user as resolved from an access token.
+
+    Carries the identity fields request handlers read from the
+    current user, without the secret hash or relationships, so it
+    can be cached between requests.
+    """
+
+    id: str = Field(
+        ..., description="Unique identifier for the user"
+    )
+    username: str = Field(
+        ..., description="Unique username for the user"
+    )
+    key_id: str = Field(
+        ...,
+        description="Public key identifier for API access",
+    )
+    created_at: Optional[datetime] = Field(
+        None,
+        description="When this user was created",
+    )
+    updated_at: Optional[datetime] = Field(
+        None,
+        description="When this user was last updated",
+    )
+
+    model_config = ConfigDict(from_attributes=True)
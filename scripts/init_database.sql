@@ -29,6 +29,7 @@ CREATE TABLE IF NOT EXISTS activities (
     activity_schema JSON NOT NULL,
     icon VARCHAR(255) NOT NULL,
     color VARCHAR(7) NOT NULL,
+    moment_count INT NOT NULL DEFAULT 0,
     processing_status ENUM(
         'NOT_PROCESSED',
         'PENDING',
@@ -126,6 +127,7 @@ CREATE TABLE IF NOT EXISTS documents (
     doc_metadata JSON NULL,
     unique_name VARCHAR(128) NULL UNIQUE,
     is_public BOOLEAN NOT NULL DEFAULT FALSE,
+    content_hash CHAR(64) NULL,  -- Shared content, NULL for own file
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NULL DEFAULT NULL ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -135,6 +137,17 @@ CREATE TABLE IF NOT EXISTS documents (
     CHECK (unique_name REGEXP '^[a-zA-Z0-9_]+$' OR unique_name IS NULL)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Create document contents table (content shared between documents)
+CREATE TABLE IF NOT EXISTS document_contents (
+    content_hash CHAR(64) PRIMARY KEY,
+    storage_url VARCHAR(1024) NULL,
+    size_bytes BIGINT NOT NULL,
+    ref_count INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CHECK (size_bytes >= 0),
+    CHECK (ref_count >= 0)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- Create moments table
 CREATE TABLE IF NOT EXISTS moments (
     id INT PRIMARY KEY AUTO_INCREMENT,
@@ -157,6 +170,7 @@ CREATE INDEX idx_moments_activity_id ON moments(activity_id);
 CREATE INDEX idx_moments_user_id ON moments(user_id);
 CREATE INDEX idx_moments_timestamp ON moments(timestamp);
 CREATE INDEX idx_moments_note_id ON moments(note_id);
+CREATE INDEX idx_moments_user_timestamp_id ON moments(user_id, timestamp, id);
 
 -- Indexes for tasks table
 CREATE INDEX idx_tasks_user_id ON tasks(user_id);
@@ -165,17 +179,21 @@ CREATE INDEX idx_tasks_note_id ON tasks(note_id);
 CREATE INDEX idx_tasks_topic_id ON tasks(topic_id);
 CREATE INDEX idx_tasks_status ON tasks(status);
 CREATE INDEX idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX idx_tasks_user_created_id ON tasks(user_id, created_at, id);
 
 -- Indexes for documents table
 CREATE INDEX idx_documents_user_id ON documents(user_id);
 CREATE INDEX idx_documents_status ON documents(status);
 CREATE INDEX idx_documents_unique_name ON documents(unique_name);
 CREATE INDEX idx_documents_public ON documents(is_public);
+CREATE INDEX idx_documents_content_hash ON documents(content_hash);
+CREATE INDEX idx_documents_user_created_id ON documents(user_id, created_at, id);
 
 -- Indexes for notes table
 CREATE INDEX idx_notes_user_id ON notes(user_id);
 CREATE INDEX idx_notes_created_at ON notes(created_at);
 CREATE INDEX idx_notes_processing_status ON notes(processing_status);
+CREATE INDEX idx_notes_user_created_id ON notes(user_id, created_at, id);
 
 -- Add index for processing_status (after the existing indexes)
 CREATE INDEX idx_activities_processing_status ON activities(processing_status);
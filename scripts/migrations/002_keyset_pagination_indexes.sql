@@ -0,0 +1,9 @@
+-- Composite indexes backing keyset (cursor) pagination.
+-- Each list endpoint seeks on (user_id, <sort key>, id) in descending
+-- order, so these indexes let the database jump straight to a cursor
+-- position instead of scanning past earlier pages.
+CREATE INDEX idx_moments_user_timestamp_id ON moments(user_id, timestamp, id);
+CREATE INDEX idx_timeline_user_timestamp_id ON timeline(user_id, timestamp, id);
+CREATE INDEX idx_tasks_user_created_id ON tasks(user_id, created_at, id);
+CREATE INDEX idx_notes_user_created_id ON notes(user_id, created_at, id);
+CREATE INDEX idx_documents_user_created_id ON documents(user_id, created_at, id);
@@ -0,0 +1,14 @@
+-- Denormalized moment counter on activities.
+-- Replaces the per-row COUNT subquery that was run for every
+-- activity loaded (activity lists and every moment joined to its
+-- activity). The application keeps the counter in step on moment
+-- insert/move/delete; the backfill below seeds existing rows.
+-- updated_at is assigned to itself so the backfill does not touch
+-- ON UPDATE CURRENT_TIMESTAMP.
+ALTER TABLE activities ADD COLUMN moment_count INT NOT NULL DEFAULT 0;
+
+UPDATE activities a
+SET a.moment_count = (
+        SELECT COUNT(*) FROM moments m WHERE m.activity_id = a.id
+    ),
+    a.updated_at = a.updated_at;
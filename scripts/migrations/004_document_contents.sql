@@ -0,0 +1,19 @@
+-- Content-addressed document storage.
+-- Documents with identical content share one stored object, keyed
+-- by the SHA-256 of the content. document_contents keeps one row
+-- per stored object with the number of documents referencing it;
+-- the application updates ref_count on upload and delete, and
+-- removes the object when it reaches zero. Existing documents
+-- keep their own files and a NULL content_hash.
+CREATE TABLE IF NOT EXISTS document_contents (
+    content_hash CHAR(64) PRIMARY KEY,
+    storage_url VARCHAR(1024) NULL,
+    size_bytes BIGINT NOT NULL,
+    ref_count INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CHECK (size_bytes >= 0),
+    CHECK (ref_count >= 0)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+ALTER TABLE documents ADD COLUMN content_hash CHAR(64) NULL;
+CREATE INDEX idx_documents_content_hash ON documents(content_hash);
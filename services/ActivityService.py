@@ -12,7 +12,10 @@ from domain.exceptions import (
     ActivityServiceError,
     ErrorCode,
 )
-from schemas.pydantic.ActivitySchema import ActivityList
+from schemas.pydantic.ActivitySchema import (
+    ActivityList,
+    ActivityResponse,
+)
 from orm.ActivityModel import Activity
 from domain.values import ProcessingStatus
 
@@ -158,20 +161,23 @@ class ActivityService:
 
     def get_activity(
         self, activity_id: int, user_id: str
-    ) -> ActivityData:
+    ) -> ActivityResponse:
         """Get activity by ID.
 
+        Reads through the repository's entity cache when one is
+        configured.
+
         Args:
             activity_id: ID of activity to get
             user_id: ID of user requesting activity
 
         Returns:
-            Activity data
+            Activity response data
 
         Raises:
             ActivityServiceError: If activity not found or access denied
         """
-        activity = self.repository.get_by_id(
+        activity = self.repository.get_cached_by_owner(
             activity_id, user_id
         )
         if not activity:
@@ -179,7 +185,7 @@ class ActivityService:
                 message=f"Activity {activity_id} not found",
                 code=ErrorCode.TASK_INVALID_REFERENCE,
             )
-        return ActivityData.from_orm(activity)
+        return activity
 
     def get_processing_status(
         self, activity_id: int, user_id: str
@@ -1,12 +1,28 @@
 """Service layer for document operations."""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 from fastapi import HTTPException, status
 from io import BytesIO
 
 from domain.document import DocumentData, DocumentStatus
-from domain.storage import IStorageService, StorageError
+from domain.exceptions import DocumentValidationError
+from domain.storage import (
+    IStorageService,
+    StorageError,
+    StorageLimitExceededError,
+)
+from infrastructure.storage.content_store import (
+    ContentAddressedStore,
+)
 from repositories.DocumentRepository import (
     DocumentRepository,
 )
@@ -36,6 +52,7 @@ class DocumentService:
         """
         self.repository = repository
         self.storage = storage
+        self.content_store = ContentAddressedStore(storage)
 
     def _get_document_internal(
         self, document_id: int
@@ -144,6 +161,66 @@ class DocumentService:
             }
         )
 
+    def _store_content(
+        self,
+        document: DocumentModel,
+        file_stream: BinaryIO,
+        max_bytes: int,
+    ) -> None:
+        """Store a document's content, sharing identical content.
+
+        The stream is staged while its SHA-256 is computed. If that
+        content is already stored, the staged copy is dropped and
+        the document takes another reference to the stored one, so
+        a duplicate upload costs only its database row.
+
+        Args:
+            document: Document the content belongs to
+            file_stream: File-like object with the content
+            max_bytes: Maximum size of the content
+
+        Raises:
+            StorageLimitExceededError: If content exceeds max_bytes
+            StorageError: If the content cannot be stored
+        """
+        staged = self.content_store.stage(
+            file_stream,
+            document.mime_type,
+            max_bytes=max_bytes,
+        )
+        try:
+            (
+                content,
+                is_new,
+            ) = self.repository.add_content_reference(
+                staged.content_hash, staged.size_bytes
+            )
+            if is_new:
+                stored = self.content_store.commit(staged)
+                content.storage_url = stored.path
+            else:
+                self.content_store.discard(staged)
+        except StorageError:
+            try:
+                self.content_store.discard(staged)
+            except StorageError:
+                pass
+            raise
+
+        # Committing also releases the lock on the content row
+        document.content_hash = staged.content_hash
+        document.storage_url = content.storage_url
+        document.size_bytes = staged.size_bytes
+        self.repository.update(
+            document.id,
+            {
+                "content_hash": staged.content_hash,
+                "storage_url": content.storage_url,
+                "size_bytes": staged.size_bytes,
+            },
+        )
+        self.repository.db.commit()
+
     def create_document(
         self,
         name: str,
@@ -201,23 +278,14 @@ class DocumentService:
             document = self.repository.create(document)
 
             try:
-                # Store file with final document ID
-                stored_file = self.storage.store(
-                    file_content,
-                    str(document.id),
-                    user_id,
-                    mime_type,
+                self._store_content(
+                    document,
+                    BytesIO(file_content),
+                    max_size,
                 )
-
-                # Update storage URL
-                document.storage_url = stored_file.path
-                self.repository.update(
-                    document.id,
-                    {"storage_url": stored_file.path},
-                )
-                self.repository.db.commit()
             except StorageError as e:
                 # Clean up if storage fails
+                self.repository.db.rollback()
                 self.repository.delete(document.id, user_id)
                 self.repository.db.commit()
                 msg = "Failed to store document: " + str(e)
@@ -234,6 +302,101 @@ class DocumentService:
                 detail=msg,
             ) from e
 
+    def create_document_from_stream(
+        self,
+        name: str,
+        mime_type: str,
+        file_stream: BinaryIO,
+        metadata: Optional[Dict[str, Any]] = None,
+        is_public: bool = False,
+        unique_name: Optional[str] = None,
+        user_id: str = None,
+    ) -> DocumentResponse:
+        """Create a new document from a content stream.
+
+        The content is copied to storage in chunks, so its size is
+        only known once the copy completes; the document size limit
+        and the user's remaining quota are enforced while it
+        streams. Content identical to an already stored document
+        is shared rather than stored again.
+
+        Args:
+            name: Name of the document
+            mime_type: MIME type of the document
+            file_stream: File-like object with the document content
+            metadata: Optional metadata for the document
+            is_public: Whether the document is publicly accessible
+            unique_name: Optional unique name for public access
+            user_id: Optional user ID
+
+        Returns:
+            DocumentResponse: Created document
+
+        Raises:
+            HTTPException: If the content exceeds the document size
+                limit or the user's storage quota
+        """
+        used_bytes = self.repository.get_total_size_by_user(
+            user_id
+        )
+        remaining = DocumentData.MAX_USER_STORAGE - used_bytes
+        max_size = min(DocumentData.MAX_DOCUMENT_SIZE, remaining)
+        msg = (
+            "File size exceeds maximum allowed size of "
+            f"{DocumentData.MAX_DOCUMENT_SIZE} bytes"
+            if max_size == DocumentData.MAX_DOCUMENT_SIZE
+            else "Storage quota exceeded"
+        )
+        if max_size <= 0:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=msg,
+            )
+
+        try:
+            # Create document in database first
+            document = DocumentModel(
+                name=name,
+                mime_type=mime_type,
+                size_bytes=0,  # Will be updated after storage
+                doc_metadata=metadata or {},
+                is_public=is_public,
+                unique_name=unique_name,
+                user_id=user_id,
+                status=DocumentStatus.ACTIVE,
+                storage_url="",  # Will be updated after storage
+            )
+            document = self.repository.create(document)
+
+            try:
+                self._store_content(
+                    document, file_stream, max_size
+                )
+            except StorageError as e:
+                # Clean up if storage fails
+                self.repository.db.rollback()
+                self.repository.delete(document.id, user_id)
+                self.repository.db.commit()
+                if isinstance(e, StorageLimitExceededError):
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=msg,
+                    ) from e
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to store document: " + str(e),
+                ) from e
+
+            return self._prepare_document_response(document)
+        except HTTPException:
+            raise
+        except Exception as e:
+            msg = "Failed to create document: " + str(e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=msg,
+            ) from e
+
     def get_document(
         self, document_id: int, user_id: str
     ) -> DocumentResponse:
@@ -304,6 +467,10 @@ class DocumentService:
                 )
 
             # Get file content from storage
+            if document.content_hash:
+                return self.content_store.retrieve(
+                    document.content_hash
+                )
             content = self.storage.retrieve(
                 file_id=str(document_id), user_id=user_id
             )
@@ -354,6 +521,11 @@ class DocumentService:
                 )
 
             try:
+                if document.content_hash:
+                    return self.content_store.retrieve(
+                        document.content_hash
+                    )
+
                 # For public documents or when the user is the owner,
                 # we use the document owner's ID for storage access
                 effective_owner_id = document.user_id
@@ -381,6 +553,77 @@ class DocumentService:
                 detail=f"Failed to retrieve document content: {str(e)}",
             ) from e
 
+    def stream_document_content(
+        self,
+        document_id: int,
+        user_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """Stream document file content in chunks.
+
+        Args:
+            document_id: ID of the document
+            user_id: ID of the user making the request
+            start: Offset of the first byte to return
+            end: Offset of the last byte to return, inclusive
+
+        Returns:
+            Iterator[bytes]: Chunks of the requested byte range
+
+        Raises:
+            HTTPException: If document not found or user not authorized
+        """
+        try:
+            document = self._get_document_internal(
+                document_id
+            )
+            if not document:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Document not found",
+                )
+
+            # Check authorization
+            if (
+                document.user_id != user_id
+                and not document.is_public
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not authorized to access this document",
+                )
+
+            try:
+                if document.content_hash:
+                    return self.content_store.stream(
+                        document.content_hash,
+                        start=start,
+                        end=end,
+                    )
+
+                # Storage access always goes through the owner
+                return self.storage.stream(
+                    str(document_id),
+                    document.user_id,
+                    owner_id=document.user_id,
+                    start=start,
+                    end=end,
+                )
+            except (FileNotFoundError, StorageError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Document content not found: {str(e)}",
+                ) from e
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to retrieve document content: {str(e)}",
+            ) from e
+
     def update_document(
         self,
         document_id: int,
@@ -484,6 +727,25 @@ class DocumentService:
                     detail="Not authorized to delete this document",
                 )
 
+            if document.content_hash:
+                # Drop this document's reference to the shared
+                # content, deleting the content with the last one.
+                # It goes before the commit, while the content row
+                # is still locked, so a concurrent upload of the
+                # same content can't take a reference to it first.
+                if self.repository.release_content_reference(
+                    document.content_hash
+                ):
+                    try:
+                        self.content_store.delete(
+                            document.content_hash
+                        )
+                    except StorageError:
+                        pass
+                self.repository.delete(document_id, user_id)
+                self.repository.db.commit()
+                return
+
             # Delete from database first
             self.repository.delete(document_id, user_id)
             self.repository.db.commit()
@@ -537,12 +799,54 @@ class DocumentService:
             for doc in documents
         ]
 
+    def list_documents_by_cursor(
+        self,
+        user_id: str,
+        cursor: str = "",
+        limit: int = 10,
+        name_pattern: Optional[str] = None,
+    ) -> Tuple[List[DocumentResponse], Optional[str]]:
+        """List documents for a user by keyset, newest first.
+
+        Args:
+            user_id: ID of the user
+            cursor: Cursor from a previous page ("" for the first page)
+            limit: Maximum number of records to return
+            name_pattern: Optional pattern to filter documents by name
+
+        Returns:
+            Tuple of (documents, next_cursor)
+
+        Raises:
+            DocumentValidationError: If the cursor is malformed
+        """
+        try:
+            (
+                documents,
+                next_cursor,
+            ) = self.repository.list_documents_by_cursor(
+                user_id=user_id,
+                cursor=cursor,
+                limit=limit,
+                name_pattern=name_pattern,
+            )
+        except ValueError as e:
+            raise DocumentValidationError(str(e)) from e
+        return [
+            self._prepare_document_response(doc)
+            for doc in documents
+        ], next_cursor
+
     def get_storage_usage(
         self,
         user_id: str,
     ) -> StorageUsageResponse:
         """Get storage usage for a user.
 
+        used_bytes is what counts against the quota: every
+        document's full size. physical_bytes is what is actually
+        stored, with content shared between documents counted once.
+
         Args:
             user_id: ID of the user
 
@@ -552,10 +856,15 @@ class DocumentService:
         total_size = self.repository.get_total_size_by_user(
             user_id
         )
-        # Set a default storage limit of 1GB
-        total_limit = 1024 * 1024 * 1024  # 1GB in bytes
+        physical_size = (
+            self.repository.get_physical_size_by_user(
+                user_id
+            )
+        )
         return StorageUsageResponse(
-            used_bytes=total_size, total_bytes=total_limit
+            used_bytes=total_size,
+            physical_bytes=physical_size,
+            total_bytes=DocumentData.MAX_USER_STORAGE,
         )
 
     def update_document_status(
@@ -3,9 +3,14 @@
 import json
 import logging
 from datetime import datetime, UTC
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional
 from instructor import OpenAISchema
-from pydantic import Field, ConfigDict
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+)
 
 from openai import OpenAI
 from domain.exceptions import (
@@ -17,10 +22,11 @@ from domain.exceptions import (
 from domain.robo import (
     RoboService,
     RoboConfig,
+    RoboNoteResult,
     RoboProcessingResult,
 )
 from domain.values import TaskPriority
-from services.RateLimiter import RateLimiter
+from services.RateLimiter import get_rate_limiter
 from utils.retry import with_retry
 
 logger = logging.getLogger(__name__)
@@ -172,6 +178,53 @@ class NoteEnrichmentSchema(OpenAISchema):
             )
 
 
+class ExtractedTaskSchema(BaseModel):
+    """Task extracted from a note."""
+
+    content: str = Field(
+        ...,
+        description="The task description",
+    )
+    priority: Optional[
+        Literal["urgent", "high", "medium", "low"]
+    ] = Field(
+        None,
+        description="Task priority level",
+    )
+    status: Optional[
+        Literal["todo", "in_progress", "done"]
+    ] = Field(
+        None,
+        description="Task status",
+    )
+    due_date: Optional[str] = Field(
+        None,
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+        description=(
+            "Due date in ISO format (YYYY-MM-DD) "
+            "if mentioned in the task"
+        ),
+    )
+
+
+class NoteProcessingSchema(OpenAISchema):
+    """Enrich a note and extract the tasks it mentions."""
+
+    title: str = Field(
+        ...,
+        max_length=50,
+        description="Extracted title for the note",
+    )
+    formatted: str = Field(
+        ...,
+        description="Well-formatted markdown content",
+    )
+    tasks: List[ExtractedTaskSchema] = Field(
+        default_factory=list,
+        description="Tasks mentioned in the note",
+    )
+
+
 class TaskEnrichmentSchema(OpenAISchema):
     """Schema for task processing function."""
 
@@ -394,22 +447,27 @@ class InstructorService(RoboService):
             )
 
             # Process with OpenAI using instructor
+            completion = self.client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.config.note_enrichment_prompt,
+                    },
+                    {
+                        "role": "user",
+                        "content": f"{content}{context_str}",
+                    },
+                ],
+                model=self.config.model_name,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+            )
+            self.rate_limiter.record_usage(
+                datetime.now(UTC),
+                completion.usage.total_tokens,
+            )
             result = TextProcessingSchema.from_completion(
-                completion=self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": self.config.note_enrichment_prompt,
-                        },
-                        {
-                            "role": "user",
-                            "content": f"{content}{context_str}",
-                        },
-                    ],
-                    model=self.config.model_name,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
-                )
+                completion=completion
             )
 
             # Return the result
@@ -487,11 +545,7 @@ class InstructorService(RoboService):
 
         self.config = config
         self.client = OpenAI(api_key=config.api_key)
-        self.rate_limiter = RateLimiter(
-            requests_per_minute=60,  # Default to 60 RPM
-            tokens_per_minute=90000,  # Default to 90K TPM
-            max_wait_seconds=60,  # Default to 60s max wait
-        )
+        self.rate_limiter = get_rate_limiter()
 
     def _get_datetime_context(self) -> str:
         """Generate current datetime context for LLM.
@@ -620,21 +674,28 @@ class InstructorService(RoboService):
             )
 
             # Process with OpenAI using instructor
-            enrichment = NoteEnrichmentSchema.from_completion(
-                completion=self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": self.config.note_enrichment_prompt,
-                        },
-                        {
-                            "role": "user",
-                            "content": f"{content}{context_str}",
-                        },
-                    ],
-                    model=self.config.model_name,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
+            completion = self.client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.config.note_enrichment_prompt,
+                    },
+                    {
+                        "role": "user",
+                        "content": f"{content}{context_str}",
+                    },
+                ],
+                model=self.config.model_name,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+            )
+            self.rate_limiter.record_usage(
+                datetime.now(UTC),
+                completion.usage.total_tokens,
+            )
+            enrichment = (
+                NoteEnrichmentSchema.from_completion(
+                    completion=completion
                 )
             )
 
@@ -657,6 +718,132 @@ class InstructorService(RoboService):
                 f"Failed to process note: {str(e)}"
             ) from e
 
+    @with_retry(
+        max_retries=3,
+        retry_on=(RoboAPIError, RoboRateLimitError),
+        exclude_on=tuple(),  # Allow retrying on RoboRateLimitError
+    )
+    def process_note_with_tasks(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> RoboNoteResult:
+        """Enrich a note and extract its tasks in one API call.
+
+        The model fills NoteProcessingSchema through a single
+        function call, which instructor parses and validates. When
+        only the tasks fail validation, the note is kept.
+
+        Args:
+            content: Note content to process
+            context: Optional context for processing
+
+        Returns:
+            RoboNoteResult: Enriched note and extracted tasks (None
+                when the response's tasks are invalid)
+
+        Raises:
+            RoboAPIError: If API call fails
+            RoboRateLimitError: If rate limit is exceeded
+            RoboValidationError: If content is invalid
+        """
+        if not content:
+            raise RoboValidationError(
+                "Content cannot be empty"
+            )
+
+        # Estimate tokens needed for this request
+        estimated_tokens = self._estimate_tokens(content)
+
+        if not self.rate_limiter.wait_for_capacity(
+            tokens=estimated_tokens
+        ):
+            raise RoboRateLimitError("Rate limit exceeded")
+
+        try:
+            # Create context string if provided
+            context_str = (
+                "\n\nContext:\n" + json.dumps(context)
+                if context
+                else ""
+            )
+
+            schema = NoteProcessingSchema.openai_schema
+            response = self.client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.config.note_processing_prompt,
+                    },
+                    {
+                        "role": "user",
+                        "content": f"{content}{context_str}",
+                    },
+                ],
+                model=self.config.model_name,
+                temperature=self.config.temperature,
+                max_tokens=self.config.note_processing_max_tokens,
+                tools=[
+                    {"type": "function", "function": schema}
+                ],
+                tool_choice={
+                    "type": "function",
+                    "function": {"name": schema["name"]},
+                },
+            )
+            self.rate_limiter.record_usage(
+                datetime.now(UTC),
+                response.usage.total_tokens,
+            )
+            try:
+                processed = (
+                    NoteProcessingSchema.from_response(
+                        response
+                    )
+                )
+                tasks = [
+                    task.model_dump(exclude_none=True)
+                    for task in processed.tasks
+                ]
+            except ValidationError as e:
+                if any(
+                    error["loc"][:1] != ("tasks",)
+                    for error in e.errors()
+                ):
+                    raise
+                logger.warning(
+                    "Invalid tasks in note processing response, "
+                    "leaving them to be extracted separately"
+                )
+                arguments = json.loads(
+                    response.choices[0]
+                    .message.tool_calls[0]
+                    .function.arguments
+                )
+                arguments.pop("tasks")
+                processed = (
+                    NoteProcessingSchema.model_validate(
+                        arguments
+                    )
+                )
+                tasks = None
+
+            return RoboNoteResult(
+                note=RoboProcessingResult(
+                    content=processed.formatted,
+                    metadata={"title": processed.title},
+                    tokens_used=response.usage.total_tokens,
+                    model_name=self.config.model_name,
+                    created_at=datetime.now(UTC),
+                ),
+                tasks=tasks,
+            )
+
+        except Exception as e:
+            raise RoboAPIError(
+                f"Failed to process note: {str(e)}"
+            ) from e
+
     @with_retry(
         max_retries=3,
         retry_on=(RoboAPIError, RoboRateLimitError),
@@ -709,21 +896,28 @@ class InstructorService(RoboService):
             )
 
             # Process with OpenAI using instructor
-            enrichment = TaskEnrichmentSchema.from_completion(
-                completion=self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": self.config.task_enrichment_prompt,
-                        },
-                        {
-                            "role": "user",
-                            "content": f"{content}{context_str}",
-                        },
-                    ],
-                    model=self.config.model_name,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
+            completion = self.client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.config.task_enrichment_prompt,
+                    },
+                    {
+                        "role": "user",
+                        "content": f"{content}{context_str}",
+                    },
+                ],
+                model=self.config.model_name,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+            )
+            self.rate_limiter.record_usage(
+                datetime.now(UTC),
+                completion.usage.total_tokens,
+            )
+            enrichment = (
+                TaskEnrichmentSchema.from_completion(
+                    completion=completion
                 )
             )
 
@@ -817,18 +1011,25 @@ Create templates that:
 Respond with templates that will look good when populated."""
 
             # Process with OpenAI using instructor
-            analysis = ActivitySchemaAnalysis.from_completion(
-                completion=self.client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": self.config.activity_schema_prompt,
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    model=self.config.model_name,
-                    temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
+            completion = self.client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": self.config.activity_schema_prompt,
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                model=self.config.model_name,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+            )
+            self.rate_limiter.record_usage(
+                datetime.now(UTC),
+                completion.usage.total_tokens,
+            )
+            analysis = (
+                ActivitySchemaAnalysis.from_completion(
+                    completion=completion
                 )
             )
 
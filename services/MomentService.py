@@ -1,9 +1,10 @@
 """Service for handling moment-related operations"""
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from fastapi import HTTPException, Depends, status
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
+from jsonschema.exceptions import best_match
 
 from domain.moment import MomentData
 from repositories.MomentRepository import MomentRepository
@@ -15,11 +16,18 @@ from schemas.pydantic.MomentSchema import (
     MomentCreate,
     MomentUpdate,
     MomentResponse,
+    MomentBatchItemResult,
+    MomentBatchResult,
 )
 from schemas.pydantic.PaginationSchema import (
     PaginationResponse,
 )
 from utils.validation import validate_pagination
+from utils.pagination import decode_cursor
+from infrastructure.cache.count_cache import get_count_cache
+from infrastructure.cache.entity_cache import (
+    get_entity_cache,
+)
 from domain.exceptions import (
     MomentValidationError,
     MomentTimestampError,
@@ -44,23 +52,34 @@ class MomentService:
             db: SQLAlchemy database session
         """
         self.db = db
-        self.moment_repository = MomentRepository(db)
-        self.activity_repository = ActivityRepository(db)
+        self.moment_repository = MomentRepository(
+            db,
+            count_cache=get_count_cache(),
+            entity_cache=get_entity_cache(),
+        )
+        self.activity_repository = ActivityRepository(
+            db, entity_cache=get_entity_cache()
+        )
 
     def _validate_pagination(
-        self, page: int, size: int
+        self,
+        page: int,
+        size: int,
+        cursor: Optional[str] = None,
     ) -> None:
         """Validate pagination parameters.
 
         Args:
             page: Page number (1-based)
             size: Items per page
+            cursor: Optional keyset cursor
 
         Raises:
             HTTPException: If parameters are invalid
         """
         try:
             validate_pagination(page, size)
+            decode_cursor(cursor)
         except ValueError as e:
             raise HTTPException(
                 status_code=400,
@@ -184,41 +203,157 @@ class MomentService:
                 )
             )
 
-        # Validate activity ownership
-        self._validate_activity_ownership(
-            domain_data.activity_id, user_id
-        )
-
-        # Validate timestamp
-        self._validate_timestamp(domain_data.timestamp)
-
-        # Get activity and validate data against its schema
+        # Get activity, validating ownership
         activity = (
             self.activity_repository.validate_existence(
                 domain_data.activity_id, user_id
             )
         )
 
+        # Validate timestamp
+        self._validate_timestamp(domain_data.timestamp)
+
         # Validate moment data against activity schema
-        try:
-            activity.validate_moment_data(domain_data.data)
-        except ValueError as e:
+        error = self._match_activity_schema(
+            activity, domain_data.data
+        )
+        if error is not None:
             raise HTTPException(
-                status_code=400,
-                detail=f"Moment data does not match"
-                f" activity schema: {str(e)}",
+                status_code=400, detail=error
             )
 
-        # Create the moment - validation handled by Pydantic
+        # Create the moment; its data was checked above
         moment = self.moment_repository.create(
             instance_or_activity_id=activity.id,  # Use validated activity
             data=domain_data.data,
             user_id=user_id,
             timestamp=domain_data.timestamp,
+            schema_checked=True,
         )
 
         return MomentResponse.model_validate(moment)
 
+    def _match_activity_schema(
+        self, activity, data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Check moment data against an activity's schema
+
+        Args:
+            activity: Activity the moment belongs to
+            data: Moment data to check
+
+        Returns:
+            Reason the data does not match, or None if it does
+        """
+        cache = self.moment_repository.validator_cache
+        try:
+            validator = cache.get_validator(activity)
+        except ValueError as e:
+            return str(e)
+        schema_error = best_match(
+            validator.iter_errors(data)
+        )
+        if schema_error is None:
+            return None
+        return (
+            "Moment data does not match activity"
+            f" schema: {schema_error.message}"
+        )
+
+    def create_moments_batch(
+        self,
+        moments: List[MomentCreate],
+        user_id: str,
+    ) -> MomentBatchResult:
+        """Create many moments with one activity lookup and insert
+
+        Each moment goes through the same checks as create_moment,
+        but activities are loaded once, schemas are checked with
+        the repository's cached validators, and valid moments are
+        inserted together.
+        Invalid moments are reported per item instead of failing
+        the whole batch.
+
+        Args:
+            moments: Moments to create, in request order
+            user_id: ID of the user creating the moments
+
+        Returns:
+            Counts and per-item status in request order
+
+        Raises:
+            HTTPException: If the insert itself fails
+        """
+        activities = (
+            self.activity_repository.get_many_by_user(
+                [moment.activity_id for moment in moments],
+                user_id,
+            )
+        )
+        rows: List[Dict[str, Any]] = []
+        results: List[MomentBatchItemResult] = []
+
+        for index, moment in enumerate(moments):
+            error = None
+            activity = activities.get(moment.activity_id)
+            if activity is None:
+                error = "Activity not found or does not belong to user"
+            else:
+                # Same defaults as a single create: now, in UTC
+                timestamp = (
+                    moment.timestamp
+                    or datetime.now(timezone.utc)
+                )
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(
+                        tzinfo=timezone.utc
+                    )
+                try:
+                    domain_data = moment.model_copy(
+                        update={"timestamp": timestamp}
+                    ).to_domain(user_id)
+                    domain_data.validate_timestamp()
+                except (
+                    MomentValidationError,
+                    ValueError,
+                ) as e:
+                    error = str(e)
+                else:
+                    error = self._match_activity_schema(
+                        activity, domain_data.data
+                    )
+
+            if error is None:
+                rows.append(
+                    {
+                        "activity_id": domain_data.activity_id,
+                        "data": domain_data.data,
+                        "timestamp": domain_data.timestamp,
+                    }
+                )
+                results.append(
+                    MomentBatchItemResult(
+                        index=index, status="created"
+                    )
+                )
+            else:
+                results.append(
+                    MomentBatchItemResult(
+                        index=index,
+                        status="failed",
+                        error=error,
+                    )
+                )
+
+        created = self.moment_repository.bulk_create(
+            rows, user_id
+        )
+        return MomentBatchResult(
+            created=created,
+            failed=len(moments) - created,
+            results=results,
+        )
+
     def list_moments(
         self,
         page: int,
@@ -227,6 +362,8 @@ class MomentService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> PaginationResponse[MomentResponse]:
         """List moments with optional filters
 
@@ -237,6 +374,8 @@ class MomentService:
             start_date: Optional start date filter
             end_date: Optional end date filter
             user_id: Optional user ID filter
+            cursor: Optional keyset cursor ("" starts cursor mode)
+            include_total: Whether to report total and pages
 
         Returns:
             List of moments matching filters
@@ -244,7 +383,7 @@ class MomentService:
         Raises:
             HTTPException: If pagination parameters are invalid
         """
-        self._validate_pagination(page, size)
+        self._validate_pagination(page, size, cursor)
 
         # Apply filters
         moment_list = self.moment_repository.list_moments(
@@ -255,6 +394,8 @@ class MomentService:
             end_time=end_date,
             user_id=user_id,
             include_activity=True,
+            cursor=cursor,
+            include_total=include_total,
         )
 
         # Convert to response models
@@ -269,6 +410,7 @@ class MomentService:
             page=moment_list.page,
             size=moment_list.size,
             pages=moment_list.pages,
+            next_cursor=moment_list.next_cursor,
         )
 
     def get_moment(
@@ -331,14 +473,12 @@ class MomentService:
                 detail="Activity not found",
             )
 
-        try:
-            activity.validate_moment_data(
-                moment_update.data
-            )
-        except ValueError as e:
+        error = self._match_activity_schema(
+            activity, moment_update.data
+        )
+        if error is not None:
             raise HTTPException(
-                status_code=400,
-                detail=f"Moment data does not match activity schema: {str(e)}",
+                status_code=400, detail=error
             )
 
         # Update the moment
@@ -1,6 +1,6 @@
 """Service for managing notes in the system."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from configs.Database import get_db_connection
@@ -198,14 +198,35 @@ class NoteService:
         return NoteResponse.model_validate(note.to_dict())
 
     def list_notes(
-        self, user_id: str, page: int = 1, size: int = 50
+        self,
+        user_id: str,
+        page: int = 1,
+        size: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """List notes for a user with pagination."""
+        """List notes for a user with pagination.
+
+        Any cursor (including "") switches to keyset pagination.
+        """
         validate_pagination(page, size)
         skip = (page - 1) * size
-        items = self.note_repo.list_notes(
-            user_id, skip=skip, limit=size
-        )
+        next_cursor = None
+        if cursor is not None:
+            try:
+                (
+                    items,
+                    next_cursor,
+                ) = self.note_repo.list_notes_by_cursor(
+                    user_id, cursor=cursor, limit=size
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400, detail=str(e)
+                )
+        else:
+            items = self.note_repo.list_notes(
+                user_id, skip=skip, limit=size
+            )
         total = self.note_repo.count_user_notes(user_id)
         return {
             "items": [
@@ -216,6 +237,7 @@ class NoteService:
             "page": page,
             "size": size,
             "pages": (total + size - 1) // size,
+            "next_cursor": next_cursor,
         }
 
     def update_note(
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, UTC
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import json
 
 from openai import OpenAI
@@ -16,9 +16,10 @@ from domain.exceptions import (
 from domain.robo import (
     RoboService,
     RoboConfig,
+    RoboNoteResult,
     RoboProcessingResult,
 )
-from services.RateLimiter import RateLimiter
+from services.RateLimiter import get_rate_limiter
 from utils.retry import with_retry
 
 logger = logging.getLogger(__name__)
@@ -221,6 +222,26 @@ EXTRACT_TASKS_FUNCTION = {
     },
 }
 
+PROCESS_NOTE_FUNCTION = {
+    "name": "process_note",
+    "description": (
+        "Enrich a raw note by formatting content and extracting "
+        "title, and extract the tasks it mentions"
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            **ENRICH_NOTE_FUNCTION["parameters"][
+                "properties"
+            ],
+            "tasks": EXTRACT_TASKS_FUNCTION["parameters"][
+                "properties"
+            ]["tasks"],
+        },
+        "required": ["title", "formatted", "tasks"],
+    },
+}
+
 
 class OpenAIService(RoboService):
     """OpenAI service implementation."""
@@ -241,11 +262,7 @@ class OpenAIService(RoboService):
 
         self.config = config
         self.client = OpenAI(api_key=config.api_key)
-        self.rate_limiter = RateLimiter(
-            requests_per_minute=60,  # Default to 60 RPM
-            tokens_per_minute=90000,  # Default to 90K TPM
-            max_wait_seconds=60,  # Default to 60s max wait
-        )
+        self.rate_limiter = get_rate_limiter()
 
     def _get_datetime_context(self) -> str:
         """Generate current datetime context for LLM.
@@ -494,22 +511,31 @@ class OpenAIService(RoboService):
 
         return result
 
-    def _enrich_note(
+    def _call_note_function(
         self,
         content: str,
-        context: Optional[Dict[str, Any]] = None,
-    ) -> RoboProcessingResult:
-        """Internal method to enrich notes using function calling.
+        system_prompt: str,
+        function: Dict[str, Any],
+        max_tokens: int,
+    ) -> Tuple[Dict[str, Any], RoboProcessingResult]:
+        """Call a note function and parse its response.
+
+        Only the note fields are required; callers check any
+        other fields they asked for.
 
         Args:
             content: Raw note content
-            context: Optional processing context
+            system_prompt: System prompt for the call
+            function: Function definition the model must call
+            max_tokens: Completion token budget for the call
 
         Returns:
-            RoboProcessingResult with processed note
+            Tuple of the function arguments and the enriched note
+            built from them
 
         Raises:
             RoboAPIError: If processing fails
+            RoboRateLimitError: If rate limit is exceeded
         """
         try:
             # Estimate token usage
@@ -528,7 +554,7 @@ class OpenAIService(RoboService):
             # Prepare messages with datetime context
             messages = self._prepare_messages(
                 content=content,
-                system_prompt=self.config.note_enrichment_prompt,
+                system_prompt=system_prompt,
             )
 
             response = self.client.chat.completions.create(
@@ -537,15 +563,15 @@ class OpenAIService(RoboService):
                 tools=[
                     {
                         "type": "function",
-                        "function": ENRICH_NOTE_FUNCTION,
+                        "function": function,
                     }
                 ],
                 tool_choice={
                     "type": "function",
-                    "function": {"name": "enrich_note"},
+                    "function": {"name": function["name"]},
                 },
                 temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
+                max_tokens=max_tokens,
                 timeout=self.config.timeout_seconds,
             )
 
@@ -553,7 +579,7 @@ class OpenAIService(RoboService):
             result = self._validate_tool_response(
                 response,
                 required_fields=["title", "formatted"],
-                expected_function="enrich_note",
+                expected_function=function["name"],
             )
 
             # Record token usage
@@ -564,7 +590,7 @@ class OpenAIService(RoboService):
                 response.usage.total_tokens,
             )
 
-            return RoboProcessingResult(
+            return result, RoboProcessingResult(
                 content=result["formatted"],
                 metadata={
                     "title": result["title"],
@@ -587,11 +613,38 @@ class OpenAIService(RoboService):
                 e, (RoboAPIError, RoboRateLimitError)
             ):
                 raise
-            logger.error(f"Error in _enrich_note: {str(e)}")
+            logger.error(
+                f"Error in {function['name']}: {str(e)}"
+            )
             raise RoboAPIError(
                 f"Failed to process note: {str(e)}"
             )
 
+    def _enrich_note(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> RoboProcessingResult:
+        """Internal method to enrich notes using function calling.
+
+        Args:
+            content: Raw note content
+            context: Optional processing context
+
+        Returns:
+            RoboProcessingResult with processed note
+
+        Raises:
+            RoboAPIError: If processing fails
+        """
+        _, note = self._call_note_function(
+            content,
+            self.config.note_enrichment_prompt,
+            ENRICH_NOTE_FUNCTION,
+            self.config.max_tokens,
+        )
+        return note
+
     def _process_task(
         self,
         content: str,
@@ -739,6 +792,61 @@ class OpenAIService(RoboService):
 
         return self._enrich_note(content, context)
 
+    @with_retry(
+        max_retries=3,
+        retry_on=(RoboAPIError,),
+        exclude_on=(
+            RoboConfigError,
+            RoboValidationError,
+            RoboRateLimitError,
+        ),
+    )
+    def process_note_with_tasks(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> RoboNoteResult:
+        """Enrich a note and extract its tasks in one API call.
+
+        Args:
+            content: Note content to process
+            context: Optional context for processing
+
+        Returns:
+            RoboNoteResult: Enriched note and extracted tasks (None
+                when the response's tasks are invalid)
+
+        Raises:
+            RoboAPIError: If API call fails
+            RoboRateLimitError: If rate limit is exceeded
+            RoboValidationError: If content is invalid
+        """
+        if not content:
+            raise RoboValidationError(
+                message="Note content cannot be empty"
+            )
+
+        result, note = self._call_note_function(
+            content,
+            self.config.note_processing_prompt,
+            PROCESS_NOTE_FUNCTION,
+            self.config.note_processing_max_tokens,
+        )
+
+        # Keep the note when only the tasks are unusable
+        tasks = result.get("tasks")
+        if not isinstance(tasks, list) or not all(
+            isinstance(task, dict)
+            and isinstance(task.get("content"), str)
+            for task in tasks
+        ):
+            logger.warning(
+                "Invalid tasks in note processing response, "
+                "leaving them to be extracted separately"
+            )
+            tasks = None
+        return RoboNoteResult(note=note, tasks=tasks)
+
     @with_retry(
         max_retries=3,
         retry_on=(RoboAPIError,),
@@ -913,8 +1021,22 @@ class OpenAIService(RoboService):
         Raises:
             OpenAIError: If API call fails
             ValidationError: If response validation fails
+            RoboRateLimitError: If rate limit is exceeded
         """
         try:
+            # Estimate token usage
+            estimated_tokens = (
+                len(content) // 4
+            ) + 100  # Buffer for response
+
+            # Wait for rate limit capacity
+            if not self.rate_limiter.wait_for_capacity(
+                estimated_tokens
+            ):
+                raise RoboRateLimitError(
+                    "Failed to acquire capacity after retries"
+                )
+
             # Prepare messages with datetime context
             messages = self._prepare_messages(
                 content=content,
@@ -929,6 +1051,14 @@ class OpenAIService(RoboService):
                 function_call={"name": "extract_tasks"},
             )
 
+            # Record token usage, parsed or not
+            self.rate_limiter.record_usage(
+                datetime.fromtimestamp(
+                    response.created, UTC
+                ),
+                response.usage.total_tokens,
+            )
+
             # Parse and validate response
             try:
                 # Try tool_calls first (newer format)
@@ -1,12 +1,39 @@
 """Rate limiter for API calls."""
 
+import logging
+import threading
 import time
+import uuid
 from datetime import datetime, timedelta, UTC
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+from redis import Redis
+from redis.exceptions import RedisError, WatchError
+
+from configs.Environment import get_environment_variables
+from configs.redis.RedisConnection import (
+    RedisConnectionError,
+    get_redis_connection,
+)
+
+logger = logging.getLogger(__name__)
+
+# Length of the sliding window both limits apply to
+WINDOW_SECONDS = 60
+
+# Token history entry reserved for a request in this process
+LocalReservation = Tuple[datetime, int]
 
 
 class RateLimiter:
-    """Rate limiter for API calls with token tracking."""
+    """Rate limiter for API calls with token tracking.
+
+    Capacity is reserved up front: wait_for_capacity counts the
+    request and its estimated tokens, and record_usage then replaces
+    the estimate reserved by the calling thread with the tokens the
+    API actually used.
+    """
 
     def __init__(
         self,
@@ -26,6 +53,9 @@ class RateLimiter:
         self.max_wait_seconds = max_wait_seconds
         self.request_history: List[datetime] = []
         self.token_history: List[Tuple[datetime, int]] = []
+        self._lock = threading.Lock()
+        # Reservation awaiting record_usage, per calling thread
+        self._pending = threading.local()
 
     def _clean_history(self, now: datetime) -> None:
         """Clean up history older than 1 minute.
@@ -33,16 +63,19 @@ class RateLimiter:
         Args:
             now: Current timestamp
         """
-        one_minute_ago = now - timedelta(minutes=1)
+        one_minute_ago = now - timedelta(
+            seconds=WINDOW_SECONDS
+        )
         self.request_history = [
             ts
             for ts in self.request_history
             if ts > one_minute_ago
         ]
+        # Keep the entries themselves, which reservations point at
         self.token_history = [
-            (ts, tokens)
-            for ts, tokens in self.token_history
-            if ts > one_minute_ago
+            entry
+            for entry in self.token_history
+            if entry[0] > one_minute_ago
         ]
 
     def _get_current_usage(
@@ -85,6 +118,75 @@ class RateLimiter:
             <= self.tokens_per_minute
         )
 
+    def _reserve(
+        self, tokens: int
+    ) -> Optional[LocalReservation]:
+        """Reserve capacity for one request if there is any.
+
+        Args:
+            tokens: Estimated tokens for the request
+
+        Returns:
+            Optional[LocalReservation]: The reserved token entry,
+            or None if the limits are reached
+        """
+        with self._lock:
+            now = datetime.now(UTC)
+            if not self._has_capacity(now, tokens):
+                return None
+            reservation = (now, tokens)
+            self.request_history.append(now)
+            self.token_history.append(reservation)
+            return reservation
+
+    def _record(
+        self,
+        reservation: Optional[LocalReservation],
+        timestamp: datetime,
+        tokens: int,
+    ) -> None:
+        """Replace a reservation's estimate with actual usage.
+
+        Usage without a reservation is added as a new entry. A
+        reservation that has already left the window is dropped.
+
+        Args:
+            reservation: Reservation made for the request, if any
+            timestamp: When the usage occurred
+            tokens: Number of tokens used
+        """
+        with self._lock:
+            if reservation is None:
+                self.token_history.append(
+                    (timestamp, tokens)
+                )
+            else:
+                for index, entry in enumerate(
+                    self.token_history
+                ):
+                    if entry is reservation:
+                        self.token_history[index] = (
+                            entry[0],
+                            tokens,
+                        )
+                        break
+            self._clean_history(datetime.now(UTC))
+
+    def try_acquire(self, tokens: int) -> bool:
+        """Reserve capacity without waiting.
+
+        Args:
+            tokens: Number of tokens needed
+
+        Returns:
+            Whether capacity was acquired
+        """
+        reservation = self._reserve(tokens)
+        if reservation is None:
+            return False
+        self._pending.reservation = reservation
+        return True
+
     def wait_for_capacity(self, tokens: int) -> bool:
         """Wait for rate limit capacity.
 
@@ -98,9 +200,7 @@ class RateLimiter:
         while (
             time.time() - start_time < self.max_wait_seconds
         ):
-            now = datetime.now(UTC)
-            if self._has_capacity(now, tokens):
-                self.request_history.append(now)
+            if self.try_acquire(tokens):
                 return True
             time.sleep(1)
         return False
@@ -110,9 +210,297 @@ class RateLimiter:
     ) -> None:
         """Record token usage.
 
+        Reconciles the capacity the calling thread last acquired,
+        so the estimate reserved for the request stops counting.
+
         Args:
             timestamp: When the usage occurred
             tokens: Number of tokens used
         """
-        self.token_history.append((timestamp, tokens))
-        self._clean_history(datetime.now(UTC))
+        reservation = getattr(
+            self._pending, "reservation", None
+        )
+        self._pending.reservation = None
+        self._record(reservation, timestamp, tokens)
+
+
+class SharedRateLimiter(RateLimiter):
+    """Rate limiter shared by every process through Redis.
+
+    Each process otherwise believes it has the whole provider quota
+    to itself. Requests and token counts live in Redis sorted sets
+    keyed by reservation ID and scored with the Redis server clock,
+    and are checked and reserved in one WATCH/MULTI transaction so
+    concurrent workers can't overbook the window.
+
+    When Redis is unreachable the limiter falls back to the
+    in-process window and retries the connection after a cool-down.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_wait_seconds: int = 60,
+        redis: Optional[Redis] = None,
+        retry_after_seconds: int = 30,
+        prefix: str = "ratelimit:robo",
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum tokens per minute
+            max_wait_seconds: Maximum seconds to wait for capacity
+            redis: Optional Redis client (defaults to the shared one)
+            retry_after_seconds: Cool-down after a Redis failure
+            prefix: Key prefix shared by all processes
+        """
+        super().__init__(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            max_wait_seconds=max_wait_seconds,
+        )
+        self._redis = redis
+        self.retry_after_seconds = retry_after_seconds
+        self._disabled_until = 0.0
+        self._requests_key = f"{prefix}:requests"
+        self._tokens_key = f"{prefix}:tokens"
+        self._amounts_key = f"{prefix}:amounts"
+
+    def _client(self) -> Optional[Redis]:
+        """Get the Redis client, or None while Redis is unavailable."""
+        if time.monotonic() < self._disabled_until:
+            return None
+        if self._redis is None:
+            try:
+                self._redis = get_redis_connection()
+            except RedisConnectionError as e:
+                self._disable(e)
+        return self._redis
+
+    def _disable(self, error: Exception) -> None:
+        """Use the in-process window until the cool-down has passed."""
+        logger.warning(
+            f"Shared rate limit disabled for "
+            f"{self.retry_after_seconds}s: {str(error)}"
+        )
+        self._disabled_until = (
+            time.monotonic() + self.retry_after_seconds
+        )
+
+    def _reserve(
+        self, tokens: int
+    ) -> Optional[Union[str, LocalReservation]]:
+        """Reserve capacity in Redis, or locally without Redis.
+
+        Args:
+            tokens: Estimated tokens for the request
+
+        Returns:
+            Optional[Union[str, LocalReservation]]: Reservation ID
+            in Redis or local token entry, or None if the limits
+            are reached
+        """
+        client = self._client()
+        if client is not None:
+            try:
+                return self._reserve_shared(client, tokens)
+            except RedisError as e:
+                self._disable(e)
+        return super()._reserve(tokens)
+
+    def _reserve_shared(
+        self, client: Redis, tokens: int
+    ) -> Optional[str]:
+        """Reserve capacity in the shared window.
+
+        Args:
+            client: Redis client
+            tokens: Estimated tokens for the request
+
+        Returns:
+            Optional[str]: Reservation ID, or None if the limits
+            are reached
+        """
+        reservation_id = uuid.uuid4().hex
+        keys = (
+            self._requests_key,
+            self._tokens_key,
+            self._amounts_key,
+        )
+        with client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(*keys)
+                    seconds, microseconds = pipe.time()
+                    now = seconds + microseconds / 1_000_000
+                    cutoff = now - WINDOW_SECONDS
+                    request_count = pipe.zcount(
+                        self._requests_key,
+                        f"({cutoff}",
+                        "+inf",
+                    )
+                    live = pipe.zrangebyscore(
+                        self._tokens_key,
+                        f"({cutoff}",
+                        "+inf",
+                    )
+                    used = sum(
+                        int(amount)
+                        for amount in (
+                            pipe.hmget(
+                                self._amounts_key, live
+                            )
+                            if live
+                            else []
+                        )
+                        if amount is not None
+                    )
+                    if (
+                        request_count
+                        >= self.requests_per_minute
+                        or used + tokens
+                        > self.tokens_per_minute
+                    ):
+                        pipe.unwatch()
+                        return None
+
+                    expired = pipe.zrangebyscore(
+                        self._tokens_key, "-inf", cutoff
+                    )
+                    pipe.multi()
+                    pipe.zremrangebyscore(
+                        self._requests_key, "-inf", cutoff
+                    )
+                    pipe.zremrangebyscore(
+                        self._tokens_key, "-inf", cutoff
+                    )
+                    if expired:
+                        pipe.hdel(
+                            self._amounts_key, *expired
+                        )
+                    pipe.zadd(
+                        self._requests_key,
+                        {reservation_id: now},
+                    )
+                    pipe.zadd(
+                        self._tokens_key,
+                        {reservation_id: now},
+                    )
+                    pipe.hset(
+                        self._amounts_key,
+                        reservation_id,
+                        tokens,
+                    )
+                    for key in keys:
+                        pipe.expire(key, WINDOW_SECONDS)
+                    pipe.execute()
+                    return reservation_id
+                except WatchError:
+                    # Another process changed the window; recheck
+                    continue
+
+    def _record(
+        self,
+        reservation: Optional[Union[str, LocalReservation]],
+        timestamp: datetime,
+        tokens: int,
+    ) -> None:
+        """Replace a reservation's estimate with actual usage.
+
+        Args:
+            reservation: Reservation made for the request, if any
+            timestamp: When the usage occurred
+            tokens: Number of tokens used
+        """
+        if isinstance(reservation, str):
+            client = self._client()
+            if client is None:
+                return
+            try:
+                self._reconcile_shared(
+                    client, reservation, tokens
+                )
+            except RedisError as e:
+                self._disable(e)
+            return
+
+        if reservation is None:
+            client = self._client()
+            if client is not None:
+                try:
+                    self._record_shared(client, tokens)
+                    return
+                except RedisError as e:
+                    self._disable(e)
+        super()._record(reservation, timestamp, tokens)
+
+    def _reconcile_shared(
+        self,
+        client: Redis,
+        reservation_id: str,
+        tokens: int,
+    ) -> None:
+        """Set the tokens of a reservation still in the window.
+
+        Args:
+            client: Redis client
+            reservation_id: ID returned by _reserve_shared
+            tokens: Number of tokens used
+        """
+        with client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(self._amounts_key)
+                    if not pipe.hexists(
+                        self._amounts_key, reservation_id
+                    ):
+                        pipe.unwatch()
+                        return
+                    pipe.multi()
+                    pipe.hset(
+                        self._amounts_key,
+                        reservation_id,
+                        tokens,
+                    )
+                    pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    def _record_shared(
+        self, client: Redis, tokens: int
+    ) -> None:
+        """Add usage made without a reservation to the window.
+
+        Args:
+            client: Redis client
+            tokens: Number of tokens used
+        """
+        seconds, microseconds = client.time()
+        now = seconds + microseconds / 1_000_000
+        usage_id = uuid.uuid4().hex
+        pipe = client.pipeline()
+        pipe.zadd(self._tokens_key, {usage_id: now})
+        pipe.hset(self._amounts_key, usage_id, tokens)
+        pipe.expire(self._tokens_key, WINDOW_SECONDS)
+        pipe.expire(self._amounts_key, WINDOW_SECONDS)
+        pipe.execute()
+
+
+@lru_cache()
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter for LLM calls."""
+    env = get_environment_variables()
+    if env.ROBO_SHARED_RATE_LIMIT:
+        return SharedRateLimiter(
+            requests_per_minute=env.ROBO_REQUESTS_PER_MINUTE,
+            tokens_per_minute=env.ROBO_TOKENS_PER_MINUTE,
+            max_wait_seconds=env.ROBO_RATE_LIMIT_MAX_WAIT_SECONDS,
+        )
+    return RateLimiter(
+        requests_per_minute=env.ROBO_REQUESTS_PER_MINUTE,
+        tokens_per_minute=env.ROBO_TOKENS_PER_MINUTE,
+        max_wait_seconds=env.ROBO_RATE_LIMIT_MAX_WAIT_SECONDS,
+    )
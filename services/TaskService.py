@@ -8,6 +8,9 @@ from sqlalchemy.orm import Session
 from configs.Database import get_db_connection
 from repositories.TaskRepository import TaskRepository
 from repositories.TopicRepository import TopicRepository
+from infrastructure.cache.entity_cache import (
+    get_entity_cache,
+)
 from domain.values import (
     TaskStatus,
     TaskPriority,
@@ -58,7 +61,9 @@ class TaskService:
         """
         self.db = db
         self.task_repo = TaskRepository(db)
-        self.topic_repo = TopicRepository(db)
+        self.topic_repo = TopicRepository(
+            db, entity_cache=get_entity_cache()
+        )
         self.queue_service = queue_service
 
     def _validate_topic(
@@ -73,7 +78,7 @@ class TaskService:
         Raises:
             TaskReferenceError: If topic not found or doesn't belong to user
         """
-        topic = self.topic_repo.get_by_owner(
+        topic = self.topic_repo.get_cached_by_owner(
             topic_id, user_id
         )
         if topic is None:
@@ -187,9 +192,14 @@ class TaskService:
         topic_id: Optional[int] = None,
         page: int = 1,
         size: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """List tasks for a user with filtering and pagination.
 
+        Pages are ordered by priority then due date. In cursor mode
+        (any cursor, "" for the first page) tasks are returned newest
+        first by keyset on (created_at, id).
+
         Args:
             user_id: ID of the user whose tasks to list
             status: Optional status filter
@@ -200,6 +210,7 @@ class TaskService:
             topic_id: Optional topic ID filter
             page: Page number (default: 1)
             size: Page size (default: 50)
+            cursor: Optional keyset cursor
 
         Returns:
             Dict[str, Any]: Paginated list of tasks
@@ -214,17 +225,39 @@ class TaskService:
         if topic_id is not None:
             self._validate_topic(topic_id, user_id)
 
-        tasks = self.task_repo.list_tasks(
-            user_id=user_id,
-            status=status,
-            priority=priority,
-            due_before=due_before,
-            due_after=due_after,
-            parent_id=parent_id,
-            topic_id=topic_id,
-            skip=skip,
-            limit=size,
-        )
+        next_cursor = None
+        if cursor is not None:
+            try:
+                (
+                    tasks,
+                    next_cursor,
+                ) = self.task_repo.list_tasks_by_cursor(
+                    user_id=user_id,
+                    cursor=cursor,
+                    status=status,
+                    priority=priority,
+                    due_before=due_before,
+                    due_after=due_after,
+                    parent_id=parent_id,
+                    topic_id=topic_id,
+                    limit=size,
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400, detail=str(e)
+                )
+        else:
+            tasks = self.task_repo.list_tasks(
+                user_id=user_id,
+                status=status,
+                priority=priority,
+                due_before=due_before,
+                due_after=due_after,
+                parent_id=parent_id,
+                topic_id=topic_id,
+                skip=skip,
+                limit=size,
+            )
 
         total = self.task_repo.count_tasks(
             user_id=user_id,
@@ -241,6 +274,7 @@ class TaskService:
             "page": page,
             "size": size,
             "pages": (total + size - 1) // size,
+            "next_cursor": next_cursor,
         }
 
     def update_task(
@@ -7,6 +7,7 @@ from typing import Dict, Any, List, Optional
 from domain.robo import (
     RoboService,
     RoboConfig,
+    RoboNoteResult,
     RoboProcessingResult,
 )
 
@@ -100,6 +101,27 @@ class TestRoboService(RoboService):
             created_at=datetime.now(UTC),
         )
 
+    def process_note_with_tasks(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> RoboNoteResult:
+        """Return a stubbed enriched note without tasks.
+
+        Args:
+            content: Note content to process
+            context: Optional context for processing
+
+        Returns:
+            RoboNoteResult: Stubbed note and an empty task list
+        """
+        return RoboNoteResult(
+            note=self.process_text(
+                content, context={"type": "note_enrichment"}
+            ),
+            tasks=[],
+        )
+
     def extract_entities(
         self, text: str, entity_types: List[str]
     ) -> Dict[str, List[Dict[str, Any]]]:
@@ -3,15 +3,17 @@
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from configs.Database import get_db_connection
-from repositories.TimelineRepository import (
-    TimelineRepository,
+from configs.Database import get_async_db_connection
+from repositories.AsyncTimelineRepository import (
+    AsyncTimelineRepository,
 )
 from domain.timeline import TimelineEventType
 from domain.exceptions import TimelineValidationError
 from utils.validation import validate_pagination
+from utils.pagination import decode_cursor
+from infrastructure.cache.count_cache import get_count_cache
 from schemas.pydantic.TimelineSchema import TimelineEvent
 
 import logging
@@ -24,23 +26,26 @@ class TimelineService:
 
     This service handles the business logic for retrieving and filtering
     timeline events. It ensures proper validation and authorization.
+    Queries run on an AsyncSession so they do not block the event loop.
 
     Attributes:
-        db: Database session
+        db: Async database session
         timeline_repo: Repository for timeline operations
     """
 
     def __init__(
         self,
-        db: Session = Depends(get_db_connection),
+        db: AsyncSession = Depends(get_async_db_connection),
     ):
         """Initialize the timeline service.
 
         Args:
-            db: Database session from dependency injection
+            db: Async database session from dependency injection
         """
         self.db = db
-        self.timeline_repo = TimelineRepository(db)
+        self.timeline_repo = AsyncTimelineRepository(
+            db, count_cache=get_count_cache()
+        )
 
     def _handle_timeline_error(
         self, error: Exception
@@ -56,6 +61,28 @@ class TimelineService:
             )
         raise error
 
+    def _validate_pagination(
+        self,
+        page: int,
+        size: int,
+        cursor: Optional[str] = None,
+    ) -> None:
+        """Validate pagination parameters.
+
+        Args:
+            page: Page number (1-based)
+            size: Items per page
+            cursor: Optional keyset cursor
+
+        Raises:
+            TimelineValidationError: If parameters are invalid
+        """
+        try:
+            validate_pagination(page, size)
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise TimelineValidationError(str(e))
+
     async def get_recent_events(
         self, user_id: str, limit: int = 5
     ) -> List[TimelineEvent]:
@@ -72,8 +99,10 @@ class TimelineService:
             HTTPException: If retrieval fails
         """
         try:
-            events = self.timeline_repo.get_recent_by_user(
-                user_id=user_id, limit=limit
+            events = (
+                await self.timeline_repo.get_recent_by_user(
+                    user_id=user_id, limit=limit
+                )
             )
             return [
                 TimelineEvent.model_validate(event)
@@ -95,6 +124,8 @@ class TimelineService:
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """List timeline events with filtering and pagination.
 
@@ -105,28 +136,33 @@ class TimelineService:
             start_time: Optional start time to filter by
             end_time: Optional end time to filter by
             user_id: Optional user ID to filter by
+            cursor: Optional keyset cursor ("" starts cursor mode)
+            include_total: Whether to report total and pages
 
         Returns:
             Dict containing:
                 - items: List of timeline events
-                - total: Total number of events
+                - total: Total number of events (None if skipped)
                 - page: Current page number
                 - size: Page size
-                - pages: Total number of pages
+                - pages: Total number of pages (None if skipped)
+                - next_cursor: Cursor for the next page (cursor mode)
 
         Raises:
             HTTPException: If validation fails or retrieval fails
         """
         try:
-            validate_pagination(page, size)
+            self._validate_pagination(page, size, cursor)
 
-            result = self.timeline_repo.list_events(
+            result = await self.timeline_repo.list_events(
                 page=page,
                 size=size,
                 event_type=event_type,
                 start_time=start_time,
                 end_time=end_time,
                 user_id=user_id,
+                cursor=cursor,
+                include_total=include_total,
             )
 
             return {
@@ -138,6 +174,7 @@ class TimelineService:
                 "page": result.page,
                 "size": result.size,
                 "pages": result.pages,
+                "next_cursor": result.next_cursor,
             }
 
         except Exception as e:
@@ -153,6 +190,7 @@ class TimelineService:
         user_id: str,
         page: int = 1,
         size: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get timeline events of a specific type for a user.
 
@@ -161,6 +199,7 @@ class TimelineService:
             user_id: ID of the user to get events for
             page: Page number (1-based)
             size: Number of items per page
+            cursor: Optional keyset cursor ("" starts cursor mode)
 
         Returns:
             Dict containing paginated events of the specified type
@@ -169,13 +208,14 @@ class TimelineService:
             HTTPException: If validation fails or retrieval fails
         """
         try:
-            validate_pagination(page, size)
+            self._validate_pagination(page, size, cursor)
 
-            result = self.timeline_repo.list_events(
+            result = await self.timeline_repo.list_events(
                 page=page,
                 size=size,
                 event_type=event_type,
                 user_id=user_id,
+                cursor=cursor,
             )
 
             return {
@@ -187,6 +227,7 @@ class TimelineService:
                 "page": result.page,
                 "size": result.size,
                 "pages": result.pages,
+                "next_cursor": result.next_cursor,
             }
 
         except Exception as e:
@@ -204,6 +245,7 @@ class TimelineService:
         end_time: datetime,
         page: int = 1,
         size: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get timeline events within a specific time range.
 
@@ -213,6 +255,7 @@ class TimelineService:
             end_time: End of time range
             page: Page number (1-based)
             size: Number of items per page
+            cursor: Optional keyset cursor ("" starts cursor mode)
 
         Returns:
             Dict containing paginated events within the time range
@@ -221,19 +264,20 @@ class TimelineService:
             HTTPException: If validation fails or retrieval fails
         """
         try:
-            validate_pagination(page, size)
+            self._validate_pagination(page, size, cursor)
 
             if start_time >= end_time:
                 raise TimelineValidationError(
                     "Start time must be before end time"
                 )
 
-            result = self.timeline_repo.list_events(
+            result = await self.timeline_repo.list_events(
                 page=page,
                 size=size,
                 user_id=user_id,
                 start_time=start_time,
                 end_time=end_time,
+                cursor=cursor,
             )
 
             return {
@@ -245,6 +289,7 @@ class TimelineService:
                 "page": result.page,
                 "size": result.size,
                 "pages": result.pages,
+                "next_cursor": result.next_cursor,
             }
 
         except Exception as e:
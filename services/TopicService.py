@@ -5,6 +5,9 @@ from sqlalchemy.orm import Session
 
 from configs.Database import get_db_connection
 from repositories.TopicRepository import TopicRepository
+from infrastructure.cache.entity_cache import (
+    get_entity_cache,
+)
 from domain.exceptions import (
     TopicValidationError,
     TopicNameError,
@@ -41,7 +44,9 @@ class TopicService:
             db: SQLAlchemy database session
         """
         self.db = db
-        self.topic_repo = TopicRepository(db)
+        self.topic_repo = TopicRepository(
+            db, entity_cache=get_entity_cache()
+        )
 
     def _handle_topic_error(self, error: Exception) -> None:
         """Map domain exceptions to HTTP exceptions."""
@@ -140,7 +145,7 @@ class TopicService:
             HTTPException: If topic not found
         """
         try:
-            topic = self.topic_repo.get_by_owner(
+            topic = self.topic_repo.get_cached_by_owner(
                 topic_id, user_id
             )
             if not topic:
@@ -149,7 +154,7 @@ class TopicService:
                     detail="Topic not found",
                 )
 
-            return TopicResponse.model_validate(topic)
+            return topic
         except HTTPException:
             raise
         except Exception as e:
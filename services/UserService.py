@@ -6,6 +6,10 @@ import secrets
 
 from configs.Database import get_db_connection
 from repositories.UserRepository import UserRepository
+from infrastructure.cache.entity_cache import get_user_cache
+from infrastructure.cache.verified_key_cache import (
+    get_verified_key_cache,
+)
 from orm.UserModel import User
 from utils.security import (
     generate_api_key,
@@ -26,7 +30,10 @@ class UserService:
     def __init__(
         self, db: Session = Depends(get_db_connection)
     ):
-        self.user_repository = UserRepository(db)
+        self.user_repository = UserRepository(
+            db, user_cache=get_user_cache()
+        )
+        self.key_cache = get_verified_key_cache()
 
     def _validate_username(self, username: str) -> None:
         """Validate username format.
@@ -130,9 +137,10 @@ class UserService:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
-            # Verify the secret
-            if not self.verify_secret(
-                secret, user.user_secret
+            # Verify the secret, skipping bcrypt for keys
+            # verified recently
+            if not self._verify_api_key(
+                api_key, secret, user
             ):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -148,6 +156,29 @@ class UserService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+    def _verify_api_key(
+        self, api_key: str, secret: str, user: User
+    ) -> bool:
+        """Verify an API key's secret for the user it names.
+
+        A cache hit must map to the same user found by key_id, so a
+        rotated key or deleted user never matches a stale entry.
+
+        Args:
+            api_key: Full API key as presented
+            secret: Secret part of the key
+            user: User found by the key's key_id
+
+        Returns:
+            bool: True if the key is valid for the user
+        """
+        if self.key_cache.get_user_id(api_key) == user.id:
+            return True
+        if not self.verify_secret(secret, user.user_secret):
+            return False
+        self.key_cache.remember(api_key, user.id)
+        return True
+
     def get_user_by_id(self, user_id: str) -> User:
         """Get a user by their ID"""
         try:
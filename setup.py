@@ -13,6 +13,7 @@ setup(
         "pydantic>=2.0.0",
         "pydantic-settings>=2.0.3",
         "mysqlclient",
+        "aiomysql",
         "python-jose[cryptography]",
         "passlib[bcrypt]",
         "pytest-asyncio>=0.14.0",
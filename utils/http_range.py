@@ -0,0 +1,102 @@
+"""HTTP Range and conditional request helpers for file downloads"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiable(ValueError):
+    """Raised when a Range header selects no bytes of the file"""
+
+    pass
+
+
+def make_etag(
+    file_id: int, size_bytes: int, created_at: datetime
+) -> str:
+    """Build a strong ETag for a stored file
+
+    Stored content is never rewritten in place, so the file's
+    identity, size and creation time are enough to tell versions
+    apart without reading the content.
+
+    Args:
+        file_id: ID of the file
+        size_bytes: Size of the file in bytes
+        created_at: When the file was stored
+
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.md5(
+        f"{file_id}:{size_bytes}:{created_at.isoformat()}".encode()
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(
+    if_none_match: Optional[str], etag: str
+) -> bool:
+    """Check an If-None-Match header against an ETag
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the file
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates = [
+        tag.strip().removeprefix("W/")
+        for tag in if_none_match.split(",")
+    ]
+    return "*" in candidates or etag in candidates
+
+
+def parse_range(
+    range_header: Optional[str], size: int
+) -> Optional[Tuple[int, int]]:
+    """Parse a single-range Range header
+
+    Multi-range and non-byte requests are ignored, which tells
+    the caller to serve the whole file as RFC 9110 allows.
+
+    Args:
+        range_header: Raw Range header value, if any
+        size: Size of the file in bytes
+
+    Returns:
+        Inclusive (start, end) offsets, or None to serve the whole file
+
+    Raises:
+        RangeNotSatisfiable: If the range lies outside the file
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        elif last:
+            # Suffix range: the final N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+
+    if start > end or start >= size:
+        raise RangeNotSatisfiable(
+            f"Range {range_header} not satisfiable for {size} bytes"
+        )
+    return start, min(end, size - 1)
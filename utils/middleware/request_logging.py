@@ -1,58 +1,177 @@
-from fastapi import Request
-import time
 import logging
-from typing import Callable
-from starlette.middleware.base import BaseHTTPMiddleware
+import random
+import time
+from typing import Dict, Iterable, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from configs.Environment import get_environment_variables
+from configs.QueryTracking import (
+    UNMATCHED_ROUTE,
+    QueryTracker,
+    RequestQueryStats,
+    get_query_tracker,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses."""
+class RequestLoggingMiddleware:
+    """Middleware for logging HTTP requests and responses.
+
+    Written as a plain ASGI middleware so responses, including
+    streamed ones, pass through without an extra task or buffer.
+    Only a sampled fraction of requests is logged, server errors
+    always are, and only allow-listed request headers are copied
+    into the log record, which is built only when it will be
+    emitted.
 
-    async def dispatch(
-        self, request: Request, call_next: Callable
+    Also scopes SQL tracking to each request, so the completion log
+    carries its query count and database time. When the tracker
+    exposes headers (DEBUG_MODE), responses carry the same budget as
+    X-DB-Query-Count, X-DB-Time-Ms and X-DB-Repeated-Queries.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        query_tracker: Optional[QueryTracker] = None,
+        sample_rate: Optional[float] = None,
+        log_headers: Optional[Iterable[str]] = None,
     ):
-        """Process the request, log it, and return the response."""
-        start_time = time.time()
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            query_tracker: Tracker to use (defaults to the shared one)
+            sample_rate: Fraction of requests to log, between 0 and
+                1 (defaults to REQUEST_LOG_SAMPLE_RATE)
+            log_headers: Request header names copied into the log
+                record (defaults to REQUEST_LOG_HEADERS)
+        """
+        self.app = app
+        self.query_tracker = (
+            query_tracker or get_query_tracker()
+        )
+        env = get_environment_variables()
+        self.sample_rate = (
+            env.REQUEST_LOG_SAMPLE_RATE
+            if sample_rate is None
+            else sample_rate
+        )
+        if log_headers is None:
+            log_headers = env.REQUEST_LOG_HEADERS.split(",")
+        self.log_headers = frozenset(
+            name.strip().lower().encode("latin-1")
+            for name in log_headers
+            if name.strip()
+        )
 
-        # Log request
-        request_data = {
-            "path": request.url.path,
-            "method": request.method,
-            "headers": dict(request.headers),
-            "client_ip": (
-                request.client.host
-                if request.client
-                else None
-            ),
+    def _request_headers(
+        self, scope: Scope
+    ) -> Dict[str, str]:
+        """Get the allow-listed headers of a request."""
+        return {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name in self.log_headers
         }
 
-        logger.info(
-            f"Request started path={request_data['path']} "
-            f"method={request_data['method']}",
-            extra=request_data,
+    def _set_db_headers(
+        self, message: Message, stats: RequestQueryStats
+    ) -> None:
+        """Add the request's SQL budget to response headers."""
+        repeated = stats.repeated_shapes(
+            self.query_tracker.n_plus_one_threshold
+        )
+        headers = MutableHeaders(scope=message)
+        headers["X-DB-Query-Count"] = str(stats.query_count)
+        headers["X-DB-Time-Ms"] = str(stats.db_time_ms)
+        headers["X-DB-Repeated-Queries"] = str(
+            len(repeated)
         )
 
-        response = await call_next(request)
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Serve the request, logging it and tracking its SQL."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Calculate duration
-        duration = time.time() - start_time
+        start_time = time.time()
+        path = scope["path"]
+        method = scope["method"]
+        sampled = logger.isEnabledFor(logging.INFO) and (
+            self.sample_rate >= 1
+            or random.random() < self.sample_rate
+        )
 
-        # Log response
-        response_data = {
-            "path": request.url.path,
-            "method": request.method,
-            "status_code": response.status_code,
-            "duration_ms": round(duration * 1000, 2),
-        }
+        if sampled:
+            client = scope.get("client")
+            logger.info(
+                f"Request started path={path} "
+                f"method={method}",
+                extra={
+                    "path": path,
+                    "method": method,
+                    "headers": self._request_headers(scope),
+                    "client_ip": (
+                        client[0] if client else None
+                    ),
+                },
+            )
 
-        logger.info(
-            f"Request completed path={response_data['path']} "
-            f"method={response_data['method']} "
-            f"status_code={response_data['status_code']} "
-            f"duration_ms={response_data['duration_ms']}",
-            extra=response_data,
-        )
+        status_code = 500
+        token = self.query_tracker.start_request(path)
+        stats = self.query_tracker.current_request()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.query_tracker.expose_headers:
+                    self._set_db_headers(message, stats)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Aggregate under the route template, not the raw path,
+            # so unmatched URLs can't grow the per-route table
+            route = scope.get("route")
+            self.query_tracker.finish_request(
+                token,
+                getattr(route, "path", None)
+                or UNMATCHED_ROUTE,
+            )
 
-        return response
+            if (sampled or status_code >= 500) and (
+                logger.isEnabledFor(logging.INFO)
+            ):
+                duration_ms = round(
+                    (time.time() - start_time) * 1000, 2
+                )
+                logger.info(
+                    f"Request completed path={path} "
+                    f"method={method} "
+                    f"status_code={status_code} "
+                    f"duration_ms={duration_ms} "
+                    f"db_queries={stats.query_count} "
+                    f"db_time_ms={stats.db_time_ms}",
+                    extra={
+                        "path": path,
+                        "method": method,
+                        "status_code": status_code,
+                        "duration_ms": duration_ms,
+                        "db_queries": stats.query_count,
+                        "db_time_ms": stats.db_time_ms,
+                    },
+                )
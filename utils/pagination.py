@@ -1,6 +1,12 @@
 """Pagination utilities for consistent handling across the application"""
 
-from typing import Tuple
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.orm import Query
 
 
 def page_to_skip(page: int, size: int) -> Tuple[int, int]:
@@ -42,3 +48,111 @@ def calculate_pages(total: int, size: int) -> int:
         Total number of pages
     """
     return (total + size - 1) // size if total > 0 else 0
+
+
+def encode_cursor(
+    sort_value: datetime, item_id: int
+) -> str:
+    """Encode a keyset position into an opaque cursor
+
+    Args:
+        sort_value: Sort key (timestamp/created_at) of the last item
+        item_id: ID of the last item, used as a tie-breaker
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [sort_value.isoformat(), item_id],
+        separators=(",", ":"),
+    )
+    return (
+        base64.urlsafe_b64encode(payload.encode())
+        .decode()
+        .rstrip("=")
+    )
+
+
+def decode_cursor(
+    cursor: Optional[str],
+) -> Optional[Tuple[datetime, int]]:
+    """Decode an opaque cursor into a keyset position
+
+    An empty cursor starts cursor mode from the first item.
+
+    Args:
+        cursor: Cursor string from a previous ``next_cursor``
+
+    Returns:
+        Tuple of (sort_value, item_id), or None for an empty cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, item_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode())
+        )
+        return datetime.fromisoformat(sort_value), int(
+            item_id
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def paginate_by_cursor(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    cursor: Optional[str],
+    size: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one keyset page ordered by (sort_column, id) descending
+
+    Unlike offset pagination, the database seeks directly to the
+    cursor position, so every page costs the same as the first.
+
+    Args:
+        query: Filtered query without ordering or pagination
+        sort_column: Mapped timestamp column to order by
+        id_column: Mapped primary key column used as tie-breaker
+        cursor: Cursor from a previous page ("" for the first page)
+        size: Items per page
+
+    Returns:
+        Tuple of (items, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = decode_cursor(cursor)
+    if position is not None:
+        sort_value, item_id = position
+        query = query.filter(
+            or_(
+                sort_column < sort_value,
+                and_(
+                    sort_column == sort_value,
+                    id_column < item_id,
+                ),
+            )
+        )
+
+    items = (
+        query.order_by(desc(sort_column), desc(id_column))
+        .limit(size + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(items) > size:
+        items = items[:size]
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key),
+            getattr(last, id_column.key),
+        )
+    return items, next_cursor
@@ -1,9 +1,12 @@
 import random
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from typing import (
     TypeVar,
     Callable,
     Any,
+    Iterator,
     Type,
     Union,
     Tuple,
@@ -16,6 +19,26 @@ import time
 
 T = TypeVar("T")
 
+# Set while the caller schedules its own retries, e.g. a queue job
+# that re-enqueues itself instead of sleeping through the backoff
+_retries_deferred: ContextVar[bool] = ContextVar(
+    "retries_deferred", default=False
+)
+
+
+@contextmanager
+def defer_retries() -> Iterator[None]:
+    """Make with_retry raise at once instead of sleeping between attempts.
+
+    Used by queue jobs, which retry by re-enqueueing themselves with a
+    delay so the worker is free to run other jobs during the backoff.
+    """
+    token = _retries_deferred.set(True)
+    try:
+        yield
+    finally:
+        _retries_deferred.reset(token)
+
 
 def calculate_backoff(
     attempt: int,
@@ -54,6 +77,9 @@ def with_retry(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator for retrying functions with exponential backoff.
 
+    Inside defer_retries() the first failure is raised straight to
+    the caller, which is expected to schedule the retry itself.
+
     Args:
         max_retries: Maximum number of retry attempts
         retry_on: Exception(s) to retry on
@@ -103,8 +129,12 @@ def with_retry(
 
                     last_exception = e
 
-                    # If this was the last attempt, raise the exception
-                    if attempt == max_retries:
+                    # If this was the last attempt, or the caller
+                    # retries on its own, raise the exception
+                    if (
+                        attempt == max_retries
+                        or _retries_deferred.get()
+                    ):
                         raise last_exception
 
                     # Wait before retrying with exponential backoff
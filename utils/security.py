@@ -1,5 +1,16 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Tuple
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    Tuple,
+    TypeVar,
+)
 from jose import JWTError, jwt
 import bcrypt
 from fastapi import Depends, HTTPException, status, Request
@@ -23,6 +34,13 @@ SECRET_KEY = os.getenv(
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Threads available for bcrypt hashing and verification
+AUTH_HASH_MAX_WORKERS = int(
+    os.getenv("AUTH_HASH_MAX_WORKERS", "4")
+)
+
+T = TypeVar("T")
+
 
 # Custom bearer scheme that returns 401 for missing tokens
 class CustomHTTPBearer(HTTPBearer):
@@ -78,6 +96,43 @@ def verify_token(token: str) -> Optional[str]:
         return None
 
 
+@lru_cache()
+def get_auth_hash_executor() -> ThreadPoolExecutor:
+    """Get the bounded pool that runs bcrypt work.
+
+    bcrypt is deliberately slow; running it on the event loop
+    stalls every other request. A dedicated, small pool keeps it
+    off the loop and caps how many cores concurrent logins use,
+    queueing the rest.
+    """
+    return ThreadPoolExecutor(
+        max_workers=AUTH_HASH_MAX_WORKERS,
+        thread_name_prefix="auth-hash",
+    )
+
+
+async def run_in_auth_executor(
+    func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking call that hashes or verifies secrets.
+
+    Args:
+        func: Callable doing bcrypt work
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns; its exceptions propagate
+    """
+    loop = asyncio.get_running_loop()
+    # Keep request context (e.g. query tracking) in the worker
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_auth_hash_executor(),
+        partial(context.run, func, *args, **kwargs),
+    )
+
+
 def generate_user_secret() -> str:
     """Generate a secure random user secret"""
     return secrets.token_urlsafe(32)
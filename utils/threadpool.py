@@ -0,0 +1,75 @@
+"""Run blocking route handlers off the event loop."""
+
+from functools import partial, wraps
+from typing import Any, Callable, Optional, TypeVar
+
+import anyio
+from anyio import to_thread
+
+T = TypeVar("T")
+
+
+def run_in_threadpool(
+    func: Optional[Callable[..., T]] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+) -> Any:
+    """Decorator running a synchronous route handler in a thread.
+
+    Services use synchronous SQLAlchemy sessions, storage clients
+    and bcrypt; calling them from an ``async def`` handler blocks
+    the event loop and every other request with it. Handlers that
+    call them are written as plain functions and decorated with
+    this, which exposes them to FastAPI and ``handle_exceptions``
+    as coroutines running on the shared worker threadpool.
+
+    Context variables (request query tracking) are carried into
+    the worker thread.
+
+    Args:
+        func: Handler, when used as ``@run_in_threadpool``
+        max_concurrency: Maximum calls of this handler running at
+            once; further calls wait without holding a thread.
+            None leaves the handler bounded only by the pool size
+
+    Returns:
+        The wrapped handler, or a decorator producing it
+    """
+
+    def decorator(
+        handler: Callable[..., T],
+    ) -> Callable[..., Any]:
+        limiter = (
+            anyio.CapacityLimiter(max_concurrency)
+            if max_concurrency
+            else None
+        )
+
+        @wraps(handler)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            call = partial(handler, *args, **kwargs)
+            if limiter is None:
+                return await to_thread.run_sync(call)
+            async with limiter:
+                return await to_thread.run_sync(call)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def configure_threadpool(max_workers: int) -> None:
+    """Size the worker threadpool of the running event loop.
+
+    Must be called from within the loop, e.g. at application
+    startup.
+
+    Args:
+        max_workers: Threads available to blocking handlers and
+            synchronous dependencies together
+    """
+    to_thread.current_default_thread_limiter().total_tokens = (
+        max_workers
+    )